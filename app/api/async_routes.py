@@ -5,15 +5,20 @@ Provides non-blocking job submission with progress tracking for high-load scenar
 
 Endpoints:
     POST /v1.2/async/generate - Submit generation job to queue
+    POST /v1.2/async/jobs - Submit a job for any slide type (hero, iseries,
+                            slides, atomic, layout, content)
     GET /v1.2/async/status/{job_id} - Get job status and progress
+    GET /v1.2/async/events/{job_id} - Stream progress and the result (SSE)
     GET /v1.2/async/result/{job_id} - Get completed job result
     DELETE /v1.2/async/job/{job_id} - Cancel/cleanup a job
 
 Architecture:
     1. Client submits job → Returns job_id immediately
-    2. Job queued in Redis → Worker processes when ready
-    3. Client polls status → Gets progress updates
-    4. Job completes → Client fetches result
+    2. Job queued in Redis (list or stream backend, ASYNC_QUEUE_BACKEND;
+       see app/services/job_queue.py) → Worker processes when ready
+    3. Client follows /events (pushed progress, result in the final event),
+       passes a callback_url to get the result POSTed, or polls status
+    4. Job completes → Client fetches result (unless it was pushed)
 
 Benefits:
     - Non-blocking: Director can continue with other tasks
@@ -23,7 +28,7 @@ Benefits:
 """
 
 from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
-from pydantic import BaseModel
+from pydantic import BaseModel, HttpUrl, ValidationError
 from typing import Optional, Dict, Any
 import json
 import uuid
@@ -32,6 +37,22 @@ import logging
 import os
 import asyncio
 
+from ..services.job_queue import (
+    JOB_KEY_PREFIX,
+    TERMINAL_STATUSES,
+    JobQueue,
+    WaitEstimator,
+    VARIANT_JOB_TYPE,
+    create_job_queue,
+    get_callback_allowed_hosts,
+    is_callback_url_allowed,
+    job_events_channel,
+    job_result,
+    publish_job_event
+)
+from .slide_handlers import request_model_for
+from .sse import format_sse, sse_response
+
 logger = logging.getLogger(__name__)
 
 # Create router
@@ -48,6 +69,20 @@ class AsyncJobSubmission(BaseModel):
     slide_spec: Dict[str, Any]
     presentation_spec: Optional[Dict[str, Any]] = None
     element_relationships: Optional[Dict[str, str]] = None
+    callback_url: Optional[HttpUrl] = None  # Result is POSTed here when the job finishes
+
+
+class AsyncJobEnvelope(BaseModel):
+    """
+    Typed async job: any single-slide endpoint, run by a queue worker.
+
+    job_type is a slide type (see app/api/slide_handlers.py), e.g.
+    'hero/title-with-image', 'iseries', 'H1-generated', 'atomic/METRICS',
+    'layout/table/generate' or 'content'; request is that endpoint's body.
+    """
+    job_type: str
+    request: Dict[str, Any]
+    callback_url: Optional[HttpUrl] = None  # Result is POSTed here when the job finishes
 
 
 class JobSubmissionResponse(BaseModel):
@@ -66,6 +101,7 @@ class JobStatusResponse(BaseModel):
     progress: int  # 0-100
     stage: Optional[str] = None  # Current processing stage
     queue_position: Optional[int] = None
+    estimated_wait_seconds: Optional[int] = None
     processing_time_ms: Optional[int] = None
     error: Optional[str] = None
 
@@ -74,8 +110,10 @@ class JobResultResponse(BaseModel):
     """Response containing completed job result."""
     job_id: str
     success: bool
+    job_type: Optional[str] = None
     html: Optional[str] = None
     variant_id: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None  # Endpoint response (typed jobs)
     processing_time_ms: Optional[int] = None
     error: Optional[str] = None
 
@@ -125,6 +163,17 @@ async def get_redis():
     return _redis_client
 
 
+async def get_job_queue() -> JobQueue:
+    """Job queue for the configured backend (ASYNC_QUEUE_BACKEND)."""
+    return create_job_queue(await get_redis())
+
+
+# Per-process wait model, rebuilt from recent completions every few seconds
+_wait_estimator = WaitEstimator(
+    refresh_seconds=float(os.getenv("ASYNC_ETA_REFRESH_SECONDS", "10"))
+)
+
+
 def is_redis_enabled() -> bool:
     """Check if Redis queue is enabled."""
     return os.getenv("ENABLE_REDIS_QUEUE", "false").lower() == "true"
@@ -134,9 +183,9 @@ def is_redis_enabled() -> bool:
 # Job Queue Keys
 # =============================================================================
 
-JOB_KEY_PREFIX = "text_service:job:"
-QUEUE_KEY = "text_service:generation_queue"
+# Queue keys live in app/services/job_queue.py (shared with the workers)
 JOB_TTL_SECONDS = 3600  # 1 hour retention for completed jobs
+EVENTS_KEEPALIVE_SECONDS = 15  # Idle time before a keep-alive / status re-check
 
 
 # =============================================================================
@@ -163,7 +212,54 @@ async def submit_generation_job(
             detail="Async queue not enabled. Set ENABLE_REDIS_QUEUE=true"
         )
 
+    return await _submit_job(VARIANT_JOB_TYPE, {
+        "variant_id": request.variant_id,
+        "slide_spec": json.dumps(request.slide_spec),
+        "presentation_spec": json.dumps(request.presentation_spec) if request.presentation_spec else "",
+        "element_relationships": json.dumps(request.element_relationships) if request.element_relationships else ""
+    }, request.callback_url, label=f"variant={request.variant_id}")
+
+
+@router.post("/jobs", response_model=JobSubmissionResponse)
+async def submit_typed_job(envelope: AsyncJobEnvelope) -> JobSubmissionResponse:
+    """
+    Submit a job for any slide type to the async queue.
+
+    The request body is validated against the endpoint's model now (422 on
+    error, 400 for an unknown job_type), then a worker runs the endpoint
+    handler. GET /result returns the endpoint's response in `result`.
+    """
+    if not is_redis_enabled():
+        raise HTTPException(
+            status_code=503,
+            detail="Async queue not enabled. Set ENABLE_REDIS_QUEUE=true"
+        )
+
+    request_model = request_model_for(envelope.job_type)
+    if request_model is None:
+        raise HTTPException(status_code=400, detail=f"Unknown job_type: {envelope.job_type}")
+    try:
+        request = request_model(**envelope.request)
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=e.errors(include_url=False))
+
+    return await _submit_job(envelope.job_type, {
+        "request": request.model_dump_json(exclude_unset=True)
+    }, envelope.callback_url, label=f"type={envelope.job_type}")
+
+
+async def _submit_job(
+    job_type: str,
+    fields: Dict[str, str],
+    callback_url: Optional[HttpUrl],
+    label: str
+) -> JobSubmissionResponse:
+    """Store a job hash and queue it."""
+    if callback_url and not is_callback_url_allowed(str(callback_url), get_callback_allowed_hosts()):
+        raise HTTPException(status_code=400, detail="callback_url host is not allowed")
+
     redis = await get_redis()
+    queue = await get_job_queue()
 
     # Generate unique job ID
     job_id = str(uuid.uuid4())
@@ -171,13 +267,12 @@ async def submit_generation_job(
     # Prepare job data
     job_data = {
         "id": job_id,
+        "job_type": job_type,
         "status": "queued",
         "progress": 0,
         "stage": "waiting",
-        "variant_id": request.variant_id,
-        "slide_spec": json.dumps(request.slide_spec),
-        "presentation_spec": json.dumps(request.presentation_spec) if request.presentation_spec else "",
-        "element_relationships": json.dumps(request.element_relationships) if request.element_relationships else "",
+        **fields,
+        "callback_url": str(callback_url) if callback_url else "",
         "submitted_at": str(time.time()),
         "started_at": "",
         "completed_at": "",
@@ -190,23 +285,20 @@ async def submit_generation_job(
     await redis.hset(job_key, mapping=job_data)
     await redis.expire(job_key, JOB_TTL_SECONDS * 2)  # Keep job data longer than TTL
 
-    # Add to queue
-    await redis.lpush(QUEUE_KEY, job_id)
+    # Add to queue (returns jobs waiting, including this one)
+    queue_length = await queue.enqueue(job_id)
 
-    # Get queue position
-    queue_length = await redis.llen(QUEUE_KEY)
+    # Estimate wait time from recent throughput (~8s per job until measured)
+    estimated_wait = await _wait_estimator.estimate_wait_seconds(redis, queue_length)
 
-    # Estimate wait time (~8s per job average)
-    estimated_wait = queue_length * 8
-
-    print(f"[QUEUE-SUBMIT] job_id={job_id}, variant={request.variant_id}, queue_pos={queue_length}")
+    print(f"[QUEUE-SUBMIT] job_id={job_id}, {label}, queue_pos={queue_length}")
 
     return JobSubmissionResponse(
         job_id=job_id,
         status="queued",
         queue_position=queue_length,
         estimated_wait_seconds=estimated_wait,
-        message=f"Job queued. Poll /v1.2/async/status/{job_id} for progress."
+        message=f"Job queued. Follow /v1.2/async/events/{job_id} (or poll /v1.2/async/status/{job_id}) for progress."
     )
 
 
@@ -254,15 +346,12 @@ async def get_job_status(job_id: str) -> JobStatusResponse:
             end = time.time()
         processing_time_ms = int((end - start) * 1000)
 
-    # Get queue position if still queued
+    # Get queue position if still queued (constant time: sequence counters)
     queue_position = None
     if job_data["status"] == "queued":
-        # Find position in queue (0-indexed)
-        queue_items = await redis.lrange(QUEUE_KEY, 0, -1)
-        try:
-            queue_position = queue_items.index(job_id) + 1
-        except ValueError:
-            queue_position = None
+        queue = await get_job_queue()
+        queue_position = await queue.position(job_id, job_data)
+    estimated_wait = await _wait_estimator.estimate_wait_seconds(redis, queue_position)
 
     return JobStatusResponse(
         job_id=job_id,
@@ -270,6 +359,7 @@ async def get_job_status(job_id: str) -> JobStatusResponse:
         progress=int(job_data.get("progress", 0)),
         stage=job_data.get("stage"),
         queue_position=queue_position,
+        estimated_wait_seconds=estimated_wait,
         processing_time_ms=processing_time_ms,
         error=job_data.get("error") or None
     )
@@ -308,34 +398,88 @@ async def get_job_result(job_id: str) -> JobResultResponse:
             detail=f"Job not complete. Status: {status}, Progress: {job_data.get('progress', 0)}%"
         )
 
-    # Calculate processing time
-    processing_time_ms = None
-    if job_data.get("started_at") and job_data.get("completed_at"):
-        processing_time_ms = int(
-            (float(job_data["completed_at"]) - float(job_data["started_at"])) * 1000
-        )
+    return _job_result(job_id, job_data)
 
-    if status == "completed":
-        # Parse result
-        result = json.loads(job_data["result"]) if job_data.get("result") else {}
 
-        return JobResultResponse(
-            job_id=job_id,
-            success=True,
-            html=result.get("html"),
-            variant_id=job_data.get("variant_id"),
-            processing_time_ms=processing_time_ms
-        )
-    else:
-        # Failed job
-        return JobResultResponse(
-            job_id=job_id,
-            success=False,
-            error=job_data.get("error", "Unknown error"),
-            variant_id=job_data.get("variant_id"),
-            processing_time_ms=processing_time_ms
+def _job_result(job_id: str, job_data: Dict[str, str]) -> JobResultResponse:
+    """Result of a completed or failed job, from its Redis hash."""
+    return JobResultResponse(**job_result(job_id, job_data))
+
+
+@router.get("/events/{job_id}")
+async def stream_job_events(job_id: str):
+    """
+    Stream a job's progress and outcome as server-sent events.
+
+    Replaces polling status/result:
+    - `status`: current state when the stream opens
+    - `progress`: each status/stage change ({status, stage, progress})
+    - `completed` / `failed` / `cancelled`: final event, then the stream
+      closes; `completed` carries the same payload as GET /result
+
+    Events are pushed from the workers over Redis pub/sub. While the job is
+    idle a keep-alive comment is sent and the job hash re-checked, so a
+    missed message never leaves a client waiting.
+    """
+    if not is_redis_enabled():
+        raise HTTPException(
+            status_code=503,
+            detail="Async queue not enabled. Set ENABLE_REDIS_QUEUE=true"
         )
 
+    redis = await get_redis()
+    job_key = f"{JOB_KEY_PREFIX}{job_id}"
+
+    if not await redis.exists(job_key):
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+
+    def final_frame(job_data: Dict[str, str]) -> str:
+        if job_data["status"] == "cancelled":
+            return format_sse("cancelled", {"job_id": job_id})
+        return format_sse(job_data["status"], _job_result(job_id, job_data).model_dump())
+
+    async def frames():
+        # Subscribe before reading the snapshot so no event falls in between
+        pubsub = redis.pubsub()
+        await pubsub.subscribe(job_events_channel(job_id))
+        try:
+            job_data = await redis.hgetall(job_key)
+            if not job_data:
+                return
+            yield format_sse("status", {
+                "job_id": job_id,
+                "status": job_data["status"],
+                "stage": job_data.get("stage"),
+                "progress": int(job_data.get("progress", 0))
+            })
+            if job_data["status"] in TERMINAL_STATUSES:
+                yield final_frame(job_data)
+                return
+
+            while True:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=EVENTS_KEEPALIVE_SECONDS
+                )
+                if message is None:
+                    job_data = await redis.hgetall(job_key)
+                    if not job_data:
+                        return  # Expired or cleaned up
+                    if job_data["status"] in TERMINAL_STATUSES:
+                        yield final_frame(job_data)
+                        return
+                    yield ": keep-alive\n\n"
+                    continue
+
+                event = json.loads(message["data"])
+                yield format_sse(event["event"], event["data"])
+                if event["event"] in TERMINAL_STATUSES:
+                    return
+        finally:
+            await pubsub.unsubscribe(job_events_channel(job_id))
+            await pubsub.aclose()
+
+    return sse_response(frames())
+
 
 @router.delete("/job/{job_id}")
 async def cancel_job(job_id: str):
@@ -363,8 +507,10 @@ async def cancel_job(job_id: str):
 
     if status == "queued":
         # Remove from queue
-        await redis.lrem(QUEUE_KEY, 0, job_id)
+        queue = await get_job_queue()
+        await queue.cancel(job_id, job_data)
         await redis.hset(job_key, "status", "cancelled")
+        await publish_job_event(redis, job_id, "cancelled", {})
         print(f"[QUEUE-CANCEL] job_id={job_id}")
         return {"message": f"Job {job_id} cancelled"}
 
@@ -396,9 +542,12 @@ async def get_queue_stats():
         )
 
     redis = await get_redis()
+    queue = await get_job_queue()
 
-    # Get queue length
-    queue_length = await redis.llen(QUEUE_KEY)
+    # Backend metrics: waiting jobs, in-flight (claimed, unacked) jobs, and
+    # per-worker (list) or per-consumer pending (stream) breakdown
+    queue_metrics = await queue.stats()
+    queue_length = queue_metrics["waiting"]
 
     # Get all job keys to count by status
     # Note: This is expensive for large queues, use with caution
@@ -426,6 +575,8 @@ async def get_queue_stats():
 
     return {
         "queue_length": queue_length,
+        "queue": queue_metrics,
+        "wait_model": await _wait_estimator.model(redis),
         "total_jobs_tracked": len(job_keys),
         "status_counts": status_counts,
         "healthy": queue_length < 50  # Degraded if queue > 50
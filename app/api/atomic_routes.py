@@ -48,7 +48,7 @@ from app.models.atomic_models import (
     NumberedListAtomicRequest,
     TextBoxAtomicRequest
 )
-from app.services import create_llm_callable_async
+from app.services import create_llm_callable_for, QueueFullError
 
 logger = logging.getLogger(__name__)
 
@@ -64,12 +64,13 @@ def get_async_llm_service() -> Callable:
     """
     Get async LLM service for atomic component generation.
 
+    Routed through the shared LLM connection pool (endpoint family "atomic").
     Uses Vertex AI with Application Default Credentials (ADC).
 
     Returns:
         Async callable that takes prompt string and returns content string
     """
-    return create_llm_callable_async()
+    return create_llm_callable_for("atomic")
 
 
 def get_atomic_generator(
@@ -207,6 +208,9 @@ async def generate_metrics(
         raise HTTPException(status_code=504, detail="LLM request timed out")
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except QueueFullError:
+        raise
+
     except Exception as e:
         logger.error(f"[ATOMIC-METRICS-ERROR] {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -271,6 +275,9 @@ async def generate_sequential(
         raise HTTPException(status_code=504, detail="LLM request timed out")
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except QueueFullError:
+        raise
+
     except Exception as e:
         logger.error(f"[ATOMIC-SEQUENTIAL-ERROR] {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -336,6 +343,9 @@ async def generate_comparison(
         raise HTTPException(status_code=504, detail="LLM request timed out")
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except QueueFullError:
+        raise
+
     except Exception as e:
         logger.error(f"[ATOMIC-COMPARISON-ERROR] {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -401,6 +411,9 @@ async def generate_sections(
         raise HTTPException(status_code=504, detail="LLM request timed out")
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except QueueFullError:
+        raise
+
     except Exception as e:
         logger.error(f"[ATOMIC-SECTIONS-ERROR] {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -466,6 +479,9 @@ async def generate_callout(
         raise HTTPException(status_code=504, detail="LLM request timed out")
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except QueueFullError:
+        raise
+
     except Exception as e:
         logger.error(f"[ATOMIC-CALLOUT-ERROR] {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -531,6 +547,9 @@ async def generate_text_bullets(
         raise HTTPException(status_code=504, detail="LLM request timed out")
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except QueueFullError:
+        raise
+
     except Exception as e:
         logger.error(f"[ATOMIC-TEXT_BULLETS-ERROR] {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -596,6 +615,9 @@ async def generate_bullet_box(
         raise HTTPException(status_code=504, detail="LLM request timed out")
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except QueueFullError:
+        raise
+
     except Exception as e:
         logger.error(f"[ATOMIC-BULLET_BOX-ERROR] {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -675,6 +697,9 @@ async def generate_table(
         raise HTTPException(status_code=504, detail="LLM request timed out")
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except QueueFullError:
+        raise
+
     except Exception as e:
         logger.error(f"[ATOMIC-TABLE-ERROR] {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -740,6 +765,9 @@ async def generate_numbered_list(
         raise HTTPException(status_code=504, detail="LLM request timed out")
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except QueueFullError:
+        raise
+
     except Exception as e:
         logger.error(f"[ATOMIC-NUMBERED_LIST-ERROR] {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -848,6 +876,9 @@ async def generate_text_box(
         raise HTTPException(status_code=504, detail="LLM request timed out")
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except QueueFullError:
+        raise
+
     except Exception as e:
         logger.error(f"[ATOMIC-TEXT_BOX-ERROR] {e}")
         raise HTTPException(status_code=500, detail=str(e))
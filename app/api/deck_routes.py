@@ -0,0 +1,396 @@
+"""
+Deck (Batch) Generation Router for Text Service v1.2
+
+Generates a whole deck in one request instead of one HTTP call per slide.
+Slides are heterogeneous: each entry names its single-slide endpoint (a
+slide type, see slide_handlers.py) and carries that endpoint's request
+body. They run concurrently under a deck-level concurrency budget, and
+every LLM call still goes through the shared connection pool, so a deck
+cannot exceed the process-wide limits.
+
+Presentation context given once at deck level is merged into every slide
+(slide-level values win), so the Director does not repeat it per slide.
+
+With pack_content_slides, small 'content' slides share LLM calls: their
+complete prompts are packed several per request and the keyed response is
+split and validated per slide (see generate_slides_packed_async).
+
+Given the outline up front, /prefetch-images starts image generation for
+every hero-with-image and I-series slide in the background; each slide's
+generator then awaits that image instead of requesting its own, so its
+latency drops to content generation time (see image_prefetch.py).
+
+Endpoints:
+    POST /v1.2/deck/generate        - Generate all slides; results in request order,
+                                      or server-sent events as each slide finishes
+    POST /v1.2/deck/prefetch-images - Start image generation for a deck outline
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Dict, List, Tuple, Type
+
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel, ValidationError
+
+from ..models.deck_models import (
+    DeckGenerationRequest,
+    DeckGenerationResponse,
+    DeckImagePrefetchResponse,
+    DeckImagePrefetchSlide,
+    DeckSlideRequest,
+    DeckSlideResult
+)
+from ..services.image_prefetch import get_image_prefetch_cache
+from ..services.llm_pool import (
+    PoolPriority,
+    QueueFullError,
+    get_request_priority,
+    reset_request_priority,
+    set_request_priority
+)
+from . import v1_2_routes
+from .slide_handlers import SlideHandler, image_prefetcher, resolve_slide_types
+from .sse import describe_error, format_sse, response_error, sse_response
+
+logger = logging.getLogger(__name__)
+
+# Create router
+router = APIRouter(prefix="/v1.2/deck", tags=["deck"])
+
+# Presentation fields copied into /v1.2/slides, hero and iseries context and atomic context
+SLIDES_CONTEXT_FIELDS = ("presentation_title", "presentation_type", "industry", "company")
+ATOMIC_CONTEXT_FIELDS = ("presentation_title", "industry", "company", "prior_slides_summary")
+
+
+def _default_max_concurrency() -> int:
+    """Deck-level concurrency budget (DECK_MAX_CONCURRENCY, default: 10)."""
+    return int(os.getenv("DECK_MAX_CONCURRENCY", "10"))
+
+
+def _resolve_slide_types(
+    slides: List[DeckSlideRequest]
+) -> List[Tuple[str, Type[BaseModel], SlideHandler]]:
+    """
+    Map each slide_type to (family, request model, handler).
+
+    Raises:
+        HTTPException: 400 listing every unknown slide_type
+    """
+    resolved = resolve_slide_types([slide.slide_type for slide in slides])
+    unknown = [
+        f"slides[{index}]: {slide.slide_type}"
+        for index, (slide, entry) in enumerate(zip(slides, resolved))
+        if entry is None
+    ]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown slide_type: {', '.join(unknown)}")
+    return resolved
+
+
+def _apply_shared_context(
+    deck: DeckGenerationRequest,
+    index: int,
+    family: str,
+    body: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Merge deck-level context into one slide's request body (slide values win)."""
+    body = dict(body)
+    spec = deck.presentation_spec.model_dump(exclude_none=True) if deck.presentation_spec else {}
+
+    if family == "content":
+        if spec and not body.get("presentation_spec"):
+            body["presentation_spec"] = {
+                **spec,
+                "current_slide_number": index + 1,
+                "total_slides": len(deck.slides)
+            }
+
+    elif family == "slides":
+        body.setdefault("slide_number", index + 1)
+        context = dict(body.get("context") or {})
+        for key in SLIDES_CONTEXT_FIELDS:
+            if key in spec:
+                context.setdefault(key, spec[key])
+        body["context"] = context
+        if deck.theme_config and not body.get("theme_config"):
+            body["theme_config"] = deck.theme_config
+        if deck.content_context and not body.get("content_context"):
+            body["content_context"] = deck.content_context
+
+    elif family in ("hero", "iseries"):
+        # Both read theme_config/content_context from their context dict
+        body.setdefault("slide_number", index + 1)
+        context = dict(body.get("context") or {})
+        for key in SLIDES_CONTEXT_FIELDS:
+            if key in spec:
+                context.setdefault(key, spec[key])
+        if deck.theme_config:
+            context.setdefault("theme_config", deck.theme_config)
+        if deck.content_context:
+            context.setdefault("content_context", deck.content_context)
+        body["context"] = context
+
+    elif family == "atomic" and spec:
+        context = dict(body.get("context") or {})
+        for key in ATOMIC_CONTEXT_FIELDS:
+            if key in spec:
+                context.setdefault(key, spec[key])
+        body["context"] = context
+
+    elif family == "layout":
+        # Layout requests take a camelCase SlideContext (presentationTitle required)
+        if spec or body.get("context"):
+            context = dict(body.get("context") or {})
+            if spec:
+                context.setdefault("presentationTitle", spec["presentation_title"])
+            context.setdefault("slideIndex", index)
+            context.setdefault("slideCount", len(deck.slides))
+            body["context"] = context
+        if deck.content_context and not body.get("content_context"):
+            body["content_context"] = deck.content_context
+
+    return body
+
+
+async def _generate_slide(
+    index: int,
+    slide_type: str,
+    request_model: Type[BaseModel],
+    body: Dict[str, Any],
+    handler: SlideHandler,
+    budget: asyncio.Semaphore,
+    deck_start: float
+) -> DeckSlideResult:
+    """Run one slide through its single-slide endpoint handler."""
+    async with budget:
+        try:
+            response = await handler(request_model(**body))
+            result = response.model_dump() if isinstance(response, BaseModel) else response
+            error = response_error(result)
+            if error is not None:
+                print(f"[DECK] slide={index} type={slide_type} unsuccessful: {error[:100]}")
+            return DeckSlideResult(
+                index=index,
+                slide_type=slide_type,
+                success=error is None,
+                status_code=200,
+                result=result,
+                error=error,
+                elapsed_ms=int((time.time() - deck_start) * 1000)
+            )
+
+        except HTTPException as e:
+            status_code, error = e.status_code, str(e.detail)
+        except QueueFullError as e:
+            status_code, error = describe_error(e)
+        except ValidationError as e:
+            status_code, error = 422, str(e)
+        except Exception as e:
+            status_code, error = 500, str(e)
+
+    print(f"[DECK] slide={index} type={slide_type} failed ({status_code}): {error[:100]}")
+    return DeckSlideResult(
+        index=index,
+        slide_type=slide_type,
+        success=False,
+        status_code=status_code,
+        error=error,
+        elapsed_ms=int((time.time() - deck_start) * 1000)
+    )
+
+
+def _packed_content_handlers(
+    deck: DeckGenerationRequest,
+    resolved: List[Tuple[str, Type[BaseModel], SlideHandler]]
+) -> Dict[int, SlideHandler]:
+    """
+    Replace 'content' slide handlers with ones served by one packed generation.
+
+    Content slides whose request fails validation keep their normal handler
+    (so they report 422 as usual); the rest are generated together by
+    generate_slides_packed_async, started on first use.
+    """
+    generator = v1_2_routes.get_generator()
+    requests = {}
+    for index, (slide, (family, request_model, _)) in enumerate(zip(deck.slides, resolved)):
+        if family != "content":
+            continue
+        try:
+            requests[index] = request_model(**_apply_shared_context(deck, index, family, slide.request))
+        except ValidationError:
+            continue
+    if len(requests) < 2:
+        return {}
+
+    order = list(requests)
+    variant_ids = {index: v1_2_routes._resolve_variant_id(requests[index], generator) for index in order}
+    packed = {}
+
+    def run_packed() -> asyncio.Future:
+        if "task" not in packed:
+            print(f"[DECK] packing {len(order)} content slides")
+            packed["task"] = asyncio.ensure_future(generator.generate_slides_packed_async([
+                {
+                    "variant_id": variant_ids[index],
+                    "slide_spec": requests[index].slide_spec.model_dump(),
+                    "presentation_spec": (
+                        requests[index].presentation_spec.model_dump()
+                        if requests[index].presentation_spec else None
+                    ),
+                    "element_relationships": requests[index].element_relationships
+                }
+                for index in order
+            ]))
+        return packed["task"]
+
+    def handler_for(index: int) -> SlideHandler:
+        async def handler(request: BaseModel):
+            # Shielded: one slide being cancelled must not cancel the pack
+            results = await asyncio.shield(run_packed())
+            result = results[order.index(index)]
+            if isinstance(result, Exception):
+                status_code, detail = describe_error(result)
+                raise HTTPException(status_code=status_code, detail=detail)
+            return v1_2_routes._build_generation_response(
+                request, generator, result, variant_ids[index]
+            )
+        return handler
+
+    return {index: handler_for(index) for index in order}
+
+
+def _summarize(
+    results: List[DeckSlideResult],
+    max_concurrency: int,
+    deck_start: float
+) -> DeckGenerationResponse:
+    """Build the deck response from per-slide results."""
+    results = sorted(results, key=lambda r: r.index)
+    succeeded = sum(1 for r in results if r.success)
+    return DeckGenerationResponse(
+        success=succeeded == len(results),
+        total_slides=len(results),
+        succeeded=succeeded,
+        failed=len(results) - succeeded,
+        max_concurrency=max_concurrency,
+        elapsed_ms=int((time.time() - deck_start) * 1000),
+        slides=results
+    )
+
+
+@router.post("/generate", response_model=DeckGenerationResponse)
+async def generate_deck(deck: DeckGenerationRequest):
+    """
+    Generate a whole deck of heterogeneous slides concurrently.
+
+    Each slide is validated and generated exactly as its single-slide
+    endpoint would; one slide failing does not fail the deck. Per-slide
+    outcomes carry the HTTP status the single-slide call would have returned.
+
+    With stream=true the response is text/event-stream:
+        slide    - DeckSlideResult, as soon as the slide finishes
+        complete - DeckGenerationResponse (all slides, in request order)
+    """
+    deck_start = time.time()
+    max_concurrency = deck.max_concurrency or _default_max_concurrency()
+    budget = asyncio.Semaphore(max_concurrency)
+    resolved = _resolve_slide_types(deck.slides)
+
+    print(f"[DECK] POST /generate slides={len(deck.slides)} max_concurrency={max_concurrency} stream={deck.stream}")
+
+    if deck.pack_content_slides:
+        packed_handlers = _packed_content_handlers(deck, resolved)
+        resolved = [
+            (family, request_model, packed_handlers.get(index, handler))
+            for index, (family, request_model, handler) in enumerate(resolved)
+        ]
+
+    # Slide tasks copy the context at creation: unless the caller chose a
+    # lane (X-LLM-Priority), the deck's LLM calls queue in the batch lane
+    # so they cannot starve interactive single-slide requests
+    priority_token = set_request_priority(get_request_priority() or PoolPriority.BATCH)
+    try:
+        tasks = [
+            asyncio.create_task(_generate_slide(
+                index,
+                slide.slide_type,
+                request_model,
+                _apply_shared_context(deck, index, family, slide.request),
+                handler,
+                budget,
+                deck_start
+            ))
+            for index, (slide, (family, request_model, handler)) in enumerate(zip(deck.slides, resolved))
+        ]
+    finally:
+        reset_request_priority(priority_token)
+
+    if not deck.stream:
+        results = await asyncio.gather(*tasks)
+        response = _summarize(list(results), max_concurrency, deck_start)
+        print(f"[DECK] completed {response.succeeded}/{response.total_slides} in {response.elapsed_ms}ms")
+        return response
+
+    async def frames():
+        results = []
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                result = await next_done
+                results.append(result)
+                yield format_sse("slide", result.model_dump())
+
+            response = _summarize(results, max_concurrency, deck_start)
+            print(f"[DECK] completed {response.succeeded}/{response.total_slides} in {response.elapsed_ms}ms (stream)")
+            yield format_sse("complete", response.model_dump())
+        finally:
+            # Client went away: stop generating the remaining slides
+            for task in tasks:
+                task.cancel()
+
+    return sse_response(frames())
+
+
+@router.post("/prefetch-images", response_model=DeckImagePrefetchResponse, status_code=202)
+async def prefetch_deck_images(deck: DeckGenerationRequest):
+    """
+    Start image generation for every slide of a deck outline that has one.
+
+    Takes the same body as /generate (generation options are ignored) and
+    returns immediately. Each hero-with-image and I-series slide has its
+    image prompt built and its Image Builder request sent in the background;
+    when the slide itself is generated later (per-slide endpoint or
+    /generate) with the same request, it uses that image instead of
+    starting its own.
+    """
+    cache = get_image_prefetch_cache()
+    resolved = _resolve_slide_types(deck.slides)
+    outcomes = []
+
+    for index, (slide, (family, request_model, _)) in enumerate(zip(deck.slides, resolved)):
+        outcome = DeckImagePrefetchSlide(index=index, slide_type=slide.slide_type, status="no_image")
+        outcomes.append(outcome)
+        try:
+            request = request_model(**_apply_shared_context(deck, index, family, slide.request))
+        except ValidationError as e:
+            outcome.status, outcome.error = "invalid", str(e)
+            continue
+
+        prefetcher = image_prefetcher(slide.slide_type, request)
+        if prefetcher is None:
+            continue
+        generator, generator_request = prefetcher
+        outcome.status = cache.start(
+            generator.image_prefetch_key(generator_request),
+            lambda generator=generator, generator_request=generator_request: generator.prefetch_image(generator_request)
+        )
+
+    started = sum(1 for outcome in outcomes if outcome.status == "started")
+    print(f"[DECK] POST /prefetch-images slides={len(deck.slides)} started={started}")
+    return DeckImagePrefetchResponse(
+        started=started,
+        ttl_seconds=cache.config.ttl_seconds,
+        slides=outcomes
+    )
@@ -50,7 +50,7 @@ from ..core.hero import (
     SectionDividerStructuredWithImageGenerator,
     ClosingSlideStructuredWithImageGenerator
 )
-from ..services import create_llm_callable_async
+from ..services import create_llm_callable_for, QueueFullError
 
 logger = logging.getLogger(__name__)
 
@@ -66,13 +66,13 @@ def get_async_llm_service() -> Callable:
     """
     Get async LLM service for hero slide generation.
 
-    This uses the same async LLM service as content slides for consistency.
-    Uses Vertex AI with Application Default Credentials (ADC).
+    This uses the same pooled LLM service as content slides for consistency
+    (endpoint family "hero"). Uses Vertex AI with Application Default Credentials (ADC).
 
     Returns:
         Async callable that takes prompt string and returns content string
     """
-    return create_llm_callable_async()
+    return create_llm_callable_for("hero")
 
 
 def get_title_generator(
@@ -288,6 +288,9 @@ async def generate_title_slide(
             detail=f"Title slide validation failed: {str(e)}"
         )
 
+    except QueueFullError:
+        raise
+
     except Exception as e:
         # GENERATION ERROR LOGGING
         elapsed_ms = int((time.time() - start_time) * 1000)
@@ -358,6 +361,9 @@ async def generate_section_divider(
             detail=f"Section divider validation failed: {str(e)}"
         )
 
+    except QueueFullError:
+        raise
+
     except Exception as e:
         # GENERATION ERROR LOGGING
         elapsed_ms = int((time.time() - start_time) * 1000)
@@ -431,6 +437,9 @@ async def generate_closing_slide(
             detail=f"Closing slide validation failed: {str(e)}"
         )
 
+    except QueueFullError:
+        raise
+
     except Exception as e:
         # GENERATION ERROR LOGGING
         elapsed_ms = int((time.time() - start_time) * 1000)
@@ -532,6 +541,9 @@ async def generate_title_slide_with_image(
             detail=f"Title slide with image validation failed: {str(e)}"
         )
 
+    except QueueFullError:
+        raise
+
     except Exception as e:
         # GENERATION ERROR LOGGING
         elapsed_ms = int((time.time() - start_time) * 1000)
@@ -624,6 +636,9 @@ async def generate_title_structured_with_image(
             detail=f"Title structured with image validation failed: {str(e)}"
         )
 
+    except QueueFullError:
+        raise
+
     except Exception as e:
         # GENERATION ERROR LOGGING
         elapsed_ms = int((time.time() - start_time) * 1000)
@@ -716,6 +731,9 @@ async def generate_section_structured_with_image(
             detail=f"Section structured with image validation failed: {str(e)}"
         )
 
+    except QueueFullError:
+        raise
+
     except Exception as e:
         # GENERATION ERROR LOGGING
         elapsed_ms = int((time.time() - start_time) * 1000)
@@ -809,6 +827,9 @@ async def generate_closing_structured_with_image(
             detail=f"Closing structured with image validation failed: {str(e)}"
         )
 
+    except QueueFullError:
+        raise
+
     except Exception as e:
         # GENERATION ERROR LOGGING
         elapsed_ms = int((time.time() - start_time) * 1000)
@@ -905,6 +926,9 @@ async def generate_section_divider_with_image(
             detail=f"Section divider with image validation failed: {str(e)}"
         )
 
+    except QueueFullError:
+        raise
+
     except Exception as e:
         # GENERATION ERROR LOGGING
         elapsed_ms = int((time.time() - start_time) * 1000)
@@ -1005,6 +1029,9 @@ async def generate_closing_slide_with_image(
             detail=f"Closing slide with image validation failed: {str(e)}"
         )
 
+    except QueueFullError:
+        raise
+
     except Exception as e:
         # GENERATION ERROR LOGGING
         elapsed_ms = int((time.time() - start_time) * 1000)
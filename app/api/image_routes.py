@@ -0,0 +1,55 @@
+"""
+Late-Binding Image Routes for v1.2
+
+Hero-with-image and I-series slides requested with an image deadline
+(image_deadline_ms, or IMAGE_DEADLINE_MS) are returned with the gradient
+placeholder when the image is late, together with an image_job_id. The image
+keeps generating in the background; clients poll this endpoint and swap the
+image into the slide once it is ready.
+
+Endpoints:
+    GET /v1.2/images/{job_id} - Status and URL of a late image
+
+Images generate in the process that rendered the slide; with
+IMAGE_JOB_REDIS_URL set, any instance can answer the poll (see
+app/services/image_jobs.py). Jobs expire IMAGE_JOB_TTL_SECONDS after their
+last update.
+"""
+
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel
+from typing import Optional, Dict, Any
+import logging
+
+from ..services.image_jobs import get_image_job_registry
+
+logger = logging.getLogger(__name__)
+
+# Create router
+router = APIRouter(prefix="/v1.2/images", tags=["v1.2-images"])
+
+
+class ImageJobResponse(BaseModel):
+    """Late image status: pending until the Image Builder answers."""
+    job_id: str
+    status: str  # pending, completed, failed
+    image_url: Optional[str] = None
+    error: Optional[str] = None
+    metadata: Dict[str, Any] = {}
+
+
+@router.get("/{job_id}", response_model=ImageJobResponse)
+async def get_image_job(job_id: str):
+    """
+    Get a late image by the image_job_id returned with its slide.
+
+    Returns:
+        ImageJobResponse; image_url is set once status is "completed"
+
+    Raises:
+        HTTPException 404: Unknown or expired job
+    """
+    job = await get_image_job_registry().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Image job {job_id} not found or expired")
+    return ImageJobResponse(**job)
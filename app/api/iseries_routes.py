@@ -31,7 +31,8 @@ from app.core.iseries import (
     I3Generator,
     I4Generator
 )
-from app.services.llm_service import create_llm_callable_async
+from app.services.llm_service import create_llm_callable_for
+from app.services.llm_pool import QueueFullError
 
 logger = logging.getLogger(__name__)
 
@@ -43,8 +44,8 @@ router = APIRouter(prefix="/v1.2/iseries", tags=["iseries", "v1.2"])
 # =============================================================================
 
 def get_async_llm_service() -> Callable:
-    """Get async LLM service for content generation."""
-    return create_llm_callable_async()
+    """Get pooled async LLM service for content generation (family "iseries")."""
+    return create_llm_callable_for("iseries")
 
 
 def get_generator(layout_type: ISeriesLayoutType, llm_service: Callable):
@@ -130,6 +131,9 @@ async def generate_iseries(
         )
         raise HTTPException(status_code=400, detail=str(e))
 
+    except QueueFullError:
+        raise
+
     except Exception as e:
         elapsed_ms = int((time.time() - start_time) * 1000)
         logger.error(
@@ -87,7 +87,7 @@ from app.models.layout_models import (
     # Shared models
     ErrorDetails
 )
-from app.services import create_llm_callable_async
+from app.services import create_llm_callable_for, QueueFullError
 from app.services.theme_service_client import ThemeServiceClient
 
 logger = logging.getLogger(__name__)
@@ -104,13 +104,13 @@ def get_async_llm_service() -> Callable:
     """
     Get async LLM service for Layout Service generation.
 
-    Uses the same async LLM service as content slides for consistency.
-    Uses Vertex AI with Application Default Credentials (ADC).
+    Uses the same pooled LLM service as content slides for consistency
+    (endpoint family "layout"). Uses Vertex AI with Application Default Credentials (ADC).
 
     Returns:
         Async callable that takes prompt string and returns content string
     """
-    return create_llm_callable_async()
+    return create_llm_callable_for("layout")
 
 
 # Text generator dependencies
@@ -283,6 +283,9 @@ async def generate_text(
             )
         )
 
+    except QueueFullError:
+        raise
+
     except Exception as e:
         logger.error(f"Text generation failed: {e}")
         return TextGenerateResponse(
@@ -365,6 +368,9 @@ async def transform_text(
             )
         )
 
+    except QueueFullError:
+        raise
+
     except Exception as e:
         logger.error(f"Text transformation failed: {e}")
         return TextTransformResponse(
@@ -441,6 +447,9 @@ async def autofit_text(
             )
         )
 
+    except QueueFullError:
+        raise
+
     except Exception as e:
         logger.error(f"Text autofit failed: {e}")
         return TextAutofitResponse(
@@ -518,6 +527,9 @@ async def generate_slide_title(
         logger.info(f"Slide title generation successful")
         return result
 
+    except QueueFullError:
+        raise
+
     except Exception as e:
         logger.error(f"Slide title generation failed: {e}")
         return SlideTextResponse(
@@ -565,6 +577,9 @@ async def generate_slide_subtitle(
         logger.info(f"Slide subtitle generation successful")
         return result
 
+    except QueueFullError:
+        raise
+
     except Exception as e:
         logger.error(f"Slide subtitle generation failed: {e}")
         return SlideTextResponse(
@@ -628,6 +643,9 @@ async def generate_title_slide(
         logger.info(f"Title slide generation successful")
         return result
 
+    except QueueFullError:
+        raise
+
     except Exception as e:
         logger.error(f"Title slide generation failed: {e}")
         return TitleSlideResponse(
@@ -682,6 +700,9 @@ async def generate_section_slide(
         logger.info(f"Section slide generation successful")
         return result
 
+    except QueueFullError:
+        raise
+
     except Exception as e:
         logger.error(f"Section slide generation failed: {e}")
         return SectionSlideResponse(
@@ -741,6 +762,9 @@ async def generate_closing_slide(
         logger.info(f"Closing slide generation successful")
         return result
 
+    except QueueFullError:
+        raise
+
     except Exception as e:
         logger.error(f"Closing slide generation failed: {e}")
         return ClosingSlideResponse(
@@ -918,6 +942,9 @@ async def generate_text_element(
 
         return result
 
+    except QueueFullError:
+        raise
+
     except Exception as e:
         logger.error(f"Text element generation failed: {e}")
         return SlideTextResponse(
@@ -1004,6 +1031,9 @@ async def generate_table(
             )
         )
 
+    except QueueFullError:
+        raise
+
     except Exception as e:
         logger.error(f"Table generation failed: {e}")
         return TableGenerateResponse(
@@ -1085,6 +1115,9 @@ async def transform_table(
             )
         )
 
+    except QueueFullError:
+        raise
+
     except Exception as e:
         logger.error(f"Table transformation failed: {e}")
         return TableTransformResponse(
@@ -1159,6 +1192,9 @@ async def analyze_table(
             )
         )
 
+    except QueueFullError:
+        raise
+
     except Exception as e:
         logger.error(f"Table analysis failed: {e}")
         return TableAnalyzeResponse(
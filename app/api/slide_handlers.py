@@ -0,0 +1,285 @@
+"""
+Slide Type Registry for Text Service v1.2
+
+Maps a slide type name to the single-slide endpoint that generates it, so
+callers outside HTTP routing (deck batches, async queue workers) run a slide
+exactly as its endpoint would: same request model, same handler, same
+HTTPException statuses.
+
+Slide types:
+    content              /v1.2/generate
+    C1-text, H1-..., I1  /v1.2/slides/{layout} (and the L25/L29 aliases)
+    atomic/<TYPE>        /v1.2/atomic/{TYPE}         e.g. atomic/METRICS
+    hero/<endpoint>      /v1.2/hero/{endpoint}       e.g. hero/title-with-image
+    iseries              /v1.2/iseries/generate
+    layout/<path>        /api/ai/{path}              e.g. layout/table/generate
+
+Layout handlers are imported on first use, so the other families do not
+depend on the layout generators being importable.
+
+Slide types with a generated image (hero/*-with-image, iseries, I1-I4) also
+resolve to an image prefetcher, used by /v1.2/deck/prefetch-images.
+"""
+
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+from ..core.hero import HeroGenerationRequest
+from ..models import atomic_models, layout_models
+from ..models.iseries_models import ISeriesGenerationRequest, ISeriesLayoutType
+from ..models.slides_models import UnifiedSlideRequest
+from ..models.v1_2_models import V1_2_GenerationRequest
+from . import atomic_routes, hero_routes, iseries_routes, slides_routes, v1_2_routes
+
+# Handler: (validated request) -> single-slide endpoint response
+SlideHandler = Callable[[BaseModel], Awaitable[Any]]
+
+# (generator, request as the generator receives it); the generator provides
+# image_prefetch_key(request) and prefetch_image(request)
+ImagePrefetcher = Tuple[Any, BaseModel]
+
+# (family, request model, handler)
+ResolvedSlideType = Tuple[str, Type[BaseModel], SlideHandler]
+
+SLIDES_LAYOUTS = (
+    "C1-text", "L25", "H1-generated", "L29", "H1-structured",
+    "H2-section", "H3-closing", "I1", "I2", "I3", "I4"
+)
+
+
+def _slides_handlers() -> Dict[str, SlideHandler]:
+    """Handlers for /v1.2/slides layouts (and their L-series aliases)."""
+    llm_service = slides_routes.get_llm_service()
+    image_service = slides_routes.get_image_service()
+
+    def iseries(handler):
+        return lambda request: handler(request, llm_service)
+
+    return {
+        "C1-text": lambda request: slides_routes.generate_c1_text(
+            request, slides_routes.get_c1_text_generator(llm_service)),
+        "L25": lambda request: slides_routes.generate_c1_text(
+            request, slides_routes.get_c1_text_generator(llm_service)),
+        "H1-generated": lambda request: slides_routes.generate_h1_generated(
+            request, slides_routes.get_h1_generated_generator(llm_service)),
+        "L29": lambda request: slides_routes.generate_h1_generated(
+            request, slides_routes.get_h1_generated_generator(llm_service)),
+        "H1-structured": lambda request: slides_routes.generate_h1_structured(
+            request, slides_routes.get_h1_structured_generator(llm_service)),
+        "H2-section": lambda request: slides_routes.generate_h2_section(
+            request, slides_routes.get_h2_section_generator(llm_service, image_service)),
+        "H3-closing": lambda request: slides_routes.generate_h3_closing(
+            request, slides_routes.get_h3_closing_generator(llm_service, image_service)),
+        "I1": iseries(slides_routes.generate_i1),
+        "I2": iseries(slides_routes.generate_i2),
+        "I3": iseries(slides_routes.generate_i3),
+        "I4": iseries(slides_routes.generate_i4),
+    }
+
+
+# Atomic type -> (request model, route handler)
+ATOMIC_HANDLERS: Dict[str, Tuple[Type[BaseModel], Callable]] = {
+    "METRICS": (atomic_models.MetricsAtomicRequest, atomic_routes.generate_metrics),
+    "SEQUENTIAL": (atomic_models.SequentialAtomicRequest, atomic_routes.generate_sequential),
+    "COMPARISON": (atomic_models.ComparisonAtomicRequest, atomic_routes.generate_comparison),
+    "SECTIONS": (atomic_models.SectionsAtomicRequest, atomic_routes.generate_sections),
+    "CALLOUT": (atomic_models.CalloutAtomicRequest, atomic_routes.generate_callout),
+    "TEXT_BULLETS": (atomic_models.TextBulletsAtomicRequest, atomic_routes.generate_text_bullets),
+    "BULLET_BOX": (atomic_models.BulletBoxAtomicRequest, atomic_routes.generate_bullet_box),
+    "TABLE": (atomic_models.TableAtomicRequest, atomic_routes.generate_table),
+    "NUMBERED_LIST": (atomic_models.NumberedListAtomicRequest, atomic_routes.generate_numbered_list),
+    "TEXT_BOX": (atomic_models.TextBoxAtomicRequest, atomic_routes.generate_text_box),
+}
+
+# Hero endpoint -> (route handler, generator factory)
+HERO_HANDLERS: Dict[str, Tuple[Callable, Callable]] = {
+    "title": (hero_routes.generate_title_slide, hero_routes.get_title_generator),
+    "section": (hero_routes.generate_section_divider, hero_routes.get_section_generator),
+    "closing": (hero_routes.generate_closing_slide, hero_routes.get_closing_generator),
+    "title-with-image": (
+        hero_routes.generate_title_slide_with_image, hero_routes.get_title_with_image_generator),
+    "section-with-image": (
+        hero_routes.generate_section_divider_with_image, hero_routes.get_section_with_image_generator),
+    "closing-with-image": (
+        hero_routes.generate_closing_slide_with_image, hero_routes.get_closing_with_image_generator),
+    "title-structured-with-image": (
+        hero_routes.generate_title_structured_with_image,
+        hero_routes.get_title_structured_with_image_generator),
+    "section-structured-with-image": (
+        hero_routes.generate_section_structured_with_image,
+        hero_routes.get_section_structured_with_image_generator),
+    "closing-structured-with-image": (
+        hero_routes.generate_closing_structured_with_image,
+        hero_routes.get_closing_structured_with_image_generator),
+}
+
+# Layout path -> (route handler name, generator factory name, request model,
+# factory takes the theme client)
+LAYOUT_HANDLERS: Dict[str, Tuple[str, str, Type[BaseModel], bool]] = {
+    "text/generate": ("generate_text", "get_text_generate_generator",
+                      layout_models.TextGenerateRequest, False),
+    "text/transform": ("transform_text", "get_text_transform_generator",
+                       layout_models.TextTransformRequest, False),
+    "text/autofit": ("autofit_text", "get_text_autofit_generator",
+                     layout_models.TextAutofitRequest, False),
+    "slide/title": ("generate_slide_title", "get_slide_text_generator",
+                    layout_models.SlideTextRequest, True),
+    "slide/subtitle": ("generate_slide_subtitle", "get_slide_text_generator",
+                       layout_models.SlideTextRequest, True),
+    "slide/title-slide": ("generate_title_slide", "get_title_slide_generator",
+                          layout_models.TitleSlideRequest, True),
+    "slide/section": ("generate_section_slide", "get_section_slide_generator",
+                      layout_models.SectionSlideRequest, True),
+    "slide/closing": ("generate_closing_slide", "get_closing_slide_generator",
+                      layout_models.ClosingSlideRequest, True),
+    "element/text": ("generate_text_element", "get_generic_text_generator",
+                     layout_models.GenericTextElementRequest, True),
+    "table/generate": ("generate_table", "get_table_generate_generator",
+                       layout_models.TableGenerateRequest, False),
+    "table/transform": ("transform_table", "get_table_transform_generator",
+                        layout_models.TableTransformRequest, False),
+    "table/analyze": ("analyze_table", "get_table_analyze_generator",
+                      layout_models.TableAnalyzeRequest, False),
+}
+
+
+def _layout_handler(path: str) -> SlideHandler:
+    handler_name, factory_name, _, needs_theme = LAYOUT_HANDLERS[path]
+
+    async def handler(request: BaseModel):
+        from . import layout_routes
+
+        factory = getattr(layout_routes, factory_name)
+        llm_service = layout_routes.get_async_llm_service()
+        generator = (
+            factory(llm_service, layout_routes.get_theme_client()) if needs_theme
+            else factory(llm_service)
+        )
+        return await getattr(layout_routes, handler_name)(request, generator)
+
+    return handler
+
+
+def resolve_slide_types(slide_types: List[str]) -> List[Optional[ResolvedSlideType]]:
+    """
+    Map each slide type to (family, request model, handler).
+
+    Generators and LLM services are created once for the whole list.
+
+    Returns:
+        One entry per slide type, None where the type is unknown
+    """
+    slides_handlers = _slides_handlers()
+    shared: Dict[str, Any] = {}
+
+    def atomic_generator():
+        if "atomic" not in shared:
+            shared["atomic"] = atomic_routes.get_atomic_generator(atomic_routes.get_async_llm_service())
+        return shared["atomic"]
+
+    def content_generator():
+        if "content" not in shared:
+            shared["content"] = v1_2_routes.get_generator()
+        return shared["content"]
+
+    resolved: List[Optional[ResolvedSlideType]] = []
+    for slide_type in slide_types:
+        family, _, name = slide_type.partition("/")
+        if slide_type == "content":
+            generator = content_generator()
+            resolved.append((
+                "content",
+                V1_2_GenerationRequest,
+                lambda request, generator=generator: v1_2_routes.generate_slide_content(request, generator)
+            ))
+        elif slide_type in slides_handlers:
+            resolved.append(("slides", UnifiedSlideRequest, slides_handlers[slide_type]))
+        elif family == "atomic" and name in ATOMIC_HANDLERS:
+            model, handler = ATOMIC_HANDLERS[name]
+            generator = atomic_generator()
+            resolved.append((
+                "atomic",
+                model,
+                lambda request, handler=handler, generator=generator: handler(request, generator)
+            ))
+        elif family == "hero" and name in HERO_HANDLERS:
+            handler, factory = HERO_HANDLERS[name]
+            resolved.append((
+                "hero",
+                HeroGenerationRequest,
+                lambda request, handler=handler, factory=factory: handler(
+                    request, factory(hero_routes.get_async_llm_service()))
+            ))
+        elif slide_type == "iseries":
+            resolved.append((
+                "iseries",
+                ISeriesGenerationRequest,
+                lambda request: iseries_routes.generate_iseries(
+                    request, iseries_routes.get_async_llm_service())
+            ))
+        elif family == "layout" and name in LAYOUT_HANDLERS:
+            resolved.append(("layout", LAYOUT_HANDLERS[name][2], _layout_handler(name)))
+        else:
+            resolved.append(None)
+
+    return resolved
+
+
+def request_model_for(slide_type: str) -> Optional[Type[BaseModel]]:
+    """Request model of a slide type, without creating its handler (None if unknown)."""
+    family, _, name = slide_type.partition("/")
+    if slide_type == "content":
+        return V1_2_GenerationRequest
+    if slide_type in SLIDES_LAYOUTS:
+        return UnifiedSlideRequest
+    if family == "atomic" and name in ATOMIC_HANDLERS:
+        return ATOMIC_HANDLERS[name][0]
+    if family == "hero" and name in HERO_HANDLERS:
+        return HeroGenerationRequest
+    if slide_type == "iseries":
+        return ISeriesGenerationRequest
+    if family == "layout" and name in LAYOUT_HANDLERS:
+        return LAYOUT_HANDLERS[name][2]
+    return None
+
+
+def image_prefetcher(slide_type: str, request: BaseModel) -> Optional[ImagePrefetcher]:
+    """
+    Generator that will produce this slide's image, for prefetching it.
+
+    Args:
+        slide_type: Slide type (see module docstring)
+        request: Validated request of the slide type's endpoint
+
+    Returns:
+        (generator, generator request), or None if the slide type has no
+        prefetchable image
+    """
+    family, _, name = slide_type.partition("/")
+    if family == "hero" and name in HERO_HANDLERS:
+        generator = HERO_HANDLERS[name][1](hero_routes.get_async_llm_service())
+    elif slide_type == "iseries":
+        generator = iseries_routes.get_generator(request.layout_type, iseries_routes.get_async_llm_service())
+    elif slide_type in ("I1", "I2", "I3", "I4"):
+        layout_type = ISeriesLayoutType(slide_type)
+        generator = slides_routes.get_iseries_generator(layout_type, slides_routes.get_llm_service())
+        request = slides_routes._convert_to_iseries_request(request, layout_type)
+    else:
+        return None
+
+    if not hasattr(generator, "prefetch_image"):
+        return None
+    return generator, request
+
+
+def supported_slide_types() -> List[str]:
+    """Every slide type resolve_slide_types accepts."""
+    return (
+        ["content"]
+        + list(SLIDES_LAYOUTS)
+        + [f"atomic/{name}" for name in ATOMIC_HANDLERS]
+        + [f"hero/{name}" for name in HERO_HANDLERS]
+        + ["iseries"]
+        + [f"layout/{path}" for path in LAYOUT_HANDLERS]
+    )
@@ -16,6 +16,7 @@ Endpoints:
     POST /v1.2/slides/H2-section    - Section divider slide
     POST /v1.2/slides/H3-closing    - Closing slide with contact
     POST /v1.2/slides/C1-text       - Content slide (combined gen)
+    POST /v1.2/slides/C1-text/stream - Content slide, streamed as SSE
     POST /v1.2/slides/I1-I4         - Image+text layouts
     POST /v1.2/slides/L29           - Alias for H1-generated
     POST /v1.2/slides/L25           - Alias for C1-text
@@ -28,7 +29,6 @@ Version: 1.2.2
 from fastapi import APIRouter, HTTPException, Depends, Response
 from typing import Dict, Any, Union, Optional
 import logging
-import os
 import time
 import json
 
@@ -60,10 +60,13 @@ from ..core.iseries import (
     I1Generator,
     I2Generator,
     I3Generator,
-    I4Generator
+    I4Generator,
+    load_iseries_variant_spec
 )
-from ..services import create_llm_callable_async, create_llm_callable_pooled
-from ..services.image_service_client import ImageServiceClient
+from ..core.generator_registry import get_generator_registry
+from ..services import create_llm_callable_for, create_llm_stream_for, use_llm_pool, QueueFullError
+from ..services.image_service_client import get_image_service_client
+from .sse import format_sse, format_sse_error, sse_response
 
 logger = logging.getLogger(__name__)
 
@@ -77,29 +80,37 @@ router = APIRouter(prefix="/v1.2/slides", tags=["slides"])
 
 def get_llm_service():
     """Get async LLM callable (pooled or direct based on config)."""
-    use_pool = os.getenv("USE_LLM_POOL", "true").lower() == "true"
-    if use_pool:
-        return create_llm_callable_pooled()
-    return create_llm_callable_async()
+    return create_llm_callable_for("slides")
 
 
 def get_image_service():
-    """Get image service client."""
-    return ImageServiceClient()
+    """Get the shared image service client."""
+    return get_image_service_client()
+
+
+def _shared_generator(generator_class, *args):
+    """
+    Get a process-wide generator instance from the generator registry.
+
+    Keyed by class and LLM mode so pooled/direct callables never mix.
+    """
+    mode = "pooled" if use_llm_pool() else "direct"
+    key = f"slides:{generator_class.__name__}:{mode}"
+    return get_generator_registry().get_or_create(key, lambda: generator_class(*args))
 
 
 def get_h1_generated_generator(
     llm_service=Depends(get_llm_service)
 ) -> H1GeneratedGenerator:
     """Get H1-generated generator with LLM service."""
-    return H1GeneratedGenerator(llm_service)
+    return _shared_generator(H1GeneratedGenerator, llm_service)
 
 
 def get_h1_structured_generator(
     llm_service=Depends(get_llm_service)
 ) -> H1StructuredGenerator:
     """Get H1-structured generator (no image needed)."""
-    return H1StructuredGenerator(llm_service)
+    return _shared_generator(H1StructuredGenerator, llm_service)
 
 
 def get_h2_section_generator(
@@ -107,7 +118,7 @@ def get_h2_section_generator(
     image_service=Depends(get_image_service)
 ) -> H2SectionGenerator:
     """Get H2-section generator with services."""
-    return H2SectionGenerator(llm_service, image_service)
+    return _shared_generator(H2SectionGenerator, llm_service, image_service)
 
 
 def get_h3_closing_generator(
@@ -115,14 +126,14 @@ def get_h3_closing_generator(
     image_service=Depends(get_image_service)
 ) -> H3ClosingGenerator:
     """Get H3-closing generator with services."""
-    return H3ClosingGenerator(llm_service, image_service)
+    return _shared_generator(H3ClosingGenerator, llm_service, image_service)
 
 
 def get_c1_text_generator(
     llm_service=Depends(get_llm_service)
 ) -> C1TextGenerator:
     """Get C1-text generator for combined generation."""
-    return C1TextGenerator(llm_service)
+    return _shared_generator(C1TextGenerator, llm_service)
 
 
 def get_iseries_generator(layout_type: ISeriesLayoutType, llm_service):
@@ -136,7 +147,7 @@ def get_iseries_generator(layout_type: ISeriesLayoutType, llm_service):
     generator_class = generators.get(layout_type)
     if not generator_class:
         raise ValueError(f"Unknown I-series layout type: {layout_type}")
-    return generator_class(llm_service)
+    return _shared_generator(generator_class, llm_service)
 
 
 # ---------------------------------------------------------
@@ -169,6 +180,9 @@ async def generate_h1_generated(
         print(f"[SLIDES] H1-generated completed in {elapsed}ms")
         return response
 
+    except QueueFullError:
+        raise
+
     except Exception as e:
         elapsed = int((time.time() - start) * 1000)
         print(f"[SLIDES] H1-generated failed after {elapsed}ms: {e}")
@@ -199,6 +213,9 @@ async def generate_h1_structured(
         print(f"[SLIDES] H1-structured completed in {elapsed}ms")
         return response
 
+    except QueueFullError:
+        raise
+
     except Exception as e:
         elapsed = int((time.time() - start) * 1000)
         print(f"[SLIDES] H1-structured failed after {elapsed}ms: {e}")
@@ -227,6 +244,9 @@ async def generate_h2_section(
         print(f"[SLIDES] H2-section completed in {elapsed}ms")
         return response
 
+    except QueueFullError:
+        raise
+
     except Exception as e:
         elapsed = int((time.time() - start) * 1000)
         print(f"[SLIDES] H2-section failed after {elapsed}ms: {e}")
@@ -256,6 +276,9 @@ async def generate_h3_closing(
         print(f"[SLIDES] H3-closing completed in {elapsed}ms")
         return response
 
+    except QueueFullError:
+        raise
+
     except Exception as e:
         elapsed = int((time.time() - start) * 1000)
         print(f"[SLIDES] H3-closing failed after {elapsed}ms: {e}")
@@ -296,12 +319,54 @@ async def generate_c1_text(
         print(f"[SLIDES] C1-text completed in {elapsed}ms (1 LLM call)")
         return response
 
+    except QueueFullError:
+        raise
+
     except Exception as e:
         elapsed = int((time.time() - start) * 1000)
         print(f"[SLIDES] C1-text failed after {elapsed}ms: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/C1-text/stream")
+async def generate_c1_text_stream(
+    request: UnifiedSlideRequest,
+    generator: C1TextGenerator = Depends(get_c1_text_generator)
+):
+    """
+    Streaming variant of C1-text (server-sent events).
+
+    Uses the single-call combined prompt with the provider's streaming API;
+    slide_title, subtitle and body are sent as each one completes.
+
+    Events:
+        field    - {field, value} for slide_title, subtitle, body
+        complete - the full ContentSlideResponse
+        error    - {status_code, detail}
+    """
+    start = time.time()
+    variant_id = request.variant_id or "bullets"
+    llm_stream = create_llm_stream_for("slides")
+    print(f"[SLIDES] POST /C1-text/stream slide={request.slide_number} variant={variant_id}")
+
+    async def frames():
+        try:
+            async for event in generator.generate_stream(request, llm_stream):
+                data = event["data"]
+                if event["event"] == "complete":
+                    elapsed = int((time.time() - start) * 1000)
+                    print(f"[SLIDES] C1-text stream completed in {elapsed}ms (1 LLM call)")
+                    data = data.model_dump()
+                yield format_sse(event["event"], data)
+
+        except Exception as e:
+            elapsed = int((time.time() - start) * 1000)
+            print(f"[SLIDES] C1-text stream failed after {elapsed}ms: {e}")
+            yield format_sse_error(e)
+
+    return sse_response(frames())
+
+
 # ---------------------------------------------------------
 # I-Series Endpoints
 # ---------------------------------------------------------
@@ -329,6 +394,9 @@ async def generate_i1(
         print(f"[SLIDES] I1 completed in {elapsed}ms")
         return enhanced
 
+    except QueueFullError:
+        raise
+
     except Exception as e:
         elapsed = int((time.time() - start) * 1000)
         print(f"[SLIDES] I1 failed after {elapsed}ms: {e}")
@@ -355,6 +423,9 @@ async def generate_i2(
         print(f"[SLIDES] I2 completed in {elapsed}ms")
         return enhanced
 
+    except QueueFullError:
+        raise
+
     except Exception as e:
         elapsed = int((time.time() - start) * 1000)
         print(f"[SLIDES] I2 failed after {elapsed}ms: {e}")
@@ -381,6 +452,9 @@ async def generate_i3(
         print(f"[SLIDES] I3 completed in {elapsed}ms")
         return enhanced
 
+    except QueueFullError:
+        raise
+
     except Exception as e:
         elapsed = int((time.time() - start) * 1000)
         print(f"[SLIDES] I3 failed after {elapsed}ms: {e}")
@@ -407,6 +481,9 @@ async def generate_i4(
         print(f"[SLIDES] I4 completed in {elapsed}ms")
         return enhanced
 
+    except QueueFullError:
+        raise
+
     except Exception as e:
         elapsed = int((time.time() - start) * 1000)
         print(f"[SLIDES] I4 failed after {elapsed}ms: {e}")
@@ -583,22 +660,11 @@ def _get_iseries_variant_spec(
 
     variant_id_full = f"{variant_base}{suffix}"
 
-    # Get base path - resolve relative to this file's location
-    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    spec_path = os.path.join(base_dir, "variant_specs", "iseries", f"{variant_id_full}.json")
-
-    # Load and return variant spec
-    try:
-        with open(spec_path) as f:
-            spec = json.load(f)
-            logger.info(f"[I-SERIES] Loaded variant spec: {variant_id_full}")
-            return spec
-    except FileNotFoundError:
-        logger.warning(f"[I-SERIES] Variant spec not found: {spec_path}")
-        return None
-    except Exception as e:
-        logger.warning(f"[I-SERIES] Failed to load variant spec {spec_path}: {e}")
-        return None
+    # Load from the shared I-series spec cache (preloaded at startup)
+    spec = load_iseries_variant_spec(variant_id_full)
+    if spec is not None:
+        logger.info(f"[I-SERIES] Loaded variant spec: {variant_id_full}")
+    return spec
 
 
 def _convert_to_iseries_request(
@@ -642,6 +708,7 @@ def _convert_to_iseries_request(
         content_style=request.content_style.value if hasattr(request, 'content_style') else "bullets",
         max_bullets=request.max_bullets,
         image_prompt_hint=request.image_prompt_hint,
+        image_deadline_ms=request.image_deadline_ms,
         context=context
     )
 
@@ -671,6 +738,7 @@ def _enhance_iseries_response(response: ISeriesGenerationResponse) -> ISeriesSli
         content_html=response.content_html,
         image_url=response.image_url,
         image_fallback=response.image_fallback,
+        image_job_id=response.image_job_id,
         slide_title=slide_title,
         subtitle=subtitle,
         body=response.content_html,  # Alias for content_html
@@ -0,0 +1,69 @@
+"""
+Server-Sent Events helpers for streaming endpoints.
+
+Streaming responses commit to a 200 status before generation starts, so
+failures are delivered in-band as an `error` event carrying the HTTP status
+the non-streaming endpoint would have returned.
+"""
+
+import asyncio
+import json
+from typing import Any, AsyncIterator, Optional, Tuple
+
+from fastapi.responses import StreamingResponse
+
+from ..services.llm_pool import QueueFullError
+
+# Disable proxy buffering so events reach the client as they are produced
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no"
+}
+
+
+def format_sse(event: str, data: Any) -> str:
+    """Format one SSE frame with a JSON payload."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+def describe_error(error: Exception) -> Tuple[int, str]:
+    """Map a generation exception to the (status, detail) /v1.2/generate would return."""
+    if isinstance(error, QueueFullError):
+        status, detail = 429, "Service at capacity. Please retry in 30 seconds."
+    elif isinstance(error, asyncio.TimeoutError):
+        status, detail = 504, "LLM request timed out. Please retry."
+    elif isinstance(error, FileNotFoundError):
+        status, detail = 404, f"Variant or template not found: {error}"
+    elif isinstance(error, ValueError):
+        status, detail = 400, str(error)
+    else:
+        status, detail = 500, f"Generation failed: {error}"
+    return status, detail
+
+
+def response_error(response: Any) -> Optional[str]:
+    """
+    Error detail of an endpoint response that reports failure in its body.
+
+    Atomic endpoints answer 200 with success=false (and an error) instead of
+    raising; callers that count outcomes must treat those as failures.
+
+    Returns:
+        The error detail, or None for a successful response
+    """
+    body = response.model_dump() if hasattr(response, "model_dump") else response
+    if isinstance(body, dict) and body.get("success") is False:
+        return body.get("error") or "Generation unsuccessful"
+    return None
+
+
+def format_sse_error(error: Exception) -> str:
+    """Format an exception as an `error` event with the equivalent HTTP status."""
+    status, detail = describe_error(error)
+    return format_sse("error", {"status_code": status, "detail": detail})
+
+
+def sse_response(frames: AsyncIterator[str]) -> StreamingResponse:
+    """Wrap an async iterator of formatted frames in a text/event-stream response."""
+    return StreamingResponse(frames, media_type="text/event-stream", headers=SSE_HEADERS)
@@ -5,6 +5,7 @@ This module defines the API endpoints for the v1.2 deterministic assembly archit
 
 Endpoints:
     POST /v1.2/generate - Generate slide content using element-based approach
+    POST /v1.2/generate/stream - Same, streamed as server-sent events
     GET /v1.2/variants - List all available variants
     GET /v1.2/variant/{variant_id} - Get details about a specific variant
 """
@@ -27,9 +28,10 @@ from ..models.v1_2_models import (
     ValidationResult,
     CharacterCountViolation
 )
-from ..core import ElementBasedContentGenerator
-from ..services import create_llm_callable_async, create_llm_callable_pooled, get_pool_metrics
+from ..core import ElementBasedContentGenerator, get_generator_registry
+from ..services import get_pool_metrics, create_llm_stream_for
 from ..services.llm_pool import QueueFullError
+from .sse import format_sse, format_sse_error, sse_response
 
 
 logger = logging.getLogger(__name__)
@@ -39,13 +41,14 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/v1.2", tags=["v1.2"])
 
 
-# Dependency to get or create generator instance with ASYNC LLM callable
+# Dependency to get the shared generator instance with ASYNC LLM callable
 def get_generator() -> ElementBasedContentGenerator:
     """
-    Get ElementBasedContentGenerator instance with async LLM service.
+    Get the process-wide ElementBasedContentGenerator from the generator registry.
 
     Uses pooled or direct async LLM service based on USE_LLM_POOL env variable.
-    Pooled version provides concurrency control and rate limiting.
+    Pooled version provides concurrency control and rate limiting. The instance
+    (and its variant spec and template caches) is shared across requests.
 
     Environment variables:
         USE_LLM_POOL: Set to "true" to use pooled version (default: true)
@@ -53,24 +56,70 @@ def get_generator() -> ElementBasedContentGenerator:
     Returns:
         ElementBasedContentGenerator instance with async LLM integration
     """
-    # Check if pooling is enabled (default: true for production)
-    use_pool = os.getenv("USE_LLM_POOL", "true").lower() == "true"
-
-    if use_pool:
-        # Use pooled callable with concurrency control and rate limiting
-        llm_callable = create_llm_callable_pooled()
-        print("[GEN-INIT] Using pooled LLM callable with concurrency control")
-    else:
-        # Use direct async callable (no pooling)
-        llm_callable = create_llm_callable_async()
-        print("[GEN-INIT] Using direct async LLM callable")
-
-    return ElementBasedContentGenerator(
-        llm_service=llm_callable,
-        variant_specs_dir="app/variant_specs",
-        templates_dir="app/templates",
-        enable_parallel=True,
-        max_workers=5
+    return get_generator_registry().get_content_generator()
+
+
+def _resolve_variant_id(
+    request: V1_2_GenerationRequest,
+    generator: ElementBasedContentGenerator
+) -> str:
+    """
+    Resolve the effective variant for the request's layout.
+
+    If layout_id is not L25 and a layout-specific variant
+    ("{variant_id}_{layout_id}") exists in the index, it is used instead.
+    """
+    base_variant_id = request.variant_id
+    layout_id = request.layout_id or "L25"
+
+    if layout_id != "L25":
+        layout_variant_id = f"{base_variant_id}_{layout_id.lower()}"
+        # Check if layout-specific variant exists in the index
+        variant_index = generator.prompt_builder.variant_index
+        if layout_variant_id in variant_index.get("variant_lookup", {}):
+            print(f"[GEN-LAYOUT] Resolved {base_variant_id} + {layout_id} -> {layout_variant_id}")
+            return layout_variant_id
+
+    return base_variant_id
+
+
+def _build_generation_response(
+    request: V1_2_GenerationRequest,
+    generator: ElementBasedContentGenerator,
+    result: dict,
+    variant_id: str
+) -> V1_2_GenerationResponse:
+    """Build the API response from a generator result (with optional validation)."""
+    # Validate character counts if requested
+    validation = None
+    if request.validate_character_counts:
+        validation_result = generator.validate_character_counts(
+            element_contents=result["elements"],
+            variant_id=variant_id
+        )
+
+        validation = ValidationResult(
+            valid=validation_result["valid"],
+            violations=[
+                CharacterCountViolation(**v)
+                for v in validation_result["violations"]
+            ]
+        )
+
+    # Convert elements to Pydantic models
+    elements = [
+        ElementContent(**elem)
+        for elem in result["elements"]
+    ]
+
+    return V1_2_GenerationResponse(
+        success=True,
+        html=result["html"],
+        elements=elements,
+        metadata=GenerationMetadata(**result["metadata"]),
+        validation=validation,
+        variant_id=result["variant_id"],
+        template_path=result["template_path"]
     )
 
 
@@ -102,21 +151,12 @@ async def generate_slide_content(
     start_time = time.time()
 
     # Extract request info for logging
-    base_variant_id = request.variant_id
     layout_id = request.layout_id or "L25"
     slide_title = ''
     if request.slide_spec and hasattr(request.slide_spec, 'slide_title'):
         slide_title = (request.slide_spec.slide_title or '')[:40]
 
-    # Layout-aware variant resolution: if layout_id is not L25, try layout-specific variant
-    effective_variant_id = base_variant_id
-    if layout_id != "L25":
-        layout_variant_id = f"{base_variant_id}_{layout_id.lower()}"
-        # Check if layout-specific variant exists in the index
-        variant_index = generator.prompt_builder.variant_index
-        if layout_variant_id in variant_index.get("variant_lookup", {}):
-            effective_variant_id = layout_variant_id
-            print(f"[GEN-LAYOUT] Resolved {base_variant_id} + {layout_id} -> {effective_variant_id}")
+    effective_variant_id = _resolve_variant_id(request, generator)
 
     # REQUEST ARRIVAL LOGGING
     print(f"[GEN-REQ] variant={effective_variant_id}, layout={layout_id}, title='{slide_title}'")
@@ -130,43 +170,12 @@ async def generate_slide_content(
             element_relationships=request.element_relationships
         )
 
-        # Validate character counts if requested
-        validation = None
-        if request.validate_character_counts:
-            validation_result = generator.validate_character_counts(
-                element_contents=result["elements"],
-                variant_id=effective_variant_id
-            )
-
-            validation = ValidationResult(
-                valid=validation_result["valid"],
-                violations=[
-                    CharacterCountViolation(**v)
-                    for v in validation_result["violations"]
-                ]
-            )
-
-        # Convert elements to Pydantic models
-        elements = [
-            ElementContent(**elem)
-            for elem in result["elements"]
-        ]
-
         # SUCCESS LOGGING
         elapsed_ms = int((time.time() - start_time) * 1000)
         html_len = len(result.get("html", ""))
         print(f"[GEN-OK] variant={effective_variant_id}, time={elapsed_ms}ms, html={html_len} chars")
 
-        # Build response
-        return V1_2_GenerationResponse(
-            success=True,
-            html=result["html"],
-            elements=elements,
-            metadata=GenerationMetadata(**result["metadata"]),
-            validation=validation,
-            variant_id=result["variant_id"],
-            template_path=result["template_path"]
-        )
+        return _build_generation_response(request, generator, result, effective_variant_id)
 
     except ValueError as e:
         # VALIDATION ERROR LOGGING
@@ -184,11 +193,7 @@ async def generate_slide_content(
         # QUEUE FULL ERROR - Service at capacity
         elapsed_ms = int((time.time() - start_time) * 1000)
         print(f"[GEN-429] variant={effective_variant_id}, time={elapsed_ms}ms, error=Queue full")
-        raise HTTPException(
-            status_code=429,
-            detail="Service at capacity. Please retry in 30 seconds.",
-            headers={"Retry-After": "30"}
-        )
+        raise
 
     except asyncio.TimeoutError:
         # LLM TIMEOUT ERROR
@@ -206,6 +211,59 @@ async def generate_slide_content(
         raise HTTPException(status_code=500, detail=f"Generation failed: {str(e)}")
 
 
+@router.post("/generate/stream")
+async def generate_slide_content_stream(
+    request: V1_2_GenerationRequest,
+    generator: ElementBasedContentGenerator = Depends(get_generator)
+):
+    """
+    Streaming variant of /v1.2/generate (server-sent events).
+
+    Makes the same single LLM call through the provider's streaming API and
+    parses the element map as it arrives, so the first element reaches the
+    client at roughly first-token latency instead of after the full response.
+
+    Events:
+        start    - {variant_id, template_path, element_ids}
+        element  - one ElementContent, as soon as its JSON is complete
+        complete - the full V1_2_GenerationResponse (assembled HTML)
+        error    - {status_code, detail} (same statuses as /v1.2/generate)
+    """
+    import time
+    start_time = time.time()
+    effective_variant_id = _resolve_variant_id(request, generator)
+    llm_stream = create_llm_stream_for("content")
+    print(f"[GEN-REQ] variant={effective_variant_id}, layout={request.layout_id or 'L25'}, stream=true")
+
+    async def frames():
+        try:
+            async for event in generator.generate_slide_content_stream(
+                variant_id=effective_variant_id,
+                slide_spec=request.slide_spec.model_dump(),
+                llm_stream=llm_stream,
+                presentation_spec=request.presentation_spec.model_dump() if request.presentation_spec else None,
+                element_relationships=request.element_relationships
+            ):
+                if event["event"] == "element":
+                    yield format_sse("element", ElementContent(**event["data"]).model_dump())
+                elif event["event"] == "complete":
+                    response = _build_generation_response(
+                        request, generator, event["data"], effective_variant_id
+                    )
+                    elapsed_ms = int((time.time() - start_time) * 1000)
+                    print(f"[GEN-OK] variant={effective_variant_id}, time={elapsed_ms}ms, stream=true")
+                    yield format_sse("complete", response.model_dump())
+                else:
+                    yield format_sse(event["event"], event["data"])
+
+        except Exception as e:
+            elapsed_ms = int((time.time() - start_time) * 1000)
+            print(f"[GEN-ERROR] variant={effective_variant_id}, time={elapsed_ms}ms, stream=true, error={str(e)[:100]}")
+            yield format_sse_error(e)
+
+    return sse_response(frames())
+
+
 @router.get("/variants", response_model=AvailableVariantsResponse)
 async def list_available_variants() -> AvailableVariantsResponse:
     """
@@ -215,10 +273,8 @@ async def list_available_variants() -> AvailableVariantsResponse:
         AvailableVariantsResponse with all variants grouped by type
     """
     try:
-        # Load variant index
-        index_path = Path("app/variant_specs/variant_index.json")
-        with open(index_path, 'r') as f:
-            variant_index = json.load(f)
+        # Variant index is loaded once by the shared prompt builder
+        variant_index = get_generator_registry().prompt_builder.variant_index
 
         # Transform into response format
         slide_types = {}
@@ -288,6 +344,7 @@ async def get_pool_health():
     - Active and queued requests
     - Request counts and success/failure rates
     - Average latency
+    - Per-endpoint-family breakdown (content, slides, hero, atomic, layout, iseries)
     - Pool configuration
 
     Use this endpoint to monitor service capacity and health.
@@ -303,3 +360,15 @@ async def get_pool_health():
         "status": status,
         "metrics": metrics
     }
+
+
+@router.get("/health/generators")
+async def get_generator_registry_health():
+    """
+    Get generator registry statistics.
+
+    Returns the registered generator instances and hit/miss counters for
+    the shared variant spec and template caches. A rising miss count in
+    steady state means generators are being rebuilt per request.
+    """
+    return get_generator_registry().get_stats()
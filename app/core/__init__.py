@@ -6,16 +6,31 @@ This package contains the core components for element-based content generation:
 - ContextBuilder: Builds slide and presentation context
 - TemplateAssembler: Loads and assembles HTML templates
 - ElementBasedContentGenerator: Main orchestrator for v1.2 workflow
+- GeneratorRegistry: Process-wide generator/assembler singletons
+- warm_up_caches: Startup preload of specs, templates and components
 """
 
 from .element_prompt_builder import ElementPromptBuilder
 from .context_builder import ContextBuilder
 from .template_assembler import TemplateAssembler
 from .element_based_generator import ElementBasedContentGenerator
+from .generator_registry import (
+    GeneratorRegistry,
+    init_generator_registry,
+    get_generator_registry,
+    reset_generator_registry
+)
+from .warmup import warm_up_caches, WarmupError
 
 __all__ = [
     "ElementPromptBuilder",
     "ContextBuilder",
     "TemplateAssembler",
     "ElementBasedContentGenerator",
+    "GeneratorRegistry",
+    "init_generator_registry",
+    "get_generator_registry",
+    "reset_generator_registry",
+    "warm_up_caches",
+    "WarmupError",
 ]
@@ -20,6 +20,7 @@ v1.1.0: Added count=1 support for all types + placeholder_mode
 v1.0.0: Initial atomic component endpoints
 """
 
+import asyncio
 import json
 import logging
 import time
@@ -29,6 +30,8 @@ from dataclasses import dataclass
 from copy import deepcopy
 
 from .registry import get_registry
+from ...services.llm_cache import invalidate_llm_response
+from ...services.llm_pool import QueueFullError
 from .constraints import (
     SpaceCalculator,
     CharacterLimitScaler,
@@ -468,6 +471,9 @@ class AtomicComponentGenerator:
                 metadata=metadata
             )
 
+        except (QueueFullError, asyncio.TimeoutError):
+            # Overload and timeouts are the route's to report (429 / 504)
+            raise
         except Exception as e:
             import traceback
             tb = traceback.format_exc()
@@ -960,6 +966,8 @@ Generate the content now:"""
 
             except (json.JSONDecodeError, ValueError) as e:
                 last_error = e
+                # Otherwise the retry would be served the same response from the cache
+                await invalidate_llm_response(self.llm_service, llm_prompt)
                 if attempt < MAX_RETRIES:
                     logger.warning(
                         f"[ATOMIC-LLM-RETRY] {component_type} attempt {attempt + 1} failed: {type(e).__name__}: {str(e)[:100]}... Retrying."
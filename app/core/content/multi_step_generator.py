@@ -26,6 +26,7 @@ from app.models.space_models import (
 from app.models.content_context import ContentContext, get_default_content_context
 from app.models.requests import ThemeConfig
 from app.models.slides_models import ContentSlideResponse
+from app.services.llm_pool import QueueFullError
 
 from .structure_analyzer import StructureAnalyzer
 from .space_calculator import SpaceCalculator
@@ -270,6 +271,9 @@ class MultiStepGenerator:
                 }
             )
 
+        except QueueFullError:
+            # Falling back would only resubmit to the full pool
+            raise
         except Exception as e:
             logger.error(f"Multi-step generation failed: {e}")
             # Fall back to simple generation
@@ -20,6 +20,7 @@ from app.models.space_models import (
     StructurePlan, SectionPlan, LayoutStructure
 )
 from app.models.content_context import ContentContext, get_default_content_context
+from app.services.llm_pool import QueueFullError
 
 logger = logging.getLogger(__name__)
 
@@ -158,6 +159,8 @@ class StructureAnalyzer:
             # Build StructurePlan
             return self._build_structure_plan(structure_data, content_context)
 
+        except QueueFullError:
+            raise
         except Exception as e:
             logger.error(f"Structure analysis failed: {e}")
             # Return fallback structure
@@ -81,6 +81,32 @@ Tone: {tone}
             current_slide_number: Current slide number
             total_slides: Total number of slides
 
+        Returns:
+            Formatted presentation context string
+        """
+        return self.build_shared_presentation_context(
+            presentation_title=presentation_title,
+            presentation_type=presentation_type,
+            industry=industry,
+            company=company
+        ) + self.build_slide_position_context(
+            prior_slides_summary=prior_slides_summary,
+            current_slide_number=current_slide_number,
+            total_slides=total_slides
+        )
+
+    def build_shared_presentation_context(
+        self,
+        presentation_title: str,
+        presentation_type: str,
+        industry: Optional[str] = None,
+        company: Optional[str] = None
+    ) -> str:
+        """
+        Build the presentation context shared by every slide of a deck.
+
+        Identical for all slides, so it belongs in the stable prompt prefix.
+
         Returns:
             Formatted presentation context string
         """
@@ -94,6 +120,24 @@ Presentation Type: {presentation_type}
         if company:
             context += f"Company: {company}\n"
 
+        return context
+
+    def build_slide_position_context(
+        self,
+        prior_slides_summary: Optional[str] = None,
+        current_slide_number: Optional[int] = None,
+        total_slides: Optional[int] = None
+    ) -> str:
+        """
+        Build the slide's place in the presentation (position, prior slides).
+
+        Differs per slide, so it belongs in the per-slide prompt suffix.
+
+        Returns:
+            Formatted position context string (empty when nothing is known)
+        """
+        context = ""
+
         if current_slide_number and total_slides:
             context += f"\nSlide Position: {current_slide_number} of {total_slides}\n"
 
@@ -166,7 +210,9 @@ Relationship to Other Elements:
             element_relationships: Optional dictionary mapping element_id to relationship description
 
         Returns:
-            Dictionary with "slide_context" and optional "presentation_context" keys
+            Dictionary with "slide_context" and, when presentation_spec is given,
+            "presentation_context" (shared by every slide of the deck) and
+            "slide_position_context" (this slide's position and prior slides)
         """
         # Build slide context
         slide_context = self.build_slide_context(
@@ -180,18 +226,20 @@ Relationship to Other Elements:
 
         result = {"slide_context": slide_context}
 
-        # Build presentation context if provided
+        # Build presentation context if provided, split into the part shared
+        # by the whole deck and the part specific to this slide
         if presentation_spec:
-            presentation_context = self.build_presentation_context(
+            result["presentation_context"] = self.build_shared_presentation_context(
                 presentation_title=presentation_spec["presentation_title"],
                 presentation_type=presentation_spec["presentation_type"],
                 industry=presentation_spec.get("industry"),
-                company=presentation_spec.get("company"),
+                company=presentation_spec.get("company")
+            )
+            result["slide_position_context"] = self.build_slide_position_context(
                 prior_slides_summary=presentation_spec.get("prior_slides_summary"),
                 current_slide_number=presentation_spec.get("current_slide_number"),
                 total_slides=presentation_spec.get("total_slides")
             )
-            result["presentation_context"] = presentation_context
 
         # Store element relationships for later use
         if element_relationships:
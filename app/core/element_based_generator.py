@@ -19,12 +19,19 @@ This ensures content coherence across elements and eliminates repetition.
 
 import json
 import asyncio
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, AsyncIterator, Callable, Tuple, Union
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from .element_prompt_builder import ElementPromptBuilder
 from .context_builder import ContextBuilder
 from .template_assembler import TemplateAssembler
+from .element_stream_parser import ElementStreamParser
+from ..services.llm_cache import invalidate_llm_response
+
+# Prompt packing defaults: variants whose maximum output is at most this many
+# characters are "small" and may share one LLM call with other small slides
+DEFAULT_PACK_MAX_OUTPUT_CHARS = 1400
+DEFAULT_MAX_PACK_SIZE = 4
 
 
 class ElementBasedContentGenerator:
@@ -40,7 +47,9 @@ class ElementBasedContentGenerator:
         variant_specs_dir: str = "app/variant_specs",
         templates_dir: str = "app/templates",
         enable_parallel: bool = True,
-        max_workers: int = 5
+        max_workers: int = 5,
+        prompt_builder: Optional[ElementPromptBuilder] = None,
+        template_assembler: Optional[TemplateAssembler] = None
     ):
         """
         Initialize the ElementBasedContentGenerator.
@@ -52,11 +61,15 @@ class ElementBasedContentGenerator:
             templates_dir: Directory containing HTML templates
             enable_parallel: Whether to generate elements in parallel
             max_workers: Maximum number of parallel workers
+            prompt_builder: Optional shared ElementPromptBuilder (spec cache is
+                        reused across generators when provided)
+            template_assembler: Optional shared TemplateAssembler (template cache
+                        is reused across generators when provided)
         """
         self.llm_service = llm_service
-        self.prompt_builder = ElementPromptBuilder(variant_specs_dir)
+        self.prompt_builder = prompt_builder or ElementPromptBuilder(variant_specs_dir)
         self.context_builder = ContextBuilder()
-        self.template_assembler = TemplateAssembler(templates_dir)
+        self.template_assembler = template_assembler or TemplateAssembler(templates_dir)
         self.enable_parallel = enable_parallel
         self.max_workers = max_workers
 
@@ -114,7 +127,8 @@ class ElementBasedContentGenerator:
         complete_prompt = self.prompt_builder.build_complete_slide_prompt(
             variant_id=variant_id,
             slide_context=contexts["slide_context"],
-            presentation_context=contexts.get("presentation_context")
+            presentation_context=contexts.get("presentation_context"),
+            slide_position_context=contexts.get("slide_position_context")
         )
 
         # Step 4: Generate content with ONE LLM call
@@ -195,22 +209,9 @@ class ElementBasedContentGenerator:
         if not self.llm_service:
             raise ValueError("LLM service not configured. Cannot generate content.")
 
-        # Step 1: Build contexts (sync operations)
-        contexts = self.context_builder.build_complete_context(
-            slide_spec=slide_spec,
-            presentation_spec=presentation_spec,
-            element_relationships=element_relationships
-        )
-
-        # Step 2: Get variant metadata and template path (sync operations)
-        variant_metadata = self.prompt_builder.get_variant_metadata(variant_id)
-        template_path = variant_metadata["template_path"]
-
-        # Step 3: Build COMPLETE slide prompt (all elements at once) (sync operation)
-        complete_prompt = self.prompt_builder.build_complete_slide_prompt(
-            variant_id=variant_id,
-            slide_context=contexts["slide_context"],
-            presentation_context=contexts.get("presentation_context")
+        # Steps 1-3: Build contexts and the COMPLETE slide prompt (sync operations)
+        complete_prompt, template_path = self._build_slide_prompt(
+            variant_id, slide_spec, presentation_spec, element_relationships
         )
 
         # STAGE LOGGING: Prompt built
@@ -226,26 +227,346 @@ class ElementBasedContentGenerator:
         print(f"[GEN-LLM] variant={variant_id}, response_len={len(llm_response)}, llm_time={llm_time}ms")
 
         # Step 5: Parse response into element contents (sync operation)
-        element_contents = self._parse_complete_response(
-            llm_response=llm_response,
-            variant_id=variant_id
+        try:
+            element_contents = self._parse_complete_response(
+                llm_response=llm_response,
+                variant_id=variant_id
+            )
+        except ValueError:
+            # Don't let a retry replay the rejected response from the cache
+            await invalidate_llm_response(self.llm_service, complete_prompt)
+            raise
+
+        # Steps 6-8: Assemble template and build result
+        result = self._assemble_result(
+            variant_id, template_path, element_contents, "single_call_async"
         )
 
-        # Step 6: Build content map for template assembly (sync operation)
+        # STAGE LOGGING: HTML assembled
+        total_time = int((time.time() - stage_start) * 1000)
+        print(f"[GEN-HTML] variant={variant_id}, html_len={len(result['html'])}, elements={len(element_contents)}, total_time={total_time}ms")
+
+        return result
+
+    async def generate_slide_content_stream(
+        self,
+        variant_id: str,
+        slide_spec: Dict[str, Any],
+        llm_stream: Callable[[str], AsyncIterator[str]],
+        presentation_spec: Optional[Dict[str, Any]] = None,
+        element_relationships: Optional[Dict[str, str]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Generate slide content with the same single call, streaming progress.
+
+        The LLM response is parsed incrementally: each element is emitted as
+        soon as its JSON value is complete, then the assembled slide.
+
+        Args:
+            variant_id: The variant identifier (e.g., "matrix_2x2")
+            slide_spec: Slide-level specifications (see generate_slide_content_async)
+            llm_stream: Callable that takes a prompt and returns an async
+                        iterator of response chunks (see create_llm_stream_for)
+            presentation_spec: Optional presentation-level context
+            element_relationships: Optional element relationship descriptions
+
+        Yields:
+            Event dictionaries {"event": name, "data": payload}:
+                - start: variant_id, template_path, element_ids
+                - element: one element content dictionary (as in "elements")
+                - complete: the generate_slide_content_async result
+
+        Raises:
+            ValueError: If variant_id is invalid or the response cannot be parsed
+        """
+        import time
+        stage_start = time.time()
+
+        complete_prompt, template_path = self._build_slide_prompt(
+            variant_id, slide_spec, presentation_spec, element_relationships
+        )
+        spec = self.prompt_builder.load_variant_spec(variant_id)
+        elements_by_id = {element["element_id"]: element for element in spec["elements"]}
+
+        yield {
+            "event": "start",
+            "data": {
+                "variant_id": variant_id,
+                "template_path": template_path,
+                "element_ids": list(elements_by_id)
+            }
+        }
+
+        parser = ElementStreamParser()
+        emitted = set()
+        first_element_ms = None
+
+        async for chunk in llm_stream(complete_prompt):
+            for element_id, element_data in parser.feed(chunk):
+                element = elements_by_id.get(element_id)
+                if element is None or element_id in emitted or not isinstance(element_data, dict):
+                    continue
+                try:
+                    element_content = self._build_element_content(element, element_data)
+                except ValueError:
+                    continue  # Reported by the full parse below
+                emitted.add(element_id)
+                if first_element_ms is None:
+                    first_element_ms = int((time.time() - stage_start) * 1000)
+                    print(f"[GEN-STREAM] variant={variant_id}, first_element={element_id}, time={first_element_ms}ms")
+                yield {"event": "element", "data": element_content}
+
+        # Full parse validates the complete response and recovers anything
+        # the incremental parser could not (e.g. non-JSON preamble quirks)
+        try:
+            element_contents = self._parse_complete_response(
+                llm_response=parser.text,
+                variant_id=variant_id
+            )
+        except ValueError:
+            # The stream was cached as it completed: don't replay it
+            await invalidate_llm_response(llm_stream, complete_prompt)
+            raise
+        for element_content in element_contents:
+            if element_content["element_id"] not in emitted:
+                yield {"event": "element", "data": element_content}
+
+        result = self._assemble_result(
+            variant_id, template_path, element_contents, "single_call_stream"
+        )
+
+        total_time = int((time.time() - stage_start) * 1000)
+        print(f"[GEN-HTML] variant={variant_id}, html_len={len(result['html'])}, elements={len(element_contents)}, total_time={total_time}ms (stream)")
+
+        yield {"event": "complete", "data": result}
+
+    def estimate_output_chars(self, variant_id: str) -> int:
+        """Upper bound on generated characters for a variant (sum of field maxima)."""
+        spec = self.prompt_builder.load_variant_spec(variant_id)
+        return sum(
+            element["character_requirements"][field]["max"]
+            for element in spec["elements"]
+            for field in element["required_fields"]
+        )
+
+    def is_packable(
+        self,
+        variant_id: str,
+        max_output_chars: int = DEFAULT_PACK_MAX_OUTPUT_CHARS
+    ) -> bool:
+        """Whether a variant's output is small enough to pack with other slides."""
+        return self.estimate_output_chars(variant_id) <= max_output_chars
+
+    async def generate_slides_packed_async(
+        self,
+        slides: List[Dict[str, Any]],
+        max_pack_size: int = DEFAULT_MAX_PACK_SIZE,
+        max_output_chars: int = DEFAULT_PACK_MAX_OUTPUT_CHARS
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Generate several slides, packing small ones into shared LLM calls.
+
+        Slides whose variant is packable (see is_packable) are grouped, in
+        order, up to max_pack_size per call. Each pack sends the slides'
+        complete prompts in one request and gets back one JSON object keyed
+        by slide; every slide is then validated against its own spec exactly
+        as in the single-call path. Slides missing or invalid in the packed
+        response, or in a pack whose call failed, are retried individually.
+        Other slides use generate_slide_content_async.
+
+        Args:
+            slides: Dictionaries with variant_id, slide_spec and optional
+                    presentation_spec / element_relationships
+            max_pack_size: Maximum slides per packed call
+            max_output_chars: Packability threshold (see is_packable)
+
+        Returns:
+            One entry per slide, in order: the generate_slide_content_async
+            result dict, or the exception that slide failed with
+        """
+        if not self.llm_service:
+            raise ValueError("LLM service not configured. Cannot generate content.")
+
+        results: List[Union[Dict[str, Any], Exception]] = [None] * len(slides)
+        prepared = {}
+        packs: List[List[int]] = [[]]
+        single = []
+
+        for index, slide in enumerate(slides):
+            try:
+                prompt, template_path = self._build_slide_prompt(
+                    slide["variant_id"],
+                    slide["slide_spec"],
+                    slide.get("presentation_spec"),
+                    slide.get("element_relationships")
+                )
+                packable = self.is_packable(slide["variant_id"], max_output_chars)
+            except Exception as e:
+                results[index] = e
+                continue
+
+            prepared[index] = (prompt, template_path)
+            if not packable:
+                single.append(index)
+                continue
+            if len(packs[-1]) >= max_pack_size:
+                packs.append([])
+            packs[-1].append(index)
+
+        # A "pack" of one is just a single call
+        for pack in packs:
+            if len(pack) == 1:
+                single.append(pack[0])
+        packs = [pack for pack in packs if len(pack) > 1]
+
+        async def run_single(index: int) -> None:
+            slide = slides[index]
+            try:
+                results[index] = await self.generate_slide_content_async(
+                    variant_id=slide["variant_id"],
+                    slide_spec=slide["slide_spec"],
+                    presentation_spec=slide.get("presentation_spec"),
+                    element_relationships=slide.get("element_relationships")
+                )
+            except Exception as e:
+                results[index] = e
+
+        async def run_pack(pack: List[int]) -> None:
+            failed = await self._generate_pack(pack, slides, prepared, results)
+            if failed:
+                print(f"[GEN-PACK] Falling back to single calls for {len(failed)}/{len(pack)} slides")
+                await asyncio.gather(*[run_single(index) for index in failed])
+
+        await asyncio.gather(
+            *[run_pack(pack) for pack in packs],
+            *[run_single(index) for index in single]
+        )
+        return results
+
+    async def _generate_pack(
+        self,
+        pack: List[int],
+        slides: List[Dict[str, Any]],
+        prepared: Dict[int, Tuple[str, str]],
+        results: List[Union[Dict[str, Any], Exception]]
+    ) -> List[int]:
+        """
+        Generate one pack with a single LLM call; fill results for the slides
+        that parsed and validated.
+
+        Returns:
+            Indices of slides that still need an individual call
+        """
+        import time
+        start = time.time()
+        keys = {index: f"slide_{position + 1}" for position, index in enumerate(pack)}
+
+        packed_prompt = (
+            f"Generate content for {len(pack)} independent presentation slides in ONE response.\n"
+            "Each slide below has its own instructions and its own JSON response format.\n\n"
+            "RESPONSE FORMAT:\n"
+            "Return a single JSON object keyed by slide id, where each value is exactly the "
+            "JSON object that slide's instructions ask for:\n"
+            "{" + ", ".join(f'"{key}": {{...}}' for key in keys.values()) + "}\n"
+            "Return ONLY valid JSON with no additional text.\n"
+        )
+        for index in pack:
+            packed_prompt += (
+                f"\n=== {keys[index]} ===\n"
+                f"{prepared[index][0]}"
+                f"=== end {keys[index]} ===\n"
+            )
+
+        try:
+            llm_response = await self.llm_service(packed_prompt)
+            try:
+                packed_data = json.loads(llm_response)
+            except json.JSONDecodeError:
+                packed_data = self._extract_json_from_response(llm_response)
+        except Exception as e:
+            print(f"[GEN-PACK] Packed call failed for {len(pack)} slides: {str(e)[:100]}")
+            await invalidate_llm_response(self.llm_service, packed_prompt)
+            return list(pack)
+
+        failed = []
+        for index in pack:
+            variant_id = slides[index]["variant_id"]
+            try:
+                element_contents = self._elements_from_data(packed_data.get(keys[index]), variant_id)
+                result = self._assemble_result(
+                    variant_id, prepared[index][1], element_contents, "packed"
+                )
+            except Exception as e:
+                print(f"[GEN-PACK] {keys[index]} ({variant_id}) invalid in packed response: {str(e)[:100]}")
+                failed.append(index)
+                continue
+            result["metadata"]["pack_size"] = len(pack)
+            results[index] = result
+
+        elapsed = int((time.time() - start) * 1000)
+        print(
+            f"[GEN-PACK] slides={len(pack)}, ok={len(pack) - len(failed)}, "
+            f"prompt_len={len(packed_prompt)}, time={elapsed}ms"
+        )
+        return failed
+
+    def _build_slide_prompt(
+        self,
+        variant_id: str,
+        slide_spec: Dict[str, Any],
+        presentation_spec: Optional[Dict[str, Any]],
+        element_relationships: Optional[Dict[str, str]]
+    ) -> Tuple[str, str]:
+        """
+        Build the complete single-call prompt for a slide.
+
+        Returns:
+            Tuple of (prompt, template_path)
+        """
+        # Step 1: Build contexts
+        contexts = self.context_builder.build_complete_context(
+            slide_spec=slide_spec,
+            presentation_spec=presentation_spec,
+            element_relationships=element_relationships
+        )
+
+        # Step 2: Get variant metadata and template path
+        variant_metadata = self.prompt_builder.get_variant_metadata(variant_id)
+        template_path = variant_metadata["template_path"]
+
+        # Step 3: Build COMPLETE slide prompt (all elements at once)
+        complete_prompt = self.prompt_builder.build_complete_slide_prompt(
+            variant_id=variant_id,
+            slide_context=contexts["slide_context"],
+            presentation_context=contexts.get("presentation_context"),
+            slide_position_context=contexts.get("slide_position_context")
+        )
+
+        return complete_prompt, template_path
+
+    def _assemble_result(
+        self,
+        variant_id: str,
+        template_path: str,
+        element_contents: List[Dict[str, Any]],
+        generation_mode: str
+    ) -> Dict[str, Any]:
+        """
+        Assemble parsed elements into the template and build the result dict.
+
+        Returns:
+            Dictionary with html, elements, metadata, variant_id, template_path
+        """
+        # Build content map for template assembly
         content_map = self._build_content_map(element_contents)
 
-        # Step 7: Assemble template (v1.2.2: pass variant_id for themed template selection)
+        # Assemble template (v1.2.2: pass variant_id for themed template selection)
         assembled_html = self.template_assembler.assemble_template(
             template_path=template_path,
             content_map=content_map,
             variant_id=variant_id
         )
 
-        # STAGE LOGGING: HTML assembled
-        total_time = int((time.time() - stage_start) * 1000)
-        print(f"[GEN-HTML] variant={variant_id}, html_len={len(assembled_html)}, elements={len(element_contents)}, total_time={total_time}ms")
-
-        # Step 8: Return result
         return {
             "html": assembled_html,
             "elements": element_contents,
@@ -253,7 +574,7 @@ class ElementBasedContentGenerator:
                 "variant_id": variant_id,
                 "template_path": template_path,
                 "element_count": len(element_contents),
-                "generation_mode": "single_call_async"
+                "generation_mode": generation_mode
             },
             "variant_id": variant_id,
             "template_path": template_path
@@ -287,6 +608,29 @@ class ElementBasedContentGenerator:
             # Try to extract JSON from response (handles markdown code blocks)
             all_elements_data = self._extract_json_from_response(llm_response)
 
+        return self._elements_from_data(all_elements_data, variant_id)
+
+    def _elements_from_data(
+        self,
+        all_elements_data: Dict[str, Any],
+        variant_id: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Validate parsed element data against the variant spec.
+
+        Args:
+            all_elements_data: Parsed JSON object keyed by element_id
+            variant_id: The variant identifier
+
+        Returns:
+            List of element content dictionaries in spec order
+
+        Raises:
+            ValueError: If an element or required field is missing
+        """
+        if not isinstance(all_elements_data, dict):
+            raise ValueError(f"Expected JSON object for {variant_id}, got {type(all_elements_data).__name__}")
+
         # Load variant spec to get element structure
         spec = self.prompt_builder.load_variant_spec(variant_id)
 
@@ -295,9 +639,6 @@ class ElementBasedContentGenerator:
 
         for element in spec["elements"]:
             element_id = element["element_id"]
-            element_type = element["element_type"]
-            required_fields = element["required_fields"]
-            placeholders = element["placeholders"]
 
             # Get this element's data from response
             if element_id not in all_elements_data:
@@ -306,30 +647,49 @@ class ElementBasedContentGenerator:
                     f"Expected elements: {[e['element_id'] for e in spec['elements']]}"
                 )
 
-            element_data = all_elements_data[element_id]
+            element_contents.append(
+                self._build_element_content(element, all_elements_data[element_id])
+            )
 
-            # Validate required fields are present
-            missing_fields = set(required_fields) - set(element_data.keys())
-            if missing_fields:
-                raise ValueError(
-                    f"Element {element_id} missing required fields: {missing_fields}"
-                )
+        return element_contents
 
-            # Build element content dictionary
-            element_content = {
-                "element_id": element_id,
-                "element_type": element_type,
-                "placeholders": placeholders,
-                "generated_content": element_data,
-                "character_counts": {
-                    field: len(str(value))
-                    for field, value in element_data.items()
-                }
-            }
+    def _build_element_content(
+        self,
+        element: Dict[str, Any],
+        element_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Build one element content dictionary from its spec and generated data.
 
-            element_contents.append(element_content)
+        Args:
+            element: Element entry from the variant spec
+            element_data: Generated fields for the element
 
-        return element_contents
+        Returns:
+            Element content dictionary
+
+        Raises:
+            ValueError: If required fields are missing
+        """
+        element_id = element["element_id"]
+
+        # Validate required fields are present
+        missing_fields = set(element["required_fields"]) - set(element_data.keys())
+        if missing_fields:
+            raise ValueError(
+                f"Element {element_id} missing required fields: {missing_fields}"
+            )
+
+        return {
+            "element_id": element_id,
+            "element_type": element["element_type"],
+            "placeholders": element["placeholders"],
+            "generated_content": element_data,
+            "character_counts": {
+                field: len(str(value))
+                for field, value in element_data.items()
+            }
+        }
 
     # =========================================================================
     # DEPRECATED METHODS (kept for backward compatibility)
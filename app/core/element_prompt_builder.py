@@ -14,6 +14,8 @@ import json
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
+from ..services.prompt_prefix import SplitPrompt
+
 
 class ElementPromptBuilder:
     """Builds targeted prompts for individual slide elements."""
@@ -28,6 +30,8 @@ class ElementPromptBuilder:
         self.variant_specs_dir = Path(variant_specs_dir)
         self.variant_index = self._load_variant_index()
         self._spec_cache: Dict[str, Dict] = {}
+        self._cache_hits = 0
+        self._cache_misses = 0
 
     def _load_variant_index(self) -> Dict:
         """Load the master variant index."""
@@ -56,8 +60,11 @@ class ElementPromptBuilder:
 
         # Check cache first
         if cache_key in self._spec_cache:
+            self._cache_hits += 1
             return self._spec_cache[cache_key]
 
+        self._cache_misses += 1
+
         # For non-L25 layouts, try layout-specific variant first
         effective_variant_id = variant_id
         if layout_id != "L25":
@@ -335,8 +342,9 @@ Example format:
         self,
         variant_id: str,
         slide_context: str,
-        presentation_context: Optional[str] = None
-    ) -> str:
+        presentation_context: Optional[str] = None,
+        slide_position_context: Optional[str] = None
+    ) -> SplitPrompt:
         """
         Build a single prompt for generating ALL elements of a slide at once.
 
@@ -344,26 +352,25 @@ Example format:
         Instead of generating each element separately, we ask the LLM to generate
         all elements together so they are contextually related and don't repeat.
 
+        The prompt is ordered stable-first so decks share a prefix: general
+        instructions, presentation context, then variant instructions and
+        response format. Only the slide context and slide position come
+        last, in the suffix. Providers with prefix/context caching reuse the
+        prefix across slides (see app/services/prompt_prefix.py).
+
         Args:
             variant_id: The variant identifier
             slide_context: Context about the current slide
-            presentation_context: Optional presentation context
+            presentation_context: Optional presentation context shared by the deck
+            slide_position_context: Optional slide position / prior slides context
 
         Returns:
-            Complete prompt string for generating all slide elements
+            SplitPrompt (a str) with .prefix and .suffix
         """
         spec = self.load_variant_spec(variant_id)
 
         # Build the prompt header
-        prompt = f"""Generate complete content for a presentation slide.
-
-VARIANT: {variant_id} ({spec['description']})
-SLIDE TYPE: {spec['slide_type']}
-TOTAL ELEMENTS: {len(spec['elements'])}
-
-SLIDE CONTEXT:
-{slide_context}
-"""
+        prompt = "Generate complete content for a presentation slide.\n"
 
         if presentation_context:
             prompt += f"""
@@ -371,7 +378,11 @@ PRESENTATION CONTEXT:
 {presentation_context}
 """
 
-        prompt += """
+        prompt += f"""
+VARIANT: {variant_id} ({spec['description']})
+SLIDE TYPE: {spec['slide_type']}
+TOTAL ELEMENTS: {len(spec['elements'])}
+
 IMPORTANT: Generate ALL elements together to ensure content coherence. Each element should cover a DIFFERENT aspect - avoid repetition or redundancy across elements.
 
 """
@@ -440,7 +451,58 @@ CRITICAL INSTRUCTIONS:
 5. Return ONLY valid JSON with no additional text
 """
 
-        return prompt
+        # Per-slide suffix
+        suffix = f"""
+SLIDE CONTEXT:
+{slide_context}
+"""
+        if slide_position_context:
+            suffix += f"""
+SLIDE POSITION:
+{slide_position_context.strip()}
+"""
+
+        return SplitPrompt(prompt, suffix)
+
+    def preload_all_specs(self) -> Dict[str, Any]:
+        """
+        Eagerly load every variant listed in variant_index.json (startup warm-up).
+
+        Returns:
+            Dictionary with "loaded" count, "specs" (variant_id -> spec) and
+            "missing" variant_ids whose spec file is listed in the index but
+            not present on disk
+
+        Raises:
+            json.JSONDecodeError: If a spec file is malformed
+        """
+        missing = []
+        for variant_id in self.variant_index["variant_lookup"]:
+            try:
+                self.load_variant_spec(variant_id)
+            except json.JSONDecodeError:
+                raise
+            except ValueError:
+                missing.append(variant_id)
+
+        return {
+            "loaded": len(self._spec_cache),
+            "specs": dict(self._spec_cache),
+            "missing": missing
+        }
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get statistics about the variant spec cache.
+
+        Returns:
+            Dictionary with cache statistics
+        """
+        return {
+            "cached_specs": len(self._spec_cache),
+            "cache_hits": self._cache_hits,
+            "cache_misses": self._cache_misses
+        }
 
     def get_variant_metadata(self, variant_id: str) -> Dict:
         """
@@ -0,0 +1,107 @@
+"""
+Incremental Parser for Streamed JSON Element Maps
+
+The single-call generators ask the LLM for one JSON object keyed by element
+(or field) id:
+
+    {"element_1": {...}, "element_2": {...}}
+
+ElementStreamParser is fed the response as it streams in and returns each
+top-level member as soon as its value is complete, so a streaming endpoint
+can forward element_1 while element_2 is still being generated.
+
+Text before the opening brace (e.g. a ```json fence) is skipped. Members
+that fail to parse are left for the caller's full-response parse at the end.
+
+Usage:
+    parser = ElementStreamParser()
+    async for chunk in llm_stream(prompt):
+        for key, value in parser.feed(chunk):
+            ...
+"""
+
+import json
+from typing import Any, List, Optional, Tuple
+
+
+class ElementStreamParser:
+    """Emits (key, value) for each completed top-level member of a JSON object."""
+
+    def __init__(self):
+        self._text = ""
+        self._pos = 0  # Next character to scan
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._member_start: Optional[int] = None
+        self._finished = False
+
+    @property
+    def text(self) -> str:
+        """Full response received so far."""
+        return self._text
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """
+        Consume a chunk of the response.
+
+        Args:
+            chunk: Next piece of streamed text
+
+        Returns:
+            Members completed by this chunk, in document order
+        """
+        self._text += chunk
+        completed = []
+        if self._finished:
+            return completed
+
+        text = self._text
+        while self._pos < len(text):
+            char = text[self._pos]
+
+            if self._depth == 0 and char != "{":
+                pass  # Preamble before the object (e.g. a code fence)
+
+            elif self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+
+            elif char == '"':
+                self._in_string = True
+                if self._depth == 1 and self._member_start is None:
+                    self._member_start = self._pos
+
+            elif char in "{[":
+                self._depth += 1
+
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._close_member(self._pos, completed)
+                    self._finished = True
+                    self._pos += 1
+                    break
+
+            elif char == "," and self._depth == 1:
+                self._close_member(self._pos, completed)
+
+            self._pos += 1
+
+        return completed
+
+    def _close_member(self, end: int, completed: List[Tuple[str, Any]]) -> None:
+        """Parse the member text that ends (exclusive) at end."""
+        if self._member_start is None:
+            return
+        member = self._text[self._member_start:end]
+        self._member_start = None
+        try:
+            parsed = json.loads("{" + member + "}")
+        except json.JSONDecodeError:
+            return
+        completed.extend(parsed.items())
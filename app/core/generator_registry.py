@@ -0,0 +1,200 @@
+"""
+Generator Registry for v1.2 Content Generation
+
+Process-wide registry of generator instances shared by every router and the
+async worker. Building an ElementBasedContentGenerator re-reads
+variant_index.json and starts with an empty template cache, so constructing
+one per request throws away all caching. The registry builds the shared
+ElementPromptBuilder and TemplateAssembler once and hands out long-lived
+generator instances on top of them.
+
+Usage:
+    # main.py lifespan()
+    registry = init_generator_registry()
+
+    # Route dependency
+    generator = get_generator_registry().get_content_generator()
+"""
+
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from .element_prompt_builder import ElementPromptBuilder
+from .template_assembler import TemplateAssembler
+from .element_based_generator import ElementBasedContentGenerator
+
+logger = logging.getLogger(__name__)
+
+
+class GeneratorRegistry:
+    """
+    Holds generator singletons shared across requests.
+
+    Features:
+    - One ElementPromptBuilder (variant spec cache) per process
+    - One TemplateAssembler (template cache) per process
+    - ElementBasedContentGenerator instances keyed by LLM mode (pooled/direct)
+    - Generic get_or_create() for other stateless generators
+    - Hit/miss counters for monitoring
+    """
+
+    def __init__(
+        self,
+        variant_specs_dir: str = "app/variant_specs",
+        templates_dir: str = "app/templates"
+    ):
+        """
+        Initialize the registry and the shared builder/assembler.
+
+        Args:
+            variant_specs_dir: Directory containing variant specifications
+            templates_dir: Directory containing HTML templates
+        """
+        self.variant_specs_dir = variant_specs_dir
+        self.templates_dir = templates_dir
+        self.prompt_builder = ElementPromptBuilder(variant_specs_dir)
+        self.template_assembler = TemplateAssembler(templates_dir)
+
+        self._instances: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get_or_create(self, key: str, factory: Callable[[], Any]) -> Any:
+        """
+        Return the instance registered under key, creating it on first use.
+
+        Args:
+            key: Registry key (e.g., "content:pooled", "slides:C1TextGenerator")
+            factory: Zero-argument callable that builds the instance
+
+        Returns:
+            Shared instance for key
+        """
+        instance = self._instances.get(key)
+        if instance is not None:
+            self._hits += 1
+            return instance
+
+        with self._lock:
+            instance = self._instances.get(key)
+            if instance is None:
+                self._misses += 1
+                instance = factory()
+                self._instances[key] = instance
+                logger.info(f"Registered generator instance: {key}")
+            else:
+                self._hits += 1
+        return instance
+
+    def get_content_generator(
+        self,
+        use_pool: Optional[bool] = None
+    ) -> ElementBasedContentGenerator:
+        """
+        Get the shared ElementBasedContentGenerator.
+
+        Args:
+            use_pool: Route LLM calls through the connection pool.
+                     Defaults to the USE_LLM_POOL env variable.
+
+        Returns:
+            ElementBasedContentGenerator sharing this registry's caches
+        """
+        if use_pool is None:
+            from ..services import use_llm_pool
+            use_pool = use_llm_pool()
+
+        key = "content:pooled" if use_pool else "content:direct"
+        return self.get_or_create(key, lambda: self._build_content_generator(use_pool))
+
+    def _build_content_generator(self, use_pool: bool) -> ElementBasedContentGenerator:
+        """Build a content generator on top of the shared builder/assembler."""
+        from ..services import create_llm_callable_async, create_llm_callable_pooled
+
+        if use_pool:
+            llm_callable = create_llm_callable_pooled("content")
+            print("[GEN-INIT] Using pooled LLM callable with concurrency control")
+        else:
+            llm_callable = create_llm_callable_async()
+            print("[GEN-INIT] Using direct async LLM callable")
+
+        return ElementBasedContentGenerator(
+            llm_service=llm_callable,
+            variant_specs_dir=self.variant_specs_dir,
+            templates_dir=self.templates_dir,
+            enable_parallel=True,
+            max_workers=5,
+            prompt_builder=self.prompt_builder,
+            template_assembler=self.template_assembler
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get registry and cache statistics.
+
+        Returns:
+            Dictionary with instance hit/miss counters and cache stats
+        """
+        template_stats = self.template_assembler.get_cache_stats()
+        return {
+            "instances": sorted(self._instances.keys()),
+            "instance_hits": self._hits,
+            "instance_misses": self._misses,
+            "variant_specs": self.prompt_builder.get_cache_stats(),
+            "templates": {
+                "cached_templates": template_stats["cached_templates"],
+                "cache_hits": template_stats["cache_hits"],
+                "cache_misses": template_stats["cache_misses"]
+            }
+        }
+
+    def clear(self):
+        """Drop all registered instances (caches on shared objects are kept)."""
+        with self._lock:
+            self._instances.clear()
+
+
+# Global registry instance (singleton pattern)
+_registry_instance: Optional[GeneratorRegistry] = None
+
+
+def init_generator_registry(
+    variant_specs_dir: str = "app/variant_specs",
+    templates_dir: str = "app/templates"
+) -> GeneratorRegistry:
+    """
+    Build the global registry (called from main.py lifespan on startup).
+
+    Args:
+        variant_specs_dir: Directory containing variant specifications
+        templates_dir: Directory containing HTML templates
+
+    Returns:
+        Global GeneratorRegistry instance
+    """
+    global _registry_instance
+    _registry_instance = GeneratorRegistry(variant_specs_dir, templates_dir)
+    logger.info("Generator registry initialized")
+    return _registry_instance
+
+
+def get_generator_registry() -> GeneratorRegistry:
+    """
+    Get the global registry, creating it lazily if lifespan did not run
+    (e.g., worker process or scripts).
+
+    Returns:
+        Global GeneratorRegistry instance
+    """
+    global _registry_instance
+    if _registry_instance is None:
+        _registry_instance = GeneratorRegistry()
+    return _registry_instance
+
+
+def reset_generator_registry():
+    """Reset the global registry instance (shutdown / testing)."""
+    global _registry_instance
+    _registry_instance = None
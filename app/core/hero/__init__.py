@@ -18,7 +18,8 @@ All generators inherit from BaseHeroGenerator and generate complete HTML structu
 from .base_hero_generator import (
     BaseHeroGenerator,
     HeroGenerationRequest,
-    HeroGenerationResponse
+    HeroGenerationResponse,
+    HeroImagePrefetchMixin
 )
 from .title_slide_generator import TitleSlideGenerator
 from .section_divider_generator import SectionDividerGenerator
@@ -38,6 +39,7 @@ __all__ = [
     "BaseHeroGenerator",
     "HeroGenerationRequest",
     "HeroGenerationResponse",
+    "HeroImagePrefetchMixin",
     "TitleSlideGenerator",
     "SectionDividerGenerator",
     "ClosingSlideGenerator",
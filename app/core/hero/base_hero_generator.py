@@ -12,11 +12,15 @@ Architecture:
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, Optional, Callable, Tuple
 from pydantic import BaseModel, Field
+import asyncio
 import re
 import logging
 
+from app.services.image_jobs import get_image_job_registry
+from app.services.image_prefetch import ImagePrefetchCache, get_image_prefetch_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -44,6 +48,13 @@ class HeroGenerationRequest(BaseModel):
         default=None,
         description="Global brand variables: target_demographic, visual_style, color_palette, lighting_mood"
     )
+    image_deadline_ms: Optional[int] = Field(
+        default=None,
+        ge=0,
+        description="With-image slides: return the gradient version if the image takes longer than this; "
+                    "the image continues as metadata.image_job_id (GET /v1.2/images/{job_id}). "
+                    "None uses IMAGE_DEADLINE_MS; 0 waits for the image."
+    )
 
 
 class HeroGenerationResponse(BaseModel):
@@ -293,3 +304,58 @@ class BaseHeroGenerator(ABC):
         except Exception as e:
             logger.error(f"Hero slide generation failed for {self.slide_type}: {e}")
             raise
+
+
+class HeroImagePrefetchMixin:
+    """
+    Deck image prefetch for hero generators with background images.
+
+    Requires _build_image_prompt(request) -> (prompt, archetype) and
+    _generate_image_with_retry(prompt, archetype, request). generate() calls
+    _generate_image_prefetched so a slide reuses the image a deck prefetch
+    already started for the same request, and _gather_image_and_content so
+    an image past request.image_deadline_ms does not hold the slide.
+    """
+
+    def image_prefetch_key(self, request: HeroGenerationRequest) -> str:
+        """Prefetch cache key of this generator's image for request."""
+        return ImagePrefetchCache.make_key(self.slide_type, request)
+
+    async def prefetch_image(self, request: HeroGenerationRequest) -> Dict[str, Any]:
+        """Build the image prompt and generate the image, ahead of the slide."""
+        image_prompt, archetype = self._build_image_prompt(request)
+        result = await self._generate_image_with_retry(image_prompt, archetype, request)
+        return {"prompt": image_prompt, "archetype": archetype, "result": result}
+
+    async def _generate_image_prefetched(
+        self,
+        prompt: str,
+        archetype: str,
+        request: HeroGenerationRequest
+    ) -> Dict[str, Any]:
+        """Image API response from a deck prefetch if one was started, else a new request."""
+        prefetch = get_image_prefetch_cache().get(self.image_prefetch_key(request))
+        if prefetch is not None:
+            return (await asyncio.shield(prefetch))["result"]
+        return await self._generate_image_with_retry(prompt, archetype, request)
+
+    async def _gather_image_and_content(
+        self,
+        image_task: asyncio.Future,
+        content_task: asyncio.Future,
+        request: HeroGenerationRequest
+    ) -> Tuple[Any, Any, Optional[str], bool]:
+        """
+        (image_result, content_result, image_job_id, fallback_to_gradient),
+        exceptions returned as results.
+
+        image_job_id is set, image_result None and fallback_to_gradient True
+        when the image missed the request's deadline and keeps running as an
+        image job; otherwise fallback_to_gradient is False.
+        """
+        image_result, content_result, image_job_id = await get_image_job_registry().gather(
+            image_task, content_task, request.image_deadline_ms
+        )
+        if image_job_id is not None:
+            logger.info(f"Image still generating, using gradient (image_job_id={image_job_id})")
+        return image_result, content_result, image_job_id, image_job_id is not None
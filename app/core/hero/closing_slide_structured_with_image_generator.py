@@ -33,12 +33,13 @@ import logging
 import re
 from typing import Dict, Any
 
-from .base_hero_generator import BaseHeroGenerator, HeroGenerationRequest
+from .base_hero_generator import BaseHeroGenerator, HeroGenerationRequest, HeroImagePrefetchMixin
 from .style_config import (
     get_style_config,
     get_domain_theme,
     get_image_model
 )
+from app.services.llm_cache import invalidate_llm_response
 from app.services.image_service_client import (
     get_image_service_client,
     ImageServiceClient,
@@ -48,7 +49,7 @@ from app.services.image_service_client import (
 logger = logging.getLogger(__name__)
 
 
-class ClosingSlideStructuredWithImageGenerator(BaseHeroGenerator):
+class ClosingSlideStructuredWithImageGenerator(HeroImagePrefetchMixin, BaseHeroGenerator):
     """
     Closing slide generator with structured fields and AI-generated background image.
 
@@ -381,6 +382,7 @@ Generate the JSON NOW:"""
             }
         except json.JSONDecodeError as e:
             logger.warning(f"Failed to parse LLM response as JSON: {e}")
+            await invalidate_llm_response(self.llm_service, prompt)
             return self._extract_structured_content(content, request)
 
     def _extract_structured_content(
@@ -439,30 +441,25 @@ Generate the JSON NOW:"""
 
             # Start both tasks in parallel
             image_task = asyncio.create_task(
-                self._generate_image_with_retry(image_prompt, archetype, request)
+                self._generate_image_prefetched(image_prompt, archetype, request)
             )
             content_task = asyncio.create_task(
                 self._generate_content(request)
             )
 
-            # Wait for both to complete
-            results = await asyncio.gather(
-                image_task,
-                content_task,
-                return_exceptions=True
+            # Wait for both; an image past request.image_deadline_ms continues as an image job
+            image_result, content_result, image_job_id, fallback_to_gradient = await self._gather_image_and_content(
+                image_task, content_task, request
             )
 
-            image_result = results[0]
-            content_result = results[1]
-
             # Check for content generation errors
             if isinstance(content_result, Exception):
                 logger.error(f"Content generation failed: {content_result}")
                 raise content_result
 
-            # Check for image generation errors (non-fatal)
+            # Check for image generation errors (non-fatal); fallback_to_gradient
+            # is already set if the image continues as image_job_id
             background_image = None
-            fallback_to_gradient = False
             image_metadata = {}
 
             if isinstance(image_result, Exception):
@@ -478,7 +475,7 @@ Generate the JSON NOW:"""
                     f"Image generated successfully in "
                     f"{image_metadata.get('generation_time_ms', 0)}ms"
                 )
-            else:
+            elif not fallback_to_gradient:
                 logger.warning("Image generation returned unsuccessful, using gradient fallback")
                 fallback_to_gradient = True
 
@@ -498,6 +495,7 @@ Generate the JSON NOW:"""
                     "image_generator": image_metadata.get("generator_used") or image_metadata.get("generator"),
                     "image_model": image_metadata.get("model"),
                     "fallback_to_gradient": fallback_to_gradient,
+                    "image_job_id": image_job_id,
                     "generation_mode": "structured_closing_with_image_async",
                     "layout_type": "H3-closing"
                 }
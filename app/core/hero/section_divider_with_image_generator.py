@@ -28,7 +28,7 @@ import re
 from typing import Dict, Any
 
 from .section_divider_generator import SectionDividerGenerator
-from .base_hero_generator import HeroGenerationRequest
+from .base_hero_generator import HeroGenerationRequest, HeroImagePrefetchMixin
 from .style_config import (
     get_style_config,
     get_domain_theme,
@@ -43,7 +43,7 @@ from app.services.image_service_client import (
 logger = logging.getLogger(__name__)
 
 
-class SectionDividerWithImageGenerator(SectionDividerGenerator):
+class SectionDividerWithImageGenerator(HeroImagePrefetchMixin, SectionDividerGenerator):
     """
     Section divider generator with AI-generated background images.
 
@@ -413,30 +413,25 @@ Generate the professional section divider HTML NOW:"""
 
             # Start both tasks in parallel
             image_task = asyncio.create_task(
-                self._generate_image_with_retry(image_prompt, archetype, request)
+                self._generate_image_prefetched(image_prompt, archetype, request)
             )
             content_task = asyncio.create_task(
                 self._generate_content(request)
             )
 
-            # Wait for both to complete
-            results = await asyncio.gather(
-                image_task,
-                content_task,
-                return_exceptions=True
+            # Wait for both; an image past request.image_deadline_ms continues as an image job
+            image_result, content_result, image_job_id, fallback_to_gradient = await self._gather_image_and_content(
+                image_task, content_task, request
             )
 
-            image_result = results[0]
-            content_result = results[1]
-
             # Check for content generation errors
             if isinstance(content_result, Exception):
                 logger.error(f"Content generation failed: {content_result}")
                 raise content_result
 
-            # Check for image generation errors (non-fatal)
+            # Check for image generation errors (non-fatal); fallback_to_gradient
+            # is already set if the image continues as image_job_id
             background_image = None
-            fallback_to_gradient = False
             image_metadata = {}
 
             if isinstance(image_result, Exception):
@@ -453,7 +448,7 @@ Generate the professional section divider HTML NOW:"""
                     f"Image generated successfully in "
                     f"{image_metadata.get('generation_time_ms', 0)}ms"
                 )
-            else:
+            elif not fallback_to_gradient:
                 logger.warning("Image generation returned unsuccessful, using dark background fallback")
                 fallback_to_gradient = True
 
@@ -471,6 +466,7 @@ Generate the professional section divider HTML NOW:"""
                     "background_image": background_image,
                     "image_generation_time_ms": image_metadata.get("generation_time_ms"),
                     "fallback_to_gradient": fallback_to_gradient,
+                    "image_job_id": image_job_id,
                     "validation": content_result.get("validation", {}),
                     "generation_mode": "hero_slide_with_image_async"
                 }
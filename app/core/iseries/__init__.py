@@ -17,7 +17,11 @@ Usage:
     result = await generator.generate(request)
 """
 
-from .base_iseries_generator import BaseISeriesGenerator
+from .base_iseries_generator import (
+    BaseISeriesGenerator,
+    load_iseries_variant_spec,
+    preload_iseries_variant_specs
+)
 from .i1_generator import I1Generator
 from .i2_generator import I2Generator
 from .i3_generator import I3Generator
@@ -29,4 +33,6 @@ __all__ = [
     "I2Generator",
     "I3Generator",
     "I4Generator",
+    "load_iseries_variant_spec",
+    "preload_iseries_variant_specs",
 ]
@@ -23,6 +23,12 @@ Version: 1.5.1 - Updated aspect ratios to use Gemini 2.5 Flash native ratios
               - I1: 11:18 → 2:3 (native, 8% crop)
               - I3: 1:3 → 9:16 (native, 41% crop)
               - I4: 7:18 → 9:16 (native, 31% crop)
+Version: 1.7.0 - Generation runs as a task DAG: content starts immediately while the
+              image branch (concept extraction → prompt → Image Builder) runs in
+              parallel; per-stage timings in metadata["stage_timings_ms"]
+Version: 1.8.0 - Image deadline (request.image_deadline_ms / IMAGE_DEADLINE_MS): a late
+              image no longer holds the slide; it is returned with the gradient
+              placeholder and an image_job_id for GET /v1.2/images/{job_id}
 """
 
 import asyncio
@@ -30,9 +36,10 @@ import json
 import logging
 import os
 import re
+import time
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, Any, Callable, Optional, List
+from typing import Dict, Any, Awaitable, Callable, Optional, List
 
 
 # =============================================================================
@@ -61,6 +68,9 @@ ISERIES_LAYOUT_SPECS = {
 }
 
 from app.services.image_service_client import get_image_service_client, ImageServiceClient
+from app.services.image_prefetch import ImagePrefetchCache, get_image_prefetch_cache
+from app.services.image_jobs import get_image_job_registry
+from app.services.llm_pool import QueueFullError
 from app.models.iseries_models import (
     ISeriesGenerationRequest,
     ISeriesGenerationResponse,
@@ -92,6 +102,9 @@ logger = logging.getLogger(__name__)
 # Path to variant specs directory
 VARIANT_SPECS_DIR = Path(__file__).parent.parent.parent / "variant_specs" / "iseries"
 
+# Parsed I-series specs keyed by variant_id (filled on first use or by startup warm-up)
+_iseries_spec_cache: Dict[str, Dict[str, Any]] = {}
+
 
 def load_iseries_variant_spec(variant_id: str) -> Optional[Dict[str, Any]]:
     """
@@ -103,6 +116,10 @@ def load_iseries_variant_spec(variant_id: str) -> Optional[Dict[str, Any]]:
     Returns:
         Variant spec dict or None if not found
     """
+    cached = _iseries_spec_cache.get(variant_id)
+    if cached is not None:
+        return cached
+
     spec_path = VARIANT_SPECS_DIR / f"{variant_id}.json"
     if not spec_path.exists():
         logger.warning(f"Variant spec not found: {spec_path}")
@@ -110,11 +127,46 @@ def load_iseries_variant_spec(variant_id: str) -> Optional[Dict[str, Any]]:
 
     try:
         with open(spec_path, 'r') as f:
-            return json.load(f)
+            spec = json.load(f)
     except Exception as e:
         logger.error(f"Failed to load variant spec {variant_id}: {e}")
         return None
 
+    _iseries_spec_cache[variant_id] = spec
+    return spec
+
+
+def preload_iseries_variant_specs() -> int:
+    """
+    Eagerly parse every I-series variant spec (startup warm-up).
+
+    Returns:
+        Number of cached I-series specs
+
+    Raises:
+        json.JSONDecodeError: If a spec file is malformed
+    """
+    for spec_path in sorted(VARIANT_SPECS_DIR.glob("*.json")):
+        with open(spec_path, 'r') as f:
+            _iseries_spec_cache[spec_path.stem] = json.load(f)
+    return len(_iseries_spec_cache)
+
+
+async def _timed_stage(timings: Dict[str, int], stage: str, awaitable: Awaitable[Any]) -> Any:
+    """Await one generation stage, recording its duration (also on failure)."""
+    start = time.perf_counter()
+    try:
+        return await awaitable
+    finally:
+        timings[stage] = int((time.perf_counter() - start) * 1000)
+
+
+def _critical_path(timings: Optional[Dict[str, int]]) -> Optional[str]:
+    """Which parallel branch ("image" or "content") bounded the slide's latency."""
+    if not timings or "image_branch_ms" not in timings or "content_ms" not in timings:
+        return None
+    return "image" if timings["image_branch_ms"] > timings["content_ms"] else "content"
+
 
 class BaseISeriesGenerator(ABC):
     """
@@ -178,7 +230,6 @@ class BaseISeriesGenerator(ABC):
         Returns:
             ISeriesGenerationResponse with HTML for each slot
         """
-        import time
         start_time = time.time()
 
         # Get hardcoded layout specifications
@@ -225,29 +276,36 @@ class BaseISeriesGenerator(ABC):
             f"variant={request.content_variant if hasattr(request, 'content_variant') else 'default'})"
         )
 
-        # v1.5.0: 2-step intentional spotlight image generation
-        # Step 1: Extract visual concept (WHAT to show)
-        # Step 2: Build prompt from concept (HOW to show it)
-        image_prompt, archetype, style_params = await self._build_image_prompt_2step(
-            request,
-            content_context=content_context
-        )
+        # Task DAG: content generation starts immediately; the image branch
+        # (concept extraction -> prompt -> Image Builder) runs alongside it,
+        # or waits on a deck prefetch that already started it.
+        stage_timings: Dict[str, int] = {}
+        image_branch: Dict[str, Any] = {}
+        skip_image = getattr(request, 'skip_image_generation', False)
+        prefetch = None if skip_image else get_image_prefetch_cache().get(self.image_prefetch_key(request))
 
-        # Parallel generation: image + multi-step content
-        # v1.6.0: Support skip_image_generation flag for testing
-        if getattr(request, 'skip_image_generation', False):
-            logger.info("Skipping image generation (skip_image_generation=True)")
-            image_task = asyncio.create_task(self._skip_image_task())
-        else:
+        if prefetch is not None:
             image_task = asyncio.create_task(
-                self._generate_image(
-                    image_prompt, archetype, request,
-                    aspect_ratio=image_spec["aspect_ratio"],
-                    style_params=style_params,  # v1.4.0: Pass style params
-                    image_model=image_model  # v1.5.0: Pass model for quality tier
-                )
+                _timed_stage(stage_timings, "image_branch_ms", self._await_prefetched_image(prefetch, image_branch))
             )
-        content_task = asyncio.create_task(
+        else:
+            # v1.6.0: skip_image_generation still builds the prompt (for debugging)
+            image_task = asyncio.create_task(_timed_stage(
+                stage_timings,
+                "image_branch_ms",
+                self._run_image_branch(
+                    request,
+                    content_context,
+                    image_spec["aspect_ratio"],
+                    image_model,  # v1.5.0: Pass model for quality tier
+                    stage_timings,
+                    image_branch,
+                    skip_image=skip_image
+                )
+            ))
+        content_task = asyncio.create_task(_timed_stage(
+            stage_timings,
+            "content_ms",
             self._generate_content_multi_step(
                 request,
                 content_dims["width_px"],
@@ -257,16 +315,15 @@ class BaseISeriesGenerator(ABC):
                 styling_mode,
                 variant_spec  # v1.3.2: Pass variant spec for character constraints
             )
-        )
+        ))
 
-        results = await asyncio.gather(
+        # An image that misses the deadline keeps running as an image job
+        image_result, content_result, image_job_id = await get_image_job_registry().gather(
             image_task,
             content_task,
-            return_exceptions=True
+            getattr(request, 'image_deadline_ms', None)
         )
-
-        image_result = results[0]
-        content_result = results[1]
+        image_prompt = image_branch.get("prompt")
 
         # Handle content result (fatal if fails)
         if isinstance(content_result, Exception):
@@ -279,7 +336,10 @@ class BaseISeriesGenerator(ABC):
         image_metadata = {}
         image_error = None  # v1.6.2: Capture error for debugging
 
-        if isinstance(image_result, Exception):
+        if image_job_id is not None:
+            logger.info(f"Image still generating, using placeholder (image_job_id={image_job_id})")
+            image_fallback = True
+        elif isinstance(image_result, Exception):
             image_error = str(image_result)
             logger.warning(
                 f"Image generation failed, using fallback: {image_result}"
@@ -317,16 +377,111 @@ class BaseISeriesGenerator(ABC):
             request=request,
             generation_time_ms=generation_time_ms,
             image_prompt=image_prompt,  # v1.6.1: For debugging
-            image_error=image_error  # v1.6.2: For debugging fallback issues
+            image_error=image_error,  # v1.6.2: For debugging fallback issues
+            stage_timings=stage_timings,
+            image_prefetched=prefetch is not None,
+            image_job_id=image_job_id
         )
 
         logger.info(
             f"{self.layout_type} layout generated in {generation_time_ms}ms "
-            f"(image_fallback={image_fallback})"
+            f"(image_fallback={image_fallback}, stages={stage_timings})"
         )
 
         return response
 
+    def image_prefetch_key(self, request: ISeriesGenerationRequest) -> str:
+        """Prefetch cache key of this layout's image for request."""
+        return ImagePrefetchCache.make_key(self.layout_type, request)
+
+    async def prefetch_image(self, request: ISeriesGenerationRequest) -> Dict[str, Any]:
+        """
+        Run the image branch ahead of the slide.
+
+        Returns:
+            {"prompt", "archetype", "result"} as awaited by generate() on a prefetch hit
+        """
+        layout_spec = ISERIES_LAYOUT_SPECS.get(self.layout_type, ISERIES_LAYOUT_SPECS["I1"])
+        context = request.context or {}
+        image_branch: Dict[str, Any] = {}
+        result = await self._run_image_branch(
+            request,
+            context.get("content_context"),
+            layout_spec["image"]["aspect_ratio"],
+            context.get("image_model"),
+            {},
+            image_branch
+        )
+        return {**image_branch, "result": result}
+
+    async def _run_image_branch(
+        self,
+        request: ISeriesGenerationRequest,
+        content_context: Optional[Dict[str, Any]],
+        aspect_ratio: str,
+        image_model: Optional[str],
+        stage_timings: Dict[str, int],
+        image_branch: Dict[str, Any],
+        skip_image: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Image branch of the generation DAG: concept extraction -> prompt -> Image Builder.
+
+        The built prompt and archetype are recorded in image_branch as soon as
+        they exist, so they are reported even if the image request fails.
+
+        Args:
+            request: Generation request
+            content_context: Optional dict with audience/purpose info
+            aspect_ratio: Per-layout image aspect ratio
+            image_model: Imagen model from the Director (quality tier)
+            stage_timings: Receives image_prompt_ms and image_generation_ms
+            image_branch: Receives "prompt" and "archetype"
+            skip_image: Build the prompt but skip the Image Builder call
+
+        Returns:
+            Image API response dict
+        """
+        # v1.5.0: 2-step intentional spotlight image generation
+        # Step 1: Extract visual concept (WHAT to show)
+        # Step 2: Build prompt from concept (HOW to show it)
+        image_prompt, archetype, style_params = await _timed_stage(
+            stage_timings,
+            "image_prompt_ms",
+            self._build_image_prompt_2step(request, content_context=content_context)
+        )
+        image_branch["prompt"], image_branch["archetype"] = image_prompt, archetype
+
+        if skip_image:
+            logger.info("Skipping image generation (skip_image_generation=True)")
+            return await self._skip_image_task()
+
+        return await _timed_stage(
+            stage_timings,
+            "image_generation_ms",
+            self._generate_image(
+                image_prompt, archetype, request,
+                aspect_ratio=aspect_ratio,
+                style_params=style_params,  # v1.4.0: Pass style params
+                image_model=image_model
+            )
+        )
+
+    async def _await_prefetched_image(
+        self,
+        prefetch: asyncio.Future,
+        image_branch: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Wait for a deck prefetch (shielded: this request may be cancelled, the prefetch not).
+
+        Records the prefetch's prompt and archetype in image_branch and
+        returns its Image API response, like _run_image_branch.
+        """
+        prefetched = await asyncio.shield(prefetch)
+        image_branch["prompt"], image_branch["archetype"] = prefetched["prompt"], prefetched["archetype"]
+        return prefetched["result"]
+
     def _build_image_prompt_legacy(
         self,
         request: ISeriesGenerationRequest,
@@ -1015,6 +1170,9 @@ Generate the content HTML now:"""
                     theme_config=theme_config,
                     content_context=content_context
                 )
+            except QueueFullError:
+                # Falling back would only resubmit to the full pool
+                raise
             except Exception as e:
                 logger.warning(f"Template-based generation failed: {e}. Falling back to multi-step.")
 
@@ -1086,6 +1244,8 @@ Generate the content HTML now:"""
                 "metadata": multi_step_metadata
             }
 
+        except QueueFullError:
+            raise
         except Exception as e:
             logger.error(f"Multi-step content generation failed: {e}")
             # Fall back to single-step generation
@@ -1115,7 +1275,7 @@ Generate the content HTML now:"""
         Returns:
             Dict with rich styled HTML content, validation, and metadata
         """
-        from app.core.template_assembler import TemplateAssembler
+        from app.core.generator_registry import get_generator_registry
         from app.models.requests import ThemeConfig
 
         template_path = variant_spec.get("template_path")
@@ -1140,8 +1300,8 @@ Generate the content HTML now:"""
             variant_spec=variant_spec
         )
 
-        # Assemble template with content
-        assembler = TemplateAssembler()
+        # Assemble template with content (shared assembler keeps template cache warm)
+        assembler = get_generator_registry().template_assembler
 
         # Parse theme_config if provided
         parsed_theme = None
@@ -1404,7 +1564,10 @@ Generate the JSON object now:"""
         request: ISeriesGenerationRequest,
         generation_time_ms: int,
         image_prompt: Optional[str] = None,  # v1.6.1: For debugging
-        image_error: Optional[str] = None  # v1.6.2: For debugging fallback issues
+        image_error: Optional[str] = None,  # v1.6.2: For debugging fallback issues
+        stage_timings: Optional[Dict[str, int]] = None,
+        image_prefetched: bool = False,
+        image_job_id: Optional[str] = None
     ) -> ISeriesGenerationResponse:
         """
         Build final response with all slot HTML.
@@ -1417,6 +1580,9 @@ Generate the JSON object now:"""
             generation_time_ms: Total generation time
             image_prompt: The actual prompt sent to Image Service (for debugging)
             image_error: Error message if image generation failed (for debugging)
+            stage_timings: Per-stage durations of the generation DAG
+            image_prefetched: Whether the image came from a deck prefetch
+            image_job_id: Image job still generating the image (deadline exceeded)
 
         Returns:
             ISeriesGenerationResponse
@@ -1457,7 +1623,13 @@ Generate the JSON object now:"""
             "image_prompt": image_prompt,
             "topics": list(request.topics) if request.topics else None,
             # v1.6.2: Include image error for debugging fallback issues
-            "image_error": image_error
+            "image_error": image_error,
+            # Generation DAG: image_prompt_ms + image_generation_ms make up
+            # image_branch_ms, which runs in parallel with content_ms
+            "stage_timings_ms": stage_timings or {},
+            "critical_path": _critical_path(stage_timings),
+            "image_prefetched": image_prefetched,
+            "image_job_id": image_job_id
         }
 
         # Per SLIDE_GENERATION_INPUT_SPEC.md: I-series uses background_color #ffffff
@@ -1468,6 +1640,7 @@ Generate the JSON object now:"""
             content_html=content_html,
             image_url=image_url,
             image_fallback=image_fallback,
+            image_job_id=image_job_id,
             background_color="#ffffff",  # Default per SPEC
             metadata=metadata
         )
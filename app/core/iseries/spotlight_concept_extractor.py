@@ -26,6 +26,7 @@ from app.models.iseries_models import (
     SpotlightDepth
 )
 from app.core.iseries.context_style_mapper import detect_domain_from_text
+from app.services.llm_cache import invalidate_llm_response
 
 logger = logging.getLogger(__name__)
 
@@ -503,6 +504,7 @@ async def extract_concept_llm(
 
     except json.JSONDecodeError as e:
         logger.warning(f"LLM response JSON parse failed: {e}. Response: {text[:200]}...")
+        await invalidate_llm_response(llm_service, prompt)
         # Fall back to rule-based
         return extract_concept_rule_based(
             narrative, topics, domain, audience_type, purpose_type, spotlight_depth
@@ -15,6 +15,8 @@ from dataclasses import dataclass
 from enum import Enum
 from functools import wraps
 
+from app.services.llm_client import gemini_generate_content, use_gemini_native_async
+
 # Provider SDKs
 # v3.3 Security Update: Using Vertex AI SDK (google-cloud-aiplatform) instead of
 # the old google-generativeai SDK. Vertex AI provides secure ADC authentication.
@@ -205,7 +207,11 @@ class GeminiClient(BaseLLMClient):
 
             # Create Gemini model instance
             self.client = GenerativeModel(self.model)
-            logger.info(f"Initialized Gemini model: {self.model}")
+            self.native_async = use_gemini_native_async(self.client)
+            logger.info(
+                f"Initialized Gemini model: {self.model} "
+                f"({'native async' if self.native_async else 'thread pool'})"
+            )
 
         except Exception as e:
             logger.error(f"Failed to initialize Vertex AI: {e}")
@@ -228,10 +234,13 @@ class GeminiClient(BaseLLMClient):
                 max_output_tokens=self.max_tokens,
             )
 
-            # Generate content
-            response = self.client.generate_content(
+            # Generate content without blocking the event loop (native async,
+            # or the shared Gemini thread pool)
+            response = await gemini_generate_content(
+                self.client,
                 prompt,
-                generation_config=generation_config
+                generation_config,
+                native_async=self.native_async
             )
 
             latency_ms = (time.time() - start_time) * 1000
@@ -18,9 +18,11 @@ Version: 1.3.1
 import json
 import logging
 import time
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, AsyncIterator, Optional, Callable
 
 from .base_slide_generator import BaseSlideGenerator
+from ..element_stream_parser import ElementStreamParser
+from ...services.llm_pool import QueueFullError
 from ...models.slides_models import (
     UnifiedSlideRequest,
     ContentSlideResponse,
@@ -354,6 +356,9 @@ Return ONLY the JSON object. Do NOT include ```json markers."""
 
             return response
 
+        except QueueFullError:
+            # Falling back would only resubmit to the full pool
+            raise
         except Exception as e:
             elapsed = int((time.time() - start_time) * 1000)
             logger.error(f"[C1-text] Multi-step generation failed after {elapsed}ms: {e}")
@@ -395,62 +400,134 @@ Return ONLY the JSON object. Do NOT include ```json markers."""
             # Parse JSON response
             parsed = self._parse_json_response(raw_response)
 
-            # Extract fields
-            slide_title = parsed.get("slide_title", "")
-            subtitle = parsed.get("subtitle")
-            body = parsed.get("body", "")
-
-            # Use override title if provided
-            if request.slide_title:
-                slide_title = request.slide_title
-
-            # Validate body content
-            if body:
-                validation = self._validate_html_security(body)
-                if not validation["valid"]:
-                    logger.warning(f"[C1-text] Body validation warnings: {validation['violations']}")
-                    # Don't fail, just log
-
-            # Build metadata
-            metadata = self._build_metadata(
-                request=request,
-                start_time=start_time,
-                extra={
-                    "llm_calls": 1,
-                    "generation_mode": "single_step",
-                    "variant_id": variant_id,
-                    "variant_description": variant_config.get("description"),
-                    "content_style": request.content_style.value,
-                    "title_length": len(slide_title),
-                    "subtitle_length": len(subtitle) if subtitle else 0,
-                    "body_length": len(body),
-                    "multi_step": {"enabled": False}
-                }
-            )
-
-            # Build response
-            # Per SLIDE_GENERATION_INPUT_SPEC.md: C1-text uses background_color #ffffff
-            response = ContentSlideResponse(
-                slide_title=slide_title,
-                subtitle=subtitle,
-                body=body,
-                rich_content=body,  # L25 alias
-                background_color="#ffffff",  # Default per SPEC
-                metadata=metadata
-            )
-
-            logger.info(
-                f"[C1-text] Single-step completed variant={variant_id} in {metadata['generation_time_ms']}ms "
-                f"(title={len(slide_title)}, body={len(body)} chars)"
+            return self._build_single_step_response(
+                request, parsed, variant_config, start_time, "single_step"
             )
 
-            return response
-
         except Exception as e:
             elapsed = int((time.time() - start_time) * 1000)
             logger.error(f"[C1-text] Single-step generation failed after {elapsed}ms: {e}")
             raise
 
+    def _build_single_step_response(
+        self,
+        request: UnifiedSlideRequest,
+        parsed: Dict[str, Any],
+        variant_config: Dict[str, Any],
+        start_time: float,
+        generation_mode: str
+    ) -> ContentSlideResponse:
+        """
+        Build the response for a combined (title + subtitle + body) generation.
+
+        Args:
+            request: Unified slide request
+            parsed: Parsed LLM JSON with slide_title, subtitle, body
+            variant_config: Configuration for the target variant
+            start_time: Generation start time (from time.time())
+            generation_mode: Metadata generation_mode value
+
+        Returns:
+            ContentSlideResponse with structured fields
+        """
+        variant_id = variant_config.get("variant_id", "bullets")
+
+        # Extract fields
+        slide_title = parsed.get("slide_title", "")
+        subtitle = parsed.get("subtitle")
+        body = parsed.get("body", "")
+
+        # Use override title if provided
+        if request.slide_title:
+            slide_title = request.slide_title
+
+        # Validate body content
+        if body:
+            validation = self._validate_html_security(body)
+            if not validation["valid"]:
+                logger.warning(f"[C1-text] Body validation warnings: {validation['violations']}")
+                # Don't fail, just log
+
+        # Build metadata
+        metadata = self._build_metadata(
+            request=request,
+            start_time=start_time,
+            extra={
+                "llm_calls": 1,
+                "generation_mode": generation_mode,
+                "variant_id": variant_id,
+                "variant_description": variant_config.get("description"),
+                "content_style": request.content_style.value,
+                "title_length": len(slide_title),
+                "subtitle_length": len(subtitle) if subtitle else 0,
+                "body_length": len(body),
+                "multi_step": {"enabled": False}
+            }
+        )
+
+        # Build response
+        # Per SLIDE_GENERATION_INPUT_SPEC.md: C1-text uses background_color #ffffff
+        response = ContentSlideResponse(
+            slide_title=slide_title,
+            subtitle=subtitle,
+            body=body,
+            rich_content=body,  # L25 alias
+            background_color="#ffffff",  # Default per SPEC
+            metadata=metadata
+        )
+
+        logger.info(
+            f"[C1-text] {generation_mode} completed variant={variant_id} in {metadata['generation_time_ms']}ms "
+            f"(title={len(slide_title)}, body={len(body)} chars)"
+        )
+
+        return response
+
+    async def generate_stream(
+        self,
+        request: UnifiedSlideRequest,
+        llm_stream: Callable[[str], AsyncIterator[str]]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream a content slide: each field as soon as it is generated.
+
+        Streaming uses the single-step combined prompt (one LLM call whose
+        JSON fields arrive in order), since the multi-step pipeline only
+        produces the body after its second call.
+
+        Args:
+            request: Unified slide request
+            llm_stream: Callable that takes a prompt and returns an async
+                        iterator of response chunks (see create_llm_stream_for)
+
+        Yields:
+            Event dictionaries {"event": name, "data": payload}:
+                - field: {"field": "slide_title" | "subtitle" | "body", "value": str}
+                - complete: ContentSlideResponse
+        """
+        start_time = time.time()
+        variant_config = self._get_variant_config(request.variant_id or "bullets")
+        prompt = self._build_combined_prompt(request, variant_config)
+
+        logger.info(f"[C1-text] Streaming generation for variant={variant_config['variant_id']}")
+
+        parser = ElementStreamParser()
+        async for chunk in llm_stream(prompt):
+            for field, value in parser.feed(chunk):
+                if field not in ("slide_title", "subtitle", "body"):
+                    continue
+                if field == "slide_title" and request.slide_title:
+                    value = request.slide_title
+                yield {"event": "field", "data": {"field": field, "value": value}}
+
+        parsed = self._parse_json_response(parser.text)
+        yield {
+            "event": "complete",
+            "data": self._build_single_step_response(
+                request, parsed, variant_config, start_time, "single_step_stream"
+            )
+        }
+
     @classmethod
     def get_supported_variants(cls) -> Dict[str, Any]:
         """
@@ -10,10 +10,12 @@ Architecture:
 
 v1.2.1: Added theme override support for Theme Service integration.
 v1.2.2: Added CSS variable themed template support (Phase 1).
+v1.2.3: Templates are compiled once into literal/slot segments so assembly
+        is a single join instead of one full-string replace per placeholder.
 """
 
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import Dict, FrozenSet, List, Optional, Any
 import re
 import logging
 
@@ -21,6 +23,50 @@ from app.core.theme.theming_config import get_theming_settings
 
 logger = logging.getLogger(__name__)
 
+# Match only valid placeholder names: letters, numbers, underscores
+# This prevents matching CSS curly braces like { color: #xxx; }
+PLACEHOLDER_PATTERN = re.compile(r'\{([a-z_][a-z0-9_]*)\}', re.IGNORECASE)
+
+
+class CompiledTemplate:
+    """
+    Template pre-split into literal chunks and placeholder slots.
+
+    segments alternates literal text and placeholder names:
+    [literal, name, literal, name, ..., literal], so literals sit at even
+    indexes and slots at odd indexes.
+    """
+
+    __slots__ = ("segments", "slot_names", "placeholders")
+
+    def __init__(self, template_html: str):
+        self.segments: List[str] = PLACEHOLDER_PATTERN.split(template_html)
+        self.slot_names: List[str] = self.segments[1::2]
+        self.placeholders: FrozenSet[str] = frozenset(self.slot_names)
+
+    def render(self, content_map: Dict[str, str]) -> str:
+        """
+        Render the template in a single pass.
+
+        Args:
+            content_map: Dictionary mapping placeholder names to content values
+
+        Returns:
+            Assembled HTML
+
+        Raises:
+            ValueError: If required placeholders are missing
+        """
+        missing = self.placeholders.difference(content_map)
+        if missing:
+            raise ValueError(
+                f"Missing content for placeholders: {', '.join(sorted(missing))}"
+            )
+
+        parts = self.segments.copy()
+        parts[1::2] = [content_map[name] for name in self.slot_names]
+        return ''.join(parts)
+
 
 class TemplateAssembler:
     """Loads and assembles HTML templates with generated content."""
@@ -34,6 +80,9 @@ class TemplateAssembler:
         """
         self.templates_dir = Path(templates_dir)
         self._template_cache: Dict[str, str] = {}
+        self._compiled_cache: Dict[str, CompiledTemplate] = {}
+        self._cache_hits = 0
+        self._cache_misses = 0
         self._theming_settings = get_theming_settings()
 
     def get_themed_template_path(
@@ -83,6 +132,20 @@ class TemplateAssembler:
         )
         return template_path
 
+    def _resolve_template_path(self, template_path: str, variant_id: Optional[str] = None) -> str:
+        """Normalize template_path and apply themed template selection."""
+        # Normalize template_path (remove base directory if it's included)
+        # This handles cases where variant specs include "app/templates/" in path
+        template_path_str = str(template_path)
+        base_dir_str = str(self.templates_dir) + "/"
+        if template_path_str.startswith(base_dir_str):
+            template_path = template_path_str[len(base_dir_str):]
+        elif template_path_str.startswith("app/templates/"):
+            template_path = template_path_str[len("app/templates/"):]
+
+        # Check for themed template (v1.2.2 CSS variable theming)
+        return self.get_themed_template_path(template_path, variant_id)
+
     def load_template(self, template_path: str, variant_id: Optional[str] = None) -> str:
         """
         Load an HTML template from file.
@@ -97,22 +160,18 @@ class TemplateAssembler:
         Raises:
             FileNotFoundError: If template file doesn't exist
         """
-        # Normalize template_path (remove base directory if it's included)
-        # This handles cases where variant specs include "app/templates/" in path
-        template_path_str = str(template_path)
-        base_dir_str = str(self.templates_dir) + "/"
-        if template_path_str.startswith(base_dir_str):
-            template_path = template_path_str[len(base_dir_str):]
-        elif template_path_str.startswith("app/templates/"):
-            template_path = template_path_str[len("app/templates/"):]
-
-        # Check for themed template (v1.2.2 CSS variable theming)
-        actual_template_path = self.get_themed_template_path(template_path, variant_id)
+        actual_template_path = self._resolve_template_path(template_path, variant_id)
+        return self._load_resolved(actual_template_path)
 
+    def _load_resolved(self, actual_template_path: str) -> str:
+        """Load a template by its resolved path, using the cache."""
         # Check cache first (using actual path for cache key)
         if actual_template_path in self._template_cache:
+            self._cache_hits += 1
             return self._template_cache[actual_template_path]
 
+        self._cache_misses += 1
+
         # Load from file
         full_path = self.templates_dir / actual_template_path
 
@@ -127,6 +186,36 @@ class TemplateAssembler:
 
         return template_html
 
+    def load_compiled_template(
+        self,
+        template_path: str,
+        variant_id: Optional[str] = None
+    ) -> CompiledTemplate:
+        """
+        Load a template compiled into literal/slot segments (v1.2.3).
+
+        Compilation happens once per resolved template path; later calls
+        return the cached CompiledTemplate.
+
+        Args:
+            template_path: Relative path to template
+            variant_id: Optional variant identifier for themed template selection
+
+        Returns:
+            CompiledTemplate for the resolved template
+
+        Raises:
+            FileNotFoundError: If template file doesn't exist
+        """
+        actual_template_path = self._resolve_template_path(template_path, variant_id)
+        compiled = self._compiled_cache.get(actual_template_path)
+        if compiled is None:
+            compiled = CompiledTemplate(self._load_resolved(actual_template_path))
+            self._compiled_cache[actual_template_path] = compiled
+        else:
+            self._cache_hits += 1
+        return compiled
+
     def assemble_template(
         self,
         template_path: str,
@@ -148,30 +237,9 @@ class TemplateAssembler:
         Raises:
             ValueError: If required placeholders are missing
         """
-        # Load template (will use themed version if enabled for variant)
-        template_html = self.load_template(template_path, variant_id)
-
-        # Find all placeholders in template
-        # Match only valid placeholder names: letters, numbers, underscores
-        # This prevents matching CSS curly braces like { color: #xxx; }
-        placeholder_pattern = r'\{([a-z_][a-z0-9_]*)\}'
-        placeholders = set(re.findall(placeholder_pattern, template_html, re.IGNORECASE))
-
-        # Check for missing placeholders
-        missing = placeholders - set(content_map.keys())
-        if missing:
-            raise ValueError(
-                f"Missing content for placeholders: {', '.join(sorted(missing))}"
-            )
-
-        # Replace placeholders
-        assembled_html = template_html
-        for placeholder, content in content_map.items():
-            # Escape the placeholder for regex
-            placeholder_pattern = '{' + placeholder + '}'
-            assembled_html = assembled_html.replace(placeholder_pattern, content)
-
-        return assembled_html
+        # Load compiled template (will use themed version if enabled for variant)
+        compiled = self.load_compiled_template(template_path, variant_id)
+        return compiled.render(content_map)
 
     def get_template_placeholders(self, template_path: str) -> set:
         """
@@ -183,12 +251,7 @@ class TemplateAssembler:
         Returns:
             Set of placeholder names found in template
         """
-        template_html = self.load_template(template_path)
-        # Match only valid placeholder names: letters, numbers, underscores
-        # This prevents matching CSS curly braces like { color: #xxx; }
-        placeholder_pattern = r'\{([a-z_][a-z0-9_]*)\}'
-        placeholders = set(re.findall(placeholder_pattern, template_html, re.IGNORECASE))
-        return placeholders
+        return set(self.load_compiled_template(template_path).placeholders)
 
     def validate_content_map(
         self,
@@ -214,8 +277,11 @@ class TemplateAssembler:
         }
 
     def clear_cache(self):
-        """Clear the template cache."""
+        """Clear the template caches and reset hit/miss counters."""
         self._template_cache.clear()
+        self._compiled_cache.clear()
+        self._cache_hits = 0
+        self._cache_misses = 0
 
     def get_cache_stats(self) -> Dict:
         """
@@ -226,6 +292,9 @@ class TemplateAssembler:
         """
         return {
             "cached_templates": len(self._template_cache),
+            "compiled_templates": len(self._compiled_cache),
+            "cache_hits": self._cache_hits,
+            "cache_misses": self._cache_misses,
             "template_paths": sorted(self._template_cache.keys())
         }
 
@@ -0,0 +1,185 @@
+"""
+Startup Warm-up for v1.2 Content Generation
+
+Eagerly loads every variant spec, HTML template and component definition
+into the shared in-memory caches before the service accepts traffic, so the
+first request per variant after a deploy does not pay file I/O and JSON
+parsing on the hot path.
+
+Fails fast (raises WarmupError) on malformed specs, specs whose template is
+missing, and component files that do not parse. Index entries pointing at
+spec files that do not exist are reported as warnings, matching the lazy
+loaders which already treat them as "variant not found".
+
+Usage:
+    # main.py lifespan()
+    registry = init_generator_registry()
+    report = warm_up_caches(registry)
+"""
+
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .generator_registry import GeneratorRegistry, get_generator_registry
+
+logger = logging.getLogger(__name__)
+
+# Keys every element-based variant spec must define
+REQUIRED_SPEC_KEYS = ("variant_id", "template_path", "elements")
+
+
+class WarmupError(RuntimeError):
+    """Raised when startup warm-up finds malformed specs/templates/components."""
+    pass
+
+
+def _elapsed_ms(start: float) -> float:
+    return round((time.perf_counter() - start) * 1000, 1)
+
+
+def _warm_variant_specs(registry: GeneratorRegistry, errors: List[str]) -> Dict[str, Any]:
+    """Load all element-based and I-series variant specs."""
+    from .iseries.base_iseries_generator import preload_iseries_variant_specs
+
+    start = time.perf_counter()
+    builder = registry.prompt_builder
+
+    try:
+        result = builder.preload_all_specs()
+    except json.JSONDecodeError as e:
+        errors.append(f"variant_specs: malformed JSON ({e})")
+        result = {"loaded": 0, "specs": {}, "missing": []}
+
+    for variant_id in result["missing"]:
+        logger.warning(f"[WARMUP] Variant listed in index but spec file missing: {variant_id}")
+
+    for variant_id, spec in result["specs"].items():
+        missing_keys = [key for key in REQUIRED_SPEC_KEYS if key not in spec]
+        if missing_keys:
+            errors.append(f"variant_specs: {variant_id} missing keys {missing_keys}")
+
+    try:
+        iseries_count = preload_iseries_variant_specs()
+    except json.JSONDecodeError as e:
+        errors.append(f"variant_specs/iseries: malformed JSON ({e})")
+        iseries_count = 0
+
+    return {
+        "directory": str(builder.variant_specs_dir),
+        "files_loaded": result["loaded"] + iseries_count,
+        "element_specs": result["loaded"],
+        "iseries_specs": iseries_count,
+        "missing_from_index": result["missing"],
+        "elapsed_ms": _elapsed_ms(start),
+        "_specs": result["specs"]
+    }
+
+
+def _warm_templates(
+    registry: GeneratorRegistry,
+    specs: Dict[str, Dict],
+    errors: List[str]
+) -> Dict[str, Any]:
+    """Compile every HTML template and check each spec's template resolves."""
+    start = time.perf_counter()
+    assembler = registry.template_assembler
+    templates_dir = assembler.templates_dir
+
+    template_count = 0
+    for path in sorted(templates_dir.rglob("*.html")):
+        assembler.load_compiled_template(str(path.relative_to(templates_dir)))
+        template_count += 1
+
+    for variant_id, spec in specs.items():
+        template_path = spec.get("template_path")
+        if not template_path:
+            continue
+        try:
+            assembler.load_compiled_template(template_path, variant_id)
+        except FileNotFoundError as e:
+            errors.append(f"templates: {variant_id} -> {e}")
+
+    return {
+        "directory": str(templates_dir),
+        "files_loaded": template_count,
+        "elapsed_ms": _elapsed_ms(start)
+    }
+
+
+def _warm_components(errors: List[str]) -> Dict[str, Any]:
+    """Load the component registry and verify every component file parsed."""
+    from .components.registry import get_registry
+
+    start = time.perf_counter()
+    component_registry = get_registry()
+
+    # ComponentRegistry logs and skips bad files; surface them here instead
+    components_dir = Path(component_registry.components_dir)
+    component_files = [
+        f for f in sorted(components_dir.glob("*.json"))
+        if f.name != "component_index.json"
+    ]
+    for json_file in component_files:
+        try:
+            with open(json_file, "r") as f:
+                json.load(f)
+        except json.JSONDecodeError as e:
+            errors.append(f"components: {json_file.name} malformed JSON ({e})")
+
+    if component_registry.component_count < len(component_files):
+        errors.append(
+            f"components: only {component_registry.component_count} of "
+            f"{len(component_files)} component files loaded"
+        )
+
+    return {
+        "directory": str(components_dir),
+        "files_loaded": component_registry.component_count,
+        "elapsed_ms": _elapsed_ms(start)
+    }
+
+
+def warm_up_caches(registry: Optional[GeneratorRegistry] = None) -> Dict[str, Any]:
+    """
+    Preload variant specs, templates and components into memory.
+
+    Args:
+        registry: Generator registry whose caches to fill (default: global)
+
+    Returns:
+        Dictionary with per-directory load counts and timings
+
+    Raises:
+        WarmupError: If any spec, template or component is malformed
+    """
+    registry = registry or get_generator_registry()
+    start = time.perf_counter()
+    errors: List[str] = []
+
+    variant_specs = _warm_variant_specs(registry, errors)
+    specs = variant_specs.pop("_specs")
+    report = {
+        "variant_specs": variant_specs,
+        "templates": _warm_templates(registry, specs, errors),
+        "components": _warm_components(errors),
+    }
+    report["total_elapsed_ms"] = _elapsed_ms(start)
+
+    for name in ("variant_specs", "templates", "components"):
+        section = report[name]
+        logger.info(
+            f"[WARMUP] {name}: {section['files_loaded']} loaded "
+            f"in {section['elapsed_ms']}ms ({section['directory']})"
+        )
+
+    if errors:
+        for error in errors:
+            logger.error(f"[WARMUP] {error}")
+        raise WarmupError(
+            f"Startup warm-up failed with {len(errors)} error(s): {errors[0]}"
+        )
+
+    return report
@@ -0,0 +1,122 @@
+"""
+Pydantic Models for v1.2 Deck (Batch) Generation API
+
+A deck request carries heterogeneous slide requests, each in the body format
+of its single-slide endpoint, plus presentation context shared by all slides.
+"""
+
+from pydantic import BaseModel, Field
+from typing import Optional, List, Dict, Any
+
+from .v1_2_models import PresentationSpecification
+
+
+class DeckSlideRequest(BaseModel):
+    """One slide in a deck request."""
+
+    slide_type: str = Field(
+        ...,
+        description=(
+            "Target endpoint: 'content' (/v1.2/generate), a /v1.2/slides layout "
+            "(C1-text, H1-generated, H1-structured, H2-section, H3-closing, I1-I4, "
+            "L25, L29), 'atomic/<TYPE>' (e.g. 'atomic/METRICS'), 'hero/<endpoint>' "
+            "(e.g. 'hero/title-with-image'), 'iseries' or 'layout/<path>' "
+            "(e.g. 'layout/table/generate')"
+        )
+    )
+    request: Dict[str, Any] = Field(
+        ...,
+        description="Request body for the target endpoint"
+    )
+
+
+class DeckGenerationRequest(BaseModel):
+    """Request model for POST /v1.2/deck/generate."""
+
+    slides: List[DeckSlideRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=50,
+        description="Slides in presentation order"
+    )
+    presentation_spec: Optional[PresentationSpecification] = Field(
+        None,
+        description=(
+            "Presentation context shared by every slide (slide-level values win). "
+            "current_slide_number/total_slides are filled per slide."
+        )
+    )
+    theme_config: Optional[Dict[str, Any]] = Field(
+        None,
+        description="Theme configuration applied to /v1.2/slides, hero and iseries requests that omit it"
+    )
+    content_context: Optional[Dict[str, Any]] = Field(
+        None,
+        description="Content context applied to /v1.2/slides, hero, iseries and layout requests that omit it"
+    )
+    max_concurrency: Optional[int] = Field(
+        None,
+        ge=1,
+        le=50,
+        description="Slides generated at once (default: DECK_MAX_CONCURRENCY)"
+    )
+    stream: bool = Field(
+        default=False,
+        description="Stream each slide as a server-sent event as soon as it finishes"
+    )
+    pack_content_slides: bool = Field(
+        default=False,
+        description=(
+            "Pack small 'content' slides into shared LLM calls (several slides per "
+            "prompt); slides that fail in a pack are retried individually"
+        )
+    )
+
+
+class DeckSlideResult(BaseModel):
+    """Outcome of one slide in a deck."""
+
+    index: int = Field(..., description="Position in the request's slides list")
+    slide_type: str = Field(..., description="Requested slide type")
+    success: bool = Field(..., description="Whether the slide generated")
+    status_code: int = Field(..., description="HTTP status the single-slide endpoint would return")
+    result: Optional[Dict[str, Any]] = Field(None, description="Single-slide endpoint response")
+    error: Optional[str] = Field(None, description="Error detail when success is false")
+    elapsed_ms: int = Field(..., description="Time from deck start to slide completion")
+
+
+class DeckGenerationResponse(BaseModel):
+    """Response model for POST /v1.2/deck/generate."""
+
+    success: bool = Field(..., description="True when every slide succeeded")
+    total_slides: int
+    succeeded: int
+    failed: int
+    max_concurrency: int = Field(..., description="Deck-level concurrency budget used")
+    elapsed_ms: int = Field(..., description="Wall time for the whole deck")
+    slides: List[DeckSlideResult] = Field(..., description="Results in request order")
+
+
+class DeckImagePrefetchSlide(BaseModel):
+    """Prefetch outcome of one slide in a deck outline."""
+
+    index: int = Field(..., description="Position in the request's slides list")
+    slide_type: str = Field(..., description="Requested slide type")
+    status: str = Field(
+        ...,
+        description=(
+            "'started' (image generating in the background), 'already_prefetched', "
+            "'at_capacity' (too many prefetches still running), 'no_image' (slide "
+            "type has no prefetchable image), 'invalid' (request failed validation) "
+            "or 'disabled'"
+        )
+    )
+    error: Optional[str] = Field(None, description="Validation error when status is 'invalid'")
+
+
+class DeckImagePrefetchResponse(BaseModel):
+    """Response model for POST /v1.2/deck/prefetch-images."""
+
+    started: int = Field(..., description="Slides whose image generation was started")
+    ttl_seconds: int = Field(..., description="How long a prefetched image waits for its slide request")
+    slides: List[DeckImagePrefetchSlide] = Field(..., description="Outcomes in request order")
@@ -231,6 +231,13 @@ class ISeriesGenerationRequest(BaseModel):
         description="Skip image generation (for testing content only). "
                     "When True, uses fallback placeholder instead of calling Image Service."
     )
+    image_deadline_ms: Optional[int] = Field(
+        default=None,
+        ge=0,
+        description="Return the slide with the placeholder if the image takes longer than this; "
+                    "the image continues as image_job_id (GET /v1.2/images/{job_id}). "
+                    "None uses IMAGE_DEADLINE_MS; 0 waits for the image."
+    )
 
     class Config:
         json_schema_extra = {
@@ -285,6 +292,10 @@ class ISeriesGenerationResponse(BaseModel):
         default=False,
         description="True if using placeholder instead of generated image"
     )
+    image_job_id: Optional[str] = Field(
+        default=None,
+        description="Set when the image missed image_deadline_ms: poll GET /v1.2/images/{job_id} for its URL"
+    )
 
     # SPEC-COMPLIANT: Background color for I-series slides
     # Per SLIDE_GENERATION_INPUT_SPEC.md: default #ffffff for I-series
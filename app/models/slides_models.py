@@ -224,6 +224,12 @@ class UnifiedSlideRequest(BaseModel):
         default=None,
         description="Optional hint for image generation prompt"
     )
+    image_deadline_ms: Optional[int] = Field(
+        default=None,
+        ge=0,
+        description="I-series: Return the slide with the placeholder if the image takes longer than this "
+                    "(image continues as image_job_id). None uses IMAGE_DEADLINE_MS; 0 waits."
+    )
 
     # I-series specific fields
     max_bullets: int = Field(
@@ -555,6 +561,10 @@ class ISeriesSlideResponse(BaseModel):
         default=False,
         description="True if using placeholder instead of generated image"
     )
+    image_job_id: Optional[str] = Field(
+        default=None,
+        description="Set when the image missed image_deadline_ms: poll GET /v1.2/images/{job_id} for its URL"
+    )
 
     # Layout Service aliases - also HTML with inline CSS
     slide_title: str = Field(
@@ -12,23 +12,50 @@ from .llm_client import (
     BaseLLMClient,
     GeminiClient,
     LLMResponse,
-    LLMProvider
+    LLMProvider,
+    get_gemini_executor,
+    shutdown_gemini_executor
 )
 from .llm_service import (
     get_llm_service,
     create_llm_callable,
     create_llm_callable_async,
     create_llm_callable_pooled,
+    create_llm_callable_for,
+    create_llm_stream_for,
+    use_llm_pool,
     get_pool_metrics,
     LLMService,
     ModelComplexity
 )
 from .llm_pool import (
     get_llm_pool,
+    get_model_pool,
     LLMConnectionPool,
     LLMPoolConfig,
     QueueFullError,
-    PoolStatus
+    PoolStatus,
+    PoolPriority,
+    set_request_priority,
+    reset_request_priority,
+    get_request_priority
+)
+from .llm_cache import (
+    get_llm_cache,
+    reset_llm_cache,
+    LLMResponseCache,
+    LLMCacheConfig,
+    CacheBypass,
+    set_cache_bypass,
+    parse_cache_control,
+    invalidate_llm_response
+)
+from .prompt_prefix import (
+    get_prefix_registry,
+    reset_prefix_registry,
+    PromptPrefixRegistry,
+    PromptPrefixConfig,
+    SplitPrompt
 )
 from .theme_service_client import (
     ThemeServiceClient,
@@ -53,20 +80,45 @@ __all__ = [
     "GeminiClient",
     "LLMResponse",
     "LLMProvider",
+    "get_gemini_executor",
+    "shutdown_gemini_executor",
     # LLM Service
     "get_llm_service",
     "create_llm_callable",
     "create_llm_callable_async",
     "create_llm_callable_pooled",
+    "create_llm_callable_for",
+    "create_llm_stream_for",
+    "use_llm_pool",
     "get_pool_metrics",
     "LLMService",
     "ModelComplexity",
     # Connection Pool
     "get_llm_pool",
+    "get_model_pool",
     "LLMConnectionPool",
     "LLMPoolConfig",
     "QueueFullError",
     "PoolStatus",
+    "PoolPriority",
+    "set_request_priority",
+    "reset_request_priority",
+    "get_request_priority",
+    # Response Cache
+    "get_llm_cache",
+    "reset_llm_cache",
+    "LLMResponseCache",
+    "LLMCacheConfig",
+    "CacheBypass",
+    "set_cache_bypass",
+    "parse_cache_control",
+    "invalidate_llm_response",
+    # Prompt Prefix Registry
+    "get_prefix_registry",
+    "reset_prefix_registry",
+    "PromptPrefixRegistry",
+    "PromptPrefixConfig",
+    "SplitPrompt",
     # Theme Service
     "ThemeServiceClient",
     "get_theme_client",
@@ -0,0 +1,316 @@
+"""
+Late-Binding Image Jobs
+=======================
+
+Hero-with-image and I-series slides normally hold their response until the
+Image Builder answers (up to 120s per attempt, with retries). With an image
+deadline, the slide is returned as soon as the deadline passes: its HTML uses
+the gradient fallback, and the still-running image request is registered here
+under an image_job_id. Clients poll GET /v1.2/images/{job_id} and swap the
+image in once it is ready.
+
+- The image task runs in the instance that rendered the slide; job records
+  (pending, then completed or failed) are also written to Redis when
+  IMAGE_JOB_REDIS_URL is set, so a poll can reach any instance
+- A record is kept for IMAGE_JOB_TTL_SECONDS after its last update
+- Without a deadline (the default), generation waits for the image as before
+
+Configuration: IMAGE_DEADLINE_MS (default deadline, 0 = wait for the image),
+IMAGE_JOB_TTL_SECONDS, IMAGE_JOB_MAX_ENTRIES, IMAGE_JOB_REDIS_URL.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Set, Tuple
+
+from .llm_cache import TwoTierCache
+
+logger = logging.getLogger(__name__)
+
+IMAGE_JOB_REDIS_PREFIX = "text_service:image_job:"
+
+
+@dataclass
+class ImageJobConfig:
+    """
+    Configuration for late-binding image jobs.
+
+    Attributes:
+        default_deadline_ms: Deadline for requests without image_deadline_ms (0 = none)
+        ttl_seconds: How long a job can be polled after its last update
+        max_entries: Jobs kept at once in memory (oldest evicted first)
+        redis_url: Redis URL for job records shared across instances
+                   (None = this instance only)
+    """
+    default_deadline_ms: int = 0
+    ttl_seconds: int = 600
+    max_entries: int = 1000
+    redis_url: Optional[str] = None
+
+
+class ImageJobStore(TwoTierCache):
+    """Image job records by job id: in memory, plus Redis when configured."""
+
+    redis_key_prefix = IMAGE_JOB_REDIS_PREFIX
+    label = "Image job store"
+
+    @property
+    def enabled(self) -> bool:
+        return True
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Job record, or None if unknown or expired."""
+        value = await self._get(job_id)
+        if value is None:
+            return None
+        job = json.loads(value)
+        if job["status"] == "pending" and self.config.redis_url:
+            # Another instance will update it: read Redis again next time
+            self._remove(job_id)
+        return job
+
+    async def set(self, job_id: str, job: Dict[str, Any]) -> None:
+        """Store a job record for ttl_seconds."""
+        await self._set(job_id, json.dumps(job), self.config.ttl_seconds)
+
+
+class ImageJobRegistry:
+    """
+    Map of image_job_id -> image task that outlived its slide's deadline.
+
+    Tasks resolve to an Image Builder response ({"success", "urls", ...}).
+
+    Usage (inside an image generator):
+        image_result, content_result, image_job_id = await get_image_job_registry().gather(
+            image_task, content_task, request.image_deadline_ms
+        )
+    """
+
+    def __init__(self, config: Optional[ImageJobConfig] = None):
+        """
+        Initialize the registry.
+
+        Args:
+            config: Job configuration. Uses defaults if not provided.
+        """
+        self.config = config or ImageJobConfig()
+        # job_id -> (task, registered_at), for tasks running in this process
+        self._jobs: "OrderedDict[str, Tuple[asyncio.Future, float]]" = OrderedDict()
+        self._store = ImageJobStore(self.config)
+        self._writes: Set[asyncio.Task] = set()  # Final records being stored
+
+        self.on_time = 0
+        self.deferred = 0
+        self.evictions = 0
+
+    def _prune(self) -> None:
+        cutoff = time.time() - self.config.ttl_seconds
+        while self._jobs:
+            job_id, (task, registered_at) = next(iter(self._jobs.items()))
+            if registered_at > cutoff and len(self._jobs) <= self.config.max_entries:
+                break
+            del self._jobs[job_id]
+            if not task.done():
+                task.cancel()
+            self.evictions += 1
+
+    async def register(self, task: asyncio.Future) -> str:
+        """
+        Keep task running in the background and return its job id.
+
+        The pending record is stored before the task's result can be, so the
+        final record always replaces it.
+
+        Args:
+            task: Image task that resolves to an Image Builder response
+
+        Returns:
+            Job id for GET /v1.2/images/{job_id}
+        """
+        job_id = uuid.uuid4().hex
+        self._jobs[job_id] = (task, time.time())
+        self.deferred += 1
+        self._prune()
+        await self._store.set(job_id, self._job_status(job_id, task))
+        task.add_done_callback(lambda done: self._on_done(job_id, done))
+        return job_id
+
+    def _on_done(self, job_id: str, task: asyncio.Future) -> None:
+        """Log late images as they arrive and store their final record."""
+        if task.cancelled():
+            print(f"[IMAGE-JOB] Cancelled: job={job_id[:12]}")
+        elif task.exception() is not None:
+            print(f"[IMAGE-JOB] Failed: job={job_id[:12]} ({task.exception()})")
+        else:
+            print(f"[IMAGE-JOB] Completed: job={job_id[:12]}")
+
+        write = asyncio.ensure_future(self._store.set(job_id, self._job_status(job_id, task)))
+        self._writes.add(write)
+        write.add_done_callback(self._writes.discard)
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Status of a job (None if unknown or expired).
+
+        Jobs running in this process are answered from their task, others
+        from the job store (Redis when configured).
+
+        Returns:
+            {"job_id", "status": pending|completed|failed, "image_url", "error", "metadata"}
+        """
+        self._prune()
+        entry = self._jobs.get(job_id)
+        if entry is not None:
+            return self._job_status(job_id, entry[0])
+        return await self._store.get(job_id)
+
+    @staticmethod
+    def _job_status(job_id: str, task: asyncio.Future) -> Dict[str, Any]:
+        """Job record from its image task."""
+        job = {"job_id": job_id, "status": "pending", "image_url": None, "error": None, "metadata": {}}
+        if not task.done():
+            return job
+
+        if task.cancelled():
+            job.update(status="failed", error="cancelled")
+        elif task.exception() is not None:
+            job.update(status="failed", error=str(task.exception()))
+        else:
+            result = task.result() or {}
+            if result.get("success"):
+                job.update(
+                    status="completed",
+                    image_url=result["urls"].get("cropped") or result["urls"]["original"],
+                    metadata=result.get("metadata", {})
+                )
+            else:
+                job.update(status="failed", error=result.get("error") or "Image generation unsuccessful")
+        return job
+
+    def deadline_seconds(self, deadline_ms: Optional[int]) -> Optional[float]:
+        """Deadline for one request in seconds (None = wait for the image)."""
+        if deadline_ms is None:
+            deadline_ms = self.config.default_deadline_ms
+        return deadline_ms / 1000 if deadline_ms and deadline_ms > 0 else None
+
+    async def gather(
+        self,
+        image_task: asyncio.Future,
+        content_task: asyncio.Future,
+        deadline_ms: Optional[int] = None
+    ) -> Tuple[Any, Any, Optional[str]]:
+        """
+        Wait for content, and for the image until the deadline.
+
+        Like asyncio.gather(image_task, content_task, return_exceptions=True),
+        except that an image still running when both the deadline has passed
+        and content is done is registered as a job instead of awaited.
+
+        Args:
+            image_task: Task producing the Image Builder response
+            content_task: Task producing the slide content
+            deadline_ms: Per-request deadline (None = IMAGE_DEADLINE_MS default)
+
+        Returns:
+            (image_result, content_result, image_job_id); image_result is None
+            and image_job_id is set when the image missed the deadline
+        """
+        deadline = self.deadline_seconds(deadline_ms)
+        if deadline is None:
+            image_result, content_result = await asyncio.gather(
+                image_task, content_task, return_exceptions=True
+            )
+            return image_result, content_result, None
+
+        start = time.perf_counter()
+        try:
+            content_result = await content_task
+            remaining = max(deadline - (time.perf_counter() - start), 0)
+            await asyncio.wait({image_task}, timeout=remaining)
+        except Exception as e:
+            # The slide fails anyway; nobody will poll for its image
+            image_task.cancel()
+            return None, e, None
+        except BaseException:
+            # This request (or its content task) was cancelled: same for the image
+            image_task.cancel()
+            raise
+
+        if image_task.done():
+            self.on_time += 1
+            image_result = image_task.exception() or image_task.result()
+            return image_result, content_result, None
+
+        job_id = await self.register(image_task)
+        print(f"[IMAGE-JOB] Deadline {int(deadline * 1000)}ms exceeded, image continues as job={job_id[:12]}")
+        return None, content_result, job_id
+
+    def clear(self) -> None:
+        """Forget all jobs (running tasks are not cancelled) and reset counters."""
+        self._jobs.clear()
+        self._store.clear()
+        self.on_time = self.deferred = self.evictions = 0
+
+    @property
+    def stats(self) -> dict:
+        """Job statistics for monitoring."""
+        return {
+            "jobs": len(self._jobs),
+            "pending": sum(1 for task, _ in self._jobs.values() if not task.done()),
+            "on_time": self.on_time,
+            "deferred": self.deferred,
+            "evictions": self.evictions,
+            "redis_enabled": self._store.stats["redis_enabled"],
+            "config": {
+                "default_deadline_ms": self.config.default_deadline_ms,
+                "ttl_seconds": self.config.ttl_seconds,
+                "max_entries": self.config.max_entries
+            }
+        }
+
+
+# Global job registry instance
+_job_registry: Optional[ImageJobRegistry] = None
+
+
+def get_image_job_registry(config: Optional[ImageJobConfig] = None) -> ImageJobRegistry:
+    """
+    Get the singleton image job registry.
+
+    Configuration via environment variables (first call only):
+    - IMAGE_DEADLINE_MS: Default image deadline (default: 0 = wait for the image)
+    - IMAGE_JOB_TTL_SECONDS: How long a job can be polled (default: 600)
+    - IMAGE_JOB_MAX_ENTRIES: Jobs kept at once in memory (default: 1000)
+    - IMAGE_JOB_REDIS_URL: Share job records across instances through Redis
+
+    Args:
+        config: Optional configuration (only used on first call)
+
+    Returns:
+        Shared ImageJobRegistry instance
+    """
+    global _job_registry
+
+    if _job_registry is None:
+        if config is None:
+            config = ImageJobConfig(
+                default_deadline_ms=int(os.getenv("IMAGE_DEADLINE_MS", "0")),
+                ttl_seconds=int(os.getenv("IMAGE_JOB_TTL_SECONDS", "600")),
+                max_entries=int(os.getenv("IMAGE_JOB_MAX_ENTRIES", "1000")),
+                redis_url=os.getenv("IMAGE_JOB_REDIS_URL") or None
+            )
+        _job_registry = ImageJobRegistry(config)
+
+    return _job_registry
+
+
+def reset_image_job_registry():
+    """Reset the global job registry instance (for testing)."""
+    global _job_registry
+    _job_registry = None
@@ -0,0 +1,252 @@
+"""
+Image Prefetch Cache
+====================
+
+Image generation is the longest leg of hero-with-image and I-series slides
+(8-15s per Image Builder call), yet it normally starts only when the slide's
+own request arrives. A deck outline sent to /v1.2/deck/prefetch-images starts
+each slide's image work (prompt building + Image Builder request) in the
+background; the slide's generator later finds the in-flight or finished task
+here and awaits it instead of starting its own.
+
+- Key: sha256 of (generator kind, the request's image inputs), so a slide
+  reuses an image prefetched for the same narrative, topics, style, brand
+  and context whatever its slide_number or image_deadline_ms
+- Prefetches run in the BACKGROUND pool lane, at most max_concurrent at once
+- Entries are short-lived (TTL) and bounded: finished entries are evicted
+  oldest first, and a new prefetch is refused while every entry is running
+- A failed prefetch is dropped, so later requests generate their own image
+
+Configuration: IMAGE_PREFETCH_ENABLED, IMAGE_PREFETCH_TTL_SECONDS,
+IMAGE_PREFETCH_MAX_ENTRIES, IMAGE_PREFETCH_MAX_CONCURRENT.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from pydantic import BaseModel
+
+from .llm_pool import PoolPriority, set_request_priority
+
+logger = logging.getLogger(__name__)
+
+# Request fields an image prompt is built from (hero and I-series requests);
+# anything else, e.g. slide_number or image_deadline_ms, leaves the key as is
+IMAGE_INPUT_FIELDS = (
+    "slide_type", "narrative", "topics", "visual_style", "image_prompt_hint", "global_brand", "context"
+)
+
+
+@dataclass
+class ImagePrefetchConfig:
+    """
+    Configuration for the image prefetch cache.
+
+    Attributes:
+        enabled: Accept prefetches (default: True; lookups always work)
+        ttl_seconds: How long a prefetched image waits for its slide
+        max_entries: Prefetches kept at once (finished ones evicted first)
+        max_concurrent: Prefetches generating at once (the rest wait)
+    """
+    enabled: bool = True
+    ttl_seconds: int = 300
+    max_entries: int = 200
+    max_concurrent: int = 4
+
+
+class ImagePrefetchCache:
+    """
+    Short-lived map of prefetch key -> task producing a slide's image.
+
+    Tasks resolve to {"prompt", "archetype", "result"}: the built image
+    prompt and the Image Builder response.
+
+    Usage (inside an image generator):
+        prefetch = get_image_prefetch_cache().get(key)
+        if prefetch is not None:
+            image = await asyncio.shield(prefetch)
+    """
+
+    def __init__(self, config: Optional[ImagePrefetchConfig] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            config: Prefetch configuration. Uses defaults if not provided.
+        """
+        self.config = config or ImagePrefetchConfig()
+        # key -> (task, expires_at)
+        self._entries: "OrderedDict[str, Tuple[asyncio.Future, float]]" = OrderedDict()
+        self._semaphore = asyncio.Semaphore(self.config.max_concurrent)
+
+        self.started = 0
+        self.rejected = 0
+        self.hits = 0
+        self.misses = 0
+        self.failures = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(kind: str, request: BaseModel) -> str:
+        """Key for one generator kind (e.g. "I1", "title_slide_with_image") and the request's image inputs."""
+        inputs = request.model_dump(mode="json", include=set(IMAGE_INPUT_FIELDS))
+        body = json.dumps(inputs, sort_keys=True)
+        return hashlib.sha256(f"{kind}\x00{body}".encode("utf-8")).hexdigest()
+
+    def _live(self, key: str) -> Optional[asyncio.Future]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        task, expires_at = entry
+        if expires_at <= time.time():
+            self._evict(key)
+            return None
+        return task
+
+    def _evict(self, key: str) -> None:
+        task, _ = self._entries.pop(key)
+        if not task.done():
+            task.cancel()  # Nobody can find it any more
+        self.evictions += 1
+
+    def _make_room(self) -> bool:
+        """Evict expired, then finished, entries until one more fits."""
+        now = time.time()
+        for key in [key for key, (_, expires_at) in self._entries.items() if expires_at <= now]:
+            self._evict(key)
+        finished = [key for key, (task, _) in self._entries.items() if task.done()]
+        while len(self._entries) >= self.config.max_entries and finished:
+            self._evict(finished.pop(0))
+        return len(self._entries) < self.config.max_entries
+
+    async def _run(self, fetch: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        # The task has its own context: the lane applies to this prefetch only
+        set_request_priority(PoolPriority.BACKGROUND)
+        async with self._semaphore:
+            return await fetch()
+
+    def start(self, key: str, fetch: Callable[[], Awaitable[Dict[str, Any]]]) -> str:
+        """
+        Start fetch() in the background unless key is already prefetched.
+
+        Args:
+            key: Key from make_key()
+            fetch: Zero-argument async callable producing the image entry
+
+        Returns:
+            "started", "already_prefetched", "at_capacity" (every entry is
+            still running) or "disabled"
+        """
+        if not self.config.enabled:
+            return "disabled"
+        if self._live(key) is not None:
+            return "already_prefetched"
+        if not self._make_room():
+            self.rejected += 1
+            return "at_capacity"
+
+        task = asyncio.ensure_future(self._run(fetch))
+        self._entries[key] = (task, time.time() + self.config.ttl_seconds)
+        self.started += 1
+        task.add_done_callback(lambda done: self._on_done(key, done))
+        return "started"
+
+    def _on_done(self, key: str, task: asyncio.Future) -> None:
+        """Drop failed prefetches so later requests generate their own image."""
+        if task.cancelled() or task.exception() is not None:
+            self.failures += 1
+            error = "cancelled" if task.cancelled() else task.exception()
+            print(f"[IMAGE-PREFETCH] Failed: key={key[:12]} ({error})")
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is task:
+                del self._entries[key]
+
+    def get(self, key: str) -> Optional[asyncio.Future]:
+        """
+        Prefetch task for key, finished or still running (None if none).
+
+        Await it through asyncio.shield so one cancelled request does not
+        cancel the prefetch for others.
+        """
+        task = self._live(key)
+        if task is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        print(f"[IMAGE-PREFETCH] Hit: key={key[:12]} ({'ready' if task.done() else 'in flight'})")
+        return task
+
+    def clear(self) -> None:
+        """Forget all prefetches (running tasks are not cancelled) and reset counters."""
+        self._entries.clear()
+        self.started = self.rejected = self.hits = self.misses = self.failures = self.evictions = 0
+
+    @property
+    def stats(self) -> dict:
+        """Prefetch statistics for monitoring."""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.config.enabled,
+            "entries": len(self._entries),
+            "in_flight": sum(1 for task, _ in self._entries.values() if not task.done()),
+            "started": self.started,
+            "rejected": self.rejected,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "failures": self.failures,
+            "evictions": self.evictions,
+            "config": {
+                "ttl_seconds": self.config.ttl_seconds,
+                "max_entries": self.config.max_entries,
+                "max_concurrent": self.config.max_concurrent
+            }
+        }
+
+
+# Global prefetch cache instance
+_prefetch_cache: Optional[ImagePrefetchCache] = None
+
+
+def get_image_prefetch_cache(config: Optional[ImagePrefetchConfig] = None) -> ImagePrefetchCache:
+    """
+    Get the singleton image prefetch cache.
+
+    Configuration via environment variables (first call only):
+    - IMAGE_PREFETCH_ENABLED: Accept prefetches (default: true)
+    - IMAGE_PREFETCH_TTL_SECONDS: Lifetime of a prefetched image (default: 300)
+    - IMAGE_PREFETCH_MAX_ENTRIES: Prefetches kept at once (default: 200)
+    - IMAGE_PREFETCH_MAX_CONCURRENT: Prefetches generating at once (default: 4)
+
+    Args:
+        config: Optional configuration (only used on first call)
+
+    Returns:
+        Shared ImagePrefetchCache instance
+    """
+    global _prefetch_cache
+
+    if _prefetch_cache is None:
+        if config is None:
+            config = ImagePrefetchConfig(
+                enabled=os.getenv("IMAGE_PREFETCH_ENABLED", "true").lower() == "true",
+                ttl_seconds=int(os.getenv("IMAGE_PREFETCH_TTL_SECONDS", "300")),
+                max_entries=int(os.getenv("IMAGE_PREFETCH_MAX_ENTRIES", "200")),
+                max_concurrent=int(os.getenv("IMAGE_PREFETCH_MAX_CONCURRENT", "4"))
+            )
+        _prefetch_cache = ImagePrefetchCache(config)
+
+    return _prefetch_cache
+
+
+def reset_image_prefetch_cache():
+    """Reset the global prefetch cache instance (for testing)."""
+    global _prefetch_cache
+    _prefetch_cache = None
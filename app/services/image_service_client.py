@@ -11,6 +11,8 @@ Features:
 - Crop anchor positioning for text placement
 - Retry logic with exponential backoff
 - Timeout handling (120 seconds - per API best practices)
+- Process-wide pooled HTTP client (keep-alive, HTTP/2 when h2 is installed)
+- Optional image result cache keyed by a normalized prompt fingerprint
 - Graceful error handling
 - Semantic cache metadata for improved cache hits
 
@@ -20,12 +22,20 @@ Version: 1.2.0 - Updated to follow Image Builder v2.0 API best practices:
               - Removed explicit model parameter (API handles fallback chain)
               - Added semantic cache metadata (topics, visual_style, slide_type, domain)
               - Layout-specific aspect ratios: I1/I2=2:3, I3/I4=9:16
+Version: 1.3.0 - One pooled httpx.AsyncClient shared by every request and retry
+              (configurable keep-alive limits, closed on app shutdown)
+Version: 1.4.0 - Image result cache (LRU + TTL, optional Redis tier) with
+              concurrent identical requests coalesced onto one API call
 """
 
 import os
+import json
+import hashlib
 import logging
 import asyncio
-from typing import Optional, Dict, Any
+import importlib.util
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, Awaitable, Callable
 from enum import Enum
 
 try:
@@ -36,8 +46,226 @@ except ImportError:
         "Install it with: pip install httpx>=0.24.0"
     )
 
+from .llm_cache import CacheBypass, TwoTierCache, get_cache_bypass
+from .llm_service import SingleFlight
+
 logger = logging.getLogger(__name__)
 
+IMAGE_CACHE_REDIS_PREFIX = "text_service:image_cache:"
+
+
+# Shared HTTP client (one connection pool per process)
+_image_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_image_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared connection-pooled HTTP client for Image Builder calls.
+
+    Reusing one client keeps TCP/TLS connections alive across requests and
+    retries instead of paying a fresh handshake per image.
+
+    Configuration via environment variables (first call only):
+    - IMAGE_SERVICE_MAX_CONNECTIONS: Total open connections (default: 20)
+    - IMAGE_SERVICE_MAX_KEEPALIVE: Idle connections kept open (default: 10)
+    - IMAGE_SERVICE_KEEPALIVE_EXPIRY: Seconds an idle connection is kept (default: 30)
+    - IMAGE_SERVICE_HTTP2: Negotiate HTTP/2 when the h2 package is installed (default: true)
+    """
+    global _image_http_client
+
+    if _image_http_client is None or _image_http_client.is_closed:
+        limits = httpx.Limits(
+            max_connections=int(os.getenv("IMAGE_SERVICE_MAX_CONNECTIONS", "20")),
+            max_keepalive_connections=int(os.getenv("IMAGE_SERVICE_MAX_KEEPALIVE", "10")),
+            keepalive_expiry=float(os.getenv("IMAGE_SERVICE_KEEPALIVE_EXPIRY", "30"))
+        )
+        http2 = (
+            os.getenv("IMAGE_SERVICE_HTTP2", "true").lower() == "true"
+            and importlib.util.find_spec("h2") is not None
+        )
+        _image_http_client = httpx.AsyncClient(limits=limits, http2=http2)
+        logger.info(
+            f"Image Service HTTP pool initialized: max_connections={limits.max_connections}, "
+            f"max_keepalive={limits.max_keepalive_connections}, http2={http2}"
+        )
+
+    return _image_http_client
+
+
+async def close_image_http_client() -> None:
+    """Close the shared Image Builder HTTP client (app shutdown / tests)."""
+    global _image_http_client
+
+    if _image_http_client is not None:
+        await _image_http_client.aclose()
+        _image_http_client = None
+
+
+@dataclass
+class ImageCacheConfig:
+    """
+    Configuration for the image result cache.
+
+    Attributes:
+        enabled: Master switch (default: False, opt-in)
+        max_entries: Maximum results in the in-process LRU
+        ttl_seconds: Lifetime of a cached result
+        redis_url: Redis URL for the shared tier (None = memory only)
+    """
+    enabled: bool = False
+    max_entries: int = 500
+    ttl_seconds: int = 3600
+    redis_url: Optional[str] = None
+
+
+class ImageResultCache(TwoTierCache):
+    """
+    Two-tier (LRU memory + optional Redis) cache of Image Builder results.
+
+    Slides with the same topic, style and archetype produce near-identical
+    prompts (e.g. every section divider of a deck), so results are keyed by a
+    normalized (prompt, negative_prompt, aspect_ratio, archetype, crop_anchor,
+    model, remove_background) fingerprint. Concurrent misses on one key share
+    a single API call.
+
+    Honors the request-context Cache-Control bypass of the LLM cache.
+    """
+
+    redis_key_prefix = IMAGE_CACHE_REDIS_PREFIX
+    label = "Image cache"
+
+    def __init__(self, config: Optional[ImageCacheConfig] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            config: Cache configuration. Uses defaults if not provided.
+        """
+        super().__init__(config or ImageCacheConfig())
+        self._flight = SingleFlight(tag="IMAGE-FLIGHT")
+
+    @staticmethod
+    def make_key(
+        prompt: str,
+        negative_prompt: Optional[str],
+        aspect_ratio: str,
+        archetype: Optional[str],
+        crop_anchor: str,
+        model: Optional[str] = None,
+        remove_background: bool = False
+    ) -> str:
+        """Fingerprint of an image request (case and whitespace insensitive)."""
+        parts = (prompt, negative_prompt, aspect_ratio, archetype, crop_anchor, model, remove_background)
+        normalized = "\x00".join(" ".join(str(part or "").lower().split()) for part in parts)
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached result (memory first, then Redis).
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            A fresh copy of the cached result, or None on miss
+        """
+        result = await self._get(key)
+        return json.loads(result) if result is not None else None
+
+    async def set(self, key: str, result: Dict[str, Any]) -> None:
+        """Store a successful result in both tiers."""
+        await self._set(key, json.dumps(result), self.config.ttl_seconds)
+
+    async def get_or_generate(
+        self,
+        key: str,
+        generate: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        Serve key from the cache, or call generate() once and store its result.
+
+        Does nothing extra when the cache is disabled.
+
+        Args:
+            key: Key from make_key()
+            generate: Zero-argument async callable making the API call
+
+        Returns:
+            Image Builder result (a copy the caller may modify)
+        """
+        if not self.enabled:
+            return await generate()
+
+        bypass = get_cache_bypass()
+        if bypass == CacheBypass.NONE:
+            cached = await self.get(key)
+            if cached is not None:
+                print(f"[IMAGE-CACHE] Hit: key={key[:12]}")
+                return cached
+        else:
+            self.bypasses += 1
+
+        async def fill() -> str:
+            result = await generate()
+            if bypass != CacheBypass.NO_STORE:
+                await self.set(key, result)
+            return json.dumps(result)
+
+        return json.loads(await self._flight.run(key, fill))
+
+    @property
+    def stats(self) -> dict:
+        """Cache statistics for monitoring."""
+        return {
+            **super().stats,
+            "coalesced_calls": self._flight.coalesced,
+            "config": {
+                "max_entries": self.config.max_entries,
+                "ttl_seconds": self.config.ttl_seconds
+            }
+        }
+
+
+# Global cache instance (singleton pattern)
+_image_cache_instance: Optional[ImageResultCache] = None
+
+
+def get_image_cache(config: Optional[ImageCacheConfig] = None) -> ImageResultCache:
+    """
+    Get the singleton image result cache.
+
+    Configuration via environment variables (first call only):
+    - IMAGE_CACHE_ENABLED: Enable the cache (default: false)
+    - IMAGE_CACHE_MAX_ENTRIES: LRU entry limit (default: 500)
+    - IMAGE_CACHE_TTL_SECONDS: Result lifetime (default: 3600)
+    - IMAGE_CACHE_REDIS_URL: Enables the Redis tier
+
+    Args:
+        config: Optional cache configuration (only used on first call)
+
+    Returns:
+        Shared ImageResultCache instance
+    """
+    global _image_cache_instance
+
+    if _image_cache_instance is None:
+        if config is None:
+            config = ImageCacheConfig(
+                enabled=os.getenv("IMAGE_CACHE_ENABLED", "false").lower() == "true",
+                max_entries=int(os.getenv("IMAGE_CACHE_MAX_ENTRIES", "500")),
+                ttl_seconds=int(os.getenv("IMAGE_CACHE_TTL_SECONDS", "3600")),
+                redis_url=os.getenv("IMAGE_CACHE_REDIS_URL") or None
+            )
+        _image_cache_instance = ImageResultCache(config)
+
+    return _image_cache_instance
+
+
+def reset_image_cache():
+    """Reset the global cache instance (for testing)."""
+    global _image_cache_instance
+    _image_cache_instance = None
+
 
 class SlideType(str, Enum):
     """Slide types for image generation positioning."""
@@ -67,7 +295,8 @@ class ImageServiceClient:
         base_url: Optional[str] = None,
         api_key: Optional[str] = None,
         timeout: float = 120.0,
-        max_retries: int = 2
+        max_retries: int = 2,
+        cache: Optional[ImageResultCache] = None
     ):
         """
         Initialize Image Service Client.
@@ -77,6 +306,7 @@ class ImageServiceClient:
             api_key: Optional API key (from env if None)
             timeout: Request timeout in seconds (default: 120, per API best practices)
             max_retries: Maximum retry attempts (default: 2)
+            cache: Image result cache (default: shared get_image_cache())
         """
         self.base_url = base_url or os.getenv(
             "IMAGE_SERVICE_URL",
@@ -85,11 +315,13 @@ class ImageServiceClient:
         self.api_key = api_key or os.getenv("IMAGE_SERVICE_API_KEY")
         self.timeout = timeout
         self.max_retries = max_retries
+        self.cache = cache or get_image_cache()
 
         # Track usage
         self.total_requests = 0
         self.successful_requests = 0
         self.failed_requests = 0
+        self.cache_hits = 0  # Served from the cache or a coalesced in-flight call
 
         logger.info(
             f"Initialized Image Service Client (base_url={self.base_url}, "
@@ -189,62 +421,7 @@ class ImageServiceClient:
             f"(crop_anchor={crop_anchor})"
         )
 
-        # Attempt generation with retries
-        last_error = None
-        for attempt in range(self.max_retries + 1):
-            try:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.post(
-                        f"{self.base_url}/api/v2/generate",
-                        json=payload,
-                        headers=self._get_headers()
-                    )
-
-                    # Check HTTP status
-                    response.raise_for_status()
-
-                    # Parse response
-                    result = response.json()
-
-                    # Check API success field
-                    if not result.get("success", False):
-                        error_msg = result.get("error", "Unknown error")
-                        raise ValueError(f"Image generation failed: {error_msg}")
-
-                    # Validate response structure
-                    if "urls" not in result or "original" not in result["urls"]:
-                        raise ValueError("Invalid response: missing image URLs")
-
-                    # Success!
-                    self.successful_requests += 1
-
-                    generation_time = result.get("metadata", {}).get("generation_time_ms", 0)
-                    logger.info(
-                        f"Image generated successfully in {generation_time}ms "
-                        f"(attempt {attempt + 1}/{self.max_retries + 1})"
-                    )
-
-                    return result
-
-            except (httpx.HTTPError, ValueError) as e:
-                last_error = e
-                logger.warning(
-                    f"Image generation attempt {attempt + 1} failed: {e}"
-                )
-
-                # Exponential backoff before retry
-                if attempt < self.max_retries:
-                    backoff_time = 2.0 * (attempt + 1)
-                    logger.info(f"Retrying in {backoff_time}s...")
-                    await asyncio.sleep(backoff_time)
-
-        # All retries exhausted
-        self.failed_requests += 1
-        logger.error(
-            f"Image generation failed after {self.max_retries + 1} attempts: "
-            f"{last_error}"
-        )
-        raise last_error
+        return await self._generate_cached(payload, "Image")
 
     async def generate_iseries_image(
         self,
@@ -365,47 +542,95 @@ class ImageServiceClient:
             f"(style={visual_style}, archetype={archetype}, domain={context_domain})"
         )
 
-        # Attempt generation with retries
+        return await self._generate_cached(payload, f"I-series {layout_type} image")
+
+    async def _generate_cached(self, payload: Dict[str, Any], label: str) -> Dict[str, Any]:
+        """
+        Serve payload from the image cache, or request it from the Image Builder.
+
+        Args:
+            payload: /api/v2/generate request body
+            label: Image description for log messages
+
+        Returns:
+            API response dict with image URLs and metadata
+        """
+        key = ImageResultCache.make_key(
+            payload["prompt"],
+            payload.get("negative_prompt"),
+            payload["aspect_ratio"],
+            payload.get("archetype"),
+            payload["options"]["crop_anchor"],
+            payload.get("model"),
+            payload["options"].get("remove_background", False)
+        )
+        requested = False
+
+        async def request() -> Dict[str, Any]:
+            nonlocal requested
+            requested = True
+            return await self._request_image(payload, label)
+
+        try:
+            result = await self.cache.get_or_generate(key, request)
+        except Exception:
+            if not requested:  # Shared call of another request failed
+                self.failed_requests += 1
+            raise
+
+        if not requested:
+            self.cache_hits += 1
+            self.successful_requests += 1
+        return result
+
+    async def _request_image(self, payload: Dict[str, Any], label: str) -> Dict[str, Any]:
+        """
+        POST payload to /api/v2/generate with retries and exponential backoff.
+
+        Raises:
+            httpx.HTTPError: If request fails after retries
+            ValueError: If response is invalid
+        """
         last_error = None
         for attempt in range(self.max_retries + 1):
             try:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.post(
-                        f"{self.base_url}/api/v2/generate",
-                        json=payload,
-                        headers=self._get_headers()
-                    )
+                response = await get_image_http_client().post(
+                    f"{self.base_url}/api/v2/generate",
+                    json=payload,
+                    headers=self._get_headers(),
+                    timeout=self.timeout
+                )
 
-                    # Check HTTP status
-                    response.raise_for_status()
+                # Check HTTP status
+                response.raise_for_status()
 
-                    # Parse response
-                    result = response.json()
+                # Parse response
+                result = response.json()
 
-                    # Check API success field
-                    if not result.get("success", False):
-                        error_msg = result.get("error", "Unknown error")
-                        raise ValueError(f"I-series image generation failed: {error_msg}")
+                # Check API success field
+                if not result.get("success", False):
+                    error_msg = result.get("error", "Unknown error")
+                    raise ValueError(f"{label} generation failed: {error_msg}")
 
-                    # Validate response structure
-                    if "urls" not in result or "original" not in result["urls"]:
-                        raise ValueError("Invalid response: missing image URLs")
+                # Validate response structure
+                if "urls" not in result or "original" not in result["urls"]:
+                    raise ValueError("Invalid response: missing image URLs")
 
-                    # Success!
-                    self.successful_requests += 1
+                # Success!
+                self.successful_requests += 1
 
-                    generation_time = result.get("metadata", {}).get("generation_time_ms", 0)
-                    logger.info(
-                        f"I-series image generated successfully in {generation_time}ms "
-                        f"(layout={layout_type}, attempt {attempt + 1}/{self.max_retries + 1})"
-                    )
+                generation_time = result.get("metadata", {}).get("generation_time_ms", 0)
+                logger.info(
+                    f"{label} generated successfully in {generation_time}ms "
+                    f"(attempt {attempt + 1}/{self.max_retries + 1})"
+                )
 
-                    return result
+                return result
 
             except (httpx.HTTPError, ValueError) as e:
                 last_error = e
                 logger.warning(
-                    f"I-series image generation attempt {attempt + 1} failed: {e}"
+                    f"{label} generation attempt {attempt + 1} failed: {e}"
                 )
 
                 # Exponential backoff before retry
@@ -417,7 +642,7 @@ class ImageServiceClient:
         # All retries exhausted
         self.failed_requests += 1
         logger.error(
-            f"I-series image generation failed after {self.max_retries + 1} attempts: "
+            f"{label} generation failed after {self.max_retries + 1} attempts: "
             f"{last_error}"
         )
         raise last_error
@@ -526,13 +751,13 @@ class ImageServiceClient:
             httpx.HTTPError: If health check fails
         """
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(
-                    f"{self.base_url}/api/v2/health",
-                    headers=self._get_headers()
-                )
-                response.raise_for_status()
-                return response.json()
+            response = await get_image_http_client().get(
+                f"{self.base_url}/api/v2/health",
+                headers=self._get_headers(),
+                timeout=5.0
+            )
+            response.raise_for_status()
+            return response.json()
         except httpx.HTTPError as e:
             logger.error(f"Image Service health check failed: {e}")
             raise
@@ -549,11 +774,19 @@ class ImageServiceClient:
             if self.total_requests > 0 else 0
         )
 
+        cache_hit_rate = (
+            (self.cache_hits / self.total_requests * 100)
+            if self.total_requests > 0 else 0
+        )
+
         return {
             "total_requests": self.total_requests,
             "successful_requests": self.successful_requests,
             "failed_requests": self.failed_requests,
-            "success_rate": f"{success_rate:.1f}%"
+            "success_rate": f"{success_rate:.1f}%",
+            "cache_hits": self.cache_hits,
+            "cache_hit_rate": f"{cache_hit_rate:.1f}%",
+            "cache": self.cache.stats
         }
 
     def reset_stats(self):
@@ -561,6 +794,7 @@ class ImageServiceClient:
         self.total_requests = 0
         self.successful_requests = 0
         self.failed_requests = 0
+        self.cache_hits = 0
 
 
 # Singleton instance
@@ -0,0 +1,754 @@
+"""
+Async Generation Job Queue Backends
+===================================
+
+Where async generation jobs wait between POST /v1.2/async/generate and a
+GenerationWorker. Job state (status, progress, result) always lives in the
+per-job hash text_service:job:{job_id}; the queue only carries job ids.
+
+Backends (ASYNC_QUEUE_BACKEND):
+
+- list (default): text_service:generation_queue Redis list. Workers BLMOVE a
+  job into their own processing list, refresh a heartbeat key, and a reaper
+  requeues the processing lists of workers whose heartbeat expired.
+
+- stream: text_service:generation_stream Redis Stream read by the
+  generation_workers consumer group (XREADGROUP). Jobs stay in the group's
+  pending entries list until XACK; entries idle longer than the visibility
+  timeout are taken over by live workers with XAUTOCLAIM. Acked entries stay
+  in the stream (bounded by an approximate MAXLEN) so recent jobs can be
+  replayed. Gives at-least-once delivery, replay and cheap lag / pending
+  metrics.
+
+Both backends give at-least-once delivery; workers skip jobs whose hash is
+already in a terminal state, and fail jobs claimed max_attempts times.
+
+Queue position is O(1) for both backends: every enqueue takes a ticket from
+an enqueue counter (stored as queue_seq on the job), every claim or cancel
+advances a dequeue counter, so a job's position is its ticket minus the
+dequeue counter. Wait estimates come from WaitEstimator, a cached model of
+recent processing times and completion throughput.
+
+Job events: every status change is also published on the job's pub/sub
+channel (text_service:job_events:{job_id}) as {"event", "data"} JSON, so the
+API can push progress and results instead of being polled. Events are
+fire-and-forget; the job hash stays the source of truth.
+
+Job results: job_result() builds the one payload shared by GET /result, the
+final event and webhook callbacks. Callback URLs are checked with
+is_callback_url_allowed() (CALLBACK_ALLOWED_HOSTS) at submission and again
+before the worker POSTs.
+
+Results larger than RESULT_COMPRESS_MIN_BYTES are stored zlib-compressed
+(base64, since clients use decode_responses=True); always read them with
+decode_result().
+"""
+
+import asyncio
+import base64
+import ipaddress
+import json
+import logging
+import math
+import os
+import time
+import uuid
+import zlib
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# Redis keys (shared by async_routes.py and generation_worker.py)
+JOB_KEY_PREFIX = "text_service:job:"
+QUEUE_KEY = "text_service:generation_queue"
+PROCESSING_KEY_PREFIX = "text_service:processing:"  # Per-worker in-flight list
+HEARTBEAT_KEY_PREFIX = "text_service:worker_heartbeat:"
+WORKERS_KEY = "text_service:workers"
+REAPER_LOCK_KEY = "text_service:reaper_lock"
+STREAM_KEY = "text_service:generation_stream"
+STREAM_GROUP = "generation_workers"
+STREAM_MAX_LENGTH = 10000  # XADD MAXLEN ~ bound; keep well above the largest backlog
+ENQUEUED_SEQ_KEY = "text_service:queue_enqueued_seq"  # Tickets handed out
+DEQUEUED_SEQ_KEY = "text_service:queue_dequeued_seq"  # Tickets claimed or cancelled
+RECENT_COMPLETIONS_KEY = "text_service:recent_completions"  # "finished_at:processing_ms"
+RECENT_COMPLETIONS_SIZE = 100
+JOB_EVENTS_CHANNEL_PREFIX = "text_service:job_events:"
+RESULT_COMPRESS_MIN_BYTES = 1024
+RESULT_ENCODING_ZLIB = "zlib+base64"
+
+TERMINAL_STATUSES = ("completed", "failed", "cancelled")
+
+# job_type of POST /v1.2/async/generate jobs (variant_id + slide_spec); other
+# job types are slide types of app/api/slide_handlers.py
+VARIANT_JOB_TYPE = "variant"
+
+
+def job_events_channel(job_id: str) -> str:
+    """Pub/sub channel carrying a job's progress and completion events."""
+    return f"{JOB_EVENTS_CHANNEL_PREFIX}{job_id}"
+
+
+def job_event_message(job_id: str, event: str, data: Dict[str, Any]) -> str:
+    """Serialized job event, for publishing directly or from a pipeline."""
+    return json.dumps({"event": event, "data": {"job_id": job_id, **data}}, default=str)
+
+
+async def publish_job_event(redis, job_id: str, event: str, data: Dict[str, Any]) -> int:
+    """
+    Publish a job event: progress, completed, failed or cancelled.
+
+    Returns:
+        Number of subscribers that received it
+    """
+    return await redis.publish(job_events_channel(job_id), job_event_message(job_id, event, data))
+
+
+def encode_result(result: Dict[str, Any]) -> Dict[str, str]:
+    """Job hash fields storing a result, compressed when it is large."""
+    payload = json.dumps(result)
+    if len(payload) < RESULT_COMPRESS_MIN_BYTES:
+        return {"result": payload, "result_encoding": ""}
+    compressed = base64.b64encode(zlib.compress(payload.encode("utf-8"), 6)).decode("ascii")
+    return {"result": compressed, "result_encoding": RESULT_ENCODING_ZLIB}
+
+
+def decode_result(job_data: Dict[str, str]) -> Dict[str, Any]:
+    """Result stored in a job hash by encode_result (plain JSON for older jobs)."""
+    payload = job_data.get("result")
+    if not payload:
+        return {}
+    if job_data.get("result_encoding") == RESULT_ENCODING_ZLIB:
+        payload = zlib.decompress(base64.b64decode(payload)).decode("utf-8")
+    return json.loads(payload)
+
+
+def job_result(job_id: str, job_data: Dict[str, str],
+               result: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Outcome of a completed or failed job, from its hash.
+
+    The single shape of a job result: GET /v1.2/async/result, the final
+    /events frame, the completed/failed pub/sub event and webhook callbacks
+    are all built here.
+
+    Args:
+        job_id: Job id
+        job_data: Job hash (status, result fields, timestamps, error)
+        result: Already decoded result, to skip decode_result()
+
+    Returns:
+        {"job_id", "success", "job_type", "html", "variant_id", "result",
+         "processing_time_ms", "error"}
+    """
+    processing_time_ms = None
+    if job_data.get("processing_time_ms"):
+        processing_time_ms = int(job_data["processing_time_ms"])
+    elif job_data.get("started_at") and job_data.get("completed_at"):
+        processing_time_ms = int(
+            (float(job_data["completed_at"]) - float(job_data["started_at"])) * 1000
+        )
+
+    outcome = {
+        "job_id": job_id,
+        "success": job_data["status"] == "completed",
+        "job_type": job_data.get("job_type") or VARIANT_JOB_TYPE,
+        "html": None,
+        "variant_id": job_data.get("variant_id") or None,
+        "result": None,
+        "processing_time_ms": processing_time_ms,
+        "error": None
+    }
+    if outcome["success"]:
+        result = decode_result(job_data) if result is None else result
+        outcome.update(html=result.get("html"), result=result.get("response"))
+    else:
+        outcome["error"] = job_data.get("error", "Unknown error")
+    return outcome
+
+
+def get_callback_allowed_hosts() -> List[str]:
+    """Hosts job callbacks may be POSTed to (CALLBACK_ALLOWED_HOSTS, comma-separated)."""
+    hosts = os.getenv("CALLBACK_ALLOWED_HOSTS", "")
+    return [host.strip().lower() for host in hosts.split(",") if host.strip()]
+
+
+def is_callback_url_allowed(url: str, allowed_hosts: List[str]) -> bool:
+    """
+    Whether a job's callback_url may be POSTed to.
+
+    Only http(s) URLs are allowed. With an allowlist the host must be listed
+    (".example.com" also matches its subdomains). Without one, localhost and
+    IP literals in private, loopback, link-local or reserved ranges are
+    refused; set CALLBACK_ALLOWED_HOSTS in production, since hostnames are
+    not resolved here.
+    """
+    parsed = urlsplit(url)
+    host = (parsed.hostname or "").lower()
+    if parsed.scheme not in ("http", "https") or not host:
+        return False
+
+    if allowed_hosts:
+        return any(
+            host == allowed.lstrip(".") or (allowed.startswith(".") and host.endswith(allowed))
+            for allowed in allowed_hosts
+        )
+
+    if host == "localhost" or host.endswith(".localhost"):
+        return False
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return True  # A hostname
+    return address.is_global
+
+
+@dataclass
+class ClaimedJob:
+    """A job a worker has taken off the queue and must ack when done."""
+    job_id: str
+    receipt: str  # list: the job id; stream: the stream entry id
+
+
+async def _settle_abandoned(redis, job_id: str, max_attempts: int) -> bool:
+    """
+    Decide what to do with a job whose worker went away.
+
+    Marks it failed when it has already been claimed max_attempts times.
+
+    Returns:
+        True if the job should run again, False if it is finished (already
+        terminal, expired, or just failed here)
+    """
+    job_key = f"{JOB_KEY_PREFIX}{job_id}"
+    status = await redis.hget(job_key, "status")
+    if status is None or status in TERMINAL_STATUSES:
+        return False
+
+    attempts = int(await redis.hget(job_key, "attempts") or 0)
+    if attempts >= max_attempts:
+        error = f"Job abandoned by {attempts} workers (max attempts exceeded)"
+        pipe = redis.pipeline(transaction=False)
+        pipe.hset(job_key, mapping={
+            "status": "failed",
+            "stage": "error",
+            "completed_at": str(time.time()),
+            "error": error
+        })
+        pipe.publish(job_events_channel(job_id), job_event_message(job_id, "failed", {"success": False, "error": error}))
+        await pipe.execute()
+        return False
+
+    pipe = redis.pipeline(transaction=False)
+    pipe.hset(job_key, mapping={"status": "queued", "stage": "requeued", "progress": "0"})
+    pipe.publish(job_events_channel(job_id), job_event_message(
+        job_id, "progress", {"status": "queued", "stage": "requeued", "progress": 0}
+    ))
+    await pipe.execute()
+    return True
+
+
+class JobQueue(ABC):
+    """
+    Queue of async generation job ids.
+
+    Producer side (API): enqueue, waiting_count, position, cancel, stats.
+    Consumer side (workers): register, claim, ack, heartbeat, recover,
+    deregister. A consumer is identified by its worker id.
+    """
+
+    backend: str = ""
+
+    def __init__(self, redis, visibility_timeout: int = 60, max_attempts: int = 3,
+                 reaper_interval: int = 30):
+        """
+        Args:
+            redis: redis.asyncio client (decode_responses=True)
+            visibility_timeout: Seconds a claimed job may go without a
+                                heartbeat before other workers take it over
+            max_attempts: Claims after which an abandoned job is failed
+            reaper_interval: Seconds between the consumers' recover() sweeps
+        """
+        self.redis = redis
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        self.reaper_interval = reaper_interval
+
+    # ----- producer side -----
+
+    async def enqueue(self, job_id: str) -> int:
+        """
+        Queue a job (its hash must exist).
+
+        Returns:
+            1-based position of the job (jobs waiting, including it)
+        """
+        ticket = await self.redis.incr(ENQUEUED_SEQ_KEY)
+        await self.redis.hset(f"{JOB_KEY_PREFIX}{job_id}", "queue_seq", ticket)
+        await self._push(job_id)
+        return await self.waiting_count()
+
+    async def position(self, job_id: str, job_data: Dict[str, str]) -> Optional[int]:
+        """
+        1-based queue position of a waiting job, in constant time.
+
+        Cancellations count as dequeues, so positions of jobs queued before a
+        cancelled one can read one low until it would have been claimed;
+        the result is clamped to the number of waiting jobs.
+
+        Returns:
+            Position, or None if the job has no queue ticket
+        """
+        if not job_data.get("queue_seq"):
+            return None
+        dequeued = int(await self.redis.get(DEQUEUED_SEQ_KEY) or 0)
+        ahead_or_self = int(job_data["queue_seq"]) - dequeued
+        return max(1, min(ahead_or_self, await self.waiting_count()))
+
+    async def cancel(self, job_id: str, job_data: Dict[str, str]) -> None:
+        """Remove a waiting job from the queue."""
+        if await self._remove(job_id, job_data):
+            await self.redis.incr(DEQUEUED_SEQ_KEY)
+
+    async def record_completion(self, processing_time_ms: int) -> None:
+        """Feed a finished job's processing time to the wait estimate."""
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.lpush(RECENT_COMPLETIONS_KEY, f"{time.time():.3f}:{processing_time_ms}")
+        pipe.ltrim(RECENT_COMPLETIONS_KEY, 0, RECENT_COMPLETIONS_SIZE - 1)
+        await pipe.execute()
+
+    @abstractmethod
+    async def _push(self, job_id: str) -> None:
+        """Add a job to the backend's waiting jobs."""
+
+    @abstractmethod
+    async def _remove(self, job_id: str, job_data: Dict[str, str]) -> bool:
+        """Remove a waiting job. Returns True if it was still waiting."""
+
+    @abstractmethod
+    async def waiting_count(self) -> int:
+        """Jobs queued and not yet claimed by a worker."""
+
+    @abstractmethod
+    async def stats(self) -> Dict[str, Any]:
+        """Backend metrics for /v1.2/async/queue/stats."""
+
+    # ----- consumer side -----
+
+    @abstractmethod
+    async def register(self, consumer: str) -> List[ClaimedJob]:
+        """Join the queue. Returns jobs from a previous run to process first."""
+
+    @abstractmethod
+    async def claim(self, consumer: str, timeout: int) -> Optional[ClaimedJob]:
+        """Block up to timeout seconds for the next job."""
+
+    @abstractmethod
+    async def ack(self, consumer: str, job: ClaimedJob) -> None:
+        """Mark a claimed job done (completed or failed) so it is never redelivered."""
+
+    @abstractmethod
+    async def heartbeat(self, consumer: str, in_flight: List[ClaimedJob]) -> None:
+        """Keep this consumer's claimed jobs from being taken over."""
+
+    @abstractmethod
+    async def recover(self, consumer: str, limit: int) -> List[ClaimedJob]:
+        """
+        Recover jobs abandoned by dead consumers.
+
+        Returns:
+            Up to limit jobs now claimed by this consumer (backends that
+            requeue abandoned jobs instead return an empty list)
+        """
+
+    @abstractmethod
+    async def deregister(self, consumer: str) -> None:
+        """Leave the queue on clean shutdown."""
+
+
+class ListJobQueue(JobQueue):
+    """Redis list queue with per-worker processing lists and heartbeats."""
+
+    backend = "list"
+
+    async def _push(self, job_id: str) -> None:
+        await self.redis.lpush(QUEUE_KEY, job_id)
+
+    async def _remove(self, job_id: str, job_data: Dict[str, str]) -> bool:
+        return bool(await self.redis.lrem(QUEUE_KEY, 0, job_id))
+
+    async def waiting_count(self) -> int:
+        return await self.redis.llen(QUEUE_KEY)
+
+    async def stats(self) -> Dict[str, Any]:
+        # In-flight jobs per registered worker (alive = heartbeat not expired)
+        workers = {}
+        for worker_id in await self.redis.smembers(WORKERS_KEY):
+            workers[worker_id] = {
+                "alive": bool(await self.redis.exists(f"{HEARTBEAT_KEY_PREFIX}{worker_id}")),
+                "in_flight": await self.redis.llen(f"{PROCESSING_KEY_PREFIX}{worker_id}")
+            }
+        return {
+            "backend": self.backend,
+            "waiting": await self.waiting_count(),
+            "in_flight": sum(w["in_flight"] for w in workers.values()),
+            "workers": workers
+        }
+
+    async def register(self, consumer: str) -> List[ClaimedJob]:
+        # Jobs left in our processing list by a previous run (same worker id)
+        # were never finished: put them back before claiming new ones
+        for _ in range(10):
+            token = await self._acquire_reaper_lock(consumer)
+            if token is not None:
+                try:
+                    await self._requeue_processing(consumer)
+                finally:
+                    await self._release_reaper_lock(token)
+                break
+            await asyncio.sleep(1)
+        else:
+            logger.warning(f"Reaper lock busy, {consumer} skipped recovering its own jobs")
+
+        await self.heartbeat(consumer, [])
+        await self.redis.sadd(WORKERS_KEY, consumer)
+        return []
+
+    async def claim(self, consumer: str, timeout: int) -> Optional[ClaimedJob]:
+        # Atomically move the job into our processing list
+        job_id = await self.redis.blmove(
+            QUEUE_KEY, f"{PROCESSING_KEY_PREFIX}{consumer}", timeout=timeout, src="RIGHT", dest="LEFT"
+        )
+        if job_id is None:
+            return None
+        await self.redis.incr(DEQUEUED_SEQ_KEY)
+        return ClaimedJob(job_id, job_id)
+
+    async def ack(self, consumer: str, job: ClaimedJob) -> None:
+        await self.redis.lrem(f"{PROCESSING_KEY_PREFIX}{consumer}", 1, job.receipt)
+
+    async def heartbeat(self, consumer: str, in_flight: List[ClaimedJob]) -> None:
+        await self.redis.set(
+            f"{HEARTBEAT_KEY_PREFIX}{consumer}", str(time.time()), ex=self.visibility_timeout
+        )
+
+    async def recover(self, consumer: str, limit: int) -> List[ClaimedJob]:
+        """Requeue the processing lists of registered workers whose heartbeat expired."""
+        # Only one worker reaps at a time, so a job is never requeued twice
+        token = await self._acquire_reaper_lock(consumer)
+        if token is None:
+            return []
+
+        try:
+            for worker_id in await self.redis.smembers(WORKERS_KEY):
+                if worker_id == consumer:
+                    continue
+                if await self.redis.exists(f"{HEARTBEAT_KEY_PREFIX}{worker_id}"):
+                    continue
+                await self._requeue_processing(worker_id)
+                await self.redis.srem(WORKERS_KEY, worker_id)
+        finally:
+            await self._release_reaper_lock(token)
+
+        return []
+
+    async def deregister(self, consumer: str) -> None:
+        # Unfinished jobs keep the worker registered so a reaper requeues them
+        if not await self.redis.llen(f"{PROCESSING_KEY_PREFIX}{consumer}"):
+            await self.redis.delete(f"{HEARTBEAT_KEY_PREFIX}{consumer}")
+            await self.redis.srem(WORKERS_KEY, consumer)
+
+    async def _acquire_reaper_lock(self, consumer: str) -> Optional[str]:
+        """Take the cluster-wide reaper lock; returns its token, or None if held."""
+        token = f"{consumer}:{uuid.uuid4().hex[:8]}"
+        acquired = await self.redis.set(
+            REAPER_LOCK_KEY, token, nx=True, ex=max(self.reaper_interval, 10)
+        )
+        return token if acquired else None
+
+    async def _release_reaper_lock(self, token: str) -> None:
+        if await self.redis.get(REAPER_LOCK_KEY) == token:
+            await self.redis.delete(REAPER_LOCK_KEY)
+
+    async def _requeue_processing(self, worker_id: str) -> int:
+        """
+        Move every job in worker_id's processing list back to the queue head.
+
+        Caller must hold the reaper lock.
+
+        Returns:
+            Number of jobs moved out of the processing list
+        """
+        processing_key = f"{PROCESSING_KEY_PREFIX}{worker_id}"
+        moved = 0
+
+        while True:
+            job_id = await self.redis.lindex(processing_key, -1)
+            if job_id is None:
+                break
+
+            if await _settle_abandoned(self.redis, job_id, self.max_attempts):
+                # Queue head is the right end (workers claim from the right);
+                # waiting again, so hand back its dequeue ticket
+                await self.redis.lmove(processing_key, QUEUE_KEY, "RIGHT", "RIGHT")
+                await self.redis.decr(DEQUEUED_SEQ_KEY)
+            else:
+                await self.redis.lrem(processing_key, 1, job_id)
+            moved += 1
+
+        if moved:
+            print(f"[QUEUE-REAP] Recovered {moved} jobs from {worker_id}")
+        return moved
+
+
+class StreamJobQueue(JobQueue):
+    """Redis Streams queue read through a consumer group."""
+
+    backend = "stream"
+
+    def __init__(self, redis, max_length: int = STREAM_MAX_LENGTH, **kwargs):
+        """
+        Args:
+            redis: redis.asyncio client (decode_responses=True)
+            max_length: Approximate stream length kept for replay (XADD MAXLEN ~)
+            **kwargs: See JobQueue
+        """
+        super().__init__(redis, **kwargs)
+        self.max_length = max_length
+        # XAUTOCLAIM cursor, kept across sweeps so every pending entry gets scanned
+        self._autoclaim_cursor = "0-0"
+
+    async def _ensure_group(self) -> None:
+        try:
+            # From id 0 so entries added before the group existed are delivered
+            await self.redis.xgroup_create(STREAM_KEY, STREAM_GROUP, id="0", mkstream=True)
+        except Exception as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def _group_info(self) -> Optional[Dict[str, Any]]:
+        try:
+            groups = await self.redis.xinfo_groups(STREAM_KEY)
+        except Exception:
+            return None  # Stream does not exist yet
+        return next((g for g in groups if g["name"] == STREAM_GROUP), None)
+
+    async def _push(self, job_id: str) -> None:
+        entry_id = await self.redis.xadd(
+            STREAM_KEY, {"job_id": job_id}, maxlen=self.max_length, approximate=True
+        )
+        await self.redis.hset(f"{JOB_KEY_PREFIX}{job_id}", "queue_entry_id", entry_id)
+
+    async def _remove(self, job_id: str, job_data: Dict[str, str]) -> bool:
+        entry_id = job_data.get("queue_entry_id")
+        if not entry_id:
+            return False
+        # A delivered entry is pending, not waiting: leave it to the worker
+        group = await self._group_info()
+        if group and _stream_id(entry_id) <= _stream_id(group["last-delivered-id"]):
+            return False
+        return bool(await self.redis.xdel(STREAM_KEY, entry_id))
+
+    async def waiting_count(self) -> int:
+        # Acked entries stay in the stream, so count tickets not yet claimed or cancelled
+        enqueued = int(await self.redis.get(ENQUEUED_SEQ_KEY) or 0)
+        dequeued = int(await self.redis.get(DEQUEUED_SEQ_KEY) or 0)
+        return max(enqueued - dequeued, 0)
+
+    async def stats(self) -> Dict[str, Any]:
+        group = await self._group_info()
+        consumers = {}
+        if group and group["pending"]:
+            summary = await self.redis.xpending(STREAM_KEY, STREAM_GROUP)
+            consumers = {c["name"]: c["pending"] for c in summary.get("consumers", [])}
+        return {
+            "backend": self.backend,
+            "waiting": await self.waiting_count(),
+            "in_flight": group["pending"] if group else 0,
+            "lag": group.get("lag") if group else None,
+            "consumers": group["consumers"] if group else 0,
+            "pending_by_consumer": consumers,
+            "stream_length": await self.redis.xlen(STREAM_KEY)
+        }
+
+    async def register(self, consumer: str) -> List[ClaimedJob]:
+        await self._ensure_group()
+        # Our own pending entries from a previous run (same worker id)
+        pending = await self.redis.xpending_range(
+            STREAM_KEY, STREAM_GROUP, "-", "+", 1000, consumername=consumer
+        )
+        if not pending:
+            return []
+        messages = await self.redis.xclaim(
+            STREAM_KEY, STREAM_GROUP, consumer, 0, [p["message_id"] for p in pending]
+        )
+        return await self._runnable(messages)
+
+    async def claim(self, consumer: str, timeout: int) -> Optional[ClaimedJob]:
+        response = await self.redis.xreadgroup(
+            STREAM_GROUP, consumer, {STREAM_KEY: ">"}, count=1, block=timeout * 1000
+        )
+        for _, messages in response or []:
+            for entry_id, fields in messages:
+                await self.redis.incr(DEQUEUED_SEQ_KEY)
+                return ClaimedJob(fields["job_id"], entry_id)
+        return None
+
+    async def ack(self, consumer: str, job: ClaimedJob) -> None:
+        # Acked entries are kept for replay; XADD MAXLEN trims them
+        await self.redis.xack(STREAM_KEY, STREAM_GROUP, job.receipt)
+
+    async def heartbeat(self, consumer: str, in_flight: List[ClaimedJob]) -> None:
+        # Re-claiming our own entries resets their idle time
+        if in_flight:
+            await self.redis.xclaim(
+                STREAM_KEY, STREAM_GROUP, consumer, 0, [job.receipt for job in in_flight], justid=True
+            )
+
+    async def recover(self, consumer: str, limit: int) -> List[ClaimedJob]:
+        """
+        Take over up to limit entries idle longer than the visibility timeout.
+
+        Scans the pending entries list from where the previous sweep stopped
+        until limit entries are claimed or the scan wraps around to 0-0.
+        """
+        if limit <= 0:
+            return []
+        messages = []
+        while len(messages) < limit:
+            result = await self.redis.xautoclaim(
+                STREAM_KEY, STREAM_GROUP, consumer,
+                min_idle_time=self.visibility_timeout * 1000,
+                start_id=self._autoclaim_cursor, count=limit - len(messages)
+            )
+            self._autoclaim_cursor = result[0]
+            messages.extend(result[1])
+            if result[0] == "0-0":
+                break
+        jobs = await self._runnable(messages)
+        if messages:
+            print(f"[QUEUE-REAP] {consumer} claimed {len(messages)} idle entries ({len(jobs)} to run)")
+        return jobs
+
+    async def deregister(self, consumer: str) -> None:
+        pending = await self.redis.xpending_range(
+            STREAM_KEY, STREAM_GROUP, "-", "+", 1, consumername=consumer
+        )
+        if not pending:
+            await self.redis.xgroup_delconsumer(STREAM_KEY, STREAM_GROUP, consumer)
+
+    async def _runnable(self, messages) -> List[ClaimedJob]:
+        """Filter claimed entries: ack the finished ones, return the rest."""
+        jobs = []
+        for entry_id, fields in messages:
+            job = ClaimedJob(fields["job_id"], entry_id) if fields else None
+            if job and await _settle_abandoned(self.redis, job.job_id, self.max_attempts):
+                jobs.append(job)
+            else:
+                await self.redis.xack(STREAM_KEY, STREAM_GROUP, entry_id)
+        return jobs
+
+
+def _stream_id(entry_id: str) -> tuple:
+    milliseconds, _, sequence = entry_id.partition("-")
+    return int(milliseconds), int(sequence or 0)
+
+
+QUEUE_BACKENDS = {
+    ListJobQueue.backend: ListJobQueue,
+    StreamJobQueue.backend: StreamJobQueue,
+}
+
+
+def get_queue_backend() -> str:
+    """Configured queue backend (ASYNC_QUEUE_BACKEND: list or stream, default list)."""
+    backend = os.getenv("ASYNC_QUEUE_BACKEND", "list").lower()
+    if backend not in QUEUE_BACKENDS:
+        raise ValueError(
+            f"Unknown ASYNC_QUEUE_BACKEND '{backend}' (expected one of: {', '.join(QUEUE_BACKENDS)})"
+        )
+    return backend
+
+
+def create_job_queue(redis, backend: Optional[str] = None, **kwargs) -> JobQueue:
+    """
+    Create the job queue for a Redis client.
+
+    Args:
+        redis: redis.asyncio client (decode_responses=True)
+        backend: "list" or "stream" (default: ASYNC_QUEUE_BACKEND)
+        **kwargs: visibility_timeout / max_attempts / reaper_interval (see
+                  JobQueue), max_length (stream backend)
+
+    Returns:
+        JobQueue for the backend
+    """
+    return QUEUE_BACKENDS[backend or get_queue_backend()](redis, **kwargs)
+
+
+class WaitEstimator:
+    """
+    Cached queue wait model built from recent job completions.
+
+    Workers record (finished_at, processing_time_ms) for their last
+    RECENT_COMPLETIONS_SIZE jobs. The model is rebuilt at most once per
+    refresh_seconds per process, so status polling never scans history:
+
+    - throughput: jobs finished per second over the recent window, which
+      already reflects how many workers and slots are draining the queue
+    - average processing time: fallback when throughput is unknown
+    """
+
+    def __init__(self, refresh_seconds: float = 10.0, window_seconds: float = 300.0,
+                 default_seconds_per_job: float = 8.0):
+        """
+        Args:
+            refresh_seconds: How long a computed model is reused
+            window_seconds: Completions older than this do not count toward throughput
+            default_seconds_per_job: Estimate used before any job has finished
+        """
+        self.refresh_seconds = refresh_seconds
+        self.window_seconds = window_seconds
+        self.default_seconds_per_job = default_seconds_per_job
+        self._model: Optional[Dict[str, float]] = None
+        self._model_at = 0.0
+
+    async def estimate_wait_seconds(self, redis, position: Optional[int]) -> Optional[int]:
+        """Seconds until a job at this 1-based position finishes (None if not queued)."""
+        if position is None:
+            return None
+        model = await self.model(redis)
+        if model["jobs_per_second"] > 0:
+            return math.ceil(position / model["jobs_per_second"])
+        return math.ceil(position * model["avg_processing_seconds"])
+
+    async def model(self, redis) -> Dict[str, float]:
+        """Current model, rebuilt from Redis when older than refresh_seconds."""
+        now = time.time()
+        if self._model is not None and now - self._model_at < self.refresh_seconds:
+            return self._model
+
+        samples = []
+        for entry in await redis.lrange(RECENT_COMPLETIONS_KEY, 0, RECENT_COMPLETIONS_SIZE - 1):
+            finished_at, _, processing_ms = entry.partition(":")
+            samples.append((float(finished_at), int(processing_ms)))
+
+        recent = [finished_at for finished_at, _ in samples if now - finished_at <= self.window_seconds]
+        jobs_per_second = 0.0
+        if len(recent) >= 2:
+            # Rate over the span the samples actually cover (list is capped)
+            span = max(now - min(recent), 1.0)
+            jobs_per_second = len(recent) / span
+
+        self._model = {
+            "avg_processing_seconds": (
+                sum(ms for _, ms in samples) / len(samples) / 1000 if samples
+                else self.default_seconds_per_job
+            ),
+            "jobs_per_second": round(jobs_per_second, 4),
+            "samples": len(samples)
+        }
+        self._model_at = now
+        return self._model
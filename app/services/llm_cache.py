@@ -0,0 +1,458 @@
+"""
+LLM Response Cache
+==================
+
+Content-addressed cache for LLM responses, checked before a call is admitted
+to the connection pool so a repeat render costs no LLM call and no pool slot.
+
+- Key: sha256 of (model, temperature, prompt)
+- Tier 1: in-process LRU, bounded by entry count and total content bytes
+- Tier 2 (optional): Redis, shared across instances
+- Both tiers live in TwoTierCache, also the base of the Image Builder's
+  ImageResultCache
+- TTL per endpoint family (content, slides, hero, atomic, layout, iseries)
+- Per-request bypass via Cache-Control (no-cache: skip reads, no-store: skip
+  reads and writes)
+- Callers that reject a response (e.g. invalid JSON) drop it with
+  invalidate_llm_response, so retries reach the model instead of the cache
+
+Opt-in: set LLM_CACHE_ENABLED=true.
+"""
+
+import hashlib
+import logging
+import os
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY_PREFIX = "text_service:llm_cache:"
+
+
+class CacheBypass(str, Enum):
+    """Per-request cache behaviour (from the Cache-Control request header)."""
+    NONE = "none"  # Read and write
+    NO_CACHE = "no-cache"  # Skip reads, refresh the stored entry
+    NO_STORE = "no-store"  # Skip reads and writes
+
+
+@dataclass
+class LLMCacheConfig:
+    """
+    Configuration for the LLM response cache.
+
+    Attributes:
+        enabled: Master switch (default: False, opt-in)
+        max_entries: Maximum entries in the in-process LRU
+        max_bytes: Maximum total cached content size in the in-process LRU
+        default_ttl_seconds: TTL when the endpoint family has no override
+        family_ttls: TTL overrides per endpoint family
+        redis_url: Redis URL for the shared tier (None = memory only)
+    """
+    enabled: bool = False
+    max_entries: int = 1000
+    max_bytes: int = 50 * 1024 * 1024
+    default_ttl_seconds: int = 3600
+    family_ttls: Dict[str, int] = field(default_factory=dict)
+    redis_url: Optional[str] = None
+
+    def get_ttl(self, endpoint_family: str) -> int:
+        """Get TTL in seconds for an endpoint family."""
+        return self.family_ttls.get(endpoint_family, self.default_ttl_seconds)
+
+
+# Per-request bypass mode (set by the Cache-Control header dependency)
+_cache_bypass: ContextVar[CacheBypass] = ContextVar("llm_cache_bypass", default=CacheBypass.NONE)
+
+
+def set_cache_bypass(mode: CacheBypass):
+    """Set the cache bypass mode for the current request context."""
+    return _cache_bypass.set(mode)
+
+
+def get_cache_bypass() -> CacheBypass:
+    """Get the cache bypass mode for the current request context."""
+    return _cache_bypass.get()
+
+
+def parse_cache_control(header_value: Optional[str]) -> CacheBypass:
+    """
+    Map a Cache-Control request header to a bypass mode.
+
+    Args:
+        header_value: Raw header value (e.g., "no-cache", "no-store, max-age=0")
+
+    Returns:
+        CacheBypass mode
+    """
+    if not header_value:
+        return CacheBypass.NONE
+    directives = {d.strip().split("=")[0].lower() for d in header_value.split(",")}
+    if "no-store" in directives:
+        return CacheBypass.NO_STORE
+    if "no-cache" in directives:
+        return CacheBypass.NO_CACHE
+    return CacheBypass.NONE
+
+
+class TwoTierCache:
+    """
+    LRU memory tier plus optional Redis tier for string values with a TTL.
+
+    Shared by LLMResponseCache and the Image Builder's ImageResultCache;
+    subclasses set redis_key_prefix and label, and wrap _get / _set with
+    their own key and value types.
+    """
+
+    redis_key_prefix = ""
+    label = "Cache"  # Log prefix
+
+    def __init__(self, config):
+        """
+        Initialize the cache.
+
+        Args:
+            config: Cache configuration (enabled, max_entries, redis_url)
+        """
+        self.config = config
+        # key -> (value, expires_at)
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._bytes = 0
+        self._redis = None
+        self._redis_failed = False
+
+        self.hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bypasses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.config.enabled
+
+    @property
+    def max_bytes(self) -> Optional[int]:
+        """Total value size limit of the memory tier (None = entry count only)."""
+        return None
+
+    async def _get_redis(self):
+        """Lazily connect to the Redis tier (disabled after a failed connect)."""
+        if not self.config.redis_url or self._redis_failed:
+            return None
+        if self._redis is None:
+            try:
+                import redis.asyncio as aioredis
+                self._redis = await aioredis.from_url(
+                    self.config.redis_url,
+                    encoding="utf-8",
+                    decode_responses=True
+                )
+                await self._redis.ping()
+                logger.info(f"{self.label} Redis tier connected")
+            except Exception as e:
+                logger.warning(f"{self.label} Redis tier unavailable, using memory only: {e}")
+                self._redis = None
+                self._redis_failed = True
+        return self._redis
+
+    def _get_memory(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at <= time.time():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _set_memory(self, key: str, value: str, ttl: int) -> None:
+        if key in self._entries:
+            self._remove(key)
+        size = len(value)
+        max_bytes = self.max_bytes
+        if max_bytes is not None and size > max_bytes:
+            return
+        self._entries[key] = (value, time.time() + ttl)
+        self._bytes += size
+        while (
+            len(self._entries) > self.config.max_entries
+            or (max_bytes is not None and self._bytes > max_bytes)
+        ):
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        value, _ = self._entries.pop(key)
+        self._bytes -= len(value)
+
+    async def _get(self, key: str) -> Optional[str]:
+        """Look up a value (memory first, then Redis); counts hits and misses."""
+        value = self._get_memory(key)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        redis = await self._get_redis()
+        if redis is not None:
+            try:
+                value = await redis.get(self.redis_key_prefix + key)
+                ttl = await redis.ttl(self.redis_key_prefix + key) if value is not None else 0
+            except Exception as e:
+                logger.warning(f"{self.label} Redis get failed: {e}")
+                value = None
+            if value is not None:
+                # Promote to memory for the entry's remaining lifetime
+                self.redis_hits += 1
+                self._set_memory(key, value, max(1, ttl or 1))
+                return value
+
+        self.misses += 1
+        return None
+
+    async def _set(self, key: str, value: str, ttl: int) -> None:
+        """Store a value in both tiers (nothing for ttl <= 0)."""
+        if ttl <= 0:
+            return
+        self._set_memory(key, value, ttl)
+
+        redis = await self._get_redis()
+        if redis is not None:
+            try:
+                await redis.set(self.redis_key_prefix + key, value, ex=ttl)
+            except Exception as e:
+                logger.warning(f"{self.label} Redis set failed: {e}")
+
+    async def delete(self, key: str) -> None:
+        """Remove an entry from both tiers."""
+        if key in self._entries:
+            self._remove(key)
+
+        redis = await self._get_redis()
+        if redis is not None:
+            try:
+                await redis.delete(self.redis_key_prefix + key)
+            except Exception as e:
+                logger.warning(f"{self.label} Redis delete failed: {e}")
+
+    def clear(self) -> None:
+        """Clear the in-process tier and reset counters."""
+        self._entries.clear()
+        self._bytes = 0
+        self.hits = self.redis_hits = self.misses = self.evictions = self.bypasses = 0
+
+    @property
+    def stats(self) -> dict:
+        """Cache statistics for monitoring."""
+        lookups = self.hits + self.redis_hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "bypasses": self.bypasses,
+            "evictions": self.evictions,
+            "hit_rate": round((self.hits + self.redis_hits) / lookups, 3) if lookups else 0.0,
+            "redis_enabled": bool(self.config.redis_url) and not self._redis_failed
+        }
+
+
+class LLMResponseCache(TwoTierCache):
+    """
+    Two-tier (LRU memory + optional Redis) cache of LLM response content.
+
+    Usage:
+        cache = get_llm_cache()
+        key = cache.make_key(model, temperature, prompt)
+        content = await cache.get(key)
+        if content is None:
+            content = await generate(prompt)
+            await cache.set(key, content, endpoint_family="content")
+    """
+
+    redis_key_prefix = REDIS_KEY_PREFIX
+    label = "LLM cache"
+
+    def __init__(self, config: Optional[LLMCacheConfig] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            config: Cache configuration. Uses defaults if not provided.
+        """
+        super().__init__(config or LLMCacheConfig())
+
+    @staticmethod
+    def make_key(model: str, temperature: float, prompt: str) -> str:
+        """Content-addressed key for a (model, temperature, prompt) triple."""
+        digest = hashlib.sha256(
+            f"{model}\x00{temperature}\x00{prompt}".encode("utf-8")
+        ).hexdigest()
+        return digest
+
+    @property
+    def max_bytes(self) -> Optional[int]:
+        return self.config.max_bytes
+
+    async def get(self, key: str) -> Optional[str]:
+        """
+        Look up cached content (memory first, then Redis).
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Cached content or None on miss
+        """
+        return await self._get(key)
+
+    async def set(self, key: str, content: str, endpoint_family: str = "default") -> None:
+        """
+        Store content in both tiers with the endpoint family's TTL.
+
+        Args:
+            key: Key from make_key()
+            content: LLM response content
+            endpoint_family: Family used to pick the TTL
+        """
+        await self._set(key, content, self.config.get_ttl(endpoint_family))
+
+    @property
+    def stats(self) -> dict:
+        """Cache statistics for monitoring."""
+        return {
+            **super().stats,
+            "config": {
+                "max_entries": self.config.max_entries,
+                "max_bytes": self.config.max_bytes,
+                "default_ttl_seconds": self.config.default_ttl_seconds,
+                "family_ttls": self.config.family_ttls
+            }
+        }
+
+
+async def cached_generate(
+    cache: "LLMResponseCache",
+    model: str,
+    temperature: float,
+    prompt: str,
+    endpoint_family: str,
+    generate
+) -> str:
+    """
+    Serve prompt from the cache, or call generate(prompt) and store the result.
+
+    Honors the request-context bypass mode. Does nothing extra when the cache
+    is disabled.
+
+    Args:
+        cache: Response cache
+        model: Model the prompt routes to
+        temperature: Sampling temperature
+        prompt: Prompt text
+        endpoint_family: Family used to pick the TTL
+        generate: Async callable prompt -> content
+
+    Returns:
+        Response content
+    """
+    if not cache.enabled:
+        return await generate(prompt)
+
+    bypass = get_cache_bypass()
+    key = cache.make_key(model, temperature, prompt)
+
+    if bypass == CacheBypass.NONE:
+        content = await cache.get(key)
+        if content is not None:
+            print(f"[LLM-CACHE] Hit ({endpoint_family}): key={key[:12]}")
+            return content
+    else:
+        cache.bypasses += 1
+
+    content = await generate(prompt)
+
+    if bypass != CacheBypass.NO_STORE and content:
+        await cache.set(key, content, endpoint_family)
+    return content
+
+
+async def invalidate_llm_response(llm_callable: Any, prompt: str) -> None:
+    """
+    Drop the cached response to prompt after the caller rejected it.
+
+    Call when a response fails parsing or validation, before retrying, so
+    the retry reaches the model instead of replaying the cached response.
+    A no-op for callables without a cache (e.g. test fakes).
+
+    Args:
+        llm_callable: Callable from create_llm_callable_for / _async / _pooled
+        prompt: Prompt whose response was rejected
+    """
+    invalidate = getattr(llm_callable, "invalidate", None)
+    if invalidate is not None:
+        await invalidate(prompt)
+
+
+def _parse_ttl_env(value: str) -> Dict[str, int]:
+    """Parse "content=3600,hero=600" style TTL overrides."""
+    result = {}
+    for item in value.split(","):
+        if "=" in item:
+            family, seconds = item.split("=", 1)
+            result[family.strip()] = int(seconds)
+    return result
+
+
+# Global cache instance (singleton pattern)
+_cache_instance: Optional[LLMResponseCache] = None
+
+
+def get_llm_cache(config: Optional[LLMCacheConfig] = None) -> LLMResponseCache:
+    """
+    Get the singleton LLM response cache.
+
+    Configuration via environment variables (first call only):
+    - LLM_CACHE_ENABLED: Enable the cache (default: false)
+    - LLM_CACHE_MAX_ENTRIES: LRU entry limit (default: 1000)
+    - LLM_CACHE_MAX_BYTES: LRU content size limit (default: 50MB)
+    - LLM_CACHE_TTL_SECONDS: Default TTL (default: 3600)
+    - LLM_CACHE_TTLS: Per-family TTLs, e.g. "content=3600,hero=600"
+    - LLM_CACHE_REDIS_URL: Enables the Redis tier
+
+    Args:
+        config: Optional cache configuration (only used on first call)
+
+    Returns:
+        Shared LLMResponseCache instance
+    """
+    global _cache_instance
+
+    if _cache_instance is None:
+        if config is None:
+            config = LLMCacheConfig(
+                enabled=os.getenv("LLM_CACHE_ENABLED", "false").lower() == "true",
+                max_entries=int(os.getenv("LLM_CACHE_MAX_ENTRIES", "1000")),
+                max_bytes=int(os.getenv("LLM_CACHE_MAX_BYTES", str(50 * 1024 * 1024))),
+                default_ttl_seconds=int(os.getenv("LLM_CACHE_TTL_SECONDS", "3600")),
+                family_ttls=_parse_ttl_env(os.getenv("LLM_CACHE_TTLS", "")),
+                redis_url=os.getenv("LLM_CACHE_REDIS_URL") or None
+            )
+        _cache_instance = LLMResponseCache(config)
+
+    return _cache_instance
+
+
+def reset_llm_cache():
+    """Reset the global cache instance (for testing)."""
+    global _cache_instance
+    _cache_instance = None
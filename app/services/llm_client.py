@@ -9,11 +9,17 @@ import os
 import time
 import logging
 import asyncio
-from typing import Optional, Dict, Any, List
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import partial
+from typing import Optional, Dict, Any, List, AsyncIterator, Tuple
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
 
+from .prompt_prefix import PrefixEntry, PromptPrefixRegistry, SplitPrompt, get_prefix_registry
+
 # Provider SDKs
 # v3.3 Security Update: Using Vertex AI SDK (google-cloud-aiplatform) instead of
 # the old google-generativeai SDK. Vertex AI provides secure ADC authentication.
@@ -31,6 +37,85 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Anthropic ignores cache_control on prompts shorter than this
+ANTHROPIC_MIN_CACHE_TOKENS = 1024
+
+
+# Dedicated executor for blocking Vertex calls when the native async API is
+# not used (GEMINI_USE_NATIVE_ASYNC=false). Sized independently of the event
+# loop's default executor so file I/O and other to_thread users never queue
+# behind in-flight LLM calls.
+_gemini_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_gemini_executor() -> ThreadPoolExecutor:
+    """
+    Get the shared thread pool for blocking Gemini calls.
+
+    Size from GEMINI_THREAD_POOL_SIZE, default 2 x LLM_MAX_CONCURRENT (one
+    thread per slot in each of the Flash and Pro sub-pools).
+    """
+    global _gemini_executor
+
+    if _gemini_executor is None:
+        default_size = 2 * int(os.getenv("LLM_MAX_CONCURRENT", "10"))
+        size = int(os.getenv("GEMINI_THREAD_POOL_SIZE", str(default_size)))
+        _gemini_executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix="gemini")
+        logger.info(f"Gemini thread pool initialized: max_workers={size}")
+
+    return _gemini_executor
+
+
+def shutdown_gemini_executor() -> None:
+    """Shut down the Gemini thread pool (app shutdown / tests)."""
+    global _gemini_executor
+
+    if _gemini_executor is not None:
+        _gemini_executor.shutdown(wait=False, cancel_futures=True)
+        _gemini_executor = None
+
+
+def use_gemini_native_async(model: Any) -> bool:
+    """Whether to call model.generate_content_async (GEMINI_USE_NATIVE_ASYNC, default true)."""
+    return (
+        os.getenv("GEMINI_USE_NATIVE_ASYNC", "true").lower() == "true"
+        and hasattr(model, "generate_content_async")
+    )
+
+
+async def gemini_generate_content(
+    model: Any,
+    prompt: str,
+    generation_config: Any,
+    native_async: bool = True
+) -> Any:
+    """
+    Run GenerativeModel.generate_content without blocking the event loop.
+
+    With native_async the SDK's generate_content_async is awaited directly,
+    so in-flight calls hold no threads at all. Otherwise the blocking call
+    runs on the dedicated Gemini executor.
+
+    Args:
+        model: Vertex AI GenerativeModel (or compatible object)
+        prompt: Prompt text
+        generation_config: GenerationConfig for the call
+        native_async: Use generate_content_async
+
+    Returns:
+        The SDK GenerationResponse
+    """
+    if native_async:
+        return await model.generate_content_async(
+            prompt,
+            generation_config=generation_config
+        )
+
+    return await asyncio.get_running_loop().run_in_executor(
+        get_gemini_executor(),
+        partial(model.generate_content, prompt, generation_config=generation_config)
+    )
+
 
 class LLMProvider(str, Enum):
     """Supported LLM providers."""
@@ -54,6 +139,7 @@ class LLMResponse:
     provider: str = ""
     latency_ms: float = 0.0
     finish_reason: str = ""
+    cached_tokens: int = 0
     raw_response: Optional[Any] = None
 
 
@@ -76,6 +162,12 @@ class BaseLLMClient(ABC):
         self.max_tokens = max_tokens
         self.kwargs = kwargs
 
+    def _record_prefix(self, prompt: str) -> Optional[PrefixEntry]:
+        """Register a SplitPrompt's prefix with the prefix registry."""
+        if isinstance(prompt, SplitPrompt):
+            return get_prefix_registry().record(prompt)
+        return None
+
     @abstractmethod
     async def generate(self, prompt: str) -> LLMResponse:
         """
@@ -89,6 +181,22 @@ class BaseLLMClient(ABC):
         """
         pass
 
+    async def generate_stream(self, prompt: str) -> AsyncIterator[str]:
+        """
+        Stream generated content as text chunks.
+
+        Default implementation yields the full generate() result as a single
+        chunk; providers with a streaming API override this.
+
+        Args:
+            prompt: System prompt + user input
+
+        Yields:
+            Content text chunks in order
+        """
+        response = await self.generate(prompt)
+        yield response.content
+
     @abstractmethod
     def is_configured(self) -> bool:
         """Check if provider is properly configured (API keys, etc.)."""
@@ -154,7 +262,11 @@ class GeminiClient(BaseLLMClient):
 
             # Create Gemini model instance
             self.client = GenerativeModel(self.model)
-            logger.info(f"Initialized Gemini model: {self.model}")
+            self.native_async = use_gemini_native_async(self.client)
+            logger.info(
+                f"Initialized Gemini model: {self.model} "
+                f"({'native async' if self.native_async else 'thread pool'})"
+            )
 
         except Exception as e:
             logger.error(f"Failed to initialize Vertex AI: {e}")
@@ -165,20 +277,15 @@ class GeminiClient(BaseLLMClient):
         start_time = time.time()
 
         try:
-            # Import GenerationConfig
-            from vertexai.preview.generative_models import GenerationConfig
-
-            generation_config = GenerationConfig(
-                temperature=self.temperature,
-                max_output_tokens=self.max_tokens,
-            )
-
-            # Generate content using asyncio.to_thread() to avoid blocking event loop
-            # This enables true concurrent LLM calls instead of sequential processing
-            response = await asyncio.to_thread(
-                self.client.generate_content,
-                prompt,
-                generation_config=generation_config
+            model, contents = await self._resolve_context_cache(prompt)
+
+            # Native async call (or dedicated thread pool) so concurrent
+            # calls never pin threads of the default executor
+            response = await gemini_generate_content(
+                model,
+                contents,
+                self._generation_config(),
+                native_async=self.native_async
             )
 
             latency_ms = (time.time() - start_time) * 1000
@@ -189,9 +296,13 @@ class GeminiClient(BaseLLMClient):
             # Token usage (if available)
             prompt_tokens = 0
             completion_tokens = 0
+            cached_tokens = 0
             if hasattr(response, 'usage_metadata'):
                 prompt_tokens = getattr(response.usage_metadata, 'prompt_token_count', 0)
                 completion_tokens = getattr(response.usage_metadata, 'candidates_token_count', 0)
+                # Explicit context cache or Gemini's implicit prefix caching
+                cached_tokens = getattr(response.usage_metadata, 'cached_content_token_count', 0) or 0
+                get_prefix_registry().record_cached_tokens(cached_tokens)
 
             return LLMResponse(
                 content=content,
@@ -202,6 +313,7 @@ class GeminiClient(BaseLLMClient):
                 provider="gemini-vertex",
                 latency_ms=latency_ms,
                 finish_reason="",
+                cached_tokens=cached_tokens,
                 raw_response=response
             )
 
@@ -209,6 +321,127 @@ class GeminiClient(BaseLLMClient):
             logger.error(f"Gemini Vertex AI generation error: {e}")
             raise
 
+    async def _resolve_context_cache(self, prompt: str) -> Tuple[Any, str]:
+        """
+        Pick the model and contents for a call.
+
+        When a Vertex context cache holds the prompt's stable prefix, the
+        call goes to the cache-backed model with only the per-slide suffix.
+        Otherwise (plain prompts, caching disabled, prefix too small or not
+        yet repeated) the base model gets the full prompt.
+        """
+        entry = self._record_prefix(prompt)
+        if entry is None:
+            return self.client, prompt
+
+        registry = get_prefix_registry()
+        cached_model = registry.get_provider_cache(entry, self.model)
+        if cached_model is None and registry.should_create_provider_cache(entry, self.model):
+            cached_model = await self._create_context_cache(registry, entry, prompt.prefix)
+
+        if cached_model is None:
+            return self.client, prompt
+        return cached_model, prompt.suffix
+
+    async def _create_context_cache(
+        self,
+        registry: PromptPrefixRegistry,
+        entry: PrefixEntry,
+        prefix: str
+    ) -> Optional[Any]:
+        """Create a Vertex CachedContent for prefix; returns the model bound to it."""
+        from vertexai.preview import caching
+        from vertexai.preview.generative_models import GenerativeModel
+
+        def _create():
+            cached_content = caching.CachedContent.create(
+                model_name=self.model,
+                contents=prefix,
+                ttl=timedelta(seconds=registry.config.cache_ttl_seconds)
+            )
+            return GenerativeModel.from_cached_content(cached_content=cached_content)
+
+        entry.creating.add(self.model)
+        try:
+            cached_model = await asyncio.get_running_loop().run_in_executor(
+                get_gemini_executor(), _create
+            )
+        except Exception as e:
+            registry.mark_failed(entry, self.model, e)
+            return None
+        finally:
+            entry.creating.discard(self.model)
+
+        registry.set_provider_cache(entry, self.model, cached_model)
+        return cached_model
+
+    def _generation_config(self):
+        """Build the GenerationConfig for a call."""
+        from vertexai.preview.generative_models import GenerationConfig
+
+        return GenerationConfig(
+            temperature=self.temperature,
+            max_output_tokens=self.max_tokens,
+        )
+
+    async def generate_stream(self, prompt: str) -> AsyncIterator[str]:
+        """Stream content chunks from Gemini via Vertex AI."""
+        generation_config = self._generation_config()
+        model, contents = await self._resolve_context_cache(prompt)
+
+        if self.native_async:
+            try:
+                responses = await model.generate_content_async(
+                    contents,
+                    generation_config=generation_config,
+                    stream=True
+                )
+                async for chunk in responses:
+                    text = getattr(chunk, "text", "")
+                    if text:
+                        yield text
+            except Exception as e:
+                logger.error(f"Gemini Vertex AI streaming error: {e}")
+                raise
+            return
+
+        # The blocking SDK stream is drained on the Gemini executor and
+        # handed to the event loop through a queue
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        done = object()
+        stopped = threading.Event()
+
+        def _drain():
+            try:
+                for chunk in model.generate_content(
+                    contents,
+                    generation_config=generation_config,
+                    stream=True
+                ):
+                    if stopped.is_set():
+                        break  # Consumer went away
+                    text = getattr(chunk, "text", "")
+                    if text:
+                        loop.call_soon_threadsafe(queue.put_nowait, text)
+            except Exception as e:
+                loop.call_soon_threadsafe(queue.put_nowait, e)
+            finally:
+                loop.call_soon_threadsafe(queue.put_nowait, done)
+
+        loop.run_in_executor(get_gemini_executor(), _drain)
+        try:
+            while True:
+                item = await queue.get()
+                if item is done:
+                    break
+                if isinstance(item, Exception):
+                    logger.error(f"Gemini Vertex AI streaming error: {item}")
+                    raise item
+                yield item
+        finally:
+            stopped.set()
+
     def is_configured(self) -> bool:
         """Check if Gemini Vertex AI is configured."""
         return os.getenv("GCP_PROJECT_ID") is not None
@@ -246,6 +479,8 @@ class OpenAIClient(BaseLLMClient):
     async def generate(self, prompt: str) -> LLMResponse:
         """Generate content using OpenAI."""
         start_time = time.time()
+        # Stable prefixes come first, so OpenAI's automatic prompt caching applies
+        self._record_prefix(prompt)
 
         try:
             response = await self.client.chat.completions.create(
@@ -262,6 +497,9 @@ class OpenAIClient(BaseLLMClient):
 
             choice = response.choices[0]
             usage = response.usage
+            details = getattr(usage, "prompt_tokens_details", None)
+            cached_tokens = getattr(details, "cached_tokens", 0) or 0
+            get_prefix_registry().record_cached_tokens(cached_tokens)
 
             return LLMResponse(
                 content=choice.message.content,
@@ -272,6 +510,7 @@ class OpenAIClient(BaseLLMClient):
                 provider="openai",
                 latency_ms=latency_ms,
                 finish_reason=choice.finish_reason,
+                cached_tokens=cached_tokens,
                 raw_response=response
             )
 
@@ -279,6 +518,28 @@ class OpenAIClient(BaseLLMClient):
             logger.error(f"OpenAI generation error: {e}")
             raise
 
+    async def generate_stream(self, prompt: str) -> AsyncIterator[str]:
+        """Stream content chunks from OpenAI."""
+        self._record_prefix(prompt)
+        try:
+            stream = await self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": "You are a professional presentation content generator."},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=self.temperature,
+                max_tokens=self.max_tokens,
+                stream=True
+            )
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+        except Exception as e:
+            logger.error(f"OpenAI streaming error: {e}")
+            raise
+
     def is_configured(self) -> bool:
         """Check if OpenAI is configured."""
         return self.api_key is not None and AsyncOpenAI is not None
@@ -313,6 +574,26 @@ class AnthropicClient(BaseLLMClient):
 
         logger.info(f"Initialized Anthropic client with model: {self.model}")
 
+    def _messages(self, prompt: str) -> List[Dict[str, Any]]:
+        """
+        Build the messages for a call.
+
+        A repeated SplitPrompt prefix is sent as its own content block marked
+        cache_control, so later calls read it from Anthropic's prompt cache.
+        """
+        entry = self._record_prefix(prompt)
+        if entry is not None and get_prefix_registry().wants_provider_cache(
+            entry, ANTHROPIC_MIN_CACHE_TOKENS
+        ):
+            return [{
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": prompt.prefix, "cache_control": {"type": "ephemeral"}},
+                    {"type": "text", "text": prompt.suffix}
+                ]
+            }]
+        return [{"role": "user", "content": prompt}]
+
     async def generate(self, prompt: str) -> LLMResponse:
         """Generate content using Anthropic Claude."""
         start_time = time.time()
@@ -322,15 +603,15 @@ class AnthropicClient(BaseLLMClient):
                 model=self.model,
                 max_tokens=self.max_tokens,
                 temperature=self.temperature,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
+                messages=self._messages(prompt)
             )
 
             latency_ms = (time.time() - start_time) * 1000
 
             # Extract content from response
             content = response.content[0].text if response.content else ""
+            cached_tokens = getattr(response.usage, "cache_read_input_tokens", 0) or 0
+            get_prefix_registry().record_cached_tokens(cached_tokens)
 
             return LLMResponse(
                 content=content,
@@ -341,6 +622,7 @@ class AnthropicClient(BaseLLMClient):
                 provider="anthropic",
                 latency_ms=latency_ms,
                 finish_reason=response.stop_reason,
+                cached_tokens=cached_tokens,
                 raw_response=response
             )
 
@@ -348,6 +630,22 @@ class AnthropicClient(BaseLLMClient):
             logger.error(f"Anthropic generation error: {e}")
             raise
 
+    async def generate_stream(self, prompt: str) -> AsyncIterator[str]:
+        """Stream content chunks from Anthropic Claude."""
+        try:
+            async with self.client.messages.stream(
+                model=self.model,
+                max_tokens=self.max_tokens,
+                temperature=self.temperature,
+                messages=self._messages(prompt)
+            ) as stream:
+                async for text in stream.text_stream:
+                    yield text
+
+        except Exception as e:
+            logger.error(f"Anthropic streaming error: {e}")
+            raise
+
     def is_configured(self) -> bool:
         """Check if Anthropic is configured."""
         return self.api_key is not None and AsyncAnthropic is not None
@@ -4,16 +4,26 @@ LLM Connection Pool with Concurrency Control and Rate Limiting
 
 Manages concurrent LLM requests with:
 - Semaphore-based concurrency control (prevents overload)
-- Rate limiting (respects Vertex AI API quotas)
+- Token-bucket rate limiting on requests and input/output tokens per minute
+  (respects Vertex AI API quotas)
 - Request queue with overflow protection
 - Timeout handling per request
 - Status monitoring for observability
+- Per-endpoint-family metrics (content, slides, hero, atomic, layout, iseries)
+- Priority lanes (interactive, batch, background) with weighted-fair
+  dequeueing and per-lane concurrency caps
+- Per-model sub-pools (Flash/Pro) with independent concurrency, queue and
+  rate limits, so slow Pro backlogs never block Flash calls
+- Streaming calls (stream()) that hold their slot until the stream ends
 """
 
 import asyncio
+import os
 import time
 import logging
-from typing import Optional, Callable, Any
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Optional, Callable, Any, AsyncIterator, Dict, Tuple
 from dataclasses import dataclass, field
 from collections import deque
 from enum import Enum
@@ -28,6 +38,17 @@ class PoolStatus(str, Enum):
     OVERLOADED = "overloaded"  # Queue full
 
 
+class PoolPriority(str, Enum):
+    """Scheduling lane for a pooled LLM request."""
+    INTERACTIVE = "interactive"  # User-facing, latency sensitive (autofit, single slide)
+    BATCH = "batch"  # Bulk deck generation
+    BACKGROUND = "background"  # Async worker / prefetch
+
+
+# Lane order doubles as the tie-breaker when lanes have equal virtual time
+LANE_ORDER = (PoolPriority.INTERACTIVE, PoolPriority.BATCH, PoolPriority.BACKGROUND)
+
+
 @dataclass
 class LLMPoolConfig:
     """
@@ -38,13 +59,113 @@ class LLMPoolConfig:
         max_queue_size: Maximum pending requests before rejection (default: 50)
         timeout_seconds: Per-request timeout (default: 120s)
         rate_limit_rpm: Requests per minute limit (Vertex AI: ~300 RPM)
+        input_tpm_limit: Prompt tokens per minute limit (0 = unlimited)
+        output_tpm_limit: Completion tokens per minute limit (0 = unlimited)
+        rate_limit_burst_seconds: Bucket size as seconds of budget that may be
+                                  spent at once (default: 10s worth)
         warning_threshold: Queue depth that triggers degraded status (default: 0.7)
+        lane_weights: Share of freed slots each lane gets when several are waiting
+        lane_max_concurrent: Per-lane cap on in-flight calls. Lanes not listed
+                            default to 100% (interactive), 70% (batch) and
+                            30% (background) of max_concurrent.
     """
     max_concurrent: int = 10
     max_queue_size: int = 50
     timeout_seconds: float = 120.0
     rate_limit_rpm: int = 300
+    input_tpm_limit: int = 0
+    output_tpm_limit: int = 0
+    rate_limit_burst_seconds: float = 10.0
     warning_threshold: float = 0.7  # 70% of max_queue_size
+    lane_weights: Dict[str, int] = field(default_factory=lambda: {
+        PoolPriority.INTERACTIVE.value: 6,
+        PoolPriority.BATCH.value: 3,
+        PoolPriority.BACKGROUND.value: 1,
+    })
+    lane_max_concurrent: Dict[str, int] = field(default_factory=dict)
+
+    def get_lane_weight(self, lane: PoolPriority) -> int:
+        """Get scheduling weight for a lane (minimum 1)."""
+        return max(1, int(self.lane_weights.get(lane.value, 1)))
+
+    def get_lane_cap(self, lane: PoolPriority) -> int:
+        """Get the concurrency cap for a lane (bounded by max_concurrent)."""
+        default_share = {
+            PoolPriority.INTERACTIVE: 1.0,
+            PoolPriority.BATCH: 0.7,
+            PoolPriority.BACKGROUND: 0.3,
+        }[lane]
+        cap = self.lane_max_concurrent.get(
+            lane.value,
+            int(self.max_concurrent * default_share)
+        )
+        return max(1, min(int(cap), self.max_concurrent))
+
+
+class TokenBucket:
+    """
+    Continuously refilling token bucket for a per-minute budget.
+
+    Refills at limit_per_minute / 60 tokens per second up to a burst capacity.
+    consume() may drive the balance negative (post-hoc accounting for output
+    tokens), which delays later admissions until the debt is repaid.
+    A limit of 0 disables the bucket.
+    """
+
+    def __init__(self, limit_per_minute: int, burst_seconds: float = 10.0):
+        self.limit_per_minute = limit_per_minute
+        self.rate = limit_per_minute / 60.0
+        self.capacity = max(1.0, self.rate * burst_seconds)
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+
+    @property
+    def enabled(self) -> bool:
+        return self.limit_per_minute > 0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until `amount` tokens are available (0 if available now)."""
+        if not self.enabled:
+            return 0.0
+        self._refill()
+        # A single request larger than the bucket only needs a full bucket
+        deficit = min(amount, self.capacity) - self.tokens
+        return deficit / self.rate if deficit > 0 else 0.0
+
+    def consume(self, amount: float) -> None:
+        """Take tokens from the bucket (negative amounts refund)."""
+        if not self.enabled:
+            return
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens - amount)
+
+    @property
+    def remaining(self) -> Optional[int]:
+        """Tokens available now (None when the bucket is disabled)."""
+        if not self.enabled:
+            return None
+        self._refill()
+        return int(max(0.0, self.tokens))
+
+
+# Rough prompt size estimate used for input-TPM admission before the
+# real prompt_tokens count is known
+CHARS_PER_TOKEN = 4
+
+
+@dataclass
+class LaneState:
+    """Scheduler state for one priority lane."""
+    waiters: deque = field(default_factory=deque)  # (future, enqueue_time)
+    active: int = 0
+    virtual_time: float = 0.0  # Stride-scheduling pass value
+    total_granted: int = 0
+    wait_times_ms: deque = field(default_factory=lambda: deque(maxlen=100))
 
 
 @dataclass
@@ -60,6 +181,41 @@ class PoolMetrics:
     total_rejections: int = 0
     avg_latency_ms: float = 0.0
     last_request_time: Optional[float] = None
+    total_prompt_tokens: int = 0
+    total_completion_tokens: int = 0
+
+
+# Endpoint family used when callers do not tag their requests
+DEFAULT_ENDPOINT_FAMILY = "default"
+
+# Per-request priority (set by the X-LLM-Priority header dependency or batch
+# endpoints); used when execute() is not given an explicit priority.
+_request_priority: ContextVar[Optional[PoolPriority]] = ContextVar(
+    "llm_request_priority", default=None
+)
+
+
+def set_request_priority(priority: Optional[PoolPriority]):
+    """
+    Set the LLM priority lane for the current request context.
+
+    Args:
+        priority: Lane for pooled calls made from this context (None clears it)
+
+    Returns:
+        ContextVar token (pass to reset_request_priority to restore)
+    """
+    return _request_priority.set(priority)
+
+
+def reset_request_priority(token) -> None:
+    """Restore the priority that was active before set_request_priority()."""
+    _request_priority.reset(token)
+
+
+def get_request_priority() -> Optional[PoolPriority]:
+    """Get the LLM priority lane for the current request context."""
+    return _request_priority.get()
 
 
 class QueueFullError(Exception):
@@ -88,39 +244,59 @@ class LLMConnectionPool:
         result = await pool.execute(llm_client.generate, prompt)
     """
 
-    def __init__(self, config: Optional[LLMPoolConfig] = None):
+    def __init__(self, config: Optional[LLMPoolConfig] = None, name: str = "default"):
         """
         Initialize the connection pool.
 
         Args:
             config: Pool configuration. Uses defaults if not provided.
+            name: Pool name for logs/metrics (model name for per-model sub-pools)
         """
         self.config = config or LLMPoolConfig()
-        self._semaphore = asyncio.Semaphore(self.config.max_concurrent)
-        self._request_times: deque = deque()  # For rate limiting
+        self.name = name
+        self._active_slots = 0
+        self._lanes: Dict[PoolPriority, LaneState] = {lane: LaneState() for lane in LANE_ORDER}
+        self._global_virtual_time = 0.0
+        self._request_times: deque = deque()  # For requests_last_minute metric
         self._lock = asyncio.Lock()
+        self._admission_lock = asyncio.Lock()  # Serializes rate-limit waiters (FIFO)
+        burst = self.config.rate_limit_burst_seconds
+        self._request_bucket = TokenBucket(self.config.rate_limit_rpm, burst)
+        self._input_token_bucket = TokenBucket(self.config.input_tpm_limit, burst)
+        self._output_token_bucket = TokenBucket(self.config.output_tpm_limit, burst)
         self._metrics = PoolMetrics()
         self._latencies: deque = deque(maxlen=100)  # Rolling window for avg
+        self._family_metrics: Dict[str, PoolMetrics] = {}
+        self._family_latencies: Dict[str, deque] = {}
 
         logger.info(
-            f"LLM Pool initialized: max_concurrent={self.config.max_concurrent}, "
+            f"LLM Pool '{name}' initialized: max_concurrent={self.config.max_concurrent}, "
             f"max_queue={self.config.max_queue_size}, "
-            f"rate_limit={self.config.rate_limit_rpm} RPM"
+            f"rate_limit={self.config.rate_limit_rpm} RPM, "
+            f"lane_caps={ {lane.value: self.config.get_lane_cap(lane) for lane in LANE_ORDER} }"
         )
 
     async def execute(
         self,
         llm_callable: Callable,
         prompt: str,
-        timeout: Optional[float] = None
+        timeout: Optional[float] = None,
+        endpoint_family: str = DEFAULT_ENDPOINT_FAMILY,
+        priority: Optional[PoolPriority] = None
     ) -> Any:
         """
         Execute an LLM request through the pool.
 
+        If the callable returns an object with prompt_tokens/completion_tokens
+        (LLMResponse), actual usage is charged to the TPM buckets.
+
         Args:
             llm_callable: Async callable that takes prompt and returns result
             prompt: The prompt to send to the LLM
             timeout: Optional per-request timeout (uses config default if not set)
+            endpoint_family: Router family for per-family metrics (e.g., "hero")
+            priority: Scheduling lane. Defaults to the request-context priority
+                     (see set_request_priority), else INTERACTIVE.
 
         Returns:
             Result from the LLM callable
@@ -131,74 +307,293 @@ class LLMConnectionPool:
             Exception: Any exception from the LLM callable
         """
         timeout = timeout or self.config.timeout_seconds
+        start_time = time.time()
 
-        # Check if we can accept this request
-        await self._check_capacity()
+        async with self._admission(prompt, endpoint_family, priority) as (family, estimated_tokens):
+            try:
+                # Execute with timeout
+                result = await asyncio.wait_for(
+                    llm_callable(prompt),
+                    timeout=timeout
+                )
+
+                # Record success
+                latency_ms = (time.time() - start_time) * 1000
+                self._record_token_usage(result, estimated_tokens)
+                await self._record_success(endpoint_family, family, latency_ms)
+
+                print(f"[LLM-POOL] Success: latency={latency_ms:.0f}ms")
+                return result
+
+            except asyncio.TimeoutError:
+                async with self._lock:
+                    self._metrics.total_timeouts += 1
+                    family.total_timeouts += 1
+                print(f"[LLM-POOL] Timeout after {timeout}s")
+                raise
+
+            except Exception as e:
+                async with self._lock:
+                    self._metrics.total_failures += 1
+                    family.total_failures += 1
+                print(f"[LLM-POOL] Error: {str(e)[:100]}")
+                raise
+
+    async def stream(
+        self,
+        stream_callable: Callable[[str], AsyncIterator[str]],
+        prompt: str,
+        timeout: Optional[float] = None,
+        endpoint_family: str = DEFAULT_ENDPOINT_FAMILY,
+        priority: Optional[PoolPriority] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream an LLM response through the pool.
+
+        The pool slot is held from admission until the stream is exhausted
+        or the consumer stops iterating (e.g., SSE client disconnect), so
+        streaming calls count against max_concurrent like execute().
+        Completion tokens are estimated from the streamed characters.
+
+        Args:
+            stream_callable: Callable that takes prompt and returns an async
+                            iterator of text chunks
+            prompt: The prompt to send to the LLM
+            timeout: Optional timeout for the whole stream (config default if not set)
+            endpoint_family: Router family for per-family metrics
+            priority: Scheduling lane (see execute)
+
+        Yields:
+            Text chunks from the LLM
+
+        Raises:
+            QueueFullError: If queue is at capacity
+            asyncio.TimeoutError: If the stream does not finish in time
+            Exception: Any exception from the stream
+        """
+        timeout = timeout or self.config.timeout_seconds
+        start_time = time.time()
+
+        async with self._admission(prompt, endpoint_family, priority) as (family, estimated_tokens):
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout
+            streamed_chars = 0
+            chunks = stream_callable(prompt).__aiter__()
+            try:
+                while True:
+                    try:
+                        chunk = await asyncio.wait_for(
+                            chunks.__anext__(),
+                            timeout=max(deadline - loop.time(), 0)
+                        )
+                    except StopAsyncIteration:
+                        break
+                    streamed_chars += len(chunk)
+                    yield chunk
+
+            except asyncio.TimeoutError:
+                async with self._lock:
+                    self._metrics.total_timeouts += 1
+                    family.total_timeouts += 1
+                print(f"[LLM-POOL] Stream timeout after {timeout}s")
+                raise
+
+            except GeneratorExit:
+                # Consumer stopped early: not a provider failure
+                raise
+
+            except Exception as e:
+                async with self._lock:
+                    self._metrics.total_failures += 1
+                    family.total_failures += 1
+                print(f"[LLM-POOL] Stream error: {str(e)[:100]}")
+                raise
+
+            finally:
+                aclose = getattr(chunks, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+
+            latency_ms = (time.time() - start_time) * 1000
+            completion_tokens = streamed_chars // CHARS_PER_TOKEN + 1
+            self._output_token_bucket.consume(completion_tokens)
+            self._metrics.total_prompt_tokens += estimated_tokens
+            self._metrics.total_completion_tokens += completion_tokens
+            await self._record_success(endpoint_family, family, latency_ms)
+            print(f"[LLM-POOL] Stream complete: latency={latency_ms:.0f}ms, chars={streamed_chars}")
+
+    @asynccontextmanager
+    async def _admission(
+        self,
+        prompt: str,
+        endpoint_family: str,
+        priority: Optional[PoolPriority]
+    ) -> AsyncIterator[Tuple[PoolMetrics, int]]:
+        """
+        Admit a request: capacity check, lane slot, then rate-limit budget.
 
-        # Wait for rate limit if needed
-        await self._wait_for_rate_limit()
+        Holds the slot (and counts the request as active) for the body of the
+        `async with`. Yields the endpoint family's metrics bucket and the
+        estimated input tokens charged at admission.
+        """
+        family = self._get_family_metrics(endpoint_family)
+        lane = PoolPriority(priority or get_request_priority() or PoolPriority.INTERACTIVE)
+
+        # Check if we can accept this request
+        try:
+            await self._check_capacity()
+        except QueueFullError:
+            async with self._lock:
+                self._metrics.total_rejections += 1
+                family.total_rejections += 1
+            raise
 
         # Track request
         async with self._lock:
             self._metrics.queued_requests += 1
             self._metrics.total_requests += 1
+            family.queued_requests += 1
+            family.total_requests += 1
 
-        start_time = time.time()
+        slot_acquired = False
 
         try:
-            # Acquire semaphore slot (blocks if all slots busy)
-            async with self._semaphore:
+            # Acquire a slot in this lane (blocks while pool or lane is full)
+            await self._acquire_slot(lane)
+            slot_acquired = True
+            try:
                 async with self._lock:
                     self._metrics.queued_requests -= 1
                     self._metrics.active_requests += 1
-                    self._request_times.append(time.time())
+                    family.queued_requests -= 1
+                    family.active_requests += 1
+
+                # Wait for request/token budget. Done after lane scheduling so
+                # priority also decides who gets scarce rate-limit budget.
+                estimated_tokens = len(prompt) // CHARS_PER_TOKEN + 1
+                await self._wait_for_rate_limit(estimated_tokens)
 
                 # Log pool state
                 print(
-                    f"[LLM-POOL] Executing: active={self._metrics.active_requests}, "
+                    f"[LLM-POOL] Executing ({endpoint_family}/{lane.value}): "
+                    f"active={self._metrics.active_requests}, "
                     f"queued={self._metrics.queued_requests}"
                 )
 
-                try:
-                    # Execute with timeout
-                    result = await asyncio.wait_for(
-                        llm_callable(prompt),
-                        timeout=timeout
-                    )
-
-                    # Record success
-                    latency_ms = (time.time() - start_time) * 1000
-                    async with self._lock:
-                        self._metrics.total_successes += 1
-                        self._metrics.last_request_time = time.time()
-                        self._latencies.append(latency_ms)
-                        self._metrics.avg_latency_ms = sum(self._latencies) / len(self._latencies)
-
-                    print(f"[LLM-POOL] Success: latency={latency_ms:.0f}ms")
-                    return result
-
-                except asyncio.TimeoutError:
-                    async with self._lock:
-                        self._metrics.total_timeouts += 1
-                    print(f"[LLM-POOL] Timeout after {timeout}s")
-                    raise
-
-                except Exception as e:
-                    async with self._lock:
-                        self._metrics.total_failures += 1
-                    print(f"[LLM-POOL] Error: {str(e)[:100]}")
-                    raise
-
-                finally:
-                    async with self._lock:
-                        self._metrics.active_requests -= 1
+                yield family, estimated_tokens
 
-        except QueueFullError:
-            async with self._lock:
+            finally:
+                self._metrics.active_requests -= 1
+                family.active_requests -= 1
+                self._release_slot(lane)
+
+        finally:
+            if not slot_acquired:
+                # Cancelled while waiting for a slot: drop it from the queue count
                 self._metrics.queued_requests -= 1
-                self._metrics.total_rejections += 1
+                family.queued_requests -= 1
+
+    async def _record_success(
+        self,
+        endpoint_family: str,
+        family: PoolMetrics,
+        latency_ms: float
+    ) -> None:
+        """Record a successful request in pool-wide and family metrics."""
+        async with self._lock:
+            self._metrics.total_successes += 1
+            self._metrics.last_request_time = time.time()
+            self._latencies.append(latency_ms)
+            self._metrics.avg_latency_ms = sum(self._latencies) / len(self._latencies)
+            family_latencies = self._family_latencies[endpoint_family]
+            family.total_successes += 1
+            family.last_request_time = self._metrics.last_request_time
+            family_latencies.append(latency_ms)
+            family.avg_latency_ms = sum(family_latencies) / len(family_latencies)
+
+    def _can_grant(self, lane: PoolPriority) -> bool:
+        """Check pool-wide and per-lane capacity."""
+        return (
+            self._active_slots < self.config.max_concurrent
+            and self._lanes[lane].active < self.config.get_lane_cap(lane)
+        )
+
+    def _grant(self, lane: PoolPriority, enqueued_at: float) -> None:
+        """Take a slot for lane and advance its stride-scheduling pass value."""
+        state = self._lanes[lane]
+        start = max(state.virtual_time, self._global_virtual_time)
+        self._global_virtual_time = start
+        state.virtual_time = start + 1.0 / self.config.get_lane_weight(lane)
+        state.active += 1
+        state.total_granted += 1
+        state.wait_times_ms.append((time.time() - enqueued_at) * 1000)
+        self._active_slots += 1
+
+    async def _acquire_slot(self, lane: PoolPriority) -> None:
+        """Wait for a slot in lane (weighted-fair across lanes)."""
+        state = self._lanes[lane]
+        now = time.time()
+        if not state.waiters and self._can_grant(lane):
+            self._grant(lane, now)
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        state.waiters.append((waiter, now))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Slot was granted as we were cancelled: hand it back
+                self._release_slot(lane)
+            else:
+                try:
+                    state.waiters.remove((waiter, now))
+                except ValueError:
+                    pass
             raise
 
+    def _release_slot(self, lane: PoolPriority) -> None:
+        """Free a slot and hand it to the next waiter."""
+        self._lanes[lane].active -= 1
+        self._active_slots -= 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """
+        Grant free slots to waiting requests.
+
+        Stride scheduling: among lanes with waiters and spare lane capacity,
+        the one with the lowest pass value wins; each grant advances the pass
+        by 1/weight, so lanes share freed slots in proportion to their weights.
+        """
+        while self._active_slots < self.config.max_concurrent:
+            candidates = []
+            for lane in LANE_ORDER:
+                state = self._lanes[lane]
+                while state.waiters and state.waiters[0][0].done():
+                    state.waiters.popleft()  # Drop cancelled waiters
+                if state.waiters and self._can_grant(lane):
+                    candidates.append(lane)
+            if not candidates:
+                return
+
+            lane = min(
+                candidates,
+                key=lambda l: max(self._lanes[l].virtual_time, self._global_virtual_time)
+            )
+            waiter, enqueued_at = self._lanes[lane].waiters.popleft()
+            self._grant(lane, enqueued_at)
+            waiter.set_result(None)
+
+    def _get_family_metrics(self, endpoint_family: str) -> PoolMetrics:
+        """Get (or create) the metrics bucket for an endpoint family."""
+        family = self._family_metrics.get(endpoint_family)
+        if family is None:
+            family = PoolMetrics()
+            self._family_metrics[endpoint_family] = family
+            self._family_latencies[endpoint_family] = deque(maxlen=100)
+        return family
+
     async def _check_capacity(self):
         """Check if pool can accept more requests."""
         async with self._lock:
@@ -210,28 +605,46 @@ class LLMConnectionPool:
                 "Try again later."
             )
 
-    async def _wait_for_rate_limit(self):
-        """Wait if we're exceeding rate limits."""
-        async with self._lock:
-            now = time.time()
+    async def _wait_for_rate_limit(self, estimated_input_tokens: int = 0):
+        """
+        Wait until request and token budgets admit this request, then spend them.
+
+        Waiters queue on a FIFO lock and each sleeps only for its own deficit,
+        so admissions are spaced at the refill rate instead of waking together.
+        """
+        async with self._admission_lock:
+            while True:
+                wait_time = max(
+                    self._request_bucket.wait_time(1),
+                    self._input_token_bucket.wait_time(estimated_input_tokens),
+                    self._output_token_bucket.wait_time(0)
+                )
+                if wait_time <= 0:
+                    break
+                print(f"[LLM-POOL] Rate limit: waiting {wait_time:.2f}s")
+                await asyncio.sleep(wait_time)
+
+            self._request_bucket.consume(1)
+            self._input_token_bucket.consume(estimated_input_tokens)
 
-            # Remove requests older than 60 seconds
+            now = time.time()
+            self._request_times.append(now)
             while self._request_times and now - self._request_times[0] > 60:
                 self._request_times.popleft()
-
             self._metrics.requests_last_minute = len(self._request_times)
 
-            # If at limit, wait for oldest request to age out
-            if len(self._request_times) >= self.config.rate_limit_rpm:
-                wait_time = 60 - (now - self._request_times[0])
-                if wait_time > 0:
-                    print(f"[LLM-POOL] Rate limit: waiting {wait_time:.1f}s")
-                    # Release lock while waiting
-                    self._lock.release()
-                    try:
-                        await asyncio.sleep(wait_time)
-                    finally:
-                        await self._lock.acquire()
+    def _record_token_usage(self, result: Any, estimated_input_tokens: int) -> None:
+        """Charge actual token usage from an LLMResponse-like result."""
+        prompt_tokens = getattr(result, "prompt_tokens", None)
+        completion_tokens = getattr(result, "completion_tokens", None)
+        if prompt_tokens is None or completion_tokens is None:
+            return
+
+        # Correct the admission-time estimate, then charge output tokens
+        self._input_token_bucket.consume(prompt_tokens - estimated_input_tokens)
+        self._output_token_bucket.consume(completion_tokens)
+        self._metrics.total_prompt_tokens += prompt_tokens
+        self._metrics.total_completion_tokens += completion_tokens
 
     @property
     def status(self) -> PoolStatus:
@@ -258,11 +671,55 @@ class LLMConnectionPool:
             "total_timeouts": self._metrics.total_timeouts,
             "total_rejections": self._metrics.total_rejections,
             "avg_latency_ms": round(self._metrics.avg_latency_ms, 2),
+            "total_prompt_tokens": self._metrics.total_prompt_tokens,
+            "total_completion_tokens": self._metrics.total_completion_tokens,
+            "rate_limits": {
+                "requests": {
+                    "limit_per_minute": self._request_bucket.limit_per_minute,
+                    "remaining": self._request_bucket.remaining
+                },
+                "input_tokens": {
+                    "limit_per_minute": self._input_token_bucket.limit_per_minute,
+                    "remaining": self._input_token_bucket.remaining
+                },
+                "output_tokens": {
+                    "limit_per_minute": self._output_token_bucket.limit_per_minute,
+                    "remaining": self._output_token_bucket.remaining
+                }
+            },
+            "endpoint_families": {
+                name: {
+                    "active_requests": family.active_requests,
+                    "queued_requests": family.queued_requests,
+                    "total_requests": family.total_requests,
+                    "total_successes": family.total_successes,
+                    "total_failures": family.total_failures,
+                    "total_timeouts": family.total_timeouts,
+                    "total_rejections": family.total_rejections,
+                    "avg_latency_ms": round(family.avg_latency_ms, 2)
+                }
+                for name, family in sorted(self._family_metrics.items())
+            },
+            "lanes": {
+                lane.value: {
+                    "active_requests": state.active,
+                    "queued_requests": sum(1 for w, _ in state.waiters if not w.done()),
+                    "total_granted": state.total_granted,
+                    "avg_wait_ms": round(
+                        sum(state.wait_times_ms) / len(state.wait_times_ms), 2
+                    ) if state.wait_times_ms else 0.0,
+                    "weight": self.config.get_lane_weight(lane),
+                    "max_concurrent": self.config.get_lane_cap(lane)
+                }
+                for lane, state in self._lanes.items()
+            },
             "config": {
                 "max_concurrent": self.config.max_concurrent,
                 "max_queue_size": self.config.max_queue_size,
                 "timeout_seconds": self.config.timeout_seconds,
-                "rate_limit_rpm": self.config.rate_limit_rpm
+                "rate_limit_rpm": self.config.rate_limit_rpm,
+                "input_tpm_limit": self.config.input_tpm_limit,
+                "output_tpm_limit": self.config.output_tpm_limit
             }
         }
 
@@ -271,11 +728,59 @@ class LLMConnectionPool:
         self._metrics = PoolMetrics()
         self._latencies.clear()
         self._request_times.clear()
+        self._family_metrics.clear()
+        self._family_latencies.clear()
+        for state in self._lanes.values():
+            state.total_granted = 0
+            state.wait_times_ms.clear()
+
+
+def _parse_lane_env(value: str) -> Dict[str, int]:
+    """Parse "interactive=6,batch=3" style lane settings."""
+    result = {}
+    for item in value.split(","):
+        if "=" not in item:
+            continue
+        lane, number = item.split("=", 1)
+        lane = lane.strip().lower()
+        if lane in PoolPriority._value2member_map_:
+            result[lane] = int(number)
+    return result
+
+
+def _config_from_env(tier: Optional[str] = None) -> LLMPoolConfig:
+    """
+    Build pool configuration from environment variables.
+
+    With a tier (e.g., "flash", "pro"), LLM_<TIER>_<SETTING> overrides the
+    shared LLM_<SETTING> value, e.g. LLM_PRO_MAX_CONCURRENT=4 with
+    LLM_MAX_CONCURRENT=10 gives the Pro sub-pool 4 slots.
+    """
+    def env(setting: str, default: str) -> str:
+        if tier:
+            value = os.getenv(f"LLM_{tier.upper()}_{setting}")
+            if value is not None:
+                return value
+        return os.getenv(f"LLM_{setting}", default)
+
+    return LLMPoolConfig(
+        max_concurrent=int(env("MAX_CONCURRENT", "10")),
+        max_queue_size=int(env("MAX_QUEUE_SIZE", "50")),
+        timeout_seconds=float(env("TIMEOUT_SECONDS", "120")),
+        rate_limit_rpm=int(env("RATE_LIMIT_RPM", "300")),
+        input_tpm_limit=int(env("INPUT_TPM_LIMIT", "0")),
+        output_tpm_limit=int(env("OUTPUT_TPM_LIMIT", "0")),
+        lane_weights=_parse_lane_env(env("LANE_WEIGHTS", "interactive=6,batch=3,background=1")),
+        lane_max_concurrent=_parse_lane_env(env("LANE_MAX_CONCURRENT", ""))
+    )
 
 
 # Global pool instance (singleton pattern)
 _pool_instance: Optional[LLMConnectionPool] = None
 
+# Per-model sub-pools keyed by model name
+_model_pools: Dict[str, LLMConnectionPool] = {}
+
 
 def get_llm_pool(config: Optional[LLMPoolConfig] = None) -> LLMConnectionPool:
     """
@@ -295,19 +800,108 @@ def get_llm_pool(config: Optional[LLMPoolConfig] = None) -> LLMConnectionPool:
     if _pool_instance is None:
         # Read config from environment if not provided
         if config is None:
-            import os
-            config = LLMPoolConfig(
-                max_concurrent=int(os.getenv("LLM_MAX_CONCURRENT", "10")),
-                max_queue_size=int(os.getenv("LLM_MAX_QUEUE_SIZE", "50")),
-                timeout_seconds=float(os.getenv("LLM_TIMEOUT_SECONDS", "120")),
-                rate_limit_rpm=int(os.getenv("LLM_RATE_LIMIT_RPM", "300"))
-            )
+            config = _config_from_env()
         _pool_instance = LLMConnectionPool(config)
 
     return _pool_instance
 
 
+def get_model_pool(
+    model: str,
+    tier: Optional[str] = None,
+    config: Optional[LLMPoolConfig] = None
+) -> LLMConnectionPool:
+    """
+    Get the sub-pool for a model, creating it on first use.
+
+    Each model gets its own semaphore/lanes, queue cap and rate buckets, so
+    Vertex per-model quotas are tracked independently.
+
+    Args:
+        model: Model name (e.g., "gemini-2.5-pro")
+        tier: Env override tier (e.g., "flash", "pro") for LLM_<TIER>_* settings
+        config: Optional explicit configuration (only used on first call)
+
+    Returns:
+        LLMConnectionPool for the model
+    """
+    pool = _model_pools.get(model)
+    if pool is None:
+        pool = LLMConnectionPool(config or _config_from_env(tier), name=model)
+        _model_pools[model] = pool
+    return pool
+
+
+def get_all_pools() -> Dict[str, LLMConnectionPool]:
+    """Get every live pool (shared default pool plus per-model sub-pools)."""
+    pools = dict(_model_pools)
+    if _pool_instance is not None:
+        pools[_pool_instance.name] = _pool_instance
+    return pools
+
+
+_STATUS_RANK = {PoolStatus.HEALTHY.value: 0, PoolStatus.DEGRADED.value: 1, PoolStatus.OVERLOADED.value: 2}
+
+_SUMMED_METRICS = (
+    "active_requests", "queued_requests", "requests_last_minute", "total_requests",
+    "total_successes", "total_failures", "total_timeouts", "total_rejections",
+    "total_prompt_tokens", "total_completion_tokens"
+)
+
+_SUMMED_FAMILY_METRICS = (
+    "active_requests", "queued_requests", "total_requests", "total_successes",
+    "total_failures", "total_timeouts", "total_rejections"
+)
+
+
+def aggregate_pool_metrics(pools: Dict[str, LLMConnectionPool]) -> dict:
+    """
+    Combine metrics from several pools into one view.
+
+    Counters are summed, status is the worst pool status, latencies are
+    weighted by successes, and each pool's full metrics are kept under "pools".
+
+    Args:
+        pools: Pools keyed by name
+
+    Returns:
+        Aggregated metrics dictionary
+    """
+    per_pool = {name: pool.metrics for name, pool in sorted(pools.items())}
+    if not per_pool:
+        return get_llm_pool().metrics
+
+    def weighted_latency(items):
+        successes = sum(m["total_successes"] for m in items)
+        if not successes:
+            return 0.0
+        return round(sum(m["avg_latency_ms"] * m["total_successes"] for m in items) / successes, 2)
+
+    metrics = list(per_pool.values())
+    aggregated = {
+        "status": max((m["status"] for m in metrics), key=lambda s: _STATUS_RANK.get(s, 0)),
+    }
+    for key in _SUMMED_METRICS:
+        aggregated[key] = sum(m[key] for m in metrics)
+    aggregated["avg_latency_ms"] = weighted_latency(metrics)
+
+    families: Dict[str, list] = {}
+    for m in metrics:
+        for family, values in m["endpoint_families"].items():
+            families.setdefault(family, []).append(values)
+    aggregated["endpoint_families"] = {
+        family: {
+            **{key: sum(v[key] for v in values) for key in _SUMMED_FAMILY_METRICS},
+            "avg_latency_ms": weighted_latency(values)
+        }
+        for family, values in sorted(families.items())
+    }
+    aggregated["pools"] = per_pool
+    return aggregated
+
+
 def reset_pool():
-    """Reset the global pool instance (for testing)."""
+    """Reset the global pool instance and per-model sub-pools (for testing)."""
     global _pool_instance
     _pool_instance = None
+    _model_pools.clear()
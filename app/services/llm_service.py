@@ -16,11 +16,21 @@ import asyncio
 import json
 import logging
 import os
-from typing import Optional, Dict, Any, Callable
+from typing import Optional, Dict, Any, AsyncIterator, Awaitable, Callable, Tuple
 from enum import Enum
 
-from .llm_client import get_llm_client, BaseLLMClient, LLMClientFactory
-from .llm_pool import get_llm_pool, LLMPoolConfig, QueueFullError
+from .llm_client import get_llm_client, BaseLLMClient, LLMClientFactory, LLMResponse
+from .llm_pool import (
+    get_llm_pool,
+    get_model_pool,
+    get_all_pools,
+    aggregate_pool_metrics,
+    LLMPoolConfig,
+    QueueFullError,
+    PoolPriority
+)
+from .llm_cache import get_llm_cache, cached_generate, get_cache_bypass, CacheBypass, LLMResponseCache
+from .prompt_prefix import get_prefix_registry
 
 logger = logging.getLogger(__name__)
 
@@ -159,6 +169,35 @@ class LLMService:
         # Default to simple (Flash model)
         return ModelComplexity.SIMPLE
 
+    def get_model_for(self, complexity: ModelComplexity) -> str:
+        """
+        Get the model name a complexity level routes to.
+
+        Args:
+            complexity: Element complexity level
+
+        Returns:
+            Model name (flash_model unless routing is on and complexity is COMPLEX)
+        """
+        if not self.enable_model_routing or complexity == ModelComplexity.SIMPLE:
+            return self.flash_model
+        return self.pro_model
+
+    def route(self, prompt: str) -> Tuple[ModelComplexity, str, str]:
+        """
+        Decide which model a prompt goes to, before any capacity is taken.
+
+        Args:
+            prompt: Element generation prompt
+
+        Returns:
+            Tuple of (complexity, model name, tier "flash" or "pro")
+        """
+        complexity = self._determine_complexity(prompt)
+        model = self.get_model_for(complexity)
+        tier = "flash" if model == self.flash_model else "pro"
+        return complexity, model, tier
+
     def generate(self, prompt: str, complexity: Optional[ModelComplexity] = None) -> str:
         """
         Generate content synchronously.
@@ -261,6 +300,27 @@ class LLMService:
         Returns:
             Generated content as JSON string
 
+        Raises:
+            Exception: If generation fails
+        """
+        response = await self.generate_response_async(prompt, complexity)
+        return response.content
+
+    async def generate_response_async(
+        self,
+        prompt: str,
+        complexity: Optional[ModelComplexity] = None
+    ) -> LLMResponse:
+        """
+        Generate asynchronously and return the full LLMResponse (with token usage).
+
+        Args:
+            prompt: Element generation prompt
+            complexity: Optional complexity override
+
+        Returns:
+            LLMResponse with content, token counts and model
+
         Raises:
             Exception: If generation fails
         """
@@ -290,12 +350,44 @@ class LLMService:
                 f"({response.total_tokens} tokens, {response.latency_ms:.0f}ms)"
             )
 
-            return response.content
+            return response
 
         except Exception as e:
             logger.error(f"Generation failed: {e}")
             raise
 
+    async def generate_stream_async(
+        self,
+        prompt: str,
+        complexity: Optional[ModelComplexity] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream generated content as text chunks (provider streaming API).
+
+        No retries: once chunks have been forwarded to a client the call
+        cannot be transparently restarted.
+
+        Args:
+            prompt: Element generation prompt
+            complexity: Optional complexity override
+
+        Yields:
+            Content text chunks in order
+        """
+        if complexity is None:
+            complexity = self._determine_complexity(prompt)
+
+        client = self._get_or_create_client(complexity)
+
+        self.total_calls += 1
+        if complexity == ModelComplexity.SIMPLE:
+            self.flash_calls += 1
+        else:
+            self.pro_calls += 1
+
+        async for chunk in client.generate_stream(prompt):
+            yield chunk
+
     async def generate_with_retry_async(
         self,
         prompt: str,
@@ -316,6 +408,29 @@ class LLMService:
         Returns:
             Generated content as JSON string
 
+        Raises:
+            Exception: If all retries fail
+        """
+        response = await self.generate_response_with_retry_async(prompt, max_retries, complexity)
+        return response.content
+
+    async def generate_response_with_retry_async(
+        self,
+        prompt: str,
+        max_retries: int = 2,
+        complexity: Optional[ModelComplexity] = None
+    ) -> LLMResponse:
+        """
+        Same as generate_with_retry_async but returns the full LLMResponse.
+
+        Args:
+            prompt: Element generation prompt
+            max_retries: Maximum retry attempts
+            complexity: Optional complexity override
+
+        Returns:
+            LLMResponse with content and token usage
+
         Raises:
             Exception: If all retries fail
         """
@@ -323,7 +438,7 @@ class LLMService:
 
         for attempt in range(max_retries + 1):
             try:
-                return await self.generate_async(prompt, complexity)
+                return await self.generate_response_async(prompt, complexity)
             except Exception as e:
                 last_error = e
                 if attempt < max_retries:
@@ -348,7 +463,8 @@ class LLMService:
             "pro_calls": self.pro_calls,
             "total_tokens": self.total_tokens,
             "flash_percentage": (self.flash_calls / self.total_calls * 100) if self.total_calls > 0 else 0,
-            "pro_percentage": (self.pro_calls / self.total_calls * 100) if self.total_calls > 0 else 0
+            "pro_percentage": (self.pro_calls / self.total_calls * 100) if self.total_calls > 0 else 0,
+            "prompt_prefixes": get_prefix_registry().stats
         }
 
     def reset_stats(self):
@@ -359,6 +475,73 @@ class LLMService:
         self.total_tokens = 0
 
 
+class SingleFlight:
+    """
+    Collapses concurrent calls with the same key onto one in-flight task.
+
+    The first caller (leader) starts the work; callers arriving while it is
+    in flight await the same task and receive the same result or exception.
+    Waiters await through asyncio.shield, so one cancelled request does not
+    cancel the shared call for the others.
+    """
+
+    def __init__(self, tag: str = "LLM-FLIGHT"):
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self.tag = tag
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def run(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run fn() once per key among concurrent callers.
+
+        Args:
+            key: Deduplication key (e.g., prompt hash)
+            fn: Zero-argument async callable producing the result
+
+        Returns:
+            Result of the shared call
+        """
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            print(f"[{self.tag}] Coalesced onto in-flight call: key={key[:12]}")
+            return await asyncio.shield(task)
+
+        self.leaders += 1
+        task = asyncio.ensure_future(fn())
+        self._in_flight[key] = task
+        task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        return await asyncio.shield(task)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Single-flight statistics for monitoring."""
+        calls = self.leaders + self.coalesced
+        return {
+            "in_flight": len(self._in_flight),
+            "leader_calls": self.leaders,
+            "coalesced_calls": self.coalesced,
+            "coalesced_rate": round(self.coalesced / calls, 3) if calls else 0.0
+        }
+
+
+# Process-wide single-flight group for LLM callables
+_single_flight = SingleFlight()
+
+
+def _is_single_flight_enabled() -> bool:
+    """Check LLM_SINGLE_FLIGHT (default: true)."""
+    return os.getenv("LLM_SINGLE_FLIGHT", "true").lower() == "true"
+
+
+async def _coalesced(key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+    """Run fn through the single-flight group unless disabled."""
+    if not _is_single_flight_enabled():
+        return await fn()
+    return await _single_flight.run(key, fn)
+
+
 # Singleton instance
 _llm_service_instance: Optional[LLMService] = None
 
@@ -407,6 +590,11 @@ def get_llm_service(
     return _llm_service_instance
 
 
+def use_llm_pool() -> bool:
+    """Whether LLM calls go through the connection pool (USE_LLM_POOL, default: true)."""
+    return os.getenv("USE_LLM_POOL", "true").lower() == "true"
+
+
 def create_llm_callable() -> Callable[[str], str]:
     """
     Create a callable function for v1.2 ElementBasedContentGenerator.
@@ -426,26 +614,57 @@ def create_llm_callable() -> Callable[[str], str]:
     return llm_callable
 
 
-def create_llm_callable_async():
+def _cache_invalidator(service: LLMService, cache: LLMResponseCache):
+    """invalidate(prompt) for an LLM callable (see invalidate_llm_response)."""
+    async def invalidate(prompt: str) -> None:
+        if cache.enabled:
+            _, model, _ = service.route(prompt)
+            await cache.delete(LLMResponseCache.make_key(model, service.temperature, prompt))
+            print(f"[LLM-CACHE] Invalidated rejected response: model={model}")
+
+    return invalidate
+
+
+def create_llm_callable_async(endpoint_family: str = "default"):
     """
     Create an async callable function for v1.2 ElementBasedContentGenerator.
 
     This is the production-quality version for FastAPI endpoints that properly
     works within the existing event loop without conflicts.
 
+    Args:
+        endpoint_family: Family used for response cache TTLs
+
     Returns:
         Async callable that takes prompt string and returns content string
     """
     service = get_llm_service()
+    cache = get_llm_cache()
 
     async def async_llm_callable(prompt: str) -> str:
         """Generate content from prompt (async)."""
-        return await service.generate_with_retry_async(prompt)
+        complexity, model, _ = service.route(prompt)
+        key = LLMResponseCache.make_key(model, service.temperature, prompt)
+
+        async def _generate(p: str) -> str:
+            # Identical concurrent prompts share one call
+            return await _coalesced(
+                key,
+                lambda: service.generate_with_retry_async(p, complexity=complexity)
+            )
 
+        return await cached_generate(
+            cache, model, service.temperature, prompt, endpoint_family, _generate
+        )
+
+    async_llm_callable.invalidate = _cache_invalidator(service, cache)
     return async_llm_callable
 
 
-def create_llm_callable_pooled():
+def create_llm_callable_pooled(
+    endpoint_family: str = "content",
+    priority: Optional[PoolPriority] = None
+):
     """
     Create a pooled async callable with concurrency control and rate limiting.
 
@@ -460,6 +679,18 @@ def create_llm_callable_pooled():
     - LLM_MAX_QUEUE_SIZE: Max pending requests (default: 50)
     - LLM_TIMEOUT_SECONDS: Per-request timeout (default: 120)
     - LLM_RATE_LIMIT_RPM: Requests per minute (default: 300)
+    - LLM_INPUT_TPM_LIMIT / LLM_OUTPUT_TPM_LIMIT: Tokens per minute (default: 0 = off)
+    - LLM_SEPARATE_MODEL_POOLS: Per-model Flash/Pro sub-pools (default: true);
+      LLM_FLASH_* / LLM_PRO_* override any of the settings above per model
+    - LLM_CACHE_ENABLED: Serve repeat prompts from the response cache
+      (see app/services/llm_cache.py)
+    - LLM_SINGLE_FLIGHT: Coalesce identical in-flight prompts (default: true)
+
+    Args:
+        endpoint_family: Router family the calls are attributed to in pool
+                        metrics (content, slides, hero, atomic, layout, iseries)
+        priority: Fixed scheduling lane. When None, the lane comes from the
+                 request context (X-LLM-Priority header), else interactive.
 
     Returns:
         Async callable that takes prompt string and returns content string
@@ -469,26 +700,143 @@ def create_llm_callable_pooled():
         asyncio.TimeoutError: If request times out
     """
     service = get_llm_service()
-    pool = get_llm_pool()
+    cache = get_llm_cache()
+    separate_model_pools = os.getenv("LLM_SEPARATE_MODEL_POOLS", "true").lower() == "true"
 
     async def pooled_llm_callable(prompt: str) -> str:
         """Generate content through the connection pool."""
-        # Create async callable for this request
-        async def _generate(p: str) -> str:
-            return await service.generate_with_retry_async(p)
+        # Route first so the call is admitted by its model's own sub-pool
+        complexity, model, tier = service.route(prompt)
+        pool = get_model_pool(model, tier) if separate_model_pools else get_llm_pool()
+
+        # Create async callable for this request. Returns the full
+        # LLMResponse so the pool can charge real token usage to TPM limits.
+        async def _generate(p: str) -> LLMResponse:
+            return await service.generate_response_with_retry_async(p, complexity=complexity)
+
+        async def _execute_pooled(p: str) -> str:
+            response = await pool.execute(
+                _generate,
+                p,
+                endpoint_family=endpoint_family,
+                priority=priority
+            )
+            return response.content
 
-        # Execute through pool
-        return await pool.execute(_generate, prompt)
+        # Identical concurrent prompts share one pooled call
+        key = LLMResponseCache.make_key(model, service.temperature, prompt)
 
+        async def _generate_pooled(p: str) -> str:
+            return await _coalesced(key, lambda: _execute_pooled(p))
+
+        # Cache hits return before taking a pool slot or rate budget
+        return await cached_generate(
+            cache, model, service.temperature, prompt, endpoint_family, _generate_pooled
+        )
+
+    pooled_llm_callable.invalidate = _cache_invalidator(service, cache)
     return pooled_llm_callable
 
 
+def create_llm_callable_for(
+    endpoint_family: str,
+    priority: Optional[PoolPriority] = None
+):
+    """
+    Create the async LLM callable a router should use.
+
+    Single dispatch point for every LLM-calling router: returns the pooled
+    callable (tagged with endpoint_family) unless USE_LLM_POOL=false, so the
+    pool's concurrency cap, queue limit and RPM limiter bound the whole process.
+
+    Args:
+        endpoint_family: Router family (content, slides, hero, atomic, layout, iseries)
+        priority: Optional fixed scheduling lane (see create_llm_callable_pooled)
+
+    Returns:
+        Async callable that takes prompt string and returns content string
+    """
+    if use_llm_pool():
+        return create_llm_callable_pooled(endpoint_family, priority)
+    return create_llm_callable_async(endpoint_family)
+
+
+def create_llm_stream_for(
+    endpoint_family: str,
+    priority: Optional[PoolPriority] = None
+):
+    """
+    Create the streaming counterpart of create_llm_callable_for.
+
+    The returned callable yields text chunks as the provider produces them.
+    Streams go through the same model sub-pool (unless USE_LLM_POOL=false)
+    and response cache as non-streaming calls: a cache hit is yielded as a
+    single chunk, and a completed stream is stored for later requests (call
+    invalidate_llm_response(llm_stream, prompt) if it then fails parsing).
+    Streams are not coalesced, since chunks cannot be shared between clients.
+
+    Args:
+        endpoint_family: Router family (content, slides, ...)
+        priority: Optional fixed scheduling lane (see create_llm_callable_pooled)
+
+    Returns:
+        Callable that takes prompt string and returns an async iterator of
+        content chunks
+    """
+    service = get_llm_service()
+    cache = get_llm_cache()
+    use_pool = use_llm_pool()
+    separate_model_pools = os.getenv("LLM_SEPARATE_MODEL_POOLS", "true").lower() == "true"
+
+    async def llm_stream(prompt: str) -> AsyncIterator[str]:
+        """Stream content for prompt (through the pool when enabled)."""
+        complexity, model, tier = service.route(prompt)
+        key = LLMResponseCache.make_key(model, service.temperature, prompt)
+        bypass = get_cache_bypass() if cache.enabled else CacheBypass.NO_STORE
+
+        if bypass == CacheBypass.NONE:
+            content = await cache.get(key)
+            if content is not None:
+                print(f"[LLM-CACHE] Hit ({endpoint_family}, stream): key={key[:12]}")
+                yield content
+                return
+        elif cache.enabled:
+            cache.bypasses += 1
+
+        def _stream(p: str) -> AsyncIterator[str]:
+            return service.generate_stream_async(p, complexity=complexity)
+
+        if use_pool:
+            pool = get_model_pool(model, tier) if separate_model_pools else get_llm_pool()
+            chunks = pool.stream(_stream, prompt, endpoint_family=endpoint_family, priority=priority)
+        else:
+            chunks = _stream(prompt)
+
+        parts = []
+        async for chunk in chunks:
+            parts.append(chunk)
+            yield chunk
+
+        if bypass != CacheBypass.NO_STORE and parts:
+            await cache.set(key, "".join(parts), endpoint_family)
+
+    llm_stream.invalidate = _cache_invalidator(service, cache)
+    return llm_stream
+
+
 def get_pool_metrics() -> dict:
     """
     Get current LLM pool metrics for monitoring.
 
     Returns:
-        Dictionary with pool status and metrics
+        Dictionary with pool status and metrics, including per-endpoint-family
+        counters under "endpoint_families", per-model sub-pool metrics
+        under "pools" when sub-pools are in use, response cache stats
+        under "response_cache" and request coalescing stats under
+        "single_flight"
     """
-    pool = get_llm_pool()
-    return pool.metrics
+    pools = get_all_pools()
+    metrics = aggregate_pool_metrics(pools) if pools else get_llm_pool().metrics
+    metrics["response_cache"] = get_llm_cache().stats
+    metrics["single_flight"] = _single_flight.stats
+    return metrics
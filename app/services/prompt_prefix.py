@@ -0,0 +1,229 @@
+"""
+Prompt Prefix Registry
+======================
+
+Slide prompts are built as a stable prefix (system instructions, presentation
+context, variant instructions) followed by a per-slide suffix (slide context,
+slide position). Every slide of a deck re-sends the same prefix, so:
+
+- Providers with implicit prefix caching (Gemini 2.x, OpenAI) reuse it
+  automatically because it is byte-identical and comes first.
+- Providers with explicit context caching (Vertex CachedContent, Anthropic
+  cache_control) get a cache created once a prefix has been seen
+  min_uses times and is large enough to qualify.
+
+SplitPrompt is a str, so prompts keep flowing through the pool, response
+cache and single-flight unchanged; clients that understand it read .prefix
+and .suffix.
+
+Explicit provider caching is opt-in: set LLM_CONTEXT_CACHE_ENABLED=true.
+"""
+
+import hashlib
+import logging
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class SplitPrompt(str):
+    """A prompt string that remembers its stable prefix and per-call suffix."""
+
+    def __new__(cls, prefix: str, suffix: str):
+        prompt = super().__new__(cls, prefix + suffix)
+        prompt.prefix = prefix
+        prompt.suffix = suffix
+        return prompt
+
+    @property
+    def prefix_hash(self) -> str:
+        return hashlib.sha256(self.prefix.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class PromptPrefixConfig:
+    """
+    Configuration for prefix tracking and provider context caching.
+
+    Attributes:
+        context_cache_enabled: Create explicit provider caches (default: False)
+        min_uses: Calls sharing a prefix before a provider cache is created
+        min_cache_tokens: Smallest prefix worth an explicit Vertex cache
+        cache_ttl_seconds: Lifetime of provider caches
+        max_entries: Prefixes tracked (LRU)
+    """
+    context_cache_enabled: bool = False
+    min_uses: int = 2
+    min_cache_tokens: int = 4096
+    cache_ttl_seconds: int = 3600
+    max_entries: int = 512
+
+
+@dataclass
+class PrefixEntry:
+    """One tracked prefix and the provider caches created for it."""
+    prefix_hash: str
+    chars: int
+    uses: int = 0
+    # model -> (provider cache handle, expires_at)
+    provider_caches: Dict[str, Tuple[Any, float]] = field(default_factory=dict)
+    creating: Set[str] = field(default_factory=set)
+    failed: Set[str] = field(default_factory=set)
+
+    @property
+    def estimated_tokens(self) -> int:
+        """Rough prefix size in tokens (~4 characters per token)."""
+        return self.chars // 4
+
+
+class PromptPrefixRegistry:
+    """
+    LRU registry of prompt prefixes keyed by hash.
+
+    Usage (inside an LLM client):
+        entry = registry.record(prompt)           # prompt is a SplitPrompt
+        handle = registry.get_provider_cache(entry, model)
+        if handle is None and registry.should_create_provider_cache(entry, model):
+            handle = create_provider_cache(prompt.prefix)
+            registry.set_provider_cache(entry, model, handle)
+    """
+
+    def __init__(self, config: Optional[PromptPrefixConfig] = None):
+        self.config = config or PromptPrefixConfig()
+        self._entries: "OrderedDict[str, PrefixEntry]" = OrderedDict()
+
+        self.calls = 0
+        self.repeat_calls = 0
+        self.repeat_prefix_tokens = 0
+        self.provider_caches_created = 0
+        self.provider_cache_failures = 0
+        self.cached_tokens = 0
+
+    def record(self, prompt: SplitPrompt) -> PrefixEntry:
+        """Count one provider call made with prompt's prefix."""
+        prefix_hash = prompt.prefix_hash
+        entry = self._entries.get(prefix_hash)
+        if entry is None:
+            entry = PrefixEntry(prefix_hash=prefix_hash, chars=len(prompt.prefix))
+            self._entries[prefix_hash] = entry
+            while len(self._entries) > self.config.max_entries:
+                self._entries.popitem(last=False)
+        else:
+            self._entries.move_to_end(prefix_hash)
+            self.repeat_calls += 1
+            self.repeat_prefix_tokens += entry.estimated_tokens
+
+        entry.uses += 1
+        self.calls += 1
+        return entry
+
+    def wants_provider_cache(self, entry: PrefixEntry, min_tokens: int) -> bool:
+        """Whether a prefix repeats enough, and is large enough, to cache provider-side."""
+        return (
+            self.config.context_cache_enabled
+            and entry.uses >= self.config.min_uses
+            and entry.estimated_tokens >= min_tokens
+        )
+
+    def should_create_provider_cache(self, entry: PrefixEntry, model: str) -> bool:
+        """Whether to create an explicit cache for (prefix, model) now."""
+        return (
+            self.wants_provider_cache(entry, self.config.min_cache_tokens)
+            and model not in entry.creating
+            and model not in entry.failed
+        )
+
+    def get_provider_cache(self, entry: PrefixEntry, model: str) -> Optional[Any]:
+        """Live provider cache handle for (prefix, model), if any."""
+        cached = entry.provider_caches.get(model)
+        if cached is None:
+            return None
+        handle, expires_at = cached
+        # Leave a margin so a call never starts against a cache about to expire
+        if expires_at - 30 <= time.time():
+            del entry.provider_caches[model]
+            return None
+        return handle
+
+    def set_provider_cache(self, entry: PrefixEntry, model: str, handle: Any) -> None:
+        entry.provider_caches[model] = (handle, time.time() + self.config.cache_ttl_seconds)
+        self.provider_caches_created += 1
+        logger.info(f"Context cache created for prefix {entry.prefix_hash} ({model}, ~{entry.estimated_tokens} tokens)")
+
+    def mark_failed(self, entry: PrefixEntry, model: str, error: Exception) -> None:
+        """Stop trying to cache this prefix for this model."""
+        entry.failed.add(model)
+        self.provider_cache_failures += 1
+        logger.warning(f"Context cache creation failed for prefix {entry.prefix_hash} ({model}): {error}")
+
+    def record_cached_tokens(self, tokens: int) -> None:
+        """Count input tokens the provider reported as served from its cache."""
+        self.cached_tokens += tokens or 0
+
+    def clear(self) -> None:
+        """Forget all prefixes and reset counters."""
+        self._entries.clear()
+        self.calls = self.repeat_calls = self.repeat_prefix_tokens = 0
+        self.provider_caches_created = self.provider_cache_failures = self.cached_tokens = 0
+
+    @property
+    def stats(self) -> dict:
+        """Registry statistics for monitoring."""
+        return {
+            "prefixes": len(self._entries),
+            "calls": self.calls,
+            "repeat_calls": self.repeat_calls,
+            "repeat_rate": round(self.repeat_calls / self.calls, 3) if self.calls else 0.0,
+            "repeat_prefix_tokens": self.repeat_prefix_tokens,
+            "provider_cached_tokens": self.cached_tokens,
+            "provider_caches_created": self.provider_caches_created,
+            "provider_cache_failures": self.provider_cache_failures,
+            "context_cache_enabled": self.config.context_cache_enabled
+        }
+
+
+# Global registry instance
+_prefix_registry: Optional[PromptPrefixRegistry] = None
+
+
+def get_prefix_registry(config: Optional[PromptPrefixConfig] = None) -> PromptPrefixRegistry:
+    """
+    Get the singleton prompt prefix registry.
+
+    Configuration via environment variables (first call only):
+    - LLM_CONTEXT_CACHE_ENABLED: Create explicit provider caches (default: false)
+    - LLM_CONTEXT_CACHE_MIN_USES: Calls sharing a prefix before caching (default: 2)
+    - LLM_CONTEXT_CACHE_MIN_TOKENS: Smallest prefix for a Vertex cache (default: 4096)
+    - LLM_CONTEXT_CACHE_TTL_SECONDS: Provider cache lifetime (default: 3600)
+    - LLM_PREFIX_REGISTRY_SIZE: Prefixes tracked (default: 512)
+
+    Args:
+        config: Optional configuration (only used on first call)
+
+    Returns:
+        Shared PromptPrefixRegistry instance
+    """
+    global _prefix_registry
+
+    if _prefix_registry is None:
+        if config is None:
+            config = PromptPrefixConfig(
+                context_cache_enabled=os.getenv("LLM_CONTEXT_CACHE_ENABLED", "false").lower() == "true",
+                min_uses=int(os.getenv("LLM_CONTEXT_CACHE_MIN_USES", "2")),
+                min_cache_tokens=int(os.getenv("LLM_CONTEXT_CACHE_MIN_TOKENS", "4096")),
+                cache_ttl_seconds=int(os.getenv("LLM_CONTEXT_CACHE_TTL_SECONDS", "3600")),
+                max_entries=int(os.getenv("LLM_PREFIX_REGISTRY_SIZE", "512"))
+            )
+        _prefix_registry = PromptPrefixRegistry(config)
+
+    return _prefix_registry
+
+
+def reset_prefix_registry():
+    """Reset the global registry instance (for testing)."""
+    global _prefix_registry
+    _prefix_registry = None
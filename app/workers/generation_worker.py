@@ -2,11 +2,30 @@
 Generation Worker - Processes async content generation jobs from Redis queue.
 
 This worker:
-1. Connects to Redis queue
-2. Waits for jobs using BRPOP (blocking pop)
-3. Processes each job using ElementBasedContentGenerator
-4. Updates job status and progress in Redis
-5. Stores result or error in job data
+1. Connects to Redis queue (list or stream backend, see
+   app/services/job_queue.py)
+2. Waits for a free concurrency slot, then claims a job: BLMOVE into this
+   worker's processing list, or XREADGROUP from the consumer group
+3. Processes each job: variant content jobs with
+   ElementBasedContentGenerator, typed jobs (hero, iseries, slides, atomic,
+   layout) through their endpoint handler (app/api/slide_handlers.py)
+4. Updates job status and progress in Redis, publishing each change on
+   the job's events channel (pushed to clients by /v1.2/async/events)
+5. Stores result or error in job data, then acks the job
+6. POSTs the outcome to the job's callback_url, if it has one
+
+Reliability:
+- A job is never only in worker memory: until it is acked it sits in the
+  worker's processing list or in the group's pending entries.
+- Heartbeats keep this worker's claimed jobs from being taken over.
+- A reaper in every worker recovers jobs of workers silent for longer than
+  the visibility timeout (crashed or partitioned). Jobs that have been
+  claimed max_attempts times are marked failed instead.
+- Jobs are claimed only when a slot is free, so unstarted jobs stay in Redis
+  where any worker can take them; throughput scales with the worker count.
+- Typed jobs answered with 429 / 5xx, a full LLM pool or a success=false
+  body are retried with backoff, then requeued until max_attempts; only 4xx
+  errors fail at once.
 
 Can run multiple workers for horizontal scaling.
 
@@ -21,7 +40,23 @@ Usage:
 
 Environment Variables:
     REDIS_URL: Redis connection URL (default: redis://localhost:6379)
+    ASYNC_QUEUE_BACKEND: Queue backend, list or stream (default: list)
     WORKER_ID: Unique worker identifier (default: worker-{hostname})
+    WORKER_MAX_CONCURRENT: Jobs processed at once per worker (default: 3)
+    WORKER_VISIBILITY_TIMEOUT: Seconds without a heartbeat before a worker's
+        jobs are recovered by other workers (default: 60)
+    WORKER_HEARTBEAT_INTERVAL: Seconds between heartbeats (default: 10)
+    WORKER_REAPER_INTERVAL: Seconds between abandoned-job sweeps (default: 30)
+    WORKER_MAX_ATTEMPTS: Claims before an abandoned job is failed (default: 3)
+    WORKER_CALLBACK_TIMEOUT: Seconds per webhook callback attempt (default: 10)
+    CALLBACK_ALLOWED_HOSTS: Comma-separated hosts callbacks may be POSTed to
+        (default: any public host)
+    WORKER_PROGRESS_MIN_INTERVAL: Minimum seconds between a job's progress
+        writes; closer updates are coalesced (default: 0.5)
+    WORKER_TRANSIENT_RETRIES: Retries of a typed job answered with 429 or 5xx
+        before it is requeued (default: 2)
+    WORKER_RETRY_BACKOFF: Seconds before the first such retry, doubled after
+        each (default: 1.0)
     GCP_PROJECT_ID: Required for Vertex AI
 """
 
@@ -32,13 +67,104 @@ import logging
 import os
 import signal
 import sys
-from typing import Optional
+from typing import Dict, List, Optional, Set
+
+from ..services.job_queue import (
+    JOB_KEY_PREFIX,
+    TERMINAL_STATUSES,
+    VARIANT_JOB_TYPE,
+    ClaimedJob,
+    JobQueue,
+    create_job_queue,
+    encode_result,
+    get_callback_allowed_hosts,
+    is_callback_url_allowed,
+    job_event_message,
+    job_events_channel,
+    job_result
+)
+from ..services.llm_pool import PoolPriority, QueueFullError, set_request_priority
 
 logger = logging.getLogger(__name__)
 
-# Queue keys (must match async_routes.py)
-JOB_KEY_PREFIX = "text_service:job:"
-QUEUE_KEY = "text_service:generation_queue"
+
+class TransientJobError(Exception):
+    """An endpoint was at capacity or unavailable; the job may succeed later."""
+
+
+class JobProgressWriter:
+    """
+    Coalescing writer for one job's status hash and events.
+
+    Progress updates closer together than min_interval are merged: the
+    latest stage is written when the interval has passed (trailing flush),
+    or folded into the final write. Every write is one pipelined round-trip
+    carrying both the hash update and its event.
+    """
+
+    def __init__(self, redis, job_id: str, min_interval: float = 0.5):
+        self.redis = redis
+        self.job_id = job_id
+        self.job_key = f"{JOB_KEY_PREFIX}{job_id}"
+        self.min_interval = min_interval
+        self._pending: Dict[str, str] = {}
+        self._last_flush = 0.0
+        self._timer: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+
+    async def start(self, fields: Dict[str, str]):
+        """Count the attempt and mark the job processing, in one round-trip."""
+        async with self._lock:
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.hincrby(self.job_key, "attempts", 1)
+            self._write(pipe, {"status": "processing", "stage": "initializing", "progress": "10", **fields})
+            await pipe.execute()
+            self._last_flush = time.monotonic()
+
+    async def update(self, stage: str, progress: int):
+        """Record a progress change; written now or at the end of the interval."""
+        self._pending.update({"stage": stage, "progress": str(progress)})
+        wait = self._last_flush + self.min_interval - time.monotonic()
+        if wait <= 0:
+            await self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_later(wait))
+
+    async def flush(self):
+        """Write pending progress, if any."""
+        async with self._lock:
+            if not self._pending:
+                return
+            pipe = self.redis.pipeline(transaction=False)
+            self._write(pipe, self._pending)
+            self._pending = {}
+            await pipe.execute()
+            self._last_flush = time.monotonic()
+
+    async def finish(self, fields: Dict[str, str], event: str, payload: Dict):
+        """Final write (pending progress folded in) plus the terminal event."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        async with self._lock:
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.hset(self.job_key, mapping={**self._pending, **fields})
+            pipe.publish(job_events_channel(self.job_id), job_event_message(self.job_id, event, payload))
+            self._pending = {}
+            await pipe.execute()
+
+    def _write(self, pipe, mapping: Dict[str, str]):
+        pipe.hset(self.job_key, mapping=mapping)
+        pipe.publish(job_events_channel(self.job_id), job_event_message(self.job_id, "progress", {
+            "status": mapping.get("status", "processing"),
+            "stage": mapping["stage"],
+            "progress": int(mapping["progress"])
+        }))
+
+    async def _flush_later(self, delay: float):
+        await asyncio.sleep(delay)
+        self._timer = None  # From here on finish() waits on the lock instead
+        await self.flush()
 
 
 class GenerationWorker:
@@ -47,6 +173,9 @@ class GenerationWorker:
 
     Features:
     - Blocking wait for jobs (efficient, no polling)
+    - Claims jobs only when a concurrency slot is free
+    - In-flight jobs stay in Redis until acked (survive crashes)
+    - Heartbeat + reaper recover the jobs of dead workers
     - Progress updates during processing
     - Graceful shutdown on SIGTERM/SIGINT
     - Error handling with job failure recording
@@ -56,64 +185,136 @@ class GenerationWorker:
         self,
         redis_url: str,
         worker_id: str,
-        max_concurrent: int = 3
+        max_concurrent: int = 3,
+        visibility_timeout: int = 60,
+        heartbeat_interval: int = 10,
+        reaper_interval: int = 30,
+        max_attempts: int = 3,
+        queue_backend: Optional[str] = None,
+        callback_timeout: float = 10.0,
+        callback_retries: int = 2,
+        callback_allowed_hosts: Optional[List[str]] = None,
+        progress_min_interval: float = 0.5,
+        transient_retries: int = 2,
+        retry_backoff: float = 1.0
     ):
         """
         Initialize the worker.
 
         Args:
             redis_url: Redis connection URL
-            worker_id: Unique worker identifier
+            worker_id: Unique worker identifier (stable across restarts, so a
+                       restarted worker recovers its own processing list)
             max_concurrent: Max jobs to process concurrently
+            visibility_timeout: Heartbeat TTL; a worker silent for longer is
+                                considered dead and its jobs are requeued
+            heartbeat_interval: Seconds between heartbeat refreshes
+            reaper_interval: Seconds between sweeps for dead workers
+            max_attempts: Claims after which an abandoned job is failed
+            queue_backend: "list" or "stream" (default: ASYNC_QUEUE_BACKEND)
+            callback_timeout: Seconds per webhook callback attempt
+            callback_retries: Extra webhook attempts after a failure
+            callback_allowed_hosts: Hosts callbacks may go to (default:
+                                    CALLBACK_ALLOWED_HOSTS)
+            progress_min_interval: Minimum seconds between a job's progress
+                                   writes; closer updates are coalesced
+            transient_retries: Extra handler calls for a typed job answered
+                               with 429 or 5xx before it is requeued
+            retry_backoff: Seconds before the first such retry (doubled
+                           after each)
         """
         self.redis_url = redis_url
         self.worker_id = worker_id
         self.max_concurrent = max_concurrent
+        self.visibility_timeout = visibility_timeout
+        self.heartbeat_interval = heartbeat_interval
+        self.reaper_interval = reaper_interval
+        self.max_attempts = max_attempts
+        self.queue_backend = queue_backend
+        self.callback_timeout = callback_timeout
+        self.callback_retries = callback_retries
+        self.callback_allowed_hosts = (
+            get_callback_allowed_hosts() if callback_allowed_hosts is None else callback_allowed_hosts
+        )
+        self._callback_client = None  # httpx.AsyncClient shared by all callbacks
+        self.progress_min_interval = progress_min_interval
+        self.transient_retries = transient_retries
+        self.retry_backoff = retry_backoff
         self.running = False
         self.redis = None
+        self.queue: Optional[JobQueue] = None
         self._semaphore = None
+        self._slots_in_use = 0  # Semaphore slots held by claims and running jobs
         self._generator = None
+        self._handlers: Dict[str, tuple] = {}  # job_type -> resolved endpoint handler
+        self._in_flight: Dict[str, ClaimedJob] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._background: Set[asyncio.Task] = set()
 
     async def start(self):
         """Start the worker and begin processing jobs."""
         self.running = True
         self._semaphore = asyncio.Semaphore(self.max_concurrent)
 
-        # Connect to Redis
-        try:
-            import redis.asyncio as aioredis
-        except ImportError:
-            print(f"[WORKER-{self.worker_id}] ERROR: redis package not installed")
-            return
+        # Connect to Redis (unless a client was provided)
+        if self.redis is None:
+            try:
+                import redis.asyncio as aioredis
+            except ImportError:
+                print(f"[WORKER-{self.worker_id}] ERROR: redis package not installed")
+                return
 
-        try:
-            self.redis = await aioredis.from_url(
-                self.redis_url,
-                encoding="utf-8",
-                decode_responses=True
-            )
-            await self.redis.ping()
-            print(f"[WORKER-{self.worker_id}] Connected to Redis")
-        except Exception as e:
-            print(f"[WORKER-{self.worker_id}] Failed to connect to Redis: {e}")
-            return
+            try:
+                self.redis = await aioredis.from_url(
+                    self.redis_url,
+                    encoding="utf-8",
+                    decode_responses=True
+                )
+                await self.redis.ping()
+                print(f"[WORKER-{self.worker_id}] Connected to Redis")
+            except Exception as e:
+                print(f"[WORKER-{self.worker_id}] Failed to connect to Redis: {e}")
+                return
+
+        self.queue = create_job_queue(
+            self.redis,
+            self.queue_backend,
+            visibility_timeout=self.visibility_timeout,
+            max_attempts=self.max_attempts,
+            reaper_interval=self.reaper_interval
+        )
+
+        # Jobs claimed by a previous run with the same WORKER_ID were never
+        # finished: requeued, or handed back to run first
+        for job in await self.queue.register(self.worker_id):
+            await self._acquire_slot()
+            self._dispatch(job)
+
+        for loop in (self._heartbeat_loop(), self._reaper_loop()):
+            task = asyncio.create_task(loop)
+            self._background.add(task)
 
         # Initialize generator (lazy, will be created on first job)
-        print(f"[WORKER-{self.worker_id}] Started, waiting for jobs...")
+        print(f"[WORKER-{self.worker_id}] Started ({self.queue.backend} queue), waiting for jobs...")
 
         # Process jobs
         while self.running:
             try:
-                # Block waiting for job (with timeout for graceful shutdown check)
-                result = await self.redis.brpop(QUEUE_KEY, timeout=5)
-
-                if result is None:
+                # Claim a job only once a slot is free, so jobs this worker
+                # cannot start yet stay in Redis for other workers
+                await self._acquire_slot()
+                job = None
+                try:
+                    # Block waiting for job (with timeout for graceful shutdown check)
+                    job = await self.queue.claim(self.worker_id, timeout=5)
+                finally:
+                    if job is None:
+                        self._release_slot()
+
+                if job is None:
                     continue  # Timeout, check if still running
 
-                _, job_id = result
-
-                # Process job (with semaphore for concurrency control)
-                asyncio.create_task(self._process_job_with_semaphore(job_id))
+                self._dispatch(job)
 
             except asyncio.CancelledError:
                 print(f"[WORKER-{self.worker_id}] Cancelled")
@@ -124,121 +325,317 @@ class GenerationWorker:
 
         print(f"[WORKER-{self.worker_id}] Stopped")
 
-    async def _process_job_with_semaphore(self, job_id: str):
-        """Process job with semaphore for concurrency control."""
-        async with self._semaphore:
-            await self._process_job(job_id)
+    async def _acquire_slot(self):
+        await self._semaphore.acquire()
+        self._slots_in_use += 1
+
+    def _release_slot(self):
+        self._slots_in_use -= 1
+        self._semaphore.release()
+
+    def _dispatch(self, job: ClaimedJob):
+        """Run a claimed job in the background (caller holds a semaphore slot)."""
+        self._in_flight[job.receipt] = job
+        task = asyncio.create_task(self._process_claimed_job(job))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _process_claimed_job(self, job: ClaimedJob):
+        """Process a claimed job, then ack it and free its slot."""
+        # Job tasks run in their own context: this lane covers every pooled
+        # LLM call the job makes, behind interactive and batch requests
+        set_request_priority(PoolPriority.BACKGROUND)
+        try:
+            processing_time_ms = await self._process_job(job.job_id)
+            try:
+                await self.queue.ack(self.worker_id, job)
+            except Exception as e:
+                # Not acked: recovered later, and the job's terminal status
+                # stops it from running twice
+                print(f"[WORKER-{self.worker_id}] Failed to ack job {job.job_id}: {e}")
+            if processing_time_ms is not None:
+                try:
+                    await self.queue.record_completion(processing_time_ms)
+                except Exception as e:
+                    print(f"[WORKER-{self.worker_id}] Failed to record completion: {e}")
+        finally:
+            self._in_flight.pop(job.receipt, None)
+            self._release_slot()
+
+    # =========================================================================
+    # Heartbeat and reaper
+    # =========================================================================
+
+    async def _heartbeat_loop(self):
+        while self.running:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                await self.queue.heartbeat(self.worker_id, list(self._in_flight.values()))
+            except Exception as e:
+                print(f"[WORKER-{self.worker_id}] Heartbeat failed: {e}")
+
+    async def _reaper_loop(self):
+        while self.running:
+            await asyncio.sleep(self.reaper_interval)
+            try:
+                await self.reap_stale_workers()
+            except Exception as e:
+                print(f"[WORKER-{self.worker_id}] Reaper failed: {e}")
+
+    async def reap_stale_workers(self) -> int:
+        """
+        Recover jobs abandoned by dead workers.
+
+        The list backend requeues them for any worker; the stream backend
+        claims up to this worker's free slots and runs them here.
+
+        Returns:
+            Number of recovered jobs started by this worker
+        """
+        free_slots = self.max_concurrent - self._slots_in_use
+        jobs = await self.queue.recover(self.worker_id, limit=free_slots)
+        for job in jobs:
+            await self._acquire_slot()
+            self._dispatch(job)
+        return len(jobs)
+
+    async def _process_job(self, job_id: str) -> Optional[int]:
+        """
+        Process a single generation job.
 
-    async def _process_job(self, job_id: str):
-        """Process a single generation job."""
+        Redis round-trips per job: one read, one pipelined start (attempts,
+        status, event), throttled progress flushes, one pipelined finish.
+
+        Returns:
+            Processing time in ms, or None if the job was skipped or requeued
+        """
         job_key = f"{JOB_KEY_PREFIX}{job_id}"
         start_time = time.time()
 
         print(f"[WORKER-{self.worker_id}] Processing job {job_id}")
 
-        try:
-            # Update status to processing
-            await self.redis.hset(job_key, mapping={
-                "status": "processing",
-                "stage": "initializing",
-                "progress": "10",
-                "started_at": str(start_time),
-                "worker_id": self.worker_id
-            })
-
-            # Get job data
-            job_data = await self.redis.hgetall(job_key)
-
-            if not job_data:
-                print(f"[WORKER-{self.worker_id}] Job {job_id} not found")
-                return
+        # Job parameters and status in one read. A requeued job may already
+        # have finished (its worker died after storing the result) or been
+        # cancelled: never run it twice
+        job_data = await self.redis.hgetall(job_key)
+        status = job_data.get("status")
+        if status is None or status in TERMINAL_STATUSES:
+            print(f"[WORKER-{self.worker_id}] Skipping job {job_id} (status={status})")
+            return None
 
-            # Parse job parameters
-            variant_id = job_data["variant_id"]
-            slide_spec = json.loads(job_data["slide_spec"])
-            presentation_spec = json.loads(job_data["presentation_spec"]) if job_data.get("presentation_spec") else None
-            element_relationships = json.loads(job_data["element_relationships"]) if job_data.get("element_relationships") else None
-
-            # Update progress: Building prompt
-            await self.redis.hset(job_key, mapping={
-                "stage": "building_prompt",
-                "progress": "20"
-            })
-
-            # Initialize generator if needed
-            if self._generator is None:
-                from ..core import ElementBasedContentGenerator
-                from ..services import create_llm_callable_async
-
-                llm_callable = create_llm_callable_async()
-                self._generator = ElementBasedContentGenerator(
-                    llm_service=llm_callable,
-                    variant_specs_dir="app/variant_specs",
-                    templates_dir="app/templates"
-                )
+        progress = JobProgressWriter(self.redis, job_id, self.progress_min_interval)
+        try:
+            # Count the claim (a job that keeps killing workers is eventually
+            # failed) and mark it processing, in one round-trip
+            started = {"started_at": str(start_time), "worker_id": self.worker_id}
+            await progress.start(started)
 
-            # Update progress: Calling LLM
-            await self.redis.hset(job_key, mapping={
-                "stage": "calling_llm",
-                "progress": "30"
-            })
-
-            # Generate content
-            result = await self._generator.generate_slide_content_async(
-                variant_id=variant_id,
-                slide_spec=slide_spec,
-                presentation_spec=presentation_spec,
-                element_relationships=element_relationships
-            )
-
-            # Update progress: Parsing response
-            await self.redis.hset(job_key, mapping={
-                "stage": "parsing_response",
-                "progress": "70"
-            })
-
-            # Update progress: Assembling HTML
-            await self.redis.hset(job_key, mapping={
-                "stage": "assembling_html",
-                "progress": "90"
-            })
+            job_type = job_data.get("job_type") or VARIANT_JOB_TYPE
+            if job_type == VARIANT_JOB_TYPE:
+                serialized_result = await self._generate_variant(job_data, progress)
+            else:
+                serialized_result = await self._generate_typed(job_type, job_data, progress)
 
             # Store result
             processing_time_ms = int((time.time() - start_time) * 1000)
 
-            # Prepare result (only include serializable fields)
-            serialized_result = {
-                "html": result.get("html", ""),
-                "variant_id": result.get("variant_id", ""),
-                "template_path": result.get("template_path", ""),
-                "metadata": result.get("metadata", {})
-            }
-
-            await self.redis.hset(job_key, mapping={
+            fields = {
                 "status": "completed",
                 "stage": "complete",
                 "progress": "100",
                 "completed_at": str(time.time()),
-                "result": json.dumps(serialized_result),
+                **encode_result(serialized_result),
                 "processing_time_ms": str(processing_time_ms)
-            })
+            }
+            # Same payload as GET /result, from the fields just written
+            payload = job_result(job_id, {**job_data, **started, **fields}, serialized_result)
+            await progress.finish(fields, "completed", payload)
 
             print(f"[WORKER-{self.worker_id}] Job {job_id} completed in {processing_time_ms}ms")
+            self._schedule_callback(job_id, job_data, "completed", payload)
+            return processing_time_ms
 
         except Exception as e:
+            # At capacity: requeue while claims remain, then fail like any error
+            attempts = int(job_data.get("attempts") or 0) + 1
+            if isinstance(e, TransientJobError) and attempts < self.max_attempts:
+                await self._requeue(job_id, progress, e)
+                return None
+
             # Record failure
             processing_time_ms = int((time.time() - start_time) * 1000)
             error_msg = str(e)[:500]  # Truncate long errors
 
-            await self.redis.hset(job_key, mapping={
+            fields = {
                 "status": "failed",
                 "stage": "error",
                 "completed_at": str(time.time()),
                 "error": error_msg,
                 "processing_time_ms": str(processing_time_ms)
-            })
+            }
+            payload = job_result(job_id, {**job_data, **fields})
+            await progress.finish(fields, "failed", payload)
 
             print(f"[WORKER-{self.worker_id}] Job {job_id} failed: {error_msg[:100]}")
+            self._schedule_callback(job_id, job_data, "failed", payload)
+            return processing_time_ms
+
+    async def _generate_variant(self, job_data: Dict[str, str], progress: JobProgressWriter) -> Dict:
+        """Generate a /v1.2/generate variant job; returns the stored result."""
+        # Parse job parameters
+        variant_id = job_data["variant_id"]
+        slide_spec = json.loads(job_data["slide_spec"])
+        presentation_spec = json.loads(job_data["presentation_spec"]) if job_data.get("presentation_spec") else None
+        element_relationships = json.loads(job_data["element_relationships"]) if job_data.get("element_relationships") else None
+
+        # Update progress: Building prompt
+        await progress.update("building_prompt", 20)
+
+        # Initialize generator if needed
+        if self._generator is None:
+            from ..core import get_generator_registry
+
+            # Shared instance: variant spec/template caches persist across jobs, and
+            # LLM calls go through the pool (USE_LLM_POOL) like the API's
+            self._generator = get_generator_registry().get_content_generator()
+
+        # Update progress: Calling LLM
+        await progress.update("calling_llm", 30)
+
+        # Generate content
+        result = await self._generator.generate_slide_content_async(
+            variant_id=variant_id,
+            slide_spec=slide_spec,
+            presentation_spec=presentation_spec,
+            element_relationships=element_relationships
+        )
+
+        # Update progress: Parsing response, Assembling HTML (coalesced
+        # with the completion write when they land inside the interval)
+        await progress.update("parsing_response", 70)
+        await progress.update("assembling_html", 90)
+
+        # Prepare result (only include serializable fields)
+        return {
+            "html": result.get("html", ""),
+            "variant_id": result.get("variant_id", ""),
+            "template_path": result.get("template_path", ""),
+            "metadata": result.get("metadata", {})
+        }
+
+    async def _generate_typed(self, job_type: str, job_data: Dict[str, str],
+                              progress: JobProgressWriter) -> Dict:
+        """
+        Run a typed job through its single-slide endpoint handler.
+
+        Returns:
+            Stored result: {"job_type", "response", "html"}, where response is
+            the endpoint's JSON response and html its top-level html, if any
+
+        Raises:
+            ValueError: Unknown job type, or a 4xx endpoint error (with its status)
+            TransientJobError: Still 429 / 5xx / QueueFullError (or a
+                               success=false response) after
+                               transient_retries retries
+        """
+        from fastapi import HTTPException
+        from ..api.slide_handlers import resolve_slide_types
+        from ..api.sse import describe_error, response_error
+
+        if job_type not in self._handlers:
+            resolved = resolve_slide_types([job_type])[0]
+            if resolved is None:
+                raise ValueError(f"Unknown job_type: {job_type}")
+            self._handlers[job_type] = resolved
+        _, request_model, handler = self._handlers[job_type]
+
+        request = request_model(**json.loads(job_data["request"]))
+        await progress.update("generating", 30)
+
+        for attempt in range(self.transient_retries + 1):
+            cause = None
+            try:
+                response = await handler(request)
+                detail = response_error(response)
+                if detail is None:
+                    break
+                # Failure reported in a 200 body (atomic): retried like a 500
+                status_code = 500
+            except (HTTPException, QueueFullError) as e:
+                cause = e
+                if isinstance(e, QueueFullError):
+                    status_code, detail = describe_error(e)
+                else:
+                    status_code, detail = e.status_code, e.detail
+
+            error = f"{status_code}: {detail}"
+            # 4xx is the request's fault and will not change on a retry
+            if 400 <= status_code < 500 and status_code != 429:
+                raise ValueError(error) from cause
+            if attempt == self.transient_retries:
+                raise TransientJobError(error) from cause
+
+            delay = self.retry_backoff * 2 ** attempt
+            print(f"[WORKER-{self.worker_id}] {job_type} answered {status_code}, retrying in {delay:.1f}s")
+            await progress.update("retrying", 30)
+            await asyncio.sleep(delay)
+
+        await progress.update("assembling_response", 90)
+        response = response.model_dump(mode="json") if hasattr(response, "model_dump") else response
+        return {
+            "job_type": job_type,
+            "response": response,
+            "html": response.get("html") if isinstance(response, dict) else None
+        }
+
+    async def _requeue(self, job_id: str, progress: JobProgressWriter, error: Exception):
+        """Put a job back at the end of the queue (the caller then acks its claim)."""
+        await progress.finish(
+            {"status": "queued", "stage": "waiting", "progress": "0"},
+            "progress", {"status": "queued", "stage": "waiting", "progress": 0}
+        )
+        await self.queue.enqueue(job_id)
+        print(f"[WORKER-{self.worker_id}] Job {job_id} requeued: {error}")
+
+    # =========================================================================
+    # Webhooks
+    # =========================================================================
+
+    def _schedule_callback(self, job_id: str, job_data: Dict[str, str], event: str, payload: Dict):
+        """POST the job's outcome to its callback_url, if it has one."""
+        callback_url = job_data.get("callback_url")
+        if not callback_url:
+            return
+        if not is_callback_url_allowed(callback_url, self.callback_allowed_hosts):
+            print(f"[WORKER-{self.worker_id}] Callback URL not allowed for job {job_id}: {callback_url}")
+            return
+        # Tracked with the job tasks so a graceful stop waits for delivery
+        task = asyncio.create_task(self._send_callback(callback_url, {"event": event, **payload}))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send_callback(self, url: str, payload: Dict) -> bool:
+        """POST a job outcome to its callback URL (best effort, with retries)."""
+        import httpx
+
+        if self._callback_client is None:
+            # Redirects are not followed, so an allowed host cannot bounce the POST elsewhere
+            self._callback_client = httpx.AsyncClient(timeout=self.callback_timeout, follow_redirects=False)
+
+        for attempt in range(self.callback_retries + 1):
+            try:
+                response = await self._callback_client.post(url, json=payload)
+                if response.status_code < 500:
+                    if response.status_code >= 400:
+                        print(f"[WORKER-{self.worker_id}] Callback rejected ({response.status_code}): {url}")
+                    return response.status_code < 400
+            except httpx.HTTPError as e:
+                print(f"[WORKER-{self.worker_id}] Callback attempt {attempt + 1} failed: {e}")
+            if attempt < self.callback_retries:
+                await asyncio.sleep(2 ** attempt)
+
+        print(f"[WORKER-{self.worker_id}] Callback gave up for job {payload['job_id']}")
+        return False
 
     async def stop(self):
         """Stop the worker gracefully."""
@@ -246,32 +643,33 @@ class GenerationWorker:
         self.running = False
 
         # Wait for current jobs to complete (with timeout)
-        if self._semaphore:
-            # Wait for all semaphore slots to be available (jobs complete)
-            try:
-                await asyncio.wait_for(
-                    self._wait_for_jobs_complete(),
-                    timeout=30
-                )
-            except asyncio.TimeoutError:
-                print(f"[WORKER-{self.worker_id}] Timeout waiting for jobs")
+        if self._tasks:
+            done, pending = await asyncio.wait(set(self._tasks), timeout=30)
+            if pending:
+                # Unfinished jobs stay claimed in Redis; they are recovered
+                # on restart or by another worker's reaper
+                print(f"[WORKER-{self.worker_id}] Timeout waiting for {len(pending)} jobs")
+
+        for task in self._background:
+            task.cancel()
+
+        if self._callback_client is not None:
+            await self._callback_client.aclose()
+            self._callback_client = None
 
         if self.redis:
+            try:
+                if self.queue:
+                    await self.queue.deregister(self.worker_id)
+            except Exception as e:
+                print(f"[WORKER-{self.worker_id}] Deregister failed: {e}")
             await self.redis.close()
 
-    async def _wait_for_jobs_complete(self):
-        """Wait for all current jobs to complete."""
-        while True:
-            # Check if all semaphore slots are available
-            if self._semaphore._value == self.max_concurrent:
-                break
-            await asyncio.sleep(0.5)
-
 
 async def run_worker(
     worker_id: Optional[str] = None,
     redis_url: Optional[str] = None,
-    max_concurrent: int = 3
+    max_concurrent: Optional[int] = None
 ):
     """
     Run a generation worker.
@@ -279,19 +677,29 @@ async def run_worker(
     Args:
         worker_id: Unique worker ID (auto-generated if not provided)
         redis_url: Redis URL (from REDIS_URL env if not provided)
-        max_concurrent: Max concurrent jobs
+        max_concurrent: Max concurrent jobs (from WORKER_MAX_CONCURRENT env
+                        if not provided)
     """
     import socket
 
     # Get configuration
     worker_id = worker_id or os.getenv("WORKER_ID", f"worker-{socket.gethostname()[:8]}")
     redis_url = redis_url or os.getenv("REDIS_URL", "redis://localhost:6379")
+    max_concurrent = max_concurrent or int(os.getenv("WORKER_MAX_CONCURRENT", "3"))
 
     # Create worker
     worker = GenerationWorker(
         redis_url=redis_url,
         worker_id=worker_id,
-        max_concurrent=max_concurrent
+        max_concurrent=max_concurrent,
+        visibility_timeout=int(os.getenv("WORKER_VISIBILITY_TIMEOUT", "60")),
+        heartbeat_interval=int(os.getenv("WORKER_HEARTBEAT_INTERVAL", "10")),
+        reaper_interval=int(os.getenv("WORKER_REAPER_INTERVAL", "30")),
+        max_attempts=int(os.getenv("WORKER_MAX_ATTEMPTS", "3")),
+        callback_timeout=float(os.getenv("WORKER_CALLBACK_TIMEOUT", "10")),
+        progress_min_interval=float(os.getenv("WORKER_PROGRESS_MIN_INTERVAL", "0.5")),
+        transient_retries=int(os.getenv("WORKER_TRANSIENT_RETRIES", "2")),
+        retry_backoff=float(os.getenv("WORKER_RETRY_BACKOFF", "1.0"))
     )
 
     # Setup signal handlers for graceful shutdown
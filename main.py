@@ -18,7 +18,9 @@ import logging
 from contextlib import asynccontextmanager
 from pathlib import Path
 
-from fastapi import FastAPI
+from typing import Optional
+
+from fastapi import FastAPI, Depends, Header, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
@@ -33,6 +35,15 @@ from app.api.coordination_routes import router as coordination_router
 from app.api.iseries_routes import router as iseries_router
 from app.api.slides_routes import router as slides_router
 from app.api.atomic_routes import router as atomic_router
+from app.api.deck_routes import router as deck_router
+from app.api.image_routes import router as image_router
+from app.api.sse import describe_error
+from app.core.generator_registry import init_generator_registry, reset_generator_registry
+from app.core.warmup import warm_up_caches
+from app.services.llm_pool import PoolPriority, QueueFullError, set_request_priority
+from app.services.llm_cache import CacheBypass, parse_cache_control, set_cache_bypass
+from app.services.llm_client import shutdown_gemini_executor
+from app.services.image_service_client import close_image_http_client, get_image_http_client
 
 # Configure logging
 logging.basicConfig(
@@ -56,6 +67,16 @@ async def lifespan(app: FastAPI):
     # Validate configuration
     validate_configuration()
 
+    # Build shared generators once (variant spec + template caches persist across requests)
+    app.state.generator_registry = init_generator_registry()
+    logger.info("✓ Generator registry initialized (shared variant spec/template caches)")
+
+    # Preload specs/templates/components so first requests skip disk I/O.
+    # Raises WarmupError on malformed files, which aborts startup.
+    if os.getenv("ENABLE_STARTUP_WARMUP", "true").lower() == "true":
+        warmup_report = warm_up_caches(app.state.generator_registry)
+        logger.info(f"✓ Startup warm-up complete in {warmup_report['total_elapsed_ms']}ms")
+
     logger.info("✓ v1.2 Content API: /v1.2/generate (26 variants)")
     logger.info("✓ v1.2 Hero API (standard):")
     logger.info("  - /v1.2/hero/title (title slides)")
@@ -72,10 +93,15 @@ async def lifespan(app: FastAPI):
     logger.info("  - /api/ai/table/generate (generate table from prompt)")
     logger.info("  - /api/ai/table/transform (transform table structure)")
     logger.info("  - /api/ai/table/analyze (analyze table data)")
+    logger.info("✓ Deck API: /v1.2/deck/generate (batch, concurrent slides)")
+    logger.info("✓ Deck image prefetch: /v1.2/deck/prefetch-images (images start before slides)")
     logger.info("✓ Variant catalog: /v1.2/variants")
     logger.info("✓ Pool health: /v1.2/health/pool")
+    logger.info("✓ Generator registry stats: /v1.2/health/generators")
     logger.info("✓ Async Queue API (Redis-based):")
     logger.info("  - /v1.2/async/generate (submit job)")
+    logger.info("  - /v1.2/async/jobs (submit job for any slide type)")
+    logger.info("  - /v1.2/async/events/{job_id} (pushed progress, SSE)")
     logger.info("  - /v1.2/async/status/{job_id} (poll progress)")
     logger.info("  - /v1.2/async/result/{job_id} (fetch result)")
     logger.info("  - /v1.2/async/queue/stats (queue health)")
@@ -110,8 +136,14 @@ async def lifespan(app: FastAPI):
     logger.info("  - /v1.2/atomic/NUMBERED_LIST (1-4 numbered lists)")
     logger.info("  - /v1.2/atomic/TEXT_BOX (1-6 gradient text boxes)")
     logger.info("✓ Gemini integration enabled")
-    logger.info("✓ Image Builder API integration enabled")
+    get_image_http_client()  # One keep-alive pool for every Image Builder call
+    logger.info("✓ Image Builder API integration enabled (shared connection pool)")
     logger.info(f"✓ LLM Pool enabled: {os.getenv('USE_LLM_POOL', 'true')}")
+    logger.info("✓ LLM priority lanes: interactive/batch/background (X-LLM-Priority header)")
+    logger.info(f"✓ LLM response cache enabled: {os.getenv('LLM_CACHE_ENABLED', 'false')}")
+    logger.info(f"✓ LLM context cache enabled: {os.getenv('LLM_CONTEXT_CACHE_ENABLED', 'false')}")
+    logger.info(f"✓ Image result cache enabled: {os.getenv('IMAGE_CACHE_ENABLED', 'false')}")
+    logger.info(f"✓ Image deadline: {os.getenv('IMAGE_DEADLINE_MS', '0')}ms (late images: /v1.2/images/{{job_id}})")
     logger.info(f"✓ Redis Queue enabled: {os.getenv('ENABLE_REDIS_QUEUE', 'false')}")
     logger.info("=" * 80)
 
@@ -119,6 +151,9 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Text & Table Builder v1.2 - Shutting Down")
+    reset_generator_registry()
+    shutdown_gemini_executor()
+    await close_image_http_client()
 
 
 def validate_configuration():
@@ -167,12 +202,36 @@ def validate_configuration():
         logger.error("  3. Set GCP_PROJECT_ID environment variable")
 
 
+async def apply_llm_request_options(
+    x_llm_priority: Optional[str] = Header(None),
+    cache_control: Optional[str] = Header(None)
+):
+    """
+    Apply per-request LLM options from headers.
+
+    - X-LLM-Priority: interactive (default), batch or background. The Director
+      sets "batch" for bulk deck generation so it cannot starve interactive calls.
+    - Cache-Control: no-cache skips response cache reads, no-store skips reads
+      and writes.
+    """
+    if x_llm_priority:
+        try:
+            set_request_priority(PoolPriority(x_llm_priority.strip().lower()))
+        except ValueError:
+            logger.warning(f"Ignoring unknown X-LLM-Priority: {x_llm_priority}")
+
+    bypass = parse_cache_control(cache_control)
+    if bypass != CacheBypass.NONE:
+        set_cache_bypass(bypass)
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Text & Table Builder v1.2",
     description="Deterministic assembly architecture with element-based content generation",
     version="1.2.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    dependencies=[Depends(apply_llm_request_options)]
 )
 
 # Configure CORS
@@ -184,6 +243,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.exception_handler(QueueFullError)
+async def queue_full_handler(request: Request, exc: QueueFullError) -> JSONResponse:
+    """LLM pool at capacity (raised by any router): 429 with Retry-After."""
+    status_code, detail = describe_error(exc)
+    return JSONResponse(status_code=status_code, content={"detail": detail}, headers={"Retry-After": "30"})
+
 # Include v1.2 routes (content slides - element-based)
 app.include_router(v1_2_router)
 
@@ -208,6 +274,12 @@ app.include_router(slides_router)
 # Include atomic component routes (direct component generation)
 app.include_router(atomic_router)
 
+# Include deck routes (batch generation of whole decks)
+app.include_router(deck_router)
+
+# Include late-binding image routes (images that missed their slide's deadline)
+app.include_router(image_router)
+
 
 @app.get("/")
 async def root():
@@ -218,6 +290,8 @@ async def root():
         "architecture": "Unified v1.2",
         "endpoints": {
             "content_slides": "POST /v1.2/generate",
+            "deck": "POST /v1.2/deck/generate",
+            "late_image": "GET /v1.2/images/{job_id}",
             "hero_standard": {
                 "title_slide": "POST /v1.2/hero/title",
                 "section_divider": "POST /v1.2/hero/section",
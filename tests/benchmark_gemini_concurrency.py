@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Gemini call concurrency with a fake Vertex model (no network).
+
+Compares three ways of running GenerativeModel.generate_content from async
+code at increasing numbers of in-flight calls:
+
+- to_thread:   legacy asyncio.to_thread (default executor, min(32, cpus + 4) threads)
+- thread pool: GeminiClient with GEMINI_USE_NATIVE_ASYNC=false (dedicated executor)
+- native:      GeminiClient with generate_content_async (no threads)
+
+Every fake call takes --latency seconds. With perfect concurrency a level of
+N calls finishes in ~latency; the "effective concurrency" column is how many
+calls were actually in flight on average.
+
+Usage:
+    python3 tests/benchmark_gemini_concurrency.py [--latency 0.2] [--levels 10,50,100,200,500]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add repo root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.llm_client import BaseLLMClient, GeminiClient, shutdown_gemini_executor
+
+
+class FakeUsage:
+    prompt_token_count = 100
+    candidates_token_count = 50
+
+
+class FakeResponse:
+    def __init__(self, text: str):
+        self.text = text
+        self.usage_metadata = FakeUsage()
+
+
+class FakeVertexModel:
+    """Stands in for vertexai GenerativeModel: sleeps for a fixed latency."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def generate_content(self, prompt, generation_config=None, stream=False):
+        time.sleep(self.latency)
+        return FakeResponse(f"response to {prompt}")
+
+    async def generate_content_async(self, prompt, generation_config=None, stream=False):
+        await asyncio.sleep(self.latency)
+        return FakeResponse(f"response to {prompt}")
+
+
+def make_client(model: FakeVertexModel, native_async: bool) -> GeminiClient:
+    """Build a GeminiClient around a fake model (skips Vertex AI init)."""
+    client = GeminiClient.__new__(GeminiClient)
+    BaseLLMClient.__init__(client, "fake-gemini")
+    client.client = model
+    client.native_async = native_async
+    client._generation_config = lambda: None
+    return client
+
+
+async def run_level(mode: str, model: FakeVertexModel, n: int) -> float:
+    """Run n concurrent calls in the given mode; return wall seconds."""
+    if mode == "to_thread":
+        async def call(i):
+            return await asyncio.to_thread(model.generate_content, f"p{i}", generation_config=None)
+    else:
+        client = make_client(model, native_async=(mode == "native"))
+
+        async def call(i):
+            return await client.generate(f"p{i}")
+
+    start = time.perf_counter()
+    await asyncio.gather(*[call(i) for i in range(n)])
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--latency", type=float, default=0.2, help="Fake call latency (s)")
+    parser.add_argument("--levels", default="10,50,100,200,500", help="In-flight call counts")
+    parser.add_argument("--pool-size", type=int, default=None,
+                        help="GEMINI_THREAD_POOL_SIZE for the thread pool mode "
+                             "(default: 2 x LLM_MAX_CONCURRENT)")
+    args = parser.parse_args()
+
+    if args.pool_size:
+        os.environ["GEMINI_THREAD_POOL_SIZE"] = str(args.pool_size)
+    levels = [int(level) for level in args.levels.split(",")]
+    model = FakeVertexModel(args.latency)
+
+    print("=" * 70)
+    print(f"GEMINI CONCURRENCY BENCHMARK (fake model, latency={args.latency * 1000:.0f}ms)")
+    print("=" * 70)
+    print(f"{'mode':<12} {'in-flight':>9} {'wall s':>8} {'calls/s':>9} {'effective concurrency':>22}")
+
+    for mode in ("to_thread", "thread pool", "native"):
+        for n in levels:
+            wall = asyncio.run(run_level(mode, model, n))
+            print(f"{mode:<12} {n:>9} {wall:>8.2f} {n / wall:>9.0f} {n * args.latency / wall:>22.0f}")
+        shutdown_gemini_executor()
+        print()
+
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
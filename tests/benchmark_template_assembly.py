@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: legacy replace-loop assembly vs compiled template assembly.
+
+Runs both strategies over every template in app/templates/ with synthetic
+content for each placeholder, checks that the output is identical, and
+reports per-template and total timings.
+
+Usage:
+    python3 tests/benchmark_template_assembly.py [--iterations 200] [--top 10]
+"""
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add repo root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.template_assembler import CompiledTemplate
+
+TEMPLATES_DIR = Path(__file__).parent.parent / "app" / "templates"
+
+
+def legacy_assemble(template_html: str, content_map: dict) -> str:
+    """Pre-v1.2.3 assembly: findall + one str.replace per placeholder."""
+    placeholder_pattern = r'\{([a-z_][a-z0-9_]*)\}'
+    placeholders = set(re.findall(placeholder_pattern, template_html, re.IGNORECASE))
+
+    missing = placeholders - set(content_map.keys())
+    if missing:
+        raise ValueError(
+            f"Missing content for placeholders: {', '.join(sorted(missing))}"
+        )
+
+    assembled_html = template_html
+    for placeholder, content in content_map.items():
+        assembled_html = assembled_html.replace('{' + placeholder + '}', content)
+    return assembled_html
+
+
+def time_call(fn, iterations: int) -> float:
+    """Return total seconds for `iterations` calls of fn()."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--top", type=int, default=10, help="Slowest templates to list")
+    args = parser.parse_args()
+
+    template_files = sorted(TEMPLATES_DIR.rglob("*.html"))
+    print("=" * 70)
+    print(f"TEMPLATE ASSEMBLY BENCHMARK ({len(template_files)} templates, "
+          f"{args.iterations} iterations each)")
+    print("=" * 70)
+
+    rows = []
+    total_legacy = 0.0
+    total_compiled = 0.0
+
+    for path in template_files:
+        template_html = path.read_text(encoding="utf-8")
+        compiled = CompiledTemplate(template_html)
+        content_map = {
+            name: f"<span>Generated content for {name}</span>"
+            for name in compiled.placeholders
+        }
+
+        if legacy_assemble(template_html, content_map) != compiled.render(content_map):
+            print(f"✗ Output mismatch: {path.relative_to(TEMPLATES_DIR)}")
+            sys.exit(1)
+
+        legacy_s = time_call(lambda: legacy_assemble(template_html, content_map), args.iterations)
+        compiled_s = time_call(lambda: compiled.render(content_map), args.iterations)
+        total_legacy += legacy_s
+        total_compiled += compiled_s
+        rows.append((str(path.relative_to(TEMPLATES_DIR)), len(compiled.placeholders),
+                     len(template_html), legacy_s, compiled_s))
+
+    print(f"✓ Output identical for all {len(rows)} templates\n")
+
+    rows.sort(key=lambda r: r[3], reverse=True)
+    print(f"{'template':<48} {'slots':>5} {'chars':>7} {'legacy µs':>10} {'compiled µs':>12} {'speedup':>8}")
+    for name, slots, chars, legacy_s, compiled_s in rows[:args.top]:
+        legacy_us = legacy_s / args.iterations * 1e6
+        compiled_us = compiled_s / args.iterations * 1e6
+        print(f"{name[:48]:<48} {slots:>5} {chars:>7} {legacy_us:>10.1f} {compiled_us:>12.1f} "
+              f"{legacy_s / compiled_s:>7.1f}x")
+
+    print()
+    print(f"Total legacy:   {total_legacy * 1000:.1f} ms")
+    print(f"Total compiled: {total_compiled * 1000:.1f} ms")
+    print(f"Overall speedup: {total_legacy / total_compiled:.1f}x")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,476 @@
+"""
+In-memory stand-in for redis.asyncio.Redis (decode_responses=True).
+
+Implements only the commands the async queue and workers use, with the same
+argument conventions as redis-py, so queue code can be tested without a
+Redis server.
+"""
+import asyncio
+import fnmatch
+import time
+from typing import Any, Dict, List, Optional
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data: Dict[str, Any] = {}
+        self.expires: Dict[str, float] = {}
+        self.subscribers: Dict[str, List["FakePubSub"]] = {}
+        self.round_trips = 0  # Pipelines executed (direct commands are not counted)
+
+    # ----- keys -----
+
+    def _alive(self, key: str) -> bool:
+        expires_at = self.expires.get(key)
+        if expires_at is not None and expires_at <= time.time():
+            self.data.pop(key, None)
+            self.expires.pop(key, None)
+        return key in self.data
+
+    def _get(self, key: str, default_factory):
+        if not self._alive(key):
+            self.data[key] = default_factory()
+        return self.data[key]
+
+    def _drop_if_empty(self, key: str):
+        if key in self.data and not self.data[key]:
+            del self.data[key]
+            self.expires.pop(key, None)
+
+    async def ping(self):
+        return True
+
+    async def close(self):
+        pass
+
+    async def aclose(self):
+        pass
+
+    async def exists(self, *keys: str) -> int:
+        return sum(1 for key in keys if self._alive(key))
+
+    async def delete(self, *keys: str) -> int:
+        removed = 0
+        for key in keys:
+            if self._alive(key):
+                del self.data[key]
+                self.expires.pop(key, None)
+                removed += 1
+        return removed
+
+    async def expire(self, key: str, seconds: int) -> bool:
+        if not self._alive(key):
+            return False
+        self.expires[key] = time.time() + seconds
+        return True
+
+    async def ttl(self, key: str) -> int:
+        if not self._alive(key):
+            return -2
+        if key not in self.expires:
+            return -1
+        return int(self.expires[key] - time.time())
+
+    async def scan(self, cursor: int = 0, match: Optional[str] = None, count: int = 10):
+        keys = [key for key in list(self.data) if self._alive(key)]
+        if match:
+            keys = [key for key in keys if fnmatch.fnmatchcase(key, match)]
+        return 0, keys
+
+    # ----- strings -----
+
+    async def set(self, name: str, value: Any, ex: Optional[int] = None, nx: bool = False, **kwargs):
+        if nx and self._alive(name):
+            return None
+        self.data[name] = str(value)
+        if ex:
+            self.expires[name] = time.time() + ex
+        else:
+            self.expires.pop(name, None)
+        return True
+
+    async def get(self, name: str) -> Optional[str]:
+        return self.data[name] if self._alive(name) else None
+
+    async def incr(self, name: str, amount: int = 1) -> int:
+        value = int(self.data[name]) + amount if self._alive(name) else amount
+        self.data[name] = str(value)
+        return value
+
+    async def decr(self, name: str, amount: int = 1) -> int:
+        return await self.incr(name, -amount)
+
+    # ----- hashes -----
+
+    async def hset(self, name: str, key: Optional[str] = None, value: Any = None,
+                   mapping: Optional[Dict[str, Any]] = None) -> int:
+        hash_ = self._get(name, dict)
+        items = dict(mapping or {})
+        if key is not None:
+            items[key] = value
+        added = sum(1 for k in items if k not in hash_)
+        hash_.update({k: str(v) for k, v in items.items()})
+        return added
+
+    async def hget(self, name: str, key: str) -> Optional[str]:
+        return self.data[name].get(key) if self._alive(name) else None
+
+    async def hgetall(self, name: str) -> Dict[str, str]:
+        return dict(self.data[name]) if self._alive(name) else {}
+
+    async def hincrby(self, name: str, key: str, amount: int = 1) -> int:
+        hash_ = self._get(name, dict)
+        hash_[key] = str(int(hash_.get(key, 0)) + amount)
+        return int(hash_[key])
+
+    # ----- sets -----
+
+    async def sadd(self, name: str, *values: str) -> int:
+        set_ = self._get(name, set)
+        added = len(set(values) - set_)
+        set_.update(values)
+        return added
+
+    async def srem(self, name: str, *values: str) -> int:
+        if not self._alive(name):
+            return 0
+        set_ = self.data[name]
+        removed = len(set(values) & set_)
+        set_.difference_update(values)
+        self._drop_if_empty(name)
+        return removed
+
+    async def smembers(self, name: str) -> set:
+        return set(self.data[name]) if self._alive(name) else set()
+
+    # ----- lists -----
+
+    def _list(self, name: str) -> List[str]:
+        return self._get(name, list)
+
+    async def lpush(self, name: str, *values: str) -> int:
+        list_ = self._list(name)
+        for value in values:
+            list_.insert(0, str(value))
+        return len(list_)
+
+    async def rpush(self, name: str, *values: str) -> int:
+        list_ = self._list(name)
+        list_.extend(str(value) for value in values)
+        return len(list_)
+
+    async def llen(self, name: str) -> int:
+        return len(self.data[name]) if self._alive(name) else 0
+
+    async def lrange(self, name: str, start: int, end: int) -> List[str]:
+        if not self._alive(name):
+            return []
+        list_ = self.data[name]
+        end = len(list_) if end == -1 else end + 1
+        return list_[start:end]
+
+    async def ltrim(self, name: str, start: int, end: int) -> bool:
+        if self._alive(name):
+            self.data[name][:] = await self.lrange(name, start, end)
+            self._drop_if_empty(name)
+        return True
+
+    async def lindex(self, name: str, index: int) -> Optional[str]:
+        if not self._alive(name):
+            return None
+        try:
+            return self.data[name][index]
+        except IndexError:
+            return None
+
+    async def lrem(self, name: str, count: int, value: str) -> int:
+        if not self._alive(name):
+            return 0
+        list_ = self.data[name]
+        removed = 0
+        while value in list_ and (count == 0 or removed < abs(count)):
+            list_.remove(value)
+            removed += 1
+        self._drop_if_empty(name)
+        return removed
+
+    async def lmove(self, first_list: str, second_list: str, src: str = "LEFT", dest: str = "RIGHT"):
+        if not self._alive(first_list):
+            return None
+        source = self.data[first_list]
+        value = source.pop(0) if src == "LEFT" else source.pop()
+        self._drop_if_empty(first_list)
+        target = self._list(second_list)
+        if dest == "LEFT":
+            target.insert(0, value)
+        else:
+            target.append(value)
+        return value
+
+    async def blmove(self, first_list: str, second_list: str, timeout: float,
+                     src: str = "LEFT", dest: str = "RIGHT"):
+        deadline = time.time() + timeout
+        while True:
+            value = await self.lmove(first_list, second_list, src, dest)
+            if value is not None or time.time() >= deadline:
+                return value
+            await asyncio.sleep(0.01)
+
+    # ----- streams (single consumer group semantics as in Redis 7) -----
+
+    def _stream(self, name: str) -> Dict[str, Any]:
+        return self._get(name, lambda: {"entries": {}, "groups": {}, "last_id": (0, 0)})
+
+    @staticmethod
+    def _parse_id(entry_id: str) -> tuple:
+        exclusive = entry_id.startswith("(")
+        entry_id = entry_id.lstrip("(")
+        if entry_id in ("-", "+"):
+            return (0, 0) if entry_id == "-" else (float("inf"), 0), exclusive
+        ms, _, seq = entry_id.partition("-")
+        return (int(ms), int(seq or 0)), exclusive
+
+    async def xadd(self, name: str, fields: Dict[str, Any], id: str = "*", **kwargs) -> str:
+        stream = self._stream(name)
+        ms = int(time.time() * 1000)
+        last_ms, last_seq = stream["last_id"]
+        new_id = (ms, 0) if ms > last_ms else (last_ms, last_seq + 1)
+        stream["last_id"] = new_id
+        entry_id = f"{new_id[0]}-{new_id[1]}"
+        stream["entries"][entry_id] = {k: str(v) for k, v in fields.items()}
+        maxlen = kwargs.get("maxlen")
+        while maxlen is not None and len(stream["entries"]) > maxlen:
+            del stream["entries"][next(iter(stream["entries"]))]
+        return entry_id
+
+    async def xlen(self, name: str) -> int:
+        return len(self.data[name]["entries"]) if self._alive(name) else 0
+
+    async def xdel(self, name: str, *ids: str) -> int:
+        if not self._alive(name):
+            return 0
+        entries = self.data[name]["entries"]
+        return sum(1 for entry_id in ids if entries.pop(entry_id, None) is not None)
+
+    async def xrange(self, name: str, min: str = "-", max: str = "+", count: Optional[int] = None):
+        if not self._alive(name):
+            return []
+        low, low_exclusive = self._parse_id(min)
+        high, _ = self._parse_id(max)
+        result = []
+        for entry_id, fields in self.data[name]["entries"].items():
+            key, _ = self._parse_id(entry_id)
+            if (key > low or (key == low and not low_exclusive)) and key <= high:
+                result.append((entry_id, dict(fields)))
+        return result[:count] if count else result
+
+    async def xgroup_create(self, name: str, groupname: str, id: str = "$", mkstream: bool = False, **kwargs):
+        if not self._alive(name) and not mkstream:
+            raise Exception("ERR The XGROUP subcommand requires the key to exist")
+        stream = self._stream(name)
+        if groupname in stream["groups"]:
+            raise Exception("BUSYGROUP Consumer Group name already exists")
+        last = "0-0" if id == "0" else "-".join(map(str, stream["last_id"]))
+        stream["groups"][groupname] = {"last": last, "pel": {}, "consumers": set(), "read": 0}
+        return True
+
+    async def xgroup_delconsumer(self, name: str, groupname: str, consumername: str) -> int:
+        group = self.data[name]["groups"][groupname]
+        group["consumers"].discard(consumername)
+        return 0
+
+    async def xinfo_groups(self, name: str):
+        if not self._alive(name):
+            raise Exception("ERR no such key")
+        stream = self.data[name]
+        groups = []
+        for group_name, group in stream["groups"].items():
+            last, _ = self._parse_id(group["last"])
+            lag = sum(1 for entry_id in stream["entries"] if self._parse_id(entry_id)[0] > last)
+            groups.append({
+                "name": group_name,
+                "consumers": len(group["consumers"]),
+                "pending": len(group["pel"]),
+                "last-delivered-id": group["last"],
+                "lag": lag
+            })
+        return groups
+
+    def _deliver(self, group: Dict[str, Any], consumer: str, entry_id: str):
+        pel = group["pel"]
+        count = pel[entry_id][2] + 1 if entry_id in pel else 1
+        pel[entry_id] = [consumer, time.time(), count]
+        group["consumers"].add(consumer)
+
+    async def xreadgroup(self, groupname: str, consumername: str, streams: Dict[str, str],
+                         count: Optional[int] = None, block: Optional[int] = None, **kwargs):
+        deadline = time.time() + (block or 0) / 1000
+        while True:
+            response = []
+            for name, position in streams.items():
+                stream = self._stream(name)
+                group = stream["groups"][groupname]
+                group["consumers"].add(consumername)
+                last, _ = self._parse_id(group["last"])
+                messages = []
+                for entry_id, fields in stream["entries"].items():
+                    if self._parse_id(entry_id)[0] > last:
+                        messages.append((entry_id, dict(fields)))
+                        self._deliver(group, consumername, entry_id)
+                        group["last"] = entry_id
+                        if count and len(messages) >= count:
+                            break
+                if messages:
+                    response.append([name, messages])
+            if response or block is None or time.time() >= deadline:
+                return response
+            await asyncio.sleep(0.01)
+
+    async def xack(self, name: str, groupname: str, *ids: str) -> int:
+        pel = self.data[name]["groups"][groupname]["pel"]
+        return sum(1 for entry_id in ids if pel.pop(entry_id, None) is not None)
+
+    async def xpending(self, name: str, groupname: str) -> Dict[str, Any]:
+        pel = self.data[name]["groups"][groupname]["pel"]
+        per_consumer: Dict[str, int] = {}
+        for consumer, _, _ in pel.values():
+            per_consumer[consumer] = per_consumer.get(consumer, 0) + 1
+        return {
+            "pending": len(pel),
+            "consumers": [{"name": c, "pending": n} for c, n in per_consumer.items()]
+        }
+
+    async def xpending_range(self, name: str, groupname: str, min: str, max: str, count: int,
+                             consumername: Optional[str] = None, idle: Optional[int] = None):
+        if not self._alive(name):
+            return []
+        pel = self.data[name]["groups"][groupname]["pel"]
+        now = time.time()
+        result = [
+            {"message_id": entry_id, "consumer": consumer,
+             "time_since_delivered": int((now - delivered) * 1000), "times_delivered": times}
+            for entry_id, (consumer, delivered, times) in sorted(pel.items(), key=lambda i: self._parse_id(i[0]))
+            if consumername is None or consumer == consumername
+        ]
+        return result[:count]
+
+    async def xclaim(self, name: str, groupname: str, consumername: str, min_idle_time: int,
+                     message_ids, justid: bool = False, **kwargs):
+        stream = self.data[name]
+        group = stream["groups"][groupname]
+        claimed = []
+        for entry_id in message_ids:
+            if entry_id not in group["pel"]:
+                continue
+            _, delivered, times = group["pel"][entry_id]
+            if (time.time() - delivered) * 1000 < min_idle_time:
+                continue
+            group["pel"][entry_id] = [consumername, time.time(), times if justid else times + 1]
+            group["consumers"].add(consumername)
+            if justid:
+                claimed.append(entry_id)
+            elif entry_id in stream["entries"]:
+                claimed.append((entry_id, dict(stream["entries"][entry_id])))
+        return claimed
+
+    async def xautoclaim(self, name: str, groupname: str, consumername: str, min_idle_time: int,
+                         start_id: str = "0-0", count: Optional[int] = None, justid: bool = False):
+        stream = self.data[name]
+        group = stream["groups"][groupname]
+        now = time.time()
+        claimed, deleted = [], []
+        start, _ = self._parse_id(start_id)
+        scan = sorted((e for e in group["pel"] if self._parse_id(e)[0] >= start),
+                      key=lambda e: self._parse_id(e)[0])
+        for entry_id in scan:
+            if count and len(claimed) >= count:
+                return [entry_id, claimed, deleted]
+            _, delivered, times = group["pel"][entry_id]
+            if (now - delivered) * 1000 < min_idle_time:
+                continue
+            if entry_id not in stream["entries"]:
+                del group["pel"][entry_id]
+                deleted.append(entry_id)
+                continue
+            group["pel"][entry_id] = [consumername, now, times + 1]
+            group["consumers"].add(consumername)
+            claimed.append((entry_id, dict(stream["entries"][entry_id])))
+        return ["0-0", claimed, deleted]
+
+    # ----- pipelines -----
+
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        return FakePipeline(self)
+
+    # ----- pub/sub -----
+
+    def pubsub(self) -> "FakePubSub":
+        return FakePubSub(self)
+
+    async def publish(self, channel: str, message: str) -> int:
+        subscribers = self.subscribers.get(channel, [])
+        for pubsub in subscribers:
+            pubsub.messages.append({"type": "message", "channel": channel, "data": message})
+        return len(subscribers)
+
+
+class FakePipeline:
+    """Queues commands and runs them in order on execute (one round-trip)."""
+
+    def __init__(self, redis: FakeRedis):
+        self.redis = redis
+        self.commands: List[tuple] = []
+
+    def __getattr__(self, name: str):
+        method = getattr(self.redis, name)
+
+        def queue(*args, **kwargs):
+            self.commands.append((method, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self) -> List[Any]:
+        commands, self.commands = self.commands, []
+        self.redis.round_trips += 1
+        return [await method(*args, **kwargs) for method, args, kwargs in commands]
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.commands = []
+
+
+class FakePubSub:
+    def __init__(self, redis: FakeRedis):
+        self.redis = redis
+        self.channels: set = set()
+        self.messages: List[Dict[str, Any]] = []
+
+    async def subscribe(self, *channels: str):
+        for channel in channels:
+            self.channels.add(channel)
+            self.redis.subscribers.setdefault(channel, []).append(self)
+            self.messages.append({"type": "subscribe", "channel": channel, "data": len(self.channels)})
+
+    async def unsubscribe(self, *channels: str):
+        for channel in channels or list(self.channels):
+            self.channels.discard(channel)
+            if self in self.redis.subscribers.get(channel, []):
+                self.redis.subscribers[channel].remove(self)
+
+    async def get_message(self, ignore_subscribe_messages: bool = False, timeout: Optional[float] = 0.0):
+        deadline = time.time() + (timeout or 0)
+        while True:
+            while self.messages:
+                message = self.messages.pop(0)
+                if ignore_subscribe_messages and message["type"] != "message":
+                    continue
+                return message
+            if time.time() >= deadline:
+                return None
+            await asyncio.sleep(0.01)
+
+    async def aclose(self):
+        await self.unsubscribe()
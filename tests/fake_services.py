@@ -0,0 +1,74 @@
+"""
+Fake Image Builder client, LLM and generator stages for hero / I-series tests.
+
+Each fake sleeps for a fixed latency instead of calling a service, so tests
+can assert on overlap and deadlines. Patch them in with monkeypatch:
+
+    monkeypatch.setattr(image_service_client, "_image_service_client_instance", FakeImageClient(0.2))
+    monkeypatch.setattr(I1Generator, "_build_image_prompt_2step", fake_image_prompt())
+    monkeypatch.setattr(I1Generator, "_generate_content_multi_step", fake_content(0.05))
+"""
+import asyncio
+import time
+from typing import Any, Dict, Optional
+
+
+class FakeImageClient:
+    """Image Builder client: every image takes latency seconds (numbered URLs unless url is set)."""
+
+    def __init__(self, latency: float, fail: bool = False, url: Optional[str] = None):
+        self.latency = latency
+        self.fail = fail
+        self.url = url
+        self.calls = 0
+
+    async def _image(self) -> Dict[str, Any]:
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        if self.fail:
+            raise ValueError("Image Builder unavailable")
+        url = self.url or f"https://img/{self.calls}.png"
+        return {"success": True, "urls": {"original": url}, "metadata": {}}
+
+    async def generate_background_image(self, **kwargs):
+        return await self._image()
+
+    async def generate_iseries_image(self, **kwargs):
+        return await self._image()
+
+
+async def fake_llm(prompt: str) -> str:
+    """LLM callable for generators whose LLM stages are patched out."""
+    return "<div>unused</div>"
+
+
+def fake_content(latency: float, html: str = "<div>content</div>", events: Optional[Dict[str, Any]] = None):
+    """
+    Content stage (_generate_content / _generate_content_multi_step) taking latency seconds.
+
+    Records its start time in events["content_started"].
+    """
+    async def generate_content(self, *args, **kwargs):
+        if events is not None:
+            events["content_started"] = time.perf_counter()
+        await asyncio.sleep(latency)
+        return {"content": html, "validation": {}}
+    return generate_content
+
+
+def fake_image_prompt(prompt: str = "a lighthouse at dawn", latency: float = 0.0,
+                      events: Optional[Dict[str, Any]] = None):
+    """
+    I-series _build_image_prompt_2step returning prompt after latency seconds.
+
+    Appends each request's slide_number to events["prompt_builds"], and
+    raises RuntimeError(events["prompt_error"]) once that is set.
+    """
+    async def build_image_prompt(self, request, content_context=None):
+        if events is not None:
+            events.setdefault("prompt_builds", []).append(request.slide_number)
+            if events.get("prompt_error"):
+                raise RuntimeError(events["prompt_error"])
+        await asyncio.sleep(latency)
+        return prompt, "spot_illustration", {}
+    return build_image_prompt
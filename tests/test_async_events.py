@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Test pushed job events (pub/sub -> SSE) and webhook callbacks (in-memory Redis).
+"""
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+# Add repo root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.api import async_routes
+from app.services.job_queue import (
+    JOB_KEY_PREFIX, create_job_queue, decode_result, is_callback_url_allowed, publish_job_event
+)
+from app.workers.generation_worker import GenerationWorker
+from fake_redis import FakeRedis
+
+
+class _FakeGenerator:
+    def __init__(self, html: str):
+        self.html = html
+
+    async def generate_slide_content_async(self, variant_id, slide_spec, presentation_spec=None,
+                                           element_relationships=None):
+        await asyncio.sleep(0.05)
+        return {"html": self.html, "variant_id": variant_id, "template_path": "t.html", "metadata": {}}
+
+
+def _parse_frames(body: str):
+    """(event, data) pairs of an SSE body, skipping comments."""
+    frames = []
+    for frame in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in frame.split("\n") if not line.startswith(":"))
+        if lines:
+            frames.append((lines["event"], json.loads(lines["data"])))
+    return frames
+
+
+async def _collect(response) -> str:
+    return "".join([chunk async for chunk in response.body_iterator])
+
+
+async def _run_worker(progress_min_interval: float, html: str = "<div>done</div>"):
+    """Run one job through a worker; returns (events, callbacks, redis)."""
+    redis = FakeRedis()
+    await redis.hset(f"{JOB_KEY_PREFIX}job-1", mapping={
+        "status": "queued",
+        "variant_id": "matrix_2x2",
+        "slide_spec": json.dumps({"slide_title": "t"}),
+        "callback_url": "http://client.test/hook"
+    })
+    await create_job_queue(redis, "list").enqueue("job-1")
+    subscriber = redis.pubsub()
+    await subscriber.subscribe("text_service:job_events:job-1")
+
+    worker = GenerationWorker("redis://unused", "w1", queue_backend="list",
+                              progress_min_interval=progress_min_interval)
+    worker.redis = redis
+    worker._generator = _FakeGenerator(html)
+    posted = []
+
+    async def record_callback(url, payload):
+        posted.append((url, payload))
+        return True
+
+    worker._send_callback = record_callback
+    task = asyncio.create_task(worker.start())
+    await asyncio.sleep(0.2)
+    await worker.stop()
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+    events = []
+    while (message := await subscriber.get_message(ignore_subscribe_messages=True)) is not None:
+        events.append(json.loads(message["data"]))
+    return events, posted, redis
+
+
+def test_worker_publishes_progress_and_posts_callback():
+    """Every stage change is published; the outcome is POSTed to callback_url."""
+    events, posted, redis = asyncio.run(_run_worker(progress_min_interval=0))
+    stored = async_routes._job_result("job-1", redis.data[f"{JOB_KEY_PREFIX}job-1"]).model_dump()
+
+    assert [e["data"]["stage"] for e in events[:-1]] == [
+        "initializing", "building_prompt", "calling_llm", "parsing_response", "assembling_html"
+    ]
+    assert events[-1]["event"] == "completed"
+    assert events[-1]["data"]["html"] == "<div>done</div>"
+    assert events[-1]["data"] == stored  # Same payload as GET /result
+    assert posted == [("http://client.test/hook", {"event": "completed", **stored})]
+
+
+def test_callback_urls_are_checked_against_the_allowlist():
+    """Only http(s) to listed hosts, or to public hosts when no allowlist is set."""
+    allowed = [".client.test", "hooks.example.com"]
+    assert is_callback_url_allowed("https://api.client.test/hook", allowed)
+    assert is_callback_url_allowed("https://hooks.example.com/x", allowed)
+    assert not is_callback_url_allowed("https://example.com/x", allowed)
+    assert not is_callback_url_allowed("ftp://hooks.example.com/x", allowed)
+
+    assert is_callback_url_allowed("https://client.example/hook", [])
+    for url in ("http://localhost:8000/", "http://127.0.0.1/", "http://169.254.169.254/latest",
+                "http://10.0.0.5/hook", "http://[::1]/hook", "file:///etc/passwd"):
+        assert not is_callback_url_allowed(url, []), url
+
+
+def test_disallowed_callback_is_not_posted(monkeypatch):
+    """The worker re-checks callback_url before POSTing."""
+    monkeypatch.setenv("CALLBACK_ALLOWED_HOSTS", "hooks.example.com")
+    _, posted, redis = asyncio.run(_run_worker(progress_min_interval=0))
+
+    assert posted == []
+    assert redis.data[f"{JOB_KEY_PREFIX}job-1"]["status"] == "completed"
+
+
+def test_progress_writes_are_coalesced_and_results_compressed():
+    """Stages inside the interval merge into one write; large results are compressed."""
+    html = "<div class='cell'>metric</div>" * 200
+    events, _, redis = asyncio.run(_run_worker(progress_min_interval=0.03, html=html))
+    job_data = redis.data[f"{JOB_KEY_PREFIX}job-1"]
+
+    # calling_llm is flushed while the LLM call runs; the last two stages
+    # fold into the completion write
+    assert [e["data"].get("stage") for e in events] == ["initializing", "calling_llm", None]
+    assert job_data["stage"] == "complete" and job_data["progress"] == "100"
+    assert redis.round_trips == 4  # start, trailing flush, finish, completion stats
+    assert job_data["result_encoding"] == "zlib+base64"
+    assert len(job_data["result"]) < len(html) / 5
+    assert decode_result(job_data)["html"] == html
+
+
+def test_events_endpoint_streams_until_the_job_finishes(monkeypatch):
+    """The SSE stream opens with the current status and closes on the final event."""
+    monkeypatch.setenv("ENABLE_REDIS_QUEUE", "true")
+
+    async def run():
+        redis = FakeRedis()
+        monkeypatch.setattr(async_routes, "_redis_client", redis)
+        job_key = f"{JOB_KEY_PREFIX}job-2"
+        await redis.hset(job_key, mapping={"status": "processing", "stage": "calling_llm", "progress": "30"})
+
+        response = await async_routes.stream_job_events("job-2")
+        body = asyncio.create_task(_collect(response))
+        await asyncio.sleep(0.05)
+
+        await publish_job_event(redis, "job-2", "progress", {"status": "processing", "stage": "parsing_response", "progress": 70})
+        await redis.hset(job_key, mapping={"status": "completed", "result": json.dumps({"html": "<p/>"}),
+                                           "started_at": "1", "completed_at": "2"})
+        await publish_job_event(redis, "job-2", "completed", {"success": True, "html": "<p/>"})
+        streamed = await asyncio.wait_for(body, timeout=2)
+
+        # Finished jobs answer at once from the hash
+        finished = await _collect(await async_routes.stream_job_events("job-2"))
+        return streamed, finished, redis.subscribers
+
+    streamed, finished, subscribers = asyncio.run(run())
+
+    assert [event for event, _ in _parse_frames(streamed)] == ["status", "progress", "completed"]
+    assert _parse_frames(streamed)[0][1]["progress"] == 30
+    assert _parse_frames(finished)[1] == ("completed", {
+        "job_id": "job-2", "success": True, "job_type": "variant", "html": "<p/>", "variant_id": None,
+        "result": None, "processing_time_ms": 1000, "error": None
+    })
+    assert not any(subscribers.values())
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Test typed async jobs: any slide type queued via /v1.2/async/jobs and run by
+a worker through its endpoint handler (in-memory Redis, fake handler).
+"""
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+# Add repo root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.api import async_routes, slides_routes
+from app.services.job_queue import JOB_KEY_PREFIX
+from app.services.llm_pool import QueueFullError, get_request_priority
+from app.workers.generation_worker import GenerationWorker
+from fake_redis import FakeRedis
+
+
+def test_typed_jobs_run_through_their_endpoint_handler(monkeypatch):
+    """Envelopes are validated on submit; capacity errors are retried, 4xx fail at once."""
+    calls = {}
+
+    async def fake_c1_text(request, generator):
+        calls[request.narrative] = calls.get(request.narrative, 0) + 1
+        if request.narrative == "busy" and calls["busy"] < 3:
+            raise HTTPException(status_code=429, detail="Service at capacity")
+        if request.narrative == "full":
+            raise QueueFullError("Queue full")
+        if request.narrative == "bad":
+            raise HTTPException(status_code=400, detail="Bad table spec")
+        if request.narrative == "unsuccessful":
+            return {"success": False, "error": "Failed to generate content"}
+        return {"slide_title": f"Slide {request.slide_number}", "html": "<section/>",
+                "lane": get_request_priority()}
+
+    monkeypatch.setattr(slides_routes, "generate_c1_text", fake_c1_text)
+    monkeypatch.setenv("ENABLE_REDIS_QUEUE", "true")
+    redis = FakeRedis()
+    monkeypatch.setattr(async_routes, "_redis_client", redis)
+    app = FastAPI()
+    app.include_router(async_routes.router)
+    client = TestClient(app)
+
+    unknown = client.post("/v1.2/async/jobs", json={"job_type": "hero/nope", "request": {}})
+    invalid = client.post("/v1.2/async/jobs", json={"job_type": "atomic/METRICS", "request": {}})
+    ok_id, busy_id, full_id, bad_id, unsuccessful_id = [
+        client.post("/v1.2/async/jobs", json={
+            "job_type": "C1-text", "request": {"narrative": narrative, "slide_number": 3}
+        }).json()["job_id"]
+        for narrative in ("ok", "busy", "full", "bad", "unsuccessful")
+    ]
+
+    async def run_worker():
+        worker = GenerationWorker("redis://unused", "w1", queue_backend="list", progress_min_interval=0,
+                                  max_attempts=2, transient_retries=1, retry_backoff=0)
+        worker.redis = redis
+        task = asyncio.create_task(worker.start())
+        await asyncio.sleep(0.2)
+        await worker.stop()
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(run_worker())
+    ok = client.get(f"/v1.2/async/result/{ok_id}").json()
+    busy, full, bad, unsuccessful = [
+        client.get(f"/v1.2/async/result/{job_id}").json()
+        for job_id in (busy_id, full_id, bad_id, unsuccessful_id)
+    ]
+
+    assert unknown.status_code == 400
+    assert invalid.status_code == 422
+    assert json.loads(redis.data[f"{JOB_KEY_PREFIX}{ok_id}"]["request"])["slide_number"] == 3
+    assert ok["success"] and ok["job_type"] == "C1-text"
+    assert ok["result"]["slide_title"] == "Slide 3" and ok["html"] == "<section/>"
+    assert ok["result"]["lane"] == "background"
+    # 429 twice: retried in place, then requeued and run again
+    assert busy["success"] and calls["busy"] == 3
+    # A full LLM pool on every call: requeued once, failed on the last claim
+    assert not full["success"] and full["error"].startswith("429: Service at capacity")
+    assert calls["full"] == 4 and redis.data[f"{JOB_KEY_PREFIX}{full_id}"]["attempts"] == "2"
+    assert not bad["success"] and bad["error"] == "400: Bad table spec" and calls["bad"] == 1
+    # success=false in a 200 body fails the job like a 500, after the same retries
+    assert not unsuccessful["success"] and unsuccessful["error"] == "500: Failed to generate content"
+    assert calls["unsuccessful"] == 4
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Test /v1.2/deck/generate with fake slide handlers (no Vertex AI).
+"""
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+# Add repo root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import deck_routes, slides_routes
+from app.services.llm_pool import PoolPriority, QueueFullError, get_request_priority
+
+SLIDE_LATENCY = 0.1
+
+
+def _client(monkeypatch):
+    seen = []
+
+    async def fake_c1_text(request, generator):
+        seen.append((request, get_request_priority()))
+        await asyncio.sleep(SLIDE_LATENCY)
+        if request.narrative == "fail":
+            raise QueueFullError("Queue full")
+        if request.narrative == "unsuccessful":
+            return {"success": False, "error": "Failed to generate content"}
+        return {"slide_title": f"Slide {request.slide_number}", "context": request.context}
+
+    monkeypatch.setattr(slides_routes, "generate_c1_text", fake_c1_text)
+    app = FastAPI()
+    app.include_router(deck_routes.router)
+    return TestClient(app), seen
+
+
+def _deck(narratives, **extra):
+    return {
+        "slides": [
+            {"slide_type": "C1-text", "request": {"narrative": narrative}}
+            for narrative in narratives
+        ],
+        "presentation_spec": {"presentation_title": "Q4 Review", "presentation_type": "Report"},
+        **extra
+    }
+
+
+def test_deck_runs_slides_concurrently_in_order(monkeypatch):
+    """A 20-slide deck takes about one slide's latency and keeps request order."""
+    client, seen = _client(monkeypatch)
+
+    response = client.post("/v1.2/deck/generate", json=_deck([f"n{i}" for i in range(20)]))
+    body = response.json()
+
+    assert response.status_code == 200
+    assert body["success"] and body["succeeded"] == 20
+    assert [s["index"] for s in body["slides"]] == list(range(20))
+    assert body["slides"][3]["result"]["slide_title"] == "Slide 4"
+    assert body["elapsed_ms"] < 20 * SLIDE_LATENCY * 1000 / 4
+    # Deck-level presentation context reaches every slide
+    assert all(r.context["presentation_title"] == "Q4 Review" for r, _ in seen)
+    # Deck slides queue in the batch LLM lane
+    assert {lane for _, lane in seen} == {PoolPriority.BATCH}
+
+
+def test_deck_concurrency_budget_and_partial_failure(monkeypatch):
+    """max_concurrency bounds in-flight slides; one failure does not fail the rest."""
+    client, _ = _client(monkeypatch)
+
+    response = client.post(
+        "/v1.2/deck/generate",
+        json=_deck(["a", "fail", "b", "unsuccessful"], max_concurrency=2)
+    )
+    body = response.json()
+
+    assert not body["success"] and body["succeeded"] == 2 and body["failed"] == 2
+    assert body["slides"][1]["status_code"] == 429
+    # A 200 that reports success=false in its body is a failed slide
+    assert not body["slides"][3]["success"]
+    assert body["slides"][3]["error"] == "Failed to generate content"
+    # 4 slides, 2 at a time
+    assert body["elapsed_ms"] >= 2 * SLIDE_LATENCY * 1000
+
+
+def test_deck_stream_and_unknown_type(monkeypatch):
+    """stream=true emits one slide event per slide then complete; bad types are 400."""
+    client, _ = _client(monkeypatch)
+
+    response = client.post("/v1.2/deck/generate", json=_deck(["a", "b"], stream=True))
+    events = [line[7:] for line in response.text.splitlines() if line.startswith("event: ")]
+    complete = json.loads(response.text.strip().splitlines()[-1][6:])
+
+    assert events == ["slide", "slide", "complete"]
+    assert complete["total_slides"] == 2
+
+    bad = client.post("/v1.2/deck/generate", json={
+        "slides": [{"slide_type": "X9", "request": {}}]
+    })
+    assert bad.status_code == 400
+
+
+def test_deck_packs_small_content_slides(monkeypatch):
+    """pack_content_slides serves small content slides from one LLM call."""
+    from app.api import v1_2_routes
+    from app.core import ElementBasedContentGenerator
+
+    calls = []
+
+    def element_data(variant_id):
+        spec = generator.prompt_builder.load_variant_spec(variant_id)
+        return {
+            element["element_id"]: {field: "text" for field in element["required_fields"]}
+            for element in spec["elements"]
+        }
+
+    async def fake_llm(prompt):
+        calls.append(prompt)
+        return json.dumps({f"slide_{i}": element_data("impact_quote_c1") for i in (1, 2)})
+
+    generator = ElementBasedContentGenerator(llm_service=fake_llm)
+    monkeypatch.setattr(v1_2_routes, "get_generator", lambda: generator)
+    app = FastAPI()
+    app.include_router(deck_routes.router)
+    slide = {
+        "slide_type": "content",
+        "request": {
+            "variant_id": "impact_quote_c1",
+            "slide_spec": {"slide_title": "Quote", "slide_purpose": "Inspire", "key_message": "Go"}
+        }
+    }
+
+    body = TestClient(app).post("/v1.2/deck/generate", json={
+        "slides": [slide, slide], "pack_content_slides": True
+    }).json()
+
+    assert body["succeeded"] == 2
+    assert len(calls) == 1
+    assert body["slides"][1]["result"]["metadata"]["generation_mode"] == "packed"
+
+
+def test_shared_context_reaches_hero_iseries_and_layout_slides():
+    """Deck-level context is merged into every family's own context format."""
+    from app.models.deck_models import DeckGenerationRequest
+
+    deck = DeckGenerationRequest(**_deck(["a", "b", "c"]), theme_config={"theme_id": "dark"},
+                                 content_context={"audience": "board"})
+    hero = deck_routes._apply_shared_context(deck, 0, "hero", {"context": {"presentation_title": "Mine"}})
+    iseries = deck_routes._apply_shared_context(deck, 1, "iseries", {"title": "Roadmap"})
+    layout = deck_routes._apply_shared_context(deck, 2, "layout", {"prompt": "x"})
+
+    assert hero["slide_number"] == 1 and hero["context"]["presentation_title"] == "Mine"
+    assert hero["context"]["presentation_type"] == "Report"
+    assert iseries["context"]["theme_config"] == {"theme_id": "dark"}
+    assert iseries["context"]["content_context"] == {"audience": "board"}
+    assert layout["context"] == {"presentationTitle": "Q4 Review", "slideIndex": 2, "slideCount": 3}
+    assert layout["content_context"] == {"audience": "board"}
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Test GeminiClient call paths with a fake Vertex model (no Vertex AI).
+"""
+import asyncio
+import sys
+import threading
+from pathlib import Path
+
+# Add repo root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.llm_client import BaseLLMClient, GeminiClient, shutdown_gemini_executor
+
+
+class _FakeResponse:
+    def __init__(self, text: str):
+        self.text = text
+
+
+class _FakeModel:
+    def __init__(self):
+        self.threads = []
+
+    def generate_content(self, prompt, generation_config=None, stream=False):
+        self.threads.append(threading.current_thread().name)
+        return _FakeResponse(f"sync {prompt}")
+
+    async def generate_content_async(self, prompt, generation_config=None, stream=False):
+        await asyncio.sleep(0)
+        return _FakeResponse(f"async {prompt}")
+
+
+def _client(model: _FakeModel, native_async: bool) -> GeminiClient:
+    client = GeminiClient.__new__(GeminiClient)
+    BaseLLMClient.__init__(client, "fake-gemini")
+    client.client = model
+    client.native_async = native_async
+    client._generation_config = lambda: None
+    return client
+
+
+def test_native_async_uses_no_threads():
+    """With native async the blocking generate_content is never called."""
+    model = _FakeModel()
+    response = asyncio.run(_client(model, native_async=True).generate("a"))
+
+    assert response.content == "async a"
+    assert model.threads == []
+
+
+def test_thread_pool_fallback_uses_dedicated_executor(monkeypatch):
+    """Without native async, calls run on the sized Gemini executor."""
+    monkeypatch.setenv("GEMINI_THREAD_POOL_SIZE", "3")
+    shutdown_gemini_executor()
+    model = _FakeModel()
+
+    async def run():
+        client = _client(model, native_async=False)
+        return await asyncio.gather(*[client.generate(str(i)) for i in range(6)])
+
+    try:
+        responses = asyncio.run(run())
+    finally:
+        shutdown_gemini_executor()
+
+    assert [r.content for r in responses] == [f"sync {i}" for i in range(6)]
+    assert all(name.startswith("gemini") for name in model.threads)
+    assert len(set(model.threads)) <= 3
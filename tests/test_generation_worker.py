@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Test the reliable Redis job queue in GenerationWorker (in-memory Redis, no LLM).
+"""
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+# Add repo root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.job_queue import (
+    JOB_KEY_PREFIX,
+    PROCESSING_KEY_PREFIX,
+    QUEUE_KEY,
+    STREAM_GROUP,
+    STREAM_KEY,
+    WORKERS_KEY,
+    create_job_queue
+)
+from app.workers.generation_worker import GenerationWorker
+from fake_redis import FakeRedis
+
+JOB_LATENCY = 0.1
+
+
+class _FakeGenerator:
+    def __init__(self):
+        self.calls = 0
+
+    async def generate_slide_content_async(self, variant_id, slide_spec, presentation_spec=None,
+                                           element_relationships=None):
+        self.calls += 1
+        await asyncio.sleep(JOB_LATENCY)
+        return {"html": f"<div>{slide_spec['slide_title']}</div>", "variant_id": variant_id,
+                "template_path": "t.html", "metadata": {}}
+
+
+async def _submit(redis: FakeRedis, job_id: str, **fields):
+    await redis.hset(f"{JOB_KEY_PREFIX}{job_id}", mapping={
+        "status": "queued",
+        "variant_id": "matrix_2x2",
+        "slide_spec": json.dumps({"slide_title": job_id}),
+        **fields
+    })
+    await redis.lpush(QUEUE_KEY, job_id)
+
+
+def _worker(redis: FakeRedis, worker_id: str, **kwargs) -> GenerationWorker:
+    kwargs.setdefault("queue_backend", "list")
+    worker = GenerationWorker("redis://unused", worker_id, **kwargs)
+    worker.redis = redis
+    worker._generator = _FakeGenerator()
+    return worker
+
+
+async def _stop(worker: GenerationWorker, task: asyncio.Task):
+    await worker.stop()
+    task.cancel()  # Skip the rest of the claim timeout
+    await asyncio.gather(task, return_exceptions=True)
+
+
+async def _submit_stream(redis: FakeRedis, job_id: str):
+    await redis.hset(f"{JOB_KEY_PREFIX}{job_id}", mapping={
+        "status": "queued",
+        "variant_id": "matrix_2x2",
+        "slide_spec": json.dumps({"slide_title": job_id})
+    })
+    await create_job_queue(redis, "stream").enqueue(job_id)
+
+
+def test_worker_claims_only_when_a_slot_is_free():
+    """In-flight jobs live in the processing list; the rest stay queued in Redis."""
+    async def run():
+        redis = FakeRedis()
+        for i in range(3):
+            await _submit(redis, f"job-{i}")
+        worker = _worker(redis, "w1", max_concurrent=1)
+        task = asyncio.create_task(worker.start())
+
+        await asyncio.sleep(JOB_LATENCY / 2)
+        during = (await redis.llen(QUEUE_KEY), await redis.lrange(f"{PROCESSING_KEY_PREFIX}w1", 0, -1))
+
+        await asyncio.sleep(JOB_LATENCY * 4)
+        await _stop(worker, task)
+        statuses = [await redis.hget(f"{JOB_KEY_PREFIX}job-{i}", "status") for i in range(3)]
+        return during, statuses, await redis.llen(f"{PROCESSING_KEY_PREFIX}w1")
+
+    (queued, in_flight), statuses, processing_after = asyncio.run(run())
+
+    assert queued == 2 and in_flight == ["job-0"]
+    assert statuses == ["completed"] * 3
+    assert processing_after == 0
+
+
+def test_reaper_requeues_jobs_of_dead_worker():
+    """A worker without a heartbeat loses its in-flight jobs to the queue; attempts are capped."""
+    async def run():
+        redis = FakeRedis()
+        await _submit(redis, "orphan", status="processing", attempts="1")
+        await _submit(redis, "poison", status="processing", attempts="3")
+        for job_id in ("orphan", "poison"):
+            await redis.lrem(QUEUE_KEY, 0, job_id)
+            await redis.lpush(f"{PROCESSING_KEY_PREFIX}dead", job_id)
+        await redis.sadd(WORKERS_KEY, "dead")  # registered, heartbeat expired
+
+        worker = _worker(redis, "w2")
+        await create_job_queue(redis, "list").recover("w2", limit=0)
+        after_reap = (await redis.lrange(QUEUE_KEY, 0, -1), await redis.smembers(WORKERS_KEY))
+
+        task = asyncio.create_task(worker.start())
+        await asyncio.sleep(JOB_LATENCY * 2)
+        await _stop(worker, task)
+        return after_reap, await redis.hgetall(f"{JOB_KEY_PREFIX}orphan"), \
+            await redis.hgetall(f"{JOB_KEY_PREFIX}poison")
+
+    (queue, workers), orphan, poison = asyncio.run(run())
+
+    assert queue == ["orphan"] and "dead" not in workers
+    assert orphan["status"] == "completed" and orphan["attempts"] == "2"
+    assert poison["status"] == "failed" and "max attempts" in poison["error"]
+
+
+def test_restarted_worker_recovers_its_own_jobs_and_skips_finished_ones():
+    """Jobs left in a worker's own list are requeued on start; finished ones are not rerun."""
+    async def run():
+        redis = FakeRedis()
+        await _submit(redis, "unfinished", status="processing", attempts="1")
+        await _submit(redis, "finished", status="completed", attempts="1")
+        for job_id in ("unfinished", "finished"):
+            await redis.lrem(QUEUE_KEY, 0, job_id)
+            await redis.lpush(f"{PROCESSING_KEY_PREFIX}w3", job_id)
+
+        worker = _worker(redis, "w3")
+        task = asyncio.create_task(worker.start())
+        await asyncio.sleep(JOB_LATENCY * 2)
+        await _stop(worker, task)
+        return worker._generator.calls, await redis.hget(f"{JOB_KEY_PREFIX}unfinished", "status")
+
+    calls, status = asyncio.run(run())
+
+    assert calls == 1
+    assert status == "completed"
+
+
+def test_stream_backend_acks_and_reports_pending():
+    """Stream jobs stay pending until acked; pending and waiting feed the stats."""
+    async def run():
+        redis = FakeRedis()
+        queue = create_job_queue(redis, "stream")
+        for i in range(3):
+            await _submit_stream(redis, f"job-{i}")
+        worker = _worker(redis, "s1", max_concurrent=1, queue_backend="stream")
+        task = asyncio.create_task(worker.start())
+
+        await asyncio.sleep(JOB_LATENCY / 2)
+        during = await queue.stats()
+        position = await queue.position("job-2", await redis.hgetall(f"{JOB_KEY_PREFIX}job-2"))
+
+        await asyncio.sleep(JOB_LATENCY * 4)
+        await _stop(worker, task)
+        statuses = [await redis.hget(f"{JOB_KEY_PREFIX}job-{i}", "status") for i in range(3)]
+        return during, position, await queue.stats(), statuses
+
+    during, position, after, statuses = asyncio.run(run())
+
+    assert during["waiting"] == 2 and during["in_flight"] == 1
+    assert during["pending_by_consumer"] == {"s1": 1}
+    assert position == 2
+    assert statuses == ["completed"] * 3
+    assert after["in_flight"] == 0 and after["stream_length"] == 3  # Acked, kept for replay
+
+
+def test_stream_backend_autoclaims_idle_entries():
+    """Entries left pending by a dead consumer are claimed and run by a live worker."""
+    async def run():
+        redis = FakeRedis()
+        dead = create_job_queue(redis, "stream", visibility_timeout=0)
+        await dead.register("dead")
+        await _submit_stream(redis, "orphan")
+        await dead.claim("dead", timeout=0)  # Claimed, never acked
+
+        worker = _worker(redis, "s2", queue_backend="stream", visibility_timeout=0)
+        task = asyncio.create_task(worker.start())
+        await asyncio.sleep(0.01)
+        recovered = await worker.reap_stale_workers()
+        await asyncio.sleep(JOB_LATENCY * 2)
+        await _stop(worker, task)
+        return recovered, await redis.hget(f"{JOB_KEY_PREFIX}orphan", "status"), \
+            await redis.xpending(STREAM_KEY, STREAM_GROUP)
+
+    recovered, status, pending = asyncio.run(run())
+
+    assert recovered == 1
+    assert status == "completed"
+    assert pending["pending"] == 0
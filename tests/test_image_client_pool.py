@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Test the Image Builder connection pool and result cache against a local fake server (no network).
+"""
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+# Add repo root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.image_service_client import (
+    ImageCacheConfig,
+    ImageResultCache,
+    ImageServiceClient,
+    SlideType,
+    close_image_http_client,
+    get_image_http_client
+)
+from fake_redis import FakeRedis
+
+CALLS = 20
+
+
+class _FakeImageBuilder:
+    """Minimal HTTP/1.1 keep-alive server answering /api/v2/generate."""
+
+    def __init__(self, fail_first: int = 0):
+        self.connections = 0
+        self.requests = 0
+        self.fail_first = fail_first
+        self._server = None
+
+    async def __aenter__(self) -> str:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self._server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}"
+
+    async def __aexit__(self, *exc):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                headers = dict(
+                    line.split(": ", 1) for line in head.decode().split("\r\n")[1:] if ": " in line
+                )
+                length = int(headers.get("content-length", headers.get("Content-Length", "0")))
+                if length:
+                    await reader.readexactly(length)
+                self.requests += 1
+
+                if self.requests <= self.fail_first:
+                    status, body = "503 Service Unavailable", b"{}"
+                else:
+                    status = "200 OK"
+                    body = json.dumps({
+                        "success": True,
+                        "urls": {"original": f"https://img/{self.requests}.png"},
+                        "metadata": {"generation_time_ms": 1}
+                    }).encode()
+                writer.write(
+                    f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\n"
+                    f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+async def _per_call_clients(base_url: str) -> None:
+    """The previous behaviour: a fresh client (and connection) per request."""
+    for _ in range(CALLS):
+        async with httpx.AsyncClient(timeout=5.0) as client:
+            response = await client.post(f"{base_url}/api/v2/generate", json={"prompt": "x"})
+            response.raise_for_status()
+
+
+def test_shared_client_reuses_one_connection():
+    """Sequential image calls share one kept-alive connection instead of one each."""
+    async def run():
+        before, after = _FakeImageBuilder(), _FakeImageBuilder()
+
+        async with before as base_url:
+            start = time.perf_counter()
+            await _per_call_clients(base_url)
+            per_call_ms = (time.perf_counter() - start) * 1000 / CALLS
+
+        async with after as base_url:
+            client = ImageServiceClient(base_url=base_url, timeout=5.0, max_retries=0)
+            start = time.perf_counter()
+            results = [
+                await client.generate_background_image("mountains", SlideType.TITLE)
+                for _ in range(CALLS)
+            ]
+            pooled_ms = (time.perf_counter() - start) * 1000 / CALLS
+            await close_image_http_client()
+
+        print(f"\nper-call client: {per_call_ms:.2f}ms/call, shared pool: {pooled_ms:.2f}ms/call")
+        return before.connections, after.connections, results
+
+    per_call_connections, pooled_connections, results = asyncio.run(run())
+
+    assert per_call_connections == CALLS
+    assert pooled_connections == 1
+    assert results[-1]["urls"]["original"] == f"https://img/{CALLS}.png"
+
+
+def test_retries_and_concurrent_calls_share_the_pool(monkeypatch):
+    """Retries reuse the pool; concurrent calls open at most max_connections."""
+    sleep = asyncio.sleep
+    monkeypatch.setattr(asyncio, "sleep", lambda _seconds: sleep(0))  # Skip retry backoff
+
+    async def run():
+        server = _FakeImageBuilder(fail_first=1)
+        async with server as base_url:
+            client = ImageServiceClient(base_url=base_url, timeout=5.0, max_retries=1)
+            retried = await client.generate_background_image("city", SlideType.SECTION)
+            connections_after_retry = server.connections
+            await asyncio.gather(*(
+                client.generate_iseries_image("forest", "I1") for _ in range(CALLS)
+            ))
+            pool = get_image_http_client()
+            await close_image_http_client()
+        return retried, connections_after_retry, server.connections, pool.is_closed
+
+    retried, connections_after_retry, connections, closed = asyncio.run(run())
+
+    assert retried["success"] is True
+    assert connections_after_retry == 1
+    assert connections <= 20  # IMAGE_SERVICE_MAX_CONNECTIONS default
+    assert closed
+
+
+def test_cache_serves_normalized_repeats_and_coalesces_concurrent_misses():
+    """Prompts differing only in case/whitespace hit the cache; concurrent misses share one call."""
+    async def run():
+        server = _FakeImageBuilder()
+        async with server as base_url:
+            cache = ImageResultCache(ImageCacheConfig(enabled=True))
+            client = ImageServiceClient(base_url=base_url, timeout=5.0, max_retries=0, cache=cache)
+
+            dividers = await asyncio.gather(*(
+                client.generate_background_image("Quarterly  growth", SlideType.SECTION)
+                for _ in range(4)
+            ))
+            repeat = await client.generate_background_image(" quarterly growth ", SlideType.SECTION)
+            other_anchor = await client.generate_background_image("quarterly growth", SlideType.TITLE)
+            await close_image_http_client()
+        return server.requests, dividers, repeat, other_anchor, client.get_usage_stats()
+
+    requests, dividers, repeat, other_anchor, stats = asyncio.run(run())
+
+    assert requests == 2  # One per crop anchor
+    assert {d["urls"]["original"] for d in dividers} == {repeat["urls"]["original"]}
+    assert other_anchor["urls"]["original"] != repeat["urls"]["original"]
+    assert stats["total_requests"] == 6 and stats["cache_hits"] == 4
+    assert stats["successful_requests"] == 6 and stats["cache_hit_rate"] == "66.7%"
+    assert stats["cache"]["coalesced_calls"] == 3 and stats["cache"]["hit_rate"] == 0.167
+
+
+def test_cache_redis_tier_is_shared_between_instances():
+    """A result stored by one instance is served to another through Redis."""
+    async def run():
+        redis = FakeRedis()
+        caches = [ImageResultCache(ImageCacheConfig(enabled=True, redis_url="redis://unused"))
+                  for _ in range(2)]
+        for cache in caches:
+            cache._redis = redis
+        key = ImageResultCache.make_key("p", None, "16:9", "photorealistic", "left")
+
+        async def generate():
+            return {"success": True, "urls": {"original": "https://img/1.png"}}
+
+        await caches[0].get_or_generate(key, generate)
+        shared = await caches[1].get(key)
+        return shared, caches[1].stats
+
+    shared, stats = asyncio.run(run())
+
+    assert shared["urls"]["original"] == "https://img/1.png"
+    assert stats["redis_hits"] == 1 and stats["entries"] == 1
+
+
+def test_cache_key_covers_model_and_background_removal():
+    """Requests for another model or a cut-out image never share a cached result."""
+    base = ("a lighthouse", None, "16:9", "photorealistic", "left")
+    keys = {
+        ImageResultCache.make_key(*base),
+        ImageResultCache.make_key(*base, model="imagen-3"),
+        ImageResultCache.make_key(*base, model="imagen-4"),
+        ImageResultCache.make_key(*base, remove_background=True)
+    }
+
+    assert len(keys) == 4
+    assert ImageResultCache.make_key(*base) == ImageResultCache.make_key("A  Lighthouse", *base[1:])
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Test image deadlines: late images return the placeholder plus an image job (/v1.2/images/{job_id}).
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add repo root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import hero_routes, image_routes
+from app.core.hero import TitleSlideWithImageGenerator
+from app.core.iseries import I1Generator
+from app.models.iseries_models import ISeriesGenerationRequest
+from app.services import image_service_client
+from app.services.image_jobs import (
+    ImageJobConfig, ImageJobRegistry, get_image_job_registry, reset_image_job_registry
+)
+from app.services.image_prefetch import reset_image_prefetch_cache
+from fake_redis import FakeRedis
+from fake_services import FakeImageClient, fake_content, fake_image_prompt, fake_llm
+
+IMAGE_LATENCY = 0.4
+CONTENT_LATENCY = 0.05
+DEADLINE_MS = 100
+
+
+@pytest.fixture(autouse=True)
+def fakes(monkeypatch):
+    monkeypatch.setattr(image_service_client, "_image_service_client_instance",
+                        FakeImageClient(IMAGE_LATENCY, url="https://img/late.png"))
+    monkeypatch.setattr(I1Generator, "_build_image_prompt_2step", fake_image_prompt())
+    monkeypatch.setattr(I1Generator, "_generate_content_multi_step", fake_content(CONTENT_LATENCY))
+    reset_image_prefetch_cache()
+    reset_image_job_registry()
+    yield
+    reset_image_job_registry()
+
+
+def _iseries_request(deadline_ms=None) -> ISeriesGenerationRequest:
+    return ISeriesGenerationRequest(
+        slide_number=4, layout_type="I1", title="Outlook", narrative="Next year", topics=["growth"],
+        image_deadline_ms=deadline_ms
+    )
+
+
+def test_late_iseries_image_becomes_a_job_that_completes():
+    """Past the deadline the slide returns the gradient; the job later yields the image URL."""
+    async def run():
+        generator = I1Generator(fake_llm)
+        start = time.perf_counter()
+        response = await generator.generate(_iseries_request(DEADLINE_MS))
+        elapsed = time.perf_counter() - start
+
+        registry = get_image_job_registry()
+        pending = await registry.get(response.image_job_id)
+        await asyncio.sleep(IMAGE_LATENCY)
+        return response, elapsed, pending, await registry.get(response.image_job_id)
+
+    response, elapsed, pending, done = asyncio.run(run())
+
+    assert elapsed < IMAGE_LATENCY
+    assert response.image_fallback and response.image_url is None
+    assert "linear-gradient" in response.image_html
+    assert response.metadata["image_job_id"] == response.image_job_id
+    assert response.metadata["image_prompt"] == "a lighthouse at dawn"
+    assert pending["status"] == "pending"
+    assert done["status"] == "completed" and done["image_url"] == "https://img/late.png"
+
+
+def test_image_within_deadline_is_inlined_without_a_job():
+    """A deadline longer than the image (or none at all) keeps the old behaviour."""
+    async def run():
+        generator = I1Generator(fake_llm)
+        return (
+            await generator.generate(_iseries_request(int(IMAGE_LATENCY * 3000))),
+            await generator.generate(_iseries_request())
+        )
+
+    within, no_deadline = asyncio.run(run())
+
+    for response in (within, no_deadline):
+        assert response.image_url == "https://img/late.png" and response.image_job_id is None
+    assert get_image_job_registry().stats["deferred"] == 0
+    assert get_image_job_registry().stats["on_time"] == 1
+
+
+def test_late_hero_image_is_polled_through_the_images_route(monkeypatch):
+    """The hero route answers at the deadline; GET /v1.2/images/{job_id} serves the image later."""
+    monkeypatch.setattr(hero_routes, "get_async_llm_service", lambda: fake_llm)
+    monkeypatch.setattr(TitleSlideWithImageGenerator, "_generate_content", fake_content(CONTENT_LATENCY))
+    app = FastAPI()
+    app.include_router(hero_routes.router)
+    app.include_router(image_routes.router)
+
+    body = {"slide_number": 1, "slide_type": "title_slide", "narrative": "Q3 growth",
+            "topics": ["growth"], "image_deadline_ms": DEADLINE_MS}
+
+    with TestClient(app) as client:
+        start = time.perf_counter()
+        slide = client.post("/v1.2/hero/title-with-image", json=body)
+        elapsed = time.perf_counter() - start
+
+        job_id = slide.json()["metadata"]["image_job_id"]
+        pending = client.get(f"/v1.2/images/{job_id}")
+        time.sleep(IMAGE_LATENCY)
+        done = client.get(f"/v1.2/images/{job_id}")
+        unknown = client.get("/v1.2/images/missing")
+
+    assert slide.status_code == 200 and elapsed < IMAGE_LATENCY
+    assert slide.json()["metadata"]["fallback_to_gradient"] is True
+    assert pending.json()["status"] == "pending"
+    assert done.json()["status"] == "completed"
+    assert done.json()["image_url"] == "https://img/late.png"
+    assert unknown.status_code == 404
+
+
+def test_job_records_are_shared_through_redis():
+    """Another instance polling the same Redis sees the job pending, then completed."""
+    async def run():
+        redis = FakeRedis()
+        config = ImageJobConfig(redis_url="redis://shared")
+        rendering, polling = ImageJobRegistry(config), ImageJobRegistry(config)
+        rendering._store._redis = polling._store._redis = redis
+
+        image = asyncio.ensure_future(FakeImageClient(IMAGE_LATENCY, url="https://img/late.png")._image())
+        content = asyncio.ensure_future(asyncio.sleep(CONTENT_LATENCY, result="content"))
+        _, _, job_id = await rendering.gather(image, content, DEADLINE_MS)
+
+        pending = await polling.get(job_id)
+        await asyncio.sleep(IMAGE_LATENCY)
+        return pending, await polling.get(job_id), await polling.get("missing")
+
+    pending, done, unknown = asyncio.run(run())
+
+    assert pending["status"] == "pending"
+    assert done["status"] == "completed" and done["image_url"] == "https://img/late.png"
+    assert unknown is None
+
+
+def test_cancelled_request_cancels_its_image():
+    """Cancelling the request while it waits for content also stops the image."""
+    async def run():
+        image = asyncio.ensure_future(asyncio.sleep(IMAGE_LATENCY))
+        content = asyncio.ensure_future(asyncio.sleep(IMAGE_LATENCY))
+        request = asyncio.ensure_future(get_image_job_registry().gather(image, content, DEADLINE_MS))
+        await asyncio.sleep(CONTENT_LATENCY)
+        request.cancel()
+        await asyncio.gather(request, image, return_exceptions=True)
+        return image
+
+    assert asyncio.run(run()).cancelled()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Test deck image prefetch (/v1.2/deck/prefetch-images) with fake image and LLM services.
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add repo root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import deck_routes, hero_routes
+from app.core.hero import TitleSlideWithImageGenerator
+from app.core.iseries import I1Generator
+from app.models.iseries_models import ISeriesGenerationRequest
+from app.services import image_service_client
+from app.services.image_prefetch import (
+    ImagePrefetchCache, ImagePrefetchConfig, get_image_prefetch_cache, reset_image_prefetch_cache
+)
+from app.services.llm_pool import PoolPriority, get_request_priority
+from fake_services import FakeImageClient, fake_content, fake_image_prompt, fake_llm
+
+IMAGE_LATENCY = 0.3
+CONTENT_LATENCY = 0.05
+
+
+@pytest.fixture
+def image_client(monkeypatch):
+    client = FakeImageClient(IMAGE_LATENCY)
+    monkeypatch.setattr(image_service_client, "_image_service_client_instance", client)
+    reset_image_prefetch_cache()
+    yield client
+    reset_image_prefetch_cache()
+
+
+def test_prefetched_hero_image_is_reused_by_the_slide(image_client, monkeypatch):
+    """The slide request awaits the prefetched image, so it only pays for content."""
+    monkeypatch.setattr(hero_routes, "get_async_llm_service", lambda: fake_llm)
+    monkeypatch.setattr(TitleSlideWithImageGenerator, "_generate_content", fake_content(CONTENT_LATENCY))
+    app = FastAPI()
+    app.include_router(deck_routes.router)
+    app.include_router(hero_routes.router)
+
+    hero_body = {"slide_number": 1, "slide_type": "title_slide", "narrative": "Q3 growth", "topics": ["growth"]}
+    outline = {"slides": [
+        {"slide_type": "hero/title-with-image", "request": hero_body},
+        {"slide_type": "hero/title", "request": hero_body},
+        {"slide_type": "hero/title-with-image", "request": {"slide_number": 2}}
+    ]}
+
+    with TestClient(app) as client:
+        prefetch = client.post("/v1.2/deck/prefetch-images", json=outline)
+        again = client.post("/v1.2/deck/prefetch-images", json={"slides": outline["slides"][:1]})
+        time.sleep(IMAGE_LATENCY * 1.5)
+
+        start = time.perf_counter()
+        slide = client.post("/v1.2/hero/title-with-image", json=hero_body)
+        slide_elapsed = time.perf_counter() - start
+
+    assert prefetch.status_code == 202
+    assert [s["status"] for s in prefetch.json()["slides"]] == ["started", "no_image", "invalid"]
+    assert again.json()["slides"][0]["status"] == "already_prefetched"
+    assert slide.status_code == 200
+    assert slide.json()["metadata"]["background_image"] == "https://img/1.png"
+    assert image_client.calls == 1
+    assert slide_elapsed < IMAGE_LATENCY
+    assert get_image_prefetch_cache().stats["hits"] == 1
+
+
+def test_iseries_slide_joins_an_in_flight_prefetch(image_client, monkeypatch):
+    """An I-series slide arriving mid-prefetch skips its own prompt building and image call."""
+    events = {}
+    monkeypatch.setattr(I1Generator, "_build_image_prompt_2step", fake_image_prompt(events=events))
+    monkeypatch.setattr(I1Generator, "_generate_content_multi_step", fake_content(CONTENT_LATENCY))
+
+    async def run():
+        generator = I1Generator(fake_llm)
+        request = ISeriesGenerationRequest(
+            slide_number=3, layout_type="I1", title="Guidance", narrative="Steady growth", topics=["growth"]
+        )
+        cache = get_image_prefetch_cache()
+        cache.start(generator.image_prefetch_key(request), lambda: generator.prefetch_image(request))
+
+        start = time.perf_counter()
+        response = await generator.generate(request)
+        return response, time.perf_counter() - start
+
+    response, elapsed = asyncio.run(run())
+
+    assert image_client.calls == 1 and events["prompt_builds"] == [3]
+    assert response.image_url == "https://img/1.png" and not response.image_fallback
+    assert response.metadata["image_prompt"] == "a lighthouse at dawn"
+    assert elapsed < IMAGE_LATENCY * 1.5
+
+
+def test_prefetch_key_ignores_slide_position_and_deadline():
+    """Only image inputs shape the key; the same image at another slide number is reused."""
+    def key(**overrides):
+        fields = {"slide_number": 3, "layout_type": "I1", "title": "Guidance", "narrative": "Steady growth",
+                  "topics": ["growth"], **overrides}
+        return ImagePrefetchCache.make_key("I1", ISeriesGenerationRequest(**fields))
+
+    assert key() == key(slide_number=7, image_deadline_ms=500)
+    assert key() != key(narrative="Sharp decline")
+    assert key() != key(image_prompt_hint="a lighthouse")
+    assert key() != key(context={"image_model": "imagen-4"})
+
+
+def test_prefetches_run_in_the_background_lane_with_a_bound():
+    """At most max_concurrent prefetches run at once; a cache full of running ones refuses more."""
+    running, peak, lanes = 0, 0, []
+
+    async def fetch():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        lanes.append(get_request_priority())
+        await asyncio.sleep(0.05)
+        running -= 1
+        return {"prompt": "p", "archetype": "a", "result": {}}
+
+    async def run():
+        cache = ImagePrefetchCache(ImagePrefetchConfig(max_entries=3, max_concurrent=2))
+        statuses = [cache.start(f"key-{i}", fetch) for i in range(4)]
+        await asyncio.sleep(0.2)
+        # Finished entries make room for new prefetches
+        return statuses, cache.start("key-4", fetch), cache.stats
+
+    statuses, after, stats = asyncio.run(run())
+
+    assert statuses == ["started"] * 3 + ["at_capacity"]
+    assert peak == 2 and set(lanes) == {PoolPriority.BACKGROUND}
+    assert after == "started" and stats["entries"] == 3 and stats["rejected"] == 1
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Test the I-series generation DAG (image branch parallel to content) with fake services.
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add repo root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.iseries import I1Generator
+from app.models.iseries_models import ISeriesGenerationRequest
+from app.services import image_service_client
+from app.services.image_prefetch import reset_image_prefetch_cache
+from fake_services import FakeImageClient, fake_content, fake_image_prompt, fake_llm
+
+PROMPT_LATENCY = 0.2
+IMAGE_LATENCY = 0.2
+CONTENT_LATENCY = 0.3
+
+
+def _request() -> ISeriesGenerationRequest:
+    return ISeriesGenerationRequest(
+        slide_number=2, layout_type="I1", title="Roadmap", narrative="Three phases", topics=["phases"]
+    )
+
+
+@pytest.fixture
+def generator(monkeypatch):
+    """I1 generator whose concept extraction, image and content calls just sleep."""
+    events = {}
+    monkeypatch.setattr(image_service_client, "_image_service_client_instance", FakeImageClient(IMAGE_LATENCY))
+    monkeypatch.setattr(I1Generator, "_build_image_prompt_2step",
+                        fake_image_prompt("a winding road", PROMPT_LATENCY, events))
+    monkeypatch.setattr(I1Generator, "_generate_content_multi_step",
+                        fake_content(CONTENT_LATENCY, "<ul><li>Phase</li></ul>", events))
+    reset_image_prefetch_cache()
+    generator = I1Generator(fake_llm)
+    generator.events = events
+    return generator
+
+
+def _generate(generator):
+    async def run():
+        start = time.perf_counter()
+        response = await generator.generate(_request())
+        return response, start, time.perf_counter() - start
+    return asyncio.run(run())
+
+
+def test_content_starts_before_concept_extraction_finishes(generator):
+    """Content no longer waits for the image prompt; stage timings are reported."""
+    response, start, elapsed = _generate(generator)
+    timings = response.metadata["stage_timings_ms"]
+
+    assert generator.events["content_started"] - start < PROMPT_LATENCY / 2
+    assert elapsed < PROMPT_LATENCY + CONTENT_LATENCY
+    assert set(timings) == {"image_prompt_ms", "image_generation_ms", "image_branch_ms", "content_ms"}
+    assert timings["image_branch_ms"] >= timings["image_prompt_ms"] + timings["image_generation_ms"] - 5
+    assert response.metadata["critical_path"] == "image"
+    assert response.metadata["image_prompt"] == "a winding road"
+    assert response.image_url == "https://img/1.png" and response.metadata["image_prefetched"] is False
+
+
+def test_image_branch_failures_fall_back_without_failing_the_slide(generator, monkeypatch):
+    """A failed image request keeps its prompt; a failed prompt build only loses the image."""
+    monkeypatch.setattr(generator, "image_client", FakeImageClient(IMAGE_LATENCY, fail=True))
+    image_failed, _, _ = _generate(generator)
+
+    generator.events["prompt_error"] = "concept extraction crashed"
+    prompt_failed, _, _ = _generate(generator)
+
+    assert image_failed.image_fallback and image_failed.metadata["image_prompt"] == "a winding road"
+    assert "unavailable" in image_failed.metadata["image_error"]
+    assert prompt_failed.image_fallback and prompt_failed.metadata["image_prompt"] is None
+    assert "crashed" in prompt_failed.metadata["image_error"]
+    assert prompt_failed.content_html == "<ul><li>Phase</li></ul>"
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Test constant-time queue positions and the cached wait model (in-memory Redis).
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add repo root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.job_queue import (
+    JOB_KEY_PREFIX, STREAM_KEY, ClaimedJob, WaitEstimator, create_job_queue
+)
+from fake_redis import FakeRedis
+
+
+async def _enqueue(redis: FakeRedis, queue, job_id: str) -> int:
+    await redis.hset(f"{JOB_KEY_PREFIX}{job_id}", "status", "queued")
+    return await queue.enqueue(job_id)
+
+
+async def _position(redis: FakeRedis, queue, job_id: str):
+    return await queue.position(job_id, await redis.hgetall(f"{JOB_KEY_PREFIX}{job_id}"))
+
+
+def test_positions_follow_claims_and_cancels():
+    """Positions come from sequence counters and never read the queue itself."""
+    async def run(backend):
+        redis = FakeRedis()
+        queue = create_job_queue(redis, backend)
+        await queue.register("w1")
+        submitted = [await _enqueue(redis, queue, f"job-{i}") for i in range(4)]
+
+        claimed = await queue.claim("w1", timeout=0)
+        after_claim = [await _position(redis, queue, f"job-{i}") for i in range(1, 4)]
+
+        await queue.cancel("job-3", await redis.hgetall(f"{JOB_KEY_PREFIX}job-3"))
+        await queue.claim("w1", timeout=0)
+        return submitted, claimed.job_id, after_claim, await _position(redis, queue, "job-2")
+
+    for backend in ("list", "stream"):
+        submitted, claimed, after_claim, last = asyncio.run(run(backend))
+        assert submitted == [1, 2, 3, 4], backend
+        assert claimed == "job-0", backend
+        assert after_claim == [1, 2, 3], backend
+        assert last == 1, backend
+
+
+def test_requeued_job_is_back_at_the_head():
+    """A job recovered from a dead worker returns its dequeue ticket."""
+    async def run():
+        redis = FakeRedis()
+        queue = create_job_queue(redis, "list")
+        await queue.register("dead")
+        for i in range(3):
+            await _enqueue(redis, queue, f"job-{i}")
+        await queue.claim("dead", timeout=0)
+        await redis.delete("text_service:worker_heartbeat:dead")
+
+        await queue.recover("w2", limit=0)
+        return [await _position(redis, queue, f"job-{i}") for i in range(3)]
+
+    assert asyncio.run(run()) == [1, 2, 3]
+
+
+def test_stream_recover_resumes_its_scan_and_acked_entries_are_kept():
+    """Each sweep continues where the last stopped; acked entries stay until MAXLEN trims them."""
+    async def run():
+        redis = FakeRedis()
+        dead = create_job_queue(redis, "stream")
+        await dead.register("dead")
+        for i in range(3):
+            await _enqueue(redis, dead, f"job-{i}")
+            await dead.claim("dead", timeout=0)
+
+        live = create_job_queue(redis, "stream", visibility_timeout=0, max_length=2)
+        sweeps = [[job.job_id for job in await live.recover("w2", limit=1)] for _ in range(3)]
+        cursor_after = live._autoclaim_cursor
+
+        entries = [entry_id for entry_id, _ in await redis.xrange(STREAM_KEY)]
+        for job_id, entry_id in zip(("job-0", "job-1", "job-2"), entries):
+            await live.ack("w2", ClaimedJob(job_id, entry_id))
+        await _enqueue(redis, live, "job-3")
+        return sweeps, cursor_after, await redis.xlen(STREAM_KEY), await live.waiting_count()
+
+    sweeps, cursor_after, length, waiting = asyncio.run(run())
+
+    assert sweeps == [["job-0"], ["job-1"], ["job-2"]]
+    assert cursor_after == "0-0"
+    assert length == 2  # Trimmed to max_length, not deleted on ack
+    assert waiting == 1
+
+
+def test_wait_estimate_uses_recent_throughput_and_is_cached():
+    """Throughput drives the estimate; the model is reused until it goes stale."""
+    async def run():
+        redis = FakeRedis()
+        queue = create_job_queue(redis, "list")
+        estimator = WaitEstimator(refresh_seconds=60)
+
+        before = await estimator.estimate_wait_seconds(redis, 3)
+        estimator._model = None  # Drop the cached default model
+
+        now = time.time()
+        for seconds_ago in (20, 15, 10, 5):
+            await redis.lpush("text_service:recent_completions", f"{now - seconds_ago:.3f}:4000")
+        await queue.record_completion(4000)
+        measured = await estimator.estimate_wait_seconds(redis, 10)
+
+        await redis.delete("text_service:recent_completions")
+        cached = await estimator.estimate_wait_seconds(redis, 10)
+        return before, measured, cached, await estimator.estimate_wait_seconds(redis, None)
+
+    before, measured, cached, not_queued = asyncio.run(run())
+
+    assert before == 24  # 8s per job until anything has been measured
+    assert measured == 40  # 5 jobs over the last 20s -> 0.25 jobs/s
+    assert cached == measured
+    assert not_queued is None
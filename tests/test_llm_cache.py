@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Test LLM response cache (memory tier only, no Redis / Vertex AI).
+"""
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add repo root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.llm_cache import (
+    LLMResponseCache,
+    LLMCacheConfig,
+    CacheBypass,
+    cached_generate,
+    invalidate_llm_response,
+    parse_cache_control,
+    set_cache_bypass
+)
+
+
+def _counting_llm():
+    calls = []
+
+    async def llm(prompt: str) -> str:
+        calls.append(prompt)
+        return f"content for {prompt}"
+
+    return llm, calls
+
+
+def test_repeat_prompt_served_from_cache():
+    """Second identical prompt costs no LLM call; other models/temps miss."""
+    cache = LLMResponseCache(LLMCacheConfig(enabled=True))
+    llm, calls = _counting_llm()
+
+    async def run():
+        first = await cached_generate(cache, "flash", 0.7, "p", "content", llm)
+        second = await cached_generate(cache, "flash", 0.7, "p", "content", llm)
+        await cached_generate(cache, "pro", 0.7, "p", "content", llm)
+        await cached_generate(cache, "flash", 0.2, "p", "content", llm)
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert first == second
+    assert len(calls) == 3
+    assert cache.stats["hits"] == 1
+
+
+def test_lru_eviction_and_ttl():
+    """Entry count bound evicts least recently used; expired entries miss."""
+    cache = LLMResponseCache(LLMCacheConfig(
+        enabled=True, max_entries=2, family_ttls={"short": 1}
+    ))
+
+    async def run():
+        await cache.set("a", "A")
+        await cache.set("b", "B")
+        await cache.get("a")  # a is now most recently used
+        await cache.set("c", "C")  # evicts b
+        a, b = await cache.get("a"), await cache.get("b")
+        await cache.set("s", "S", endpoint_family="short")
+        cache._entries["s"] = ("S", time.time() - 1)  # force expiry
+        return a, b, await cache.get("s")
+
+    a, b, s = asyncio.run(run())
+
+    assert a == "A"
+    assert b is None
+    assert s is None
+    assert cache.stats["evictions"] >= 1
+
+
+def test_bypass_modes():
+    """no-cache skips reads but refreshes; no-store skips reads and writes."""
+    assert parse_cache_control("no-cache") == CacheBypass.NO_CACHE
+    assert parse_cache_control("max-age=0, no-store") == CacheBypass.NO_STORE
+    assert parse_cache_control(None) == CacheBypass.NONE
+
+    cache = LLMResponseCache(LLMCacheConfig(enabled=True))
+    llm, calls = _counting_llm()
+
+    async def run():
+        await cached_generate(cache, "m", 0.7, "p", "content", llm)
+        set_cache_bypass(CacheBypass.NO_CACHE)
+        await cached_generate(cache, "m", 0.7, "p", "content", llm)
+        set_cache_bypass(CacheBypass.NO_STORE)
+        await cached_generate(cache, "m", 0.7, "q", "content", llm)
+        set_cache_bypass(CacheBypass.NONE)
+        await cached_generate(cache, "m", 0.7, "q", "content", llm)
+
+    asyncio.run(run())
+
+    assert calls == ["p", "p", "q", "q"]
+    assert cache.stats["bypasses"] == 2
+
+
+def test_rejected_response_is_invalidated():
+    """A response that fails the caller's JSON parse is dropped, so the retry calls the model."""
+    from types import SimpleNamespace
+    from app.services.llm_service import _cache_invalidator
+
+    cache = LLMResponseCache(LLMCacheConfig(enabled=True))
+    service = SimpleNamespace(temperature=0.7, route=lambda prompt: ("simple", "flash", "flash"))
+    responses = iter(["not json", '{"ok": true}'])
+    calls = []
+
+    async def model(prompt: str) -> str:
+        calls.append(prompt)
+        return next(responses)
+
+    async def llm(prompt: str) -> str:
+        return await cached_generate(cache, "flash", 0.7, prompt, "atomic", model)
+
+    llm.invalidate = _cache_invalidator(service, cache)
+
+    async def run():
+        for _ in range(2):
+            raw = await llm("p")
+            try:
+                parsed = json.loads(raw)
+                break
+            except json.JSONDecodeError:
+                await invalidate_llm_response(llm, "p")
+        await invalidate_llm_response(_counting_llm()[0], "p")  # No cache: no-op
+        return parsed, await llm("p")
+
+    parsed, repeat = asyncio.run(run())
+
+    assert parsed == {"ok": True} and repeat == '{"ok": true}'
+    assert len(calls) == 2
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Test LLM connection pool accounting with a fake LLM callable (no Vertex AI).
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+# Add repo root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.llm_pool import LLMConnectionPool, LLMPoolConfig, PoolPriority, QueueFullError
+
+
+async def _fake_llm(prompt: str) -> str:
+    await asyncio.sleep(0.01)
+    return f"response to {prompt}"
+
+
+async def _failing_llm(prompt: str) -> str:
+    raise RuntimeError("model error")
+
+
+def test_endpoint_family_metrics():
+    """Requests are counted per endpoint family as well as pool-wide."""
+    async def run():
+        pool = LLMConnectionPool(LLMPoolConfig(max_concurrent=2, max_queue_size=10))
+        await asyncio.gather(
+            pool.execute(_fake_llm, "a", endpoint_family="hero"),
+            pool.execute(_fake_llm, "b", endpoint_family="hero"),
+            pool.execute(_fake_llm, "c", endpoint_family="atomic"),
+        )
+        try:
+            await pool.execute(_failing_llm, "d", endpoint_family="layout")
+        except RuntimeError:
+            pass
+        return pool.metrics
+
+    metrics = asyncio.run(run())
+    families = metrics["endpoint_families"]
+
+    assert metrics["total_requests"] == 4
+    assert families["hero"]["total_successes"] == 2
+    assert families["atomic"]["total_successes"] == 1
+    assert families["layout"]["total_failures"] == 1
+    assert all(f["active_requests"] == 0 and f["queued_requests"] == 0 for f in families.values())
+
+
+def test_queue_full_counts_rejection():
+    """Requests beyond max_queue_size are rejected and attributed to their family."""
+    async def run():
+        pool = LLMConnectionPool(LLMPoolConfig(max_concurrent=1, max_queue_size=1))
+        first = asyncio.create_task(pool.execute(_fake_llm, "a", endpoint_family="slides"))
+        await asyncio.sleep(0)
+        try:
+            await pool.execute(_fake_llm, "b", endpoint_family="slides")
+            rejected = False
+        except QueueFullError:
+            rejected = True
+        await first
+        return rejected, pool.metrics
+
+    rejected, metrics = asyncio.run(run())
+
+    assert rejected
+    assert metrics["total_rejections"] == 1
+    assert metrics["endpoint_families"]["slides"]["total_rejections"] == 1
+
+
+def test_interactive_lane_not_starved_by_batch():
+    """A late interactive request is scheduled ahead of a queued batch backlog."""
+    async def run():
+        pool = LLMConnectionPool(LLMPoolConfig(
+            max_concurrent=2,
+            max_queue_size=100,
+            lane_weights={"interactive": 6, "batch": 3, "background": 1},
+            lane_max_concurrent={"batch": 2}
+        ))
+        order = []
+
+        async def tracked(prompt: str) -> str:
+            order.append(prompt)
+            await asyncio.sleep(0.01)
+            return prompt
+
+        batch = [
+            asyncio.create_task(pool.execute(tracked, f"batch-{i}", priority=PoolPriority.BATCH))
+            for i in range(10)
+        ]
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(
+            pool.execute(tracked, "interactive", priority=PoolPriority.INTERACTIVE)
+        )
+        await asyncio.gather(interactive, *batch)
+        return order, pool.metrics
+
+    order, metrics = asyncio.run(run())
+
+    # Only the two batch calls already running may precede it
+    assert order.index("interactive") <= 2
+    assert metrics["lanes"]["batch"]["total_granted"] == 10
+    assert metrics["lanes"]["interactive"]["total_granted"] == 1
+
+
+def test_lane_cap_limits_concurrency():
+    """Background lane never exceeds its concurrency cap."""
+    async def run():
+        pool = LLMConnectionPool(LLMPoolConfig(
+            max_concurrent=4,
+            max_queue_size=100,
+            lane_max_concurrent={"background": 1}
+        ))
+        peak = 0
+
+        async def tracked(prompt: str) -> str:
+            nonlocal peak
+            peak = max(peak, pool.metrics["lanes"]["background"]["active_requests"])
+            await asyncio.sleep(0.005)
+            return prompt
+
+        await asyncio.gather(*[
+            pool.execute(tracked, str(i), priority=PoolPriority.BACKGROUND)
+            for i in range(5)
+        ])
+        return peak
+
+    assert asyncio.run(run()) == 1
+
+
+def test_token_buckets_charge_actual_usage():
+    """Prompt/completion tokens from an LLMResponse are charged to the TPM buckets."""
+    from app.services.llm_client import LLMResponse
+
+    async def llm_with_usage(prompt: str) -> LLMResponse:
+        return LLMResponse(content="ok", prompt_tokens=100, completion_tokens=50, total_tokens=150)
+
+    async def run():
+        pool = LLMConnectionPool(LLMPoolConfig(
+            rate_limit_rpm=600,
+            input_tpm_limit=60000,
+            output_tpm_limit=60000
+        ))
+        await pool.execute(llm_with_usage, "x" * 40)
+        return pool.metrics
+
+    metrics = asyncio.run(run())
+    limits = metrics["rate_limits"]
+
+    assert metrics["total_prompt_tokens"] == 100
+    assert metrics["total_completion_tokens"] == 50
+    # Buckets hold 10s of budget: 100 requests, 10000 tokens each way
+    assert limits["requests"]["remaining"] == 99
+    assert 9890 <= limits["input_tokens"]["remaining"] <= 9910
+    assert 9940 <= limits["output_tokens"]["remaining"] <= 9960
+
+
+def test_rate_limited_requests_are_spaced():
+    """Once the burst is spent, admissions are spaced at the refill rate."""
+    async def run():
+        # 600 RPM = 10 req/s; burst of 0.1s = 1 request
+        pool = LLMConnectionPool(LLMPoolConfig(rate_limit_rpm=600, rate_limit_burst_seconds=0.1))
+        start = asyncio.get_running_loop().time()
+        await asyncio.gather(*[pool.execute(_fake_llm, str(i)) for i in range(4)])
+        return asyncio.get_running_loop().time() - start
+
+    elapsed = asyncio.run(run())
+
+    # First request uses the burst, the other three wait ~0.1s each
+    assert 0.25 <= elapsed < 1.0
+
+
+def test_model_sub_pools_are_independent(monkeypatch):
+    """A saturated Pro sub-pool does not delay Flash calls."""
+    from app.services import llm_pool
+
+    monkeypatch.setenv("LLM_PRO_MAX_CONCURRENT", "1")
+    llm_pool.reset_pool()
+
+    async def slow_llm(prompt: str) -> str:
+        await asyncio.sleep(0.2)
+        return prompt
+
+    async def run():
+        pro = llm_pool.get_model_pool("gemini-2.5-pro", "pro")
+        flash = llm_pool.get_model_pool("gemini-2.5-flash", "flash")
+        backlog = [asyncio.create_task(pro.execute(slow_llm, str(i))) for i in range(3)]
+        await asyncio.sleep(0)
+
+        start = asyncio.get_running_loop().time()
+        await flash.execute(_fake_llm, "flash")
+        flash_elapsed = asyncio.get_running_loop().time() - start
+
+        await asyncio.gather(*backlog)
+        return pro, flash, flash_elapsed
+
+    try:
+        pro, flash, flash_elapsed = asyncio.run(run())
+        aggregated = llm_pool.aggregate_pool_metrics(llm_pool.get_all_pools())
+    finally:
+        llm_pool.reset_pool()
+
+    assert pro.config.max_concurrent == 1
+    assert flash.config.max_concurrent == 10
+    assert flash_elapsed < 0.1
+    assert aggregated["total_requests"] == 4
+    assert set(aggregated["pools"]) == {"gemini-2.5-pro", "gemini-2.5-flash"}
+
+
+def test_full_pool_propagates_through_generator_fallbacks():
+    """QueueFullError reaches the route after one call instead of an error body or fallback resubmits."""
+    import pytest
+    from app.core.components.atomic_generator import AtomicComponentGenerator
+    from app.core.iseries import I1Generator
+    from app.core.slides.c1_text_generator import C1TextGenerator
+    from app.models.atomic_models import ATOMIC_TYPE_MAP, AtomicType
+    from app.models.iseries_models import ISeriesGenerationRequest
+    from app.models.slides_models import UnifiedSlideRequest
+
+    calls = []
+
+    async def full_llm(prompt: str) -> str:
+        calls.append(prompt)
+        raise QueueFullError("Queue full")
+
+    runs = [
+        lambda: AtomicComponentGenerator(full_llm).generate(
+            ATOMIC_TYPE_MAP[AtomicType.METRICS], "Q3 results", 3, 24, 8
+        ),
+        lambda: C1TextGenerator(full_llm).generate(
+            UnifiedSlideRequest(slide_number=2, narrative="Q3 growth", topics=["growth"])
+        ),
+        lambda: I1Generator(full_llm)._generate_content_multi_step(
+            ISeriesGenerationRequest(slide_number=4, layout_type="I1", title="Outlook",
+                                     narrative="Next year", topics=["growth"]),
+            1200, 700, None, None, "inline_styles", {"template_path": "unused", "variant_id": "x"}
+        )
+    ]
+    for run in runs:
+        calls.clear()
+        with pytest.raises(QueueFullError):
+            asyncio.run(run())
+        assert len(calls) == 1
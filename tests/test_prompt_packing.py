@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Test multi-slide prompt packing with a fake LLM (no Vertex AI).
+"""
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+# Add repo root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core import ElementBasedContentGenerator
+
+SLIDE_SPEC = {"slide_title": "Results", "slide_purpose": "Report", "key_message": "Up"}
+SMALL_VARIANTS = ["impact_quote_c1", "metrics_3col_c1", "impact_quote_c1"]
+
+
+def _element_data(generator: ElementBasedContentGenerator, variant_id: str) -> dict:
+    """Valid single-call response data for a variant."""
+    spec = generator.prompt_builder.load_variant_spec(variant_id)
+    return {
+        element["element_id"]: {field: f"{field} text" for field in element["required_fields"]}
+        for element in spec["elements"]
+    }
+
+
+def _fake_llm(generator: ElementBasedContentGenerator, variants, drop_key=None):
+    prompts = []
+
+    async def llm(prompt: str) -> str:
+        prompts.append(prompt)
+        if "=== slide_1 ===" in prompt:
+            packed = {
+                f"slide_{i + 1}": _element_data(generator, variant_id)
+                for i, variant_id in enumerate(variants)
+            }
+            packed.pop(drop_key, None)
+            return json.dumps(packed)
+        # Individual fallback call: only the dropped slide gets one
+        return json.dumps(_element_data(generator, variants[int(drop_key[6:]) - 1]))
+
+    return llm, prompts
+
+
+def test_small_slides_share_one_llm_call():
+    """Three small slides are generated by a single packed call, in order."""
+    generator = ElementBasedContentGenerator(llm_service=None)
+    generator.llm_service, prompts = _fake_llm(generator, SMALL_VARIANTS)
+
+    results = asyncio.run(generator.generate_slides_packed_async(
+        [{"variant_id": v, "slide_spec": SLIDE_SPEC} for v in SMALL_VARIANTS]
+    ))
+
+    assert len(prompts) == 1
+    assert [r["variant_id"] for r in results] == SMALL_VARIANTS
+    assert all(r["metadata"]["generation_mode"] == "packed" for r in results)
+    assert results[1]["metadata"]["pack_size"] == 3
+    assert "html" in results[1] and results[1]["elements"]
+
+
+def test_slide_missing_from_pack_falls_back_to_single_call():
+    """A slide absent from the packed response is retried on its own."""
+    generator = ElementBasedContentGenerator(llm_service=None)
+    generator.llm_service, prompts = _fake_llm(generator, SMALL_VARIANTS, drop_key="slide_2")
+
+    results = asyncio.run(generator.generate_slides_packed_async(
+        [{"variant_id": v, "slide_spec": SLIDE_SPEC} for v in SMALL_VARIANTS]
+    ))
+
+    assert len(prompts) == 2
+    assert results[0]["metadata"]["generation_mode"] == "packed"
+    assert results[1]["metadata"]["generation_mode"] != "packed"
+    assert results[1]["variant_id"] == "metrics_3col_c1"
+
+
+def test_unknown_variant_is_reported_per_slide():
+    """A slide that cannot be prepared fails alone; pack size limits apply."""
+    generator = ElementBasedContentGenerator(llm_service=None)
+    generator.llm_service, prompts = _fake_llm(generator, ["impact_quote_c1"] * 2)
+
+    results = asyncio.run(generator.generate_slides_packed_async(
+        [{"variant_id": "no_such_variant", "slide_spec": SLIDE_SPEC}]
+        + [{"variant_id": "impact_quote_c1", "slide_spec": SLIDE_SPEC}] * 2
+    ))
+
+    assert isinstance(results[0], Exception)
+    assert [r["metadata"]["pack_size"] for r in results[1:]] == [2, 2]
+    assert len(prompts) == 1
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Test stable prompt prefixes and provider context caching (no LLM calls).
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+# Add repo root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core import ElementBasedContentGenerator
+from app.services.llm_client import AnthropicClient, BaseLLMClient, GeminiClient
+from app.services.prompt_prefix import (
+    PromptPrefixConfig,
+    SplitPrompt,
+    get_prefix_registry,
+    reset_prefix_registry
+)
+
+PRESENTATION = {"presentation_title": "Q4 Review", "presentation_type": "Report", "total_slides": 10}
+
+
+def _prompt(title: str, slide_number: int) -> SplitPrompt:
+    generator = ElementBasedContentGenerator(llm_service=None)
+    prompt, _ = generator._build_slide_prompt(
+        "matrix_2x2",
+        {"slide_title": title, "slide_purpose": "Explain", "key_message": "Go"},
+        {**PRESENTATION, "current_slide_number": slide_number},
+        None
+    )
+    return prompt
+
+
+def test_slides_of_a_deck_share_the_prompt_prefix():
+    """Presentation and variant instructions are a shared prefix; slide details are the suffix."""
+    first, second = _prompt("Plan", 2), _prompt("Risks", 7)
+
+    assert first.prefix == second.prefix
+    assert first.prefix_hash == second.prefix_hash
+    assert first == first.prefix + first.suffix
+    assert "Q4 Review" in first.prefix and "RESPONSE FORMAT" in first.prefix
+    assert "Plan" in first.suffix and "2 of 10" in first.suffix
+    assert "Plan" not in first.prefix and "2 of 10" not in first.prefix
+
+
+def test_gemini_uses_context_cache_once_prefix_repeats():
+    """After min_uses calls the cached-prefix model is called with just the suffix."""
+    reset_prefix_registry()
+    get_prefix_registry(PromptPrefixConfig(context_cache_enabled=True, min_uses=2, min_cache_tokens=0))
+    created = []
+
+    client = GeminiClient.__new__(GeminiClient)
+    BaseLLMClient.__init__(client, "fake-gemini")
+    client.client = "base-model"
+
+    async def fake_create(registry, entry, prefix):
+        created.append(prefix)
+        registry.set_provider_cache(entry, client.model, "cached-model")
+        return "cached-model"
+
+    client._create_context_cache = fake_create
+
+    async def run():
+        return [await client._resolve_context_cache(_prompt(f"Slide {i}", i)) for i in range(1, 4)]
+
+    try:
+        calls = asyncio.run(run())
+        stats = get_prefix_registry().stats
+    finally:
+        reset_prefix_registry()
+
+    assert calls[0] == ("base-model", _prompt("Slide 1", 1))
+    assert calls[1] == ("cached-model", _prompt("Slide 2", 2).suffix)
+    assert calls[2][0] == "cached-model"
+    assert len(created) == 1
+    assert stats["repeat_calls"] == 2 and stats["provider_caches_created"] == 1
+
+
+def test_anthropic_marks_repeated_prefix_cacheable():
+    """Anthropic gets a cache_control prefix block once the prefix repeats."""
+    reset_prefix_registry()
+    get_prefix_registry(PromptPrefixConfig(context_cache_enabled=True, min_uses=2))
+    client = AnthropicClient.__new__(AnthropicClient)
+    BaseLLMClient.__init__(client, "fake-claude")
+    prompt = SplitPrompt("x" * 8000, "slide details")
+
+    try:
+        first = client._messages(prompt)
+        second = client._messages(prompt)
+        plain = client._messages("plain prompt")
+    finally:
+        reset_prefix_registry()
+
+    assert first == [{"role": "user", "content": prompt}]
+    assert second[0]["content"][0]["cache_control"] == {"type": "ephemeral"}
+    assert second[0]["content"][1]["text"] == "slide details"
+    assert plain == [{"role": "user", "content": "plain prompt"}]
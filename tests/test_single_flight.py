@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Test single-flight coalescing of concurrent identical calls (no Vertex AI).
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+# Add repo root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.llm_service import SingleFlight
+
+
+def test_single_flight_coalesces_concurrent_duplicates():
+    """Concurrent identical keys share one call; later calls start a new one."""
+    flight = SingleFlight()
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.02)
+        return "shared"
+
+    async def run():
+        results = await asyncio.gather(*[flight.run("k", work) for _ in range(5)])
+        await flight.run("k", work)
+        return results
+
+    results = asyncio.run(run())
+
+    assert results == ["shared"] * 5
+    assert len(calls) == 2
+    assert flight.stats["coalesced_calls"] == 4
+    assert flight.stats["in_flight"] == 0
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Test streaming slide generation with a fake streaming LLM (no Vertex AI).
+"""
+import asyncio
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add repo root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core import ElementBasedContentGenerator
+from app.core.element_stream_parser import ElementStreamParser
+from app.services import llm_cache, llm_service
+from app.services.llm_cache import LLMCacheConfig, LLMResponseCache
+from app.services.llm_pool import LLMConnectionPool, LLMPoolConfig
+
+MATRIX_RESPONSE = json.dumps({
+    f"box_{i}": {"title": f"Title {i}", "description": f"Point {i}, with {{braces}} and \"quotes\""}
+    for i in range(1, 5)
+})
+
+
+def _chunked(text: str, size: int = 7):
+    async def llm_stream(prompt: str):
+        for i in range(0, len(text), size):
+            await asyncio.sleep(0)
+            yield text[i:i + size]
+    return llm_stream
+
+
+def test_parser_emits_members_as_they_complete():
+    """Each top-level member is returned by the feed() that completes it."""
+    parser = ElementStreamParser()
+
+    assert parser.feed('```json\n{"a": {"x": "1, }"}') == []
+    assert parser.feed(', "b"') == [("a", {"x": "1, }"})]
+    assert parser.feed(': [1, 2]}\n```') == [("b", [1, 2])]
+
+
+def test_stream_emits_elements_before_complete():
+    """Elements stream in spec order and the final HTML matches the async path."""
+    async def full_llm(prompt: str) -> str:
+        return MATRIX_RESPONSE
+
+    async def run():
+        generator = ElementBasedContentGenerator(llm_service=full_llm)
+        slide_spec = {"slide_title": "Plan", "slide_purpose": "Explain", "key_message": "Go"}
+
+        events = [
+            event async for event in generator.generate_slide_content_stream(
+                variant_id="matrix_2x2",
+                slide_spec=slide_spec,
+                llm_stream=_chunked(MATRIX_RESPONSE)
+            )
+        ]
+
+        expected = await generator.generate_slide_content_async("matrix_2x2", slide_spec)
+        return events, expected
+
+    events, expected = asyncio.run(run())
+
+    assert [e["event"] for e in events] == ["start"] + ["element"] * 4 + ["complete"]
+    assert [e["data"]["element_id"] for e in events[1:5]] == ["box_1", "box_2", "box_3", "box_4"]
+    assert events[-1]["data"]["html"] == expected["html"]
+    assert events[-1]["data"]["metadata"]["generation_mode"] == "single_call_stream"
+
+
+def test_pool_stream_holds_slot_until_consumer_stops():
+    """A stream occupies a pool slot while iterated and releases it on early exit."""
+    async def run():
+        pool = LLMConnectionPool(LLMPoolConfig(max_concurrent=1))
+        stream = pool.stream(_chunked("x" * 100, 10), "prompt", endpoint_family="content")
+        first = await stream.__anext__()
+        active_while_streaming = pool.metrics["active_requests"]
+        await stream.aclose()
+        return first, active_while_streaming, pool.metrics
+
+    first, active_while_streaming, metrics = asyncio.run(run())
+
+    assert first == "x" * 10
+    assert active_while_streaming == 1
+    assert metrics["active_requests"] == 0
+    assert metrics["endpoint_families"]["content"]["active_requests"] == 0
+
+
+def test_malformed_stream_is_not_replayed_from_cache(monkeypatch):
+    """A cached stream that fails the full parse is evicted, so the next request calls the model."""
+    responses = iter(["not json at all", MATRIX_RESPONSE])
+    calls = []
+
+    async def generate_stream_async(prompt, complexity=None):
+        calls.append(prompt)
+        yield next(responses)
+
+    service = SimpleNamespace(
+        temperature=0.7,
+        route=lambda prompt: ("simple", "flash", "flash"),
+        generate_stream_async=generate_stream_async
+    )
+    monkeypatch.setenv("USE_LLM_POOL", "false")
+    monkeypatch.setattr(llm_service, "_llm_service_instance", service)
+    monkeypatch.setattr(llm_cache, "_cache_instance", LLMResponseCache(LLMCacheConfig(enabled=True)))
+
+    async def generate():
+        generator = ElementBasedContentGenerator(llm_service=None)
+        return [
+            event async for event in generator.generate_slide_content_stream(
+                variant_id="matrix_2x2",
+                slide_spec={"slide_title": "Plan", "slide_purpose": "Explain", "key_message": "Go"},
+                llm_stream=llm_service.create_llm_stream_for("content")
+            )
+        ]
+
+    with pytest.raises(ValueError):
+        asyncio.run(generate())
+    events = asyncio.run(generate())
+
+    assert events[-1]["event"] == "complete"
+    assert len(calls) == 2